@@ -10,16 +10,98 @@ def main():
                        help='Run in development mode with limited records')
     parser.add_argument('--limit', type=int, default=20,
                        help='Limit number of records in dev mode')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Disable the on-disk HTTP response cache')
+    parser.add_argument('--engine', choices=['threads', 'async'], default='threads',
+                       help='Fetch engine for detail pages (async requires aiohttp)')
+    parser.add_argument('--rps', type=float, default=None,
+                       help='Process-wide request rate limit in requests/second (0 disables it)')
+    parser.add_argument('--adaptive', action='store_true',
+                       help='Adapt concurrency (AIMD) to latency and throttling responses')
+    parser.add_argument('--parser', choices=['bs4', 'lxml'], default='bs4',
+                       help='HTML parser backend (lxml is faster and yields identical rows)')
+    parser.add_argument('--process-parsing', action='store_true',
+                       help='Parse downloaded pages in a process pool, separate from the download threads')
+    parser.add_argument('--parse-workers', type=int, default=None,
+                       help='Number of parser processes (default: one per CPU core)')
+    parser.add_argument('--retry-failed', action='store_true',
+                       help='Only re-fetch the failed URLs of previous runs and patch the raw CSVs')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only scrape events, fights and fighters that are new since the existing raw CSVs')
+    parser.add_argument('--resume', action='store_true',
+                       help='Resume an interrupted run, skipping the units recorded in the checkpoint journal')
+    parser.add_argument('--storage', choices=['csv', 'sqlite'], default='csv',
+                       help='Storage backend for the raw tables (sqlite keeps keyed tables and exports the CSVs)')
+    parser.add_argument('--parquet', action='store_true',
+                       help='Also write the raw tables as typed Parquet files (requires pyarrow)')
+    parser.add_argument('--metrics-dir', default=None,
+                       help='Directory for the run metrics report and Prometheus textfile (default: data/metrics)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Profile each phase (cProfile, tracemalloc, sampled stacks) into data/profiles/')
+    parser.add_argument('--no-archive', action='store_true',
+                       help='Do not store fetched pages in the compressed raw page archive (data/raw/pages.sqlite)')
+    parser.add_argument('--no-parse-memo', action='store_true',
+                       help='Parse every detail page even if it is unchanged since the previous run')
+    parser.add_argument('--reparse', action='store_true',
+                       help='Rebuild all raw CSVs from the page archive with no network I/O, parsing on all cores')
+    parser.add_argument('--no-transform', action='store_true',
+                       help='Do not build the cleaned CSVs in data/processed after scraping')
+    parser.add_argument('--transform-only', action='store_true',
+                       help='Only rebuild data/processed from the existing raw CSVs (requires pandas)')
+    parser.add_argument('--no-features', action='store_true',
+                       help='Do not update the pre-fight features and ratings in data/features after the transform')
+    parser.add_argument('--rebuild-features', action='store_true',
+                       help='Rebuild the pre-fight features and ratings from all fights instead of only appending new ones')
+    parser.add_argument('--no-ml-dataset', action='store_true',
+                       help='Do not build the symmetric ML dataset in data/ml after the features')
+    parser.add_argument('--ml-format', choices=['npy', 'parquet'], default='npy',
+                       help='ML dataset format: memory-mapped .npy (default) or Parquet (requires pyarrow)')
+    parser.add_argument('--ml-float32', action='store_true',
+                       help='Write the ML dataset as float32 instead of float64')
+    parser.add_argument('--base-url', default=None,
+                       help='Site to scrape instead of ufcstats.com, e.g. a local scripts/stub_server.py '
+                            '(default: $UFC_ETL_BASE_URL or http://ufcstats.com)')
     
     args = parser.parse_args()
     
     # Initialize and run orchestrator
     orchestrator = UFCScrapingOrchestrator(
         dev_mode=args.dev,
-        dev_limit=args.limit
+        dev_limit=args.limit,
+        use_cache=not args.no_cache,
+        engine=args.engine,
+        requests_per_second=args.rps,
+        adaptive=args.adaptive,
+        parser_backend=args.parser,
+        process_parsing=args.process_parsing,
+        parse_workers=args.parse_workers,
+        resume=args.resume,
+        parquet=args.parquet,
+        storage=args.storage,
+        metrics_dir=args.metrics_dir,
+        profile=args.profile,
+        base_url=args.base_url,
+        archive=not args.no_archive,
+        reparse=args.reparse,
+        parse_memo=not args.no_parse_memo,
+        transform=not args.no_transform,
+        features=not args.no_features,
+        rebuild_features=args.rebuild_features,
+        ml_dataset=not args.no_ml_dataset,
+        ml_format=args.ml_format,
+        ml_float32=args.ml_float32
     )
     
-    orchestrator.run_full_pipeline()
+    if args.transform_only:
+        orchestrator.run_transform()
+    elif args.reparse:
+        orchestrator.reparse_archive()
+    elif args.retry_failed:
+        orchestrator.retry_failed()
+    elif args.incremental:
+        orchestrator.run_incremental()
+    else:
+        orchestrator.run_full_pipeline()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,130 @@
+"""
+Script de benchmark del constructor del dataset simétrico para Machine Learning.
+Construye el mismo dataset (atributos numéricos de los luchadores y estadísticas por esquina de la pelea, como en
+las secciones 9 y 10 del notebook 04_fights_cleaning) con la ruta del notebook (dos pd.merge, renombrados por
+sufijo, búsquedas en los nombres de columna y pd.concat) y con src/pipeline/dataset.py (gathers de NumPy sobre una
+matriz preasignada). Mide el tiempo y la memoria máxima (tracemalloc) de cada uno y comprueba que los valores
+coinciden. Lee los CSV limpios de data/processed; con --scale se replican las peleas para medir con más volumen.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+from src.pipeline.dataset import SymmetricDatasetBuilder
+from src.pipeline.features import chronological_fights
+
+
+def notebook_dataset(fights: pd.DataFrame, fighters: pd.DataFrame, fighter_columns: list) -> pd.DataFrame:
+    """Secciones 9 y 10 del notebook 04, sin la imputación de nulos ni la codificación posterior."""
+    fighters_ml = fighters.reset_index()[['fighter_id'] + fighter_columns]
+    ml_df = fights.copy()
+
+    ml_df = pd.merge(ml_df, fighters_ml, left_on='red_id', right_on='fighter_id', how='left')
+    ml_df = ml_df.rename(columns={col: col + '_red' for col in fighter_columns}).drop(columns=['fighter_id'])
+    ml_df = pd.merge(ml_df, fighters_ml, left_on='blue_id', right_on='fighter_id', how='left')
+    ml_df = ml_df.rename(columns={col: col + '_blue' for col in fighter_columns}).drop(columns=['fighter_id'])
+
+    ml_df = ml_df.dropna(subset=['winner_id'])
+    ml_df['target_red'] = np.where(ml_df['red_id'] == ml_df['winner_id'], 1, 0)
+
+    red_cols = [col for col in ml_df.columns if col.endswith('_red') or col.endswith('1')]
+    blue_cols = [col for col in ml_df.columns if col.endswith('_blue') or col.endswith('2')]
+    non_fighter_cols = [col for col in ml_df.columns if col not in red_cols + blue_cols + ['target_red']]
+
+    df_A = ml_df[non_fighter_cols + red_cols + blue_cols + ['target_red']].copy()
+    df_A = df_A.rename(columns={'target_red': 'target'})
+    df_A = df_A.rename(columns={c: c.replace('_red', '_A').replace('_blue', '_B').replace('1', '_A').replace('2', '_B')
+                                for c in df_A.columns})
+    df_A['is_red_corner'] = 1
+
+    df_B = ml_df[non_fighter_cols + blue_cols + red_cols + ['target_red']].copy()
+    # target_red termina en '_red' y aparece dos veces en ambas selecciones
+    df_A = df_A.loc[:, ~df_A.columns.duplicated()]
+    df_B = df_B.loc[:, ~df_B.columns.duplicated()]
+    df_B['target'] = 1 - df_B['target_red']
+    df_B = df_B.drop(columns=['target_red'])
+    df_B = df_B.rename(columns={c: c.replace('_blue', '_A').replace('_red', '_B').replace('2', '_A').replace('1', '_B')
+                                for c in df_B.columns})
+    df_B['is_red_corner'] = 0
+    return pd.concat([df_A, df_B], ignore_index=True)
+
+
+def scaled(fights: pd.DataFrame, events: pd.DataFrame, scale: int):
+    """Replica peleas y eventos `scale` veces con identificadores distintos en cada copia."""
+    if scale <= 1:
+        return fights, events
+    fight_copies, event_copies = [], []
+    for i in range(scale):
+        fight_copies.append(fights.assign(fight_id=fights['fight_id'] + f'-{i}', event_id=fights['event_id'] + f'-{i}'))
+        event_copies.append(events.assign(event_id=events['event_id'] + f'-{i}'))
+    return pd.concat(fight_copies, ignore_index=True), pd.concat(event_copies, ignore_index=True)
+
+
+def measured(func, repeat: int):
+    """
+    Mejor tiempo de `repeat` llamadas, memoria máxima asignada (MB) según tracemalloc en una llamada aparte
+    (tracemalloc ralentiza las asignaciones y falsearía el tiempo) y el resultado.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    del result
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    """
+    Ejecuta el benchmark e imprime el tiempo y la memoria máxima de ambas rutas y si sus valores coinciden.
+    """
+    arg_parser = argparse.ArgumentParser(description='Benchmark notebook merges vs indexed ML dataset builder')
+    arg_parser.add_argument('--processed-dir', default=os.path.join('data', 'processed'),
+                            help='Directory with the cleaned CSVs (default: data/processed)')
+    arg_parser.add_argument('--scale', type=int, default=1, help='Replicate the fights this many times')
+    arg_parser.add_argument('--float32', action='store_true', help='Build the dataset as float32')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='Timed runs per path (best time is shown)')
+    args = arg_parser.parse_args()
+
+    fighters = pd.read_csv(os.path.join(args.processed_dir, 'fighters.csv'), index_col='fighter_id')
+    fights, events = scaled(pd.read_csv(os.path.join(args.processed_dir, 'fights.csv')),
+                            pd.read_csv(os.path.join(args.processed_dir, 'events.csv')), args.scale)
+    # Mismo orden y mismas peleas (con ganador) para ambas rutas
+    fights = chronological_fights(fights, events)
+    fights = fights[(fights['winner_id'] == fights['red_id']) | (fights['winner_id'] == fights['blue_id'])]
+    fighter_columns = [c for c in fighters.select_dtypes('number').columns]
+    pairs = [(c, c[:-1] + '2', c[:-1]) for c in fights.columns
+             if c.endswith('1') and c[:-1] + '2' in fights.columns]
+
+    builder = SymmetricDatasetBuilder(fighter_columns=fighter_columns, fighter_categories=(), fight_categories=(),
+                                      fight_corner_columns=pairs, age=False,
+                                      dtype='float32' if args.float32 else 'float64')
+    notebook_seconds, notebook_peak, expected = measured(lambda: notebook_dataset(fights, fighters, fighter_columns),
+                                                         args.repeat)
+    builder_seconds, builder_peak, dataset = measured(lambda: builder.build(fights, fighters, events), args.repeat)
+
+    expected_values = expected[dataset.columns].to_numpy(dtype=float)
+    rtol = 1e-6 if args.float32 else 1e-12
+    np.testing.assert_allclose(dataset.values, expected_values, rtol=rtol, equal_nan=True)
+
+    print(f"{len(dataset.values)} rows x {len(dataset.columns)} columns ({dataset.values.dtype})")
+    print(f"{'path':<10} {'seconds':>9} {'peak MB':>9}")
+    print(f"{'notebook':<10} {notebook_seconds:>9.3f} {notebook_peak:>9.1f}")
+    print(f"{'builder':<10} {builder_seconds:>9.3f} {builder_peak:>9.1f}")
+    print(f"speedup {notebook_seconds / builder_seconds:.1f}x, peak memory {notebook_peak / builder_peak:.1f}x lower, "
+          f"values equal")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Script de benchmark de los backends de parseo.
+Mide páginas por segundo de los parsers BeautifulSoup y lxml sobre el corpus de páginas de
+tests/fixtures/pages, para cada tipo de página, y comprueba que ambos producen la misma salida.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.scrapers.fighters.parser import FighterParser
+from src.scrapers.fighters.lxml_parser import LxmlFighterParser
+from src.scrapers.events.parser import EventParser
+from src.scrapers.events.lxml_parser import LxmlEventParser
+from src.scrapers.fights.parser import FightParser
+from src.scrapers.fights.lxml_parser import LxmlFightParser
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures', 'pages')
+
+# Tipo de página -> (fichero del corpus, parser bs4, parser lxml, función de parseo)
+PAGE_TYPES = {
+    'fighters_listing': ('fighters_listing.html', FighterParser, LxmlFighterParser,
+                         lambda p, page: p.parse_fighters_table(p.load(page))),
+    'fighter_details': ('fighter_details.html', FighterParser, LxmlFighterParser,
+                        lambda p, page: p.parse_fighter_details(page)),
+    'events_listing': ('events_listing.html', EventParser, LxmlEventParser,
+                       lambda p, page: p.parse_events_table(p.load(page), 'completed')),
+    'event_details': ('event_details.html', FightParser, LxmlFightParser,
+                      lambda p, page: p.parse_event_fights(p.load(page), 'event')),
+    'fight_details': ('fight_details_completed.html', FightParser, LxmlFightParser,
+                      lambda p, page: p.parse_fight_details(page)),
+}
+
+
+def pages_per_second(parser, parse, page: str, seconds: float) -> float:
+    """Parsea la página repetidamente durante `seconds` segundos y devuelve el ritmo medio."""
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < seconds:
+        parse(parser, page)
+        count += 1
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main():
+    """
+    Ejecuta el benchmark e imprime una tabla con el rendimiento de ambos backends.
+    """
+    arg_parser = argparse.ArgumentParser(description='Benchmark bs4 vs lxml parser backends')
+    arg_parser.add_argument('--seconds', type=float, default=2.0,
+                            help='Time spent parsing each page type with each backend')
+    args = arg_parser.parse_args()
+
+    print(f"{'page type':<18} {'bs4 pages/s':>12} {'lxml pages/s':>13} {'speedup':>8}  parity")
+    for page_type, (filename, bs4_cls, lxml_cls, parse) in PAGE_TYPES.items():
+        with open(os.path.join(PAGES_DIR, filename), 'r', encoding='utf-8') as f:
+            page = f.read()
+        bs4_parser, lxml_parser = bs4_cls(), lxml_cls()
+        parity = parse(bs4_parser, page) == parse(lxml_parser, page)
+        bs4_rate = pages_per_second(bs4_parser, parse, page, args.seconds)
+        lxml_rate = pages_per_second(lxml_parser, parse, page, args.seconds)
+        print(f"{page_type:<18} {bs4_rate:>12.1f} {lxml_rate:>13.1f} {lxml_rate / bs4_rate:>7.1f}x  "
+              f"{'ok' if parity else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+Script de benchmark de la fase de transformación.
+Ejecuta sobre los CSV crudos la limpieza fila a fila de los notebooks 02-04 (.apply) y la versión vectorizada de
+src/pipeline/transform.py, mide el tiempo de ambas por tabla y comprueba que producen exactamente el mismo DataFrame.
+Las funciones de referencia copian las de los notebooks con las correcciones que aplica la fase de transformación
+(marcadas con 'Corrección'). Con --scale se replican las filas, con identificadores distintos, para medir con
+más volumen del disponible.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+from src.pipeline.transform import (
+    clean_fighters, clean_events, clean_upcoming, clean_fights, FIGHT_PAIR_COLUMNS
+)
+
+
+# --- Notebook 02: luchadores ---
+
+def clean_name(name):
+    if pd.isna(name):
+        return name
+    name = str(name).strip()
+    name = re.sub(r'\s+', ' ', name)
+    return name.title()
+
+
+def clean_nickname(nickname):
+    if pd.isna(nickname) or str(nickname).lower() in ['', 'nan', 'none']:
+        return None
+    nickname = str(nickname).strip()
+    nickname = nickname.strip('"\'')
+    return nickname if nickname else None
+
+
+def parse_height_to_cm(height_str):
+    if pd.isna(height_str):
+        return np.nan
+    height_str = str(height_str).strip()
+    match = re.search(r"(\d+)'\s*(\d+)\"?", height_str)
+    if match:
+        total_inches = int(match.group(1)) * 12 + int(match.group(2))
+        return round(total_inches * 2.54, 1)
+    numbers = re.findall(r'\d+', height_str)
+    if numbers:
+        return round(int(numbers[0]) * 2.54, 1)
+    return np.nan
+
+
+def parse_weight_to_kg(weight_str):
+    if pd.isna(weight_str):
+        return np.nan
+    match = re.search(r'(\d+(?:\.\d+)?)', str(weight_str))
+    if match:
+        return round(float(match.group(1)) * 0.453592, 1)
+    return np.nan
+
+
+def parse_reach_to_cm(reach_str):
+    if pd.isna(reach_str):
+        return np.nan
+    match = re.search(r'(\d+(?:\.\d+)?)', str(reach_str))
+    if match:
+        return round(float(match.group(1)) * 2.54, 1)
+    return np.nan
+
+
+def clean_stance(stance):
+    if pd.isna(stance):
+        return 'Unknown'
+    stance = str(stance).strip().title()
+    return {'': 'Unknown', 'Nan': 'Unknown', 'None': 'Unknown'}.get(stance, stance)
+
+
+def parse_dob(dob_str):
+    if pd.isna(dob_str):
+        return pd.NaT
+    try:
+        return pd.to_datetime(str(dob_str).strip(), format='%b %d, %Y', errors='raise')
+    except (ValueError, TypeError):
+        return pd.NaT
+
+
+def notebook_fighters(raw: pd.DataFrame, today: date) -> pd.DataFrame:
+    """Limpieza de luchadores del notebook 02_fighters_cleaning."""
+    df = raw.copy()
+    df['first'] = df['first'].apply(clean_name)
+    df['last'] = df['last'].apply(clean_name)
+    # Corrección: el notebook quitaba las subcadenas 'nan ' y ' nan' de los nombres ya unidos
+    full_name = (df['first'].fillna('') + ' ' + df['last'].fillna('')).str.strip()
+    df.insert(df.columns.get_loc('first'), 'full_name', full_name)
+    df['nickname'] = df['nickname'].apply(clean_nickname)
+    df = df.drop(columns=['first', 'last'])
+
+    df['height'] = df['height'].apply(parse_height_to_cm)
+    df['weight'] = df['weight'].apply(parse_weight_to_kg)
+    df['reach'] = df['reach'].apply(parse_reach_to_cm)
+    df['stance'] = df['stance'].apply(clean_stance)
+
+    for col in ['wins', 'defeats', 'draws']:
+        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).clip(lower=0).astype(float)
+    df['total_fights'] = df[['wins', 'defeats', 'draws']].sum(axis=1)
+
+    df['dob'] = df['dob'].apply(parse_dob)
+    df['age'] = df['dob'].apply(lambda x: today.year - x.year if pd.notna(x) else np.nan)
+
+    for stat in ['slpm', 'str_acc', 'sapm', 'str_def', 'td_avg', 'td_acc', 'td_def', 'sub_avg']:
+        if stat in ['str_acc', 'str_def', 'td_acc', 'td_def']:
+            df[stat] = df[stat].astype(str).str.replace('%', '').replace('', np.nan)
+            df[stat] = pd.to_numeric(df[stat], errors='coerce') / 100
+        else:
+            df[stat] = pd.to_numeric(df[stat], errors='coerce')
+
+    exclude_cols = ['fighter_id', 'full_name', 'nickname', 'stance', 'belt', 'dob']
+    for col in [c for c in df.columns if c not in exclude_cols]:
+        df[col] = pd.to_numeric(df[col], errors='coerce').astype(float)
+    df['stance'] = df['stance'].astype('category')
+    df['full_name'] = df['full_name'].astype('string')
+    df['nickname'] = df['nickname'].astype('string')
+    df = df.set_index('fighter_id')
+    return df[~df.index.duplicated(keep='first')]
+
+
+# --- Notebook 03: eventos ---
+
+def clean_text(val):
+    if pd.isna(val):
+        return val
+    return ' '.join(str(val).strip().split()).title()
+
+
+def extract_country(location):
+    if pd.isna(location):
+        return np.nan
+    parts = location.split(',')
+    if len(parts) < 2:
+        return np.nan
+    return parts[-1].strip()
+
+
+def notebook_events(raw: pd.DataFrame) -> pd.DataFrame:
+    """Limpieza de eventos disputados del notebook 03_events_cleaning."""
+    df = raw.copy()
+    df['date'] = pd.to_datetime(df['date'], errors='coerce')
+    df['name'] = df['name'].apply(clean_text)
+    df['location'] = df['location'].apply(clean_text)
+    df['country'] = df['location'].apply(extract_country)
+    df = df.dropna(subset=['event_id', 'name', 'date'])
+    for col in ['location', 'country']:
+        df[col] = df[col].astype('category')
+    df['name'] = df['name'].astype('string')
+    return df.set_index('event_id')
+
+
+def notebook_upcoming(raw: pd.DataFrame) -> pd.DataFrame:
+    """Limpieza de eventos próximos del notebook 03_events_cleaning."""
+    df = raw.copy()
+    df['date'] = pd.to_datetime(df['date'], errors='coerce')
+    df['location'] = df['location'].astype('category')
+    df['name'] = df['name'].astype('string')
+    df = df.set_index('event_id').dropna(subset=['name', 'date'])
+    df['winner_id'] = ''
+    return df
+
+
+# --- Notebook 04: peleas ---
+
+def parse_time(val):
+    if pd.isna(val):
+        return np.nan
+    if isinstance(val, (int, float)):
+        return val
+    val = str(val).strip()
+    if ':' in val:
+        try:
+            parts = val.split(':')
+            if len(parts) == 2:
+                return int(parts[0]) * 60 + float(parts[1])
+            elif len(parts) == 3:
+                return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
+        except ValueError:
+            return np.nan
+        return np.nan
+    try:
+        return float(val)
+    except ValueError:
+        return np.nan
+
+
+def parse_pair(val):
+    """Corrección: par 'acertados of intentados' (el notebook lo convertía en nulo con pd.to_numeric)."""
+    match = re.match(r'^\s*(\d+)\s+of\s+(\d+)\s*$', val) if isinstance(val, str) else None
+    return (float(match.group(1)), float(match.group(2))) if match else (np.nan, np.nan)
+
+
+def clean_weight_class(w):
+    if pd.isnull(w):
+        return w
+    lower = w.lower()
+    if 'women' in lower:
+        for key, label in (('bantamweight', "Women's Bantamweight"), ('featherweight', "Women's Featherweight"),
+                           ('flyweight', "Women's Flyweight"), ('strawweight', "Women's Strawweight")):
+            if key in lower:
+                return label
+    male_categories = {
+        "Flyweight": "Flyweight", "Bantamweight": "Bantamweight", "Featherweight": "Featherweight",
+        "Lightweight": "Lightweight", "Welterweight": "Welterweight", "Middleweight": "Middleweight",
+        "Light Heavyweight": "Light Heavyweight", "Heavyweight": "Heavyweight", "Open Weight": "Open Weight",
+        "Catch Weight": "Catchweight", "Championship Bout": "Open Weight", "Tournament Title Bout": "Open Weight",
+    }
+    for cat, label in male_categories.items():
+        if cat.lower() in lower:
+            return label
+    return w
+
+
+def clean_method(val):
+    if pd.isna(val):
+        return val
+    val = str(val).strip().lower()
+    mapping = {
+        'ko/tko': 'KO/TKO', 'submission': 'Submission', 'decision - unanimous': 'Decision Unanimous',
+        'decision - split': 'Decision Split', 'decision - majority': 'Decision Majority', 'dq': 'DQ',
+        'draw': 'Draw', 'no contest': 'No Contest',
+    }
+    for k, v in mapping.items():
+        if k in val:
+            return v
+    return val.title()
+
+
+def notebook_fights(raw: pd.DataFrame) -> pd.DataFrame:
+    """Limpieza de peleas del notebook 04_fights_cleaning (secciones 3-8)."""
+    df = raw.copy()
+    # Corrección: winner_id es un identificador y no se pasa a formato título
+    for col in ['red_name', 'blue_name', 'referee', 'method', 'details']:
+        df[col] = df[col].apply(clean_text)
+    # Corrección: control_time1/2 no pasan por pd.to_numeric antes de convertirse a segundos
+    for col in ['kd1', 'kd2', 'sub1', 'sub2', 'pass1', 'pass2', 'rev1', 'rev2', 'round']:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    for col in ['time', 'control_time1', 'control_time2']:
+        df[col] = df[col].apply(parse_time).astype(float)
+    for col in FIGHT_PAIR_COLUMNS:
+        position = df.columns.get_loc(col)
+        pairs = df.pop(col).apply(parse_pair)
+        df.insert(position, f'{col}_landed', pairs.str[0].astype(float))
+        df.insert(position + 1, f'{col}_attempted', pairs.str[1].astype(float))
+    df['weight_class'] = df['weight_class'].apply(clean_weight_class)
+    for col in ['method', 'details']:
+        df[col] = df[col].apply(clean_method)
+    df['winner_id'] = df['winner_id'].replace({'': np.nan, 'None': np.nan})
+    df = df.drop_duplicates(subset=['fight_id'])
+    return df.dropna(subset=['event_id', 'fight_id', 'red_id', 'blue_id'])
+
+
+def scaled(raw: pd.DataFrame, scale: int) -> pd.DataFrame:
+    """Replica las filas `scale` veces con identificadores distintos en cada copia."""
+    if scale <= 1:
+        return raw
+    id_columns = [c for c in raw.columns if c.endswith('_id')]
+    copies = []
+    for i in range(scale):
+        copy = raw.copy()
+        for column in id_columns:
+            copy[column] = copy[column].where(copy[column].isna(), copy[column].astype(str) + f'-{i}')
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+
+def timed(func, raw: pd.DataFrame, repeat: int):
+    """Mejor tiempo de `repeat` ejecuciones y el resultado de la última."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(raw)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    """
+    Ejecuta el benchmark e imprime una tabla con el tiempo de ambas implementaciones y su igualdad.
+    """
+    arg_parser = argparse.ArgumentParser(description='Benchmark notebook .apply cleaning vs vectorized transform')
+    arg_parser.add_argument('--raw-dir', default=os.path.join('data', 'raw'),
+                            help='Directory with the raw CSVs (default: data/raw)')
+    arg_parser.add_argument('--scale', type=int, default=1, help='Replicate the rows this many times')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='Runs per implementation (best time is shown)')
+    args = arg_parser.parse_args()
+
+    today = date.today()
+    tables = [
+        ('fighters', 'raw_fighters.csv', lambda df: notebook_fighters(df, today), lambda df: clean_fighters(df, today)),
+        ('events', 'raw_events.csv', notebook_events, clean_events),
+        ('upcoming', 'raw_upcoming.csv', notebook_upcoming, clean_upcoming),
+        ('fights', 'raw_fights.csv', notebook_fights, clean_fights),
+    ]
+    print(f"{'table':<10} {'rows':>9} {'notebook s':>11} {'vectorized s':>13} {'speedup':>8}  equal")
+    mismatches = 0
+    for table, filename, notebook, vectorized in tables:
+        path = os.path.join(args.raw_dir, filename)
+        if not os.path.exists(path):
+            print(f"{table:<10} {'-':>9}  {path} not found")
+            continue
+        raw = scaled(pd.read_csv(path), args.scale)
+        notebook_seconds, expected = timed(notebook, raw, args.repeat)
+        vectorized_seconds, actual = timed(vectorized, raw, args.repeat)
+        try:
+            pd.testing.assert_frame_equal(actual, expected)
+            equal = 'ok'
+        except AssertionError as e:
+            equal = f"MISMATCH: {str(e).splitlines()[0]}"
+            mismatches += 1
+        print(f"{table:<10} {len(raw):>9} {notebook_seconds:>11.3f} {vectorized_seconds:>13.3f} "
+              f"{notebook_seconds / vectorized_seconds:>7.1f}x  {equal}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
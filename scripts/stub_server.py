@@ -0,0 +1,461 @@
+"""
+Servidor HTTP local que imita ufcstats.com para pruebas de carga de extremo a extremo.
+Sirve páginas con la estructura de ufcstats (listados de eventos y luchadores, detalles de eventos, peleas y
+luchadores), bien generadas de forma sintética y determinista a la escala indicada (N eventos, M peleas por evento,
+K luchadores), bien desde un corpus de páginas grabadas (--corpus tests/fixtures/pages).
+Permite inyectar latencia, errores 5xx y limitación 429 con Retry-After, para medir el rendimiento, la concurrencia
+y los reintentos del pipeline de forma reproducible y sin red:
+    python scripts/stub_server.py --events 200 --fights 12 --fighters 2000 --latency-ms 50 --error-rate 0.02
+    python main.py --base-url http://127.0.0.1:8000 --no-cache --rps 0
+Las estadísticas de peticiones servidas se consultan en /__stats.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.core.constants import (
+    FIGHTERS_PATH, EVENTS_COMPLETED_PATH, EVENTS_UPCOMING_PATH, EVENT_PATH, FIGHTER_PATH, FIGHT_PATH
+)
+
+FIRST_NAMES = ['Alex', 'Jon', 'Israel', 'Amanda', 'Max', 'Charles', 'Dustin', 'Valentina', 'Kamaru', 'Zhang',
+               'Islam', 'Sean', 'Leon', 'Tom', 'Merab', 'Ilia', 'Khamzat', 'Jiri', 'Belal', 'Julianna']
+LAST_NAMES = ['Aldo', 'Blaydes', 'Cejudo', 'Diaz', 'Edwards', 'Ferguson', 'Gaethje', 'Holloway', 'Iaquinta',
+              'Jones', 'Kattar', 'Lewis', 'Makhachev', 'Nunes', 'Oliveira', 'Poirier', 'Quarantillo', 'Rountree',
+              'Shevchenko', 'Topuria', 'Usman', 'Volkanovski', 'Whittaker', 'Xavier', 'Yan', 'Zahabi']
+NICKNAMES = ['The Great', 'Bones', 'Do Bronx', 'The Diamond', 'Blessed', 'Poatan', 'El Matador', 'Bullet', '']
+STANCES = ['Orthodox', 'Southpaw', 'Switch']
+WEIGHT_CLASSES = [('Flyweight', 125), ('Bantamweight', 135), ('Featherweight', 145), ('Lightweight', 155),
+                  ('Welterweight', 170), ('Middleweight', 185), ('Light Heavyweight', 205), ('Heavyweight', 250)]
+METHODS = [('KO/TKO', 'Punch to Head At Distance'), ('Submission', 'Rear Naked Choke'),
+           ('Decision - Unanimous', ''), ('Decision - Split', '')]
+REFEREES = ['Herb Dean', 'Marc Goddard', 'Jason Herzog', 'Keith Peterson']
+LOCATIONS = ['Las Vegas, Nevada, USA', 'Abu Dhabi, Abu Dhabi, United Arab Emirates', 'London, England, United Kingdom',
+             'Perth, Western Australia, Australia', 'Toronto, Ontario, Canada', 'Paris, Ile-de-France, France']
+
+PAGE = '<!DOCTYPE html>\n<html lang="en"><head><meta charset="UTF-8"><title>UFC Stats</title></head>' \
+       '<body class="b-page"><section class="b-statistics__section_details"><div class="l-page__container">' \
+       '{body}</div></section></body></html>'
+
+
+def stable_id(*parts) -> str:
+    """Identificador hexadecimal de 16 caracteres, como los de ufcstats, derivado de forma determinista."""
+    return hashlib.md5('-'.join(str(p) for p in parts).encode('utf-8')).hexdigest()[:16]
+
+
+def pair_cells(values: List[Tuple[str, str]]) -> str:
+    """Celdas de una tabla de estadísticas con un párrafo por luchador."""
+    return ''.join(
+        f'<td class="b-fight-details__table-col"><p class="b-fight-details__table-text">{red}</p>'
+        f'<p class="b-fight-details__table-text">{blue}</p></td>'
+        for red, blue in values
+    )
+
+
+class SyntheticSite:
+    """
+    Sitio sintético y determinista con la forma de ufcstats.
+    Args:
+        events (int): Número de eventos completados.
+        fights_per_event (int): Número de peleas de cada evento.
+        fighters (int): Número de luchadores.
+        upcoming (int): Número de eventos próximos (sus peleas no tienen estadísticas).
+        seed (int): Semilla de la generación; la misma semilla produce siempre las mismas páginas.
+    """
+
+    def __init__(self, events: int = 50, fights_per_event: int = 10, fighters: int = 500,
+                 upcoming: int = 1, seed: int = 0):
+        self.seed = seed
+        self.fights_per_event = fights_per_event
+        self.fighter_ids = [stable_id(seed, 'fighter', i) for i in range(max(fighters, 2))]
+        self.fighter_index = {fighter_id: i for i, fighter_id in enumerate(self.fighter_ids)}
+        self.event_ids = [stable_id(seed, 'event', i) for i in range(events + upcoming)]
+        self.event_index = {event_id: i for i, event_id in enumerate(self.event_ids)}
+        self.completed = events
+        self.fight_index: Dict[str, Tuple[int, int]] = {}
+        for e in range(len(self.event_ids)):
+            for k in range(fights_per_event):
+                self.fight_index[stable_id(seed, 'fight', e, k)] = (e, k)
+        self.today = date(2025, 1, 4)
+
+    def _rng(self, *parts) -> random.Random:
+        return random.Random(stable_id(self.seed, *parts))
+
+    def _fighter_name(self, i: int) -> Tuple[str, str]:
+        return FIRST_NAMES[i % len(FIRST_NAMES)], LAST_NAMES[(i // len(FIRST_NAMES) + i) % len(LAST_NAMES)]
+
+    def _event(self, e: int) -> dict:
+        upcoming = e >= self.completed
+        days = 7 * (e - self.completed + 1) if upcoming else -7 * e
+        return {
+            'id': self.event_ids[e],
+            'name': f"UFC {1000 + e}: {self._fighter_name(e)[1]} vs. {self._fighter_name(e + 7)[1]}",
+            'date': (self.today + timedelta(days=days)).strftime('%B %d, %Y'),
+            'location': LOCATIONS[e % len(LOCATIONS)],
+            'upcoming': upcoming,
+        }
+
+    def _corners(self, e: int, k: int) -> Tuple[int, int]:
+        red, blue = self._rng('corners', e, k).sample(range(len(self.fighter_ids)), 2)
+        return red, blue
+
+    def page(self, path: str, query: Dict[str, List[str]]) -> Optional[str]:
+        """HTML de la ruta solicitada, o None si no existe."""
+        kind, _, key = path.rpartition('/')
+        if path == EVENTS_COMPLETED_PATH:
+            return self.events_listing(range(self.completed))
+        if path == EVENTS_UPCOMING_PATH:
+            return self.events_listing(range(self.completed, len(self.event_ids)))
+        if path == FIGHTERS_PATH:
+            letter = query.get('char', ['a'])[0].lower()
+            return self.fighters_listing(letter)
+        if kind == EVENT_PATH and key in self.event_index:
+            return self.event_details(self.event_index[key])
+        if kind == FIGHT_PATH and key in self.fight_index:
+            return self.fight_details(*self.fight_index[key])
+        if kind == FIGHTER_PATH and key in self.fighter_index:
+            return self.fighter_details(self.fighter_index[key])
+        return None
+
+    def events_listing(self, indices) -> str:
+        rows = []
+        for e in indices:
+            event = self._event(e)
+            rows.append(
+                '<tr class="b-statistics__table-row"><td class="b-statistics__table-col">'
+                '<i class="b-statistics__table-content">'
+                f'<a href="{EVENT_PATH}/{event["id"]}" class="b-link b-link_style_black">{event["name"]}</a>'
+                f'<span class="b-statistics__date">{event["date"]}</span></i></td>'
+                f'<td class="b-statistics__table-col">{event["location"]}</td></tr>'
+            )
+        return PAGE.format(body=(
+            '<table class="b-statistics__table-events"><thead class="b-statistics__table-caption">'
+            '<tr class="b-statistics__table-row"><th>Name/date</th><th>Location</th></tr></thead><tbody>'
+            '<tr class="b-statistics__table-row"><td class="b-statistics__table-col_type_clear"></td></tr>'
+            + ''.join(rows) + '</tbody></table>'
+        ))
+
+    def fighters_listing(self, letter: str) -> str:
+        rows = []
+        for i, fighter_id in enumerate(self.fighter_ids):
+            first, last = self._fighter_name(i)
+            if not last.lower().startswith(letter):
+                continue
+            rng = self._rng('fighter', i)
+            link = f'{FIGHTER_PATH}/{fighter_id}'
+            height = rng.randint(62, 78)
+            cells = [f'<a href="{link}" class="b-link b-link_style_black">{first}</a>',
+                     f'<a href="{link}" class="b-link b-link_style_black">{last}</a>',
+                     f'<a href="{link}" class="b-link b-link_style_black">{rng.choice(NICKNAMES)}</a>',
+                     f"{height // 12}' {height % 12}\"", f"{rng.choice(WEIGHT_CLASSES)[1]} lbs.",
+                     f'{height + rng.randint(-2, 6)}.0"', rng.choice(STANCES),
+                     rng.randint(0, 30), rng.randint(0, 12), rng.randint(0, 2),
+                     '<img src="/img/belt.png">' if rng.random() < 0.02 else '']
+            rows.append('<tr class="b-statistics__table-row">'
+                        + ''.join(f'<td class="b-statistics__table-col">{cell}</td>' for cell in cells) + '</tr>')
+        return PAGE.format(body=(
+            '<table class="b-statistics__table"><thead class="b-statistics__table-caption"><tr>'
+            '<th>First</th><th>Last</th><th>Nickname</th><th>Ht.</th><th>Wt.</th><th>Reach</th><th>Stance</th>'
+            '<th>W</th><th>L</th><th>D</th><th>Belt</th></tr></thead><tbody>'
+            + ''.join(rows) + '</tbody></table>'
+        ))
+
+    def fighter_details(self, i: int) -> str:
+        rng = self._rng('fighter-details', i)
+        dob = date(1980, 1, 1) + timedelta(days=rng.randint(0, 7000))
+        stats = [('SLpM', f"{rng.uniform(1, 8):.2f}"), ('Str. Acc.', f"{rng.randint(30, 70)}%"),
+                 ('SApM', f"{rng.uniform(1, 6):.2f}"), ('Str. Def', f"{rng.randint(40, 70)}%"),
+                 ('TD Avg.', f"{rng.uniform(0, 5):.2f}"), ('TD Acc.', f"{rng.randint(0, 80)}%"),
+                 ('TD Def.', f"{rng.randint(30, 100)}%"), ('Sub. Avg.', f"{rng.uniform(0, 2):.1f}")]
+        items = ''.join(f'<li class="b-list__box-list-item"><i class="b-list__box-item-title">{title}:</i>{value}</li>'
+                        for title, value in stats)
+        return PAGE.format(body=(
+            '<div class="b-list__info-box b-list__info-box_style_small-width js-guide"><ul class="b-list__box-list">'
+            f'<li class="b-list__box-list-item"><i class="b-list__box-item-title">DOB:</i>{dob:%b %d, %Y}</li>'
+            '</ul></div>'
+            '<div class="b-list__info-box b-list__info-box_style_middle-width js-guide clearfix">'
+            f'<div class="b-list__info-box-left clearfix"><ul class="b-list__box-list">{items}</ul></div></div>'
+        ))
+
+    def event_details(self, e: int) -> str:
+        event = self._event(e)
+        rows = []
+        for k in range(self.fights_per_event):
+            fight_id = stable_id(self.seed, 'fight', e, k)
+            red, blue = self._corners(e, k)
+            names = [' '.join(self._fighter_name(i)) for i in (red, blue)]
+            cells = pair_cells([('win', ''), (names[0], names[1]), ('0', '0'), ('0', '0'), ('0', '0'), ('0', '0')])
+            cells += '<td class="b-fight-details__table-col"></td>' * 4
+            rows.append(f'<tr class="b-fight-details__table-row" data-link="{FIGHT_PATH}/{fight_id}">{cells}</tr>')
+        return PAGE.format(body=(
+            f'<h2 class="b-content__title"><span>{event["name"]}</span></h2>'
+            '<table class="b-fight-details__table js-fight-table"><thead><tr><th>W/L</th><th>Fighter</th></tr></thead>'
+            f'<tbody class="b-fight-details__table-body">{"".join(rows)}</tbody></table>'
+        ))
+
+    def fight_details(self, e: int, k: int) -> str:
+        event = self._event(e)
+        red, blue = self._corners(e, k)
+        rng = self._rng('fight', e, k)
+        weight_class = rng.choice(WEIGHT_CLASSES)[0]
+        winner = None if event['upcoming'] else rng.choice((red, blue))
+        persons = ''
+        for i in (red, blue):
+            status = ''
+            if winner is not None:
+                color = 'green' if i == winner else 'gray'
+                status = f'<i class="b-fight-details__person-status b-fight-details__person-status_style_{color}">' \
+                         f'{"W" if i == winner else "L"}</i>'
+            persons += (f'<div class="b-fight-details__person">{status}<h3 class="b-fight-details__person-name">'
+                        f'<a href="{FIGHTER_PATH}/{self.fighter_ids[i]}">{" ".join(self._fighter_name(i))}</a>'
+                        '</h3></div>')
+        bonus = '<img src="/img/perf.png">' if rng.random() < 0.1 else ''
+        head = (f'<h2 class="b-content__title"><a class="b-link" href="{EVENT_PATH}/{event["id"]}">{event["name"]}</a>'
+                f'</h2><div class="b-fight-details">{persons}<div class="b-fight-details__fight">'
+                f'<i class="b-fight-details__fight-title">{weight_class} Bout{bonus}</i>')
+        if winner is None:
+            return PAGE.format(body=head + '</div></div>')
+
+        method, details = rng.choice(METHODS)
+        rounds = 3 if rng.random() < 0.8 else 5
+        end_round = rounds if method.startswith('Decision') else rng.randint(1, rounds)
+        end_time = '5:00' if method.startswith('Decision') else f"{rng.randint(0, 4)}:{rng.randint(0, 59):02d}"
+
+        def strikes():
+            attempted = rng.randint(10, 150)
+            return f"{rng.randint(0, attempted)} of {attempted}"
+
+        def corner(stat):
+            return stat(), stat()
+
+        sig = corner(strikes)
+        totals = pair_cells([('Red', 'Blue'), corner(lambda: str(rng.randint(0, 2))), sig, ('50%', '50%'),
+                             corner(strikes), corner(lambda: f"{rng.randint(0, 4)} of {rng.randint(4, 8)}"),
+                             ('50%', '50%'), corner(lambda: str(rng.randint(0, 3))),
+                             corner(lambda: str(rng.randint(0, 1))),
+                             corner(lambda: f"{rng.randint(0, 9)}:{rng.randint(0, 59):02d}")])
+        significant = pair_cells([('Red', 'Blue'), sig, ('50%', '50%'), corner(strikes), corner(strikes),
+                                  corner(strikes), corner(strikes), corner(strikes), corner(strikes)])
+        content = (
+            '<div class="b-fight-details__content"><p class="b-fight-details__text">'
+            f'<i class="b-fight-details__text-item_first"><i class="b-fight-details__label">Method:</i>'
+            f'<i style="font-style: normal">{method}</i></i>'
+            f'<i class="b-fight-details__text-item"><i class="b-fight-details__label">Round:</i>{end_round}</i>'
+            f'<i class="b-fight-details__text-item"><i class="b-fight-details__label">Time:</i>{end_time}</i>'
+            '<i class="b-fight-details__text-item"><i class="b-fight-details__label">Time format:</i>'
+            f'{rounds} Rnd ({"-".join(["5"] * rounds)})</i>'
+            '<i class="b-fight-details__text-item"><i class="b-fight-details__label">Referee:</i>'
+            f'<span>{rng.choice(REFEREES)}</span></i></p>'
+            f'<p class="b-fight-details__text"><i class="b-fight-details__label">Details:</i>{details}</p></div>'
+        )
+        tables = (
+            f'<table><tbody class="b-fight-details__table-body"><tr>{totals}</tr></tbody></table>'
+            '<p class="b-fight-details__collapse-link_tot">Significant Strikes</p>'
+            f'<table><tbody class="b-fight-details__table-body"><tr>{significant}</tr></tbody></table>'
+        )
+        return PAGE.format(body=head + content + '</div></div>' + tables)
+
+
+class CorpusSite:
+    """
+    Sitio que sirve un corpus de páginas grabadas: cada tipo de página devuelve siempre su fichero, sea cual sea el
+    identificador solicitado. Los enlaces de las páginas grabadas determinan qué entidades recorre el pipeline.
+    Args:
+        directory (str): Directorio con los ficheros del corpus (por ejemplo, tests/fixtures/pages).
+    """
+
+    FILES = {
+        EVENTS_COMPLETED_PATH: 'events_listing.html',
+        EVENTS_UPCOMING_PATH: 'events_listing.html',
+        FIGHTERS_PATH: 'fighters_listing.html',
+        EVENT_PATH: 'event_details.html',
+        FIGHT_PATH: 'fight_details_completed.html',
+        FIGHTER_PATH: 'fighter_details.html',
+    }
+
+    def __init__(self, directory: str):
+        self.pages = {}
+        for route, name in self.FILES.items():
+            with open(os.path.join(directory, name), encoding='utf-8') as f:
+                self.pages[route] = f.read()
+
+    def page(self, path: str, query: Dict[str, List[str]]) -> Optional[str]:
+        """HTML de la ruta solicitada, o None si no existe."""
+        if path in self.pages:
+            return self.pages[path]
+        return self.pages.get(path.rpartition('/')[0])
+
+
+class Faults:
+    """
+    Fallos inyectados en las respuestas del servidor.
+    Args:
+        latency_ms (float): Latencia añadida a cada respuesta.
+        jitter_ms (float): Latencia adicional aleatoria, uniforme entre 0 y este valor.
+        error_rate (float): Fracción de peticiones que responden con un error 5xx.
+        throttle_rate (float): Fracción de peticiones que responden 429 con Retry-After.
+        max_rps (float): Peticiones por segundo admitidas; por encima se responde 429 (0 desactiva el límite).
+        retry_after (float): Segundos indicados en la cabecera Retry-After de las respuestas 429.
+        seed (int): Semilla de las decisiones aleatorias.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, max_rps: float = 0.0, retry_after: float = 1.0, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.max_rps = max_rps
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = max_rps
+        self._refilled = time.monotonic()
+
+    def decide(self) -> Tuple[float, Optional[int]]:
+        """Devuelve la latencia a aplicar (segundos) y el código de error a responder, o None si la petición sirve."""
+        with self._lock:
+            delay = (self.latency_ms + self._rng.uniform(0, self.jitter_ms)) / 1000
+            if self.max_rps > 0:
+                now = time.monotonic()
+                self._tokens = min(self.max_rps, self._tokens + (now - self._refilled) * self.max_rps)
+                self._refilled = now
+                if self._tokens < 1:
+                    return delay, 429
+                self._tokens -= 1
+            roll = self._rng.random()
+            if roll < self.throttle_rate:
+                return delay, 429
+            if roll < self.throttle_rate + self.error_rate:
+                return delay, self._rng.choice((500, 502, 503))
+        return delay, None
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Sirve las páginas del sitio del servidor aplicando los fallos inyectados."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/__stats':
+            self._respond(200, json.dumps(self.server.stats_snapshot(), indent=2), 'application/json')
+            return
+        delay, error = self.server.faults.decide()
+        if delay:
+            time.sleep(delay)
+        if error is not None:
+            headers = {'Retry-After': f"{self.server.faults.retry_after:g}"} if error == 429 else {}
+            self._respond(error, f'<html><body>Error {error}</body></html>', headers=headers)
+            return
+        body = self.server.site.page(url.path.rstrip('/') or '/', parse_qs(url.query))
+        if body is None:
+            self._respond(404, '<html><body>Not found</body></html>')
+        else:
+            self._respond(200, body)
+
+    def _respond(self, status: int, body: str, content_type: str = 'text/html; charset=utf-8', headers=None):
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+        if not self.path.startswith('/__stats'):
+            self.server.count(status)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Servidor HTTP multihilo del sitio simulado, con contadores de respuestas por código de estado.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, site, faults: Optional[Faults] = None, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), StubHandler)
+        self.site = site
+        self.faults = faults or Faults()
+        self.started = time.monotonic()
+        self._stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        """URL base con la que apuntar el pipeline al servidor (--base-url o UFC_ETL_BASE_URL)."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, status: int):
+        with self._stats_lock:
+            self._stats[status] += 1
+
+    def stats_snapshot(self) -> dict:
+        """Respuestas servidas por código de estado y ritmo medio desde el arranque."""
+        with self._stats_lock:
+            by_status = {str(status): count for status, count in sorted(self._stats.items())}
+            total = sum(self._stats.values())
+        elapsed = time.monotonic() - self.started
+        return {'requests': total, 'by_status': by_status, 'elapsed_seconds': round(elapsed, 3),
+                'requests_per_second': round(total / elapsed, 2) if elapsed else 0.0}
+
+
+def main():
+    """
+    Arranca el servidor con el sitio y los fallos indicados en la línea de comandos hasta recibir Ctrl+C.
+    """
+    parser = argparse.ArgumentParser(description='Local ufcstats stand-in server for load benchmarking')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--corpus', default=None,
+                        help='Serve recorded pages from this directory instead of synthetic ones')
+    parser.add_argument('--events', type=int, default=50, help='Completed events (synthetic site)')
+    parser.add_argument('--upcoming', type=int, default=1, help='Upcoming events (synthetic site)')
+    parser.add_argument('--fights', type=int, default=10, help='Fights per event (synthetic site)')
+    parser.add_argument('--fighters', type=int, default=500, help='Fighters (synthetic site)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic pages and injected faults')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Latency added to every response')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Extra uniform random latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of 5xx responses')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of 429 responses')
+    parser.add_argument('--max-rps', type=float, default=0.0,
+                        help='Answer 429 above this many requests/second (0 disables the limit)')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds of 429 responses')
+    args = parser.parse_args()
+
+    if args.corpus:
+        site = CorpusSite(args.corpus)
+    else:
+        site = SyntheticSite(args.events, args.fights, args.fighters, args.upcoming, args.seed)
+    faults = Faults(args.latency_ms, args.jitter_ms, args.error_rate, args.throttle_rate,
+                    args.max_rps, args.retry_after, args.seed)
+    server = StubServer(site, faults, args.host, args.port)
+    print(f"🥊 Serving a ufcstats stand-in at {server.base_url} (stats at {server.base_url}/__stats)")
+    print(f"   Run the pipeline against it with: python main.py --base-url {server.base_url} --no-cache --rps 0")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"📊 {json.dumps(server.stats_snapshot())}")
+
+
+if __name__ == "__main__":
+    main()
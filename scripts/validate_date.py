@@ -1,56 +1,52 @@
 """
 Script para validación de datos en el pipeline UFC ETL.
 Permite validar la integridad de los datos extraídos de luchadores, eventos y peleas, mostrando estadísticas de éxito.
+Las comprobaciones (nulos, rangos, formatos, unicidad y referencias de las peleas a luchadores y eventos) se ejecutan
+por columnas con DataValidator.validate_files, y el informe completo se guarda en JSON.
 """
+import argparse
+import json
 import sys
 import os
-import csv
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.core.config import Config
 from src.utils.validation import DataValidator
 
+TABLE_LABELS = {'fighter': 'Fighters', 'event': 'Events', 'fight': 'Fights'}
+
+
 def main():
     """
     Ejecuta la validación de los datos extraídos.
-    Valida los archivos de luchadores, eventos y peleas, mostrando el porcentaje de registros válidos.
+    Valida los archivos de luchadores, eventos y peleas, mostrando el porcentaje de registros válidos y las
+    comprobaciones fallidas. Termina con código 1 si alguna comprobación falla.
     """
     config = Config()
-    validator = DataValidator()
-    
-    # Validate fighters
-    print("Validating fighters data...")
-    try:
-        with open(config.data.fighters_path, 'r', encoding='utf-8') as f:
-            fighters = list(csv.DictReader(f))
-        
-        stats = validator.validate_dataset(fighters, 'fighter')
-        print(f"Fighters: {stats['valid']}/{stats['total']} valid ({stats['success_rate']:.1f}%)")
-    except FileNotFoundError:
-        print("Fighters file not found")
-    
-    # Validate events
-    print("\nValidating events data...")
-    try:
-        with open(config.data.events_path, 'r', encoding='utf-8') as f:
-            events = list(csv.DictReader(f))
-        
-        stats = validator.validate_dataset(events, 'event')
-        print(f"Events: {stats['valid']}/{stats['total']} valid ({stats['success_rate']:.1f}%)")
-    except FileNotFoundError:
-        print("Events file not found")
-    
-    # Validate fights
-    print("\nValidating fights data...")
-    try:
-        with open(config.data.fights_path, 'r', encoding='utf-8') as f:
-            fights = list(csv.DictReader(f))
-        
-        stats = validator.validate_dataset(fights, 'fight')
-        print(f"Fights: {stats['valid']}/{stats['total']} valid ({stats['success_rate']:.1f}%)")
-    except FileNotFoundError:
-        print("Fights file not found")
+    arg_parser = argparse.ArgumentParser(description='Validate the raw fighters, events and fights CSVs')
+    arg_parser.add_argument('--report', default=config.data.validation_report_path,
+                            help=f'JSON report path (default: {config.data.validation_report_path})')
+    arg_parser.add_argument('--json', action='store_true', help='Print the JSON report instead of the summary')
+    args = arg_parser.parse_args()
+
+    report = DataValidator.validate_files(config.data)
+    report.write_json(args.report)
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+        sys.exit(0 if report.ok else 1)
+
+    for table, label in TABLE_LABELS.items():
+        if table not in report.tables:
+            print(f"{label} file not found")
+            continue
+        stats = report.tables[table].stats()
+        print(f"{label}: {stats['valid']}/{stats['total']} valid ({stats['success_rate']:.1f}%)")
+    for check in report.failures:
+        print(f"  - {check.table} {check.check} {check.column}: {check.failed} rows (e.g. {check.values})")
+    print(f"\nValidated in {report.seconds:.3f}s, report written to {args.report}")
+    sys.exit(0 if report.ok else 1)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
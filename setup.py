@@ -16,6 +16,17 @@ setup(
         "pytest-mock>=3.8.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "parquet": [
+            "pyarrow>=10.0.0",
+            "pandas>=1.5.0",
+        ],
+        "transform": [
+            "pandas>=1.5.0",
+            "numpy>=1.21.0",
+        ],
         "dev": [
             "pytest-cov>=4.0.0",
             "black>=22.0.0",
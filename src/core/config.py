@@ -5,6 +5,18 @@ Define parámetros de scraping y rutas de datos, asegurando la correcta iniciali
 import os
 from dataclasses import dataclass
 from typing import Optional
+from .constants import (
+    BASE_URL, FIGHTERS_PATH, EVENTS_COMPLETED_PATH, EVENTS_UPCOMING_PATH, EVENT_PATH, FIGHTER_PATH, FIGHT_PATH
+)
+from .exceptions import ConfigurationError
+
+
+SCRAPING_ENGINES = ('threads', 'async')
+PARSER_BACKENDS = ('bs4', 'lxml')
+STORAGE_BACKENDS = ('csv', 'sqlite')
+ML_FORMATS = ('npy', 'parquet')
+ML_DTYPES = ('float64', 'float32')
+PAGE_SOURCES = ('network', 'archive')
 
 
 @dataclass
@@ -12,28 +24,146 @@ class ScrapingConfig:
     """
     Configuración de parámetros para el scraping de datos.
     Permite ajustar concurrencia, retardos, modo desarrollo y cabeceras HTTP.
+    El motor de descarga de detalles puede ser 'threads' (ThreadPoolExecutor) o 'async' (asyncio + aiohttp).
+    Todas las peticiones de red del proceso comparten un limitador de `requests_per_second` con ráfaga `burst`;
+    con `adaptive_concurrency` el número de peticiones en vuelo se ajusta por AIMD hasta `max_concurrency`.
+    Los errores transitorios se reintentan hasta `max_retries` veces con backoff exponencial, y un circuit breaker
+    por host corta las peticiones tras `breaker_threshold` fallos consecutivos durante `breaker_reset_seconds`.
+    El backend de parseo puede ser 'bs4' (BeautifulSoup, por defecto) o 'lxml' (XPath precompilado, más rápido).
+    Con `process_parsing` las páginas descargadas se parsean en un pool de `parse_workers` procesos (por defecto,
+    uno por núcleo), comunicado con los hilos de descarga mediante una cola acotada a `parse_queue_size` páginas.
+    Todas las URLs se construyen sobre `base_url` (por defecto, ufcstats.com o la variable UFC_ETL_BASE_URL), lo que
+    permite dirigir el pipeline completo a un servidor local como scripts/stub_server.py.
+    Con `page_source` 'archive' las páginas se leen del archivo de páginas crudas en lugar de la red (--reparse).
     """
     max_workers: int = 5
     delay_seconds: float = 3.0
     dev_mode: bool = False
     dev_limit: int = 20
     headers: dict = None
+    engine: str = 'threads'
+    async_concurrency: int = 50
+    request_timeout: float = 30.0
+    requests_per_second: float = 5.0
+    burst: int = 10
+    adaptive_concurrency: bool = False
+    max_concurrency: int = 32
+    latency_target: float = 2.0
+    max_retries: int = 3
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    breaker_threshold: int = 10
+    breaker_reset_seconds: float = 60.0
+    parser_backend: str = 'bs4'
+    process_parsing: bool = False
+    parse_workers: Optional[int] = None
+    parse_queue_size: int = 64
+    base_url: str = BASE_URL
+    page_source: str = 'network'
 
     def __post_init__(self):
+        self.base_url = self.base_url.rstrip('/')
+        if self.page_source not in PAGE_SOURCES:
+            raise ConfigurationError(
+                f"Unknown page source '{self.page_source}' (expected one of {', '.join(PAGE_SOURCES)})"
+            )
+        if self.engine not in SCRAPING_ENGINES:
+            raise ConfigurationError(
+                f"Unknown scraping engine '{self.engine}' (expected one of {', '.join(SCRAPING_ENGINES)})"
+            )
+        if self.parser_backend not in PARSER_BACKENDS:
+            raise ConfigurationError(
+                f"Unknown parser backend '{self.parser_backend}' (expected one of {', '.join(PARSER_BACKENDS)})"
+            )
         if self.headers is None:
             self.headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
 
+    @property
+    def pool_size(self) -> int:
+        """
+        Número de hilos de los pools de scraping.
+        En modo adaptativo se dimensiona al máximo permitido y es el limitador quien regula la concurrencia real.
+        """
+        return self.max_concurrency if self.adaptive_concurrency else self.max_workers
+
+    @property
+    def fighters_url(self) -> str:
+        """URL del listado de luchadores."""
+        return f"{self.base_url}{FIGHTERS_PATH}"
+
+    @property
+    def events_completed_url(self) -> str:
+        """URL del listado de eventos completados."""
+        return f"{self.base_url}{EVENTS_COMPLETED_PATH}"
+
+    @property
+    def events_upcoming_url(self) -> str:
+        """URL del listado de eventos próximos."""
+        return f"{self.base_url}{EVENTS_UPCOMING_PATH}"
+
+    @property
+    def event_url(self) -> str:
+        """Prefijo de las URLs de detalle de evento."""
+        return f"{self.base_url}{EVENT_PATH}"
+
+    @property
+    def fighter_url(self) -> str:
+        """Prefijo de las URLs de detalle de luchador."""
+        return f"{self.base_url}{FIGHTER_PATH}"
+
+    @property
+    def fight_url(self) -> str:
+        """Prefijo de las URLs de detalle de pelea."""
+        return f"{self.base_url}{FIGHT_PATH}"
+
 
 @dataclass
 class DataConfig:
     """
     Configuración de rutas para los datos utilizados y generados por el pipeline.
     Incluye rutas para datos crudos y de pruebas.
+    Con `write_parquet` los CSV crudos se exportan además a Parquet tipado al terminar la ejecución.
+    El almacenamiento `storage` puede ser 'csv' (por defecto) o 'sqlite', que mantiene las tablas en una base de datos
+    con upserts por clave y exporta los CSV desde ella.
+    Las métricas de cada ejecución se escriben en `metrics_dir` (por defecto, data/metrics), que puede apuntar al
+    directorio del textfile collector de node_exporter.
+    Con `archive_pages` cada página descargada se guarda comprimida en el archivo de páginas crudas
+    (data/raw/pages.sqlite), a partir del cual --reparse reconstruye los CSV sin red.
+    Con `parse_memo` se memorizan las filas parseadas de las páginas de detalle (data/raw/parsed.sqlite) y no se
+    vuelven a parsear las páginas cuyo contenido no ha cambiado desde la ejecución anterior.
+    Con `transform` el pipeline termina generando los CSV limpios de `processed_dir` (data/processed) y, con
+    `features`, las características y los ratings Elo/Glicko previos a cada pelea de `features_dir` (data/features).
+    Con `ml_dataset` se genera además el dataset simétrico de `ml_dir` (data/ml) en formato `ml_format` ('npy',
+    mapeado en memoria, o 'parquet') y tipo `ml_dtype` ('float64' o 'float32').
     """
     base_dir: str = 'data'
     test_dir: str = 'data/tests'
+    write_parquet: bool = False
+    storage: str = 'csv'
+    metrics_dir: Optional[str] = None
+    archive_pages: bool = True
+    parse_memo: bool = True
+    transform: bool = True
+    features: bool = True
+    ml_dataset: bool = True
+    ml_format: str = 'npy'
+    ml_dtype: str = 'float64'
+
+    def __post_init__(self):
+        if self.storage not in STORAGE_BACKENDS:
+            raise ConfigurationError(
+                f"Unknown storage backend '{self.storage}' (expected one of {', '.join(STORAGE_BACKENDS)})"
+            )
+        if self.ml_format not in ML_FORMATS:
+            raise ConfigurationError(
+                f"Unknown ML dataset format '{self.ml_format}' (expected one of {', '.join(ML_FORMATS)})"
+            )
+        if self.ml_dtype not in ML_DTYPES:
+            raise ConfigurationError(
+                f"Unknown ML dataset dtype '{self.ml_dtype}' (expected one of {', '.join(ML_DTYPES)})"
+            )
 
     @property
     def fighters_path(self) -> str:
@@ -50,19 +180,178 @@ class DataConfig:
         """Ruta al archivo CSV de peleas crudas."""
         return os.path.join(self.base_dir, 'raw','raw_fights.csv')
 
+    @property
+    def upcoming_events_path(self) -> str:
+        """Ruta al archivo CSV de eventos próximos."""
+        return os.path.join(self.base_dir, 'raw', 'raw_upcoming.csv')
+
+    @property
+    def upcoming_fights_path(self) -> str:
+        """Ruta al archivo CSV de peleas de eventos próximos."""
+        return os.path.join(self.base_dir, 'raw', 'raw_fights_upcoming.csv')
+
+    @property
+    def processed_dir(self) -> str:
+        """Directorio de los CSV limpios que genera la fase de transformación."""
+        return os.path.join(self.base_dir, 'processed')
+
+    @property
+    def processed_fighters_path(self) -> str:
+        """Ruta al archivo CSV de luchadores limpios."""
+        return os.path.join(self.processed_dir, 'fighters.csv')
+
+    @property
+    def processed_events_path(self) -> str:
+        """Ruta al archivo CSV de eventos limpios."""
+        return os.path.join(self.processed_dir, 'events.csv')
+
+    @property
+    def processed_upcoming_path(self) -> str:
+        """Ruta al archivo CSV de eventos próximos limpios."""
+        return os.path.join(self.processed_dir, 'upcoming.csv')
+
+    @property
+    def processed_fights_path(self) -> str:
+        """Ruta al archivo CSV de peleas limpias."""
+        return os.path.join(self.processed_dir, 'fights.csv')
+
+    @property
+    def features_dir(self) -> str:
+        """Directorio del almacén de características previas a cada pelea."""
+        return os.path.join(self.base_dir, 'features')
+
+    @property
+    def prefight_features_path(self) -> str:
+        """Ruta al archivo CSV de características previas a cada pelea."""
+        return os.path.join(self.features_dir, 'prefight.csv')
+
+    @property
+    def feature_state_path(self) -> str:
+        """Ruta al estado JSON de los acumuladores del almacén de características."""
+        return os.path.join(self.features_dir, 'state.json')
+
+    @property
+    def ratings_path(self) -> str:
+        """Ruta al archivo CSV de ratings previos a cada pelea."""
+        return os.path.join(self.features_dir, 'ratings.csv')
+
+    @property
+    def ratings_state_path(self) -> str:
+        """Ruta al estado (.npz) del motor de ratings."""
+        return os.path.join(self.features_dir, 'ratings_state.npz')
+
+    @property
+    def ml_dir(self) -> str:
+        """Directorio del dataset para Machine Learning."""
+        return os.path.join(self.base_dir, 'ml')
+
+    @property
+    def ml_dataset_path(self) -> str:
+        """Ruta al dataset simétrico (.npy o .parquet según `ml_format`)."""
+        return os.path.join(self.ml_dir, f'ml_dataset.{self.ml_format}')
+
+    @property
+    def ml_metadata_path(self) -> str:
+        """Ruta a la descripción JSON del dataset (columnas, peleas, fechas y categorías)."""
+        return os.path.join(self.ml_dir, 'ml_dataset.json')
+
+    @property
+    def failed_urls_path(self) -> str:
+        """Ruta al registro JSONL de peticiones fallidas pendientes de recuperar."""
+        return os.path.join(self.base_dir, 'raw', 'failed_urls.jsonl')
+
+    @property
+    def sqlite_path(self) -> str:
+        """Ruta a la base de datos SQLite del almacenamiento 'sqlite'."""
+        return os.path.join(self.base_dir, 'raw', 'ufc.sqlite')
+
+    @property
+    def archive_path(self) -> str:
+        """Ruta al archivo SQLite de páginas crudas comprimidas."""
+        return os.path.join(self.base_dir, 'raw', 'pages.sqlite')
+
+    @property
+    def parse_memo_path(self) -> str:
+        """Ruta a la base de datos SQLite de filas parseadas memorizadas."""
+        return os.path.join(self.base_dir, 'raw', 'parsed.sqlite')
+
+    @property
+    def metrics_report_path(self) -> str:
+        """Ruta al informe JSON de métricas de la última ejecución."""
+        return os.path.join(self.metrics_dir or os.path.join(self.base_dir, 'metrics'), 'run_report.json')
+
+    @property
+    def metrics_textfile_path(self) -> str:
+        """Ruta al fichero de métricas en formato de texto de Prometheus (textfile collector)."""
+        return os.path.join(self.metrics_dir or os.path.join(self.base_dir, 'metrics'), 'ufc_etl.prom')
+
+    @property
+    def validation_report_path(self) -> str:
+        """Ruta al informe JSON de la última validación de los CSV crudos (scripts/validate_date.py)."""
+        return os.path.join(self.metrics_dir or os.path.join(self.base_dir, 'metrics'), 'validation_report.json')
+
+    @property
+    def profiles_dir(self) -> str:
+        """Directorio de los perfiles por fase del modo --profile."""
+        return os.path.join(self.base_dir, 'profiles')
+
+    @property
+    def checkpoints_dir(self) -> str:
+        """Directorio del journal de checkpoints que permite reanudar una ejecución interrumpida (--resume)."""
+        return os.path.join(self.base_dir, 'raw', 'checkpoints')
+
+
+@dataclass
+class CacheConfig:
+    """
+    Configuración de la caché HTTP persistente en disco.
+    Permite activarla o desactivarla, elegir su directorio y fijar el presupuesto máximo de disco.
+    """
+    enabled: bool = True
+    directory: str = os.path.join('data', 'cache', 'http')
+    max_bytes: int = 2 * 1024 ** 3
+
 
 class Config:
     """
     Clase principal de configuración del sistema.
     Inicializa y agrupa la configuración de scraping y de rutas de datos.
     Garantiza la existencia de los directorios necesarios para la operación del pipeline.
+    Con `reparse` las páginas se leen del archivo de páginas crudas, sin red, caché ni límite de tasa, y se
+    parsean todas de nuevo (sin memoria de filas parseadas) en un pool de procesos con todos los núcleos.
     """
-    def __init__(self, dev_mode: Optional[bool] = None, dev_limit: Optional[int] = None):
+    def __init__(self, dev_mode: Optional[bool] = None, dev_limit: Optional[int] = None,
+                 use_cache: Optional[bool] = None, engine: Optional[str] = None,
+                 requests_per_second: Optional[float] = None, adaptive: Optional[bool] = None,
+                 parser_backend: Optional[str] = None, process_parsing: Optional[bool] = None,
+                 parse_workers: Optional[int] = None, parquet: Optional[bool] = None,
+                 storage: Optional[str] = None, metrics_dir: Optional[str] = None,
+                 base_url: Optional[str] = None, archive: Optional[bool] = None, reparse: Optional[bool] = None,
+                 parse_memo: Optional[bool] = None, transform: Optional[bool] = None,
+                 features: Optional[bool] = None, ml_dataset: Optional[bool] = None,
+                 ml_format: Optional[str] = None, ml_float32: bool = False):
         self.scraping = ScrapingConfig(
             dev_mode=dev_mode or False,
-            dev_limit=dev_limit or 20
+            dev_limit=dev_limit or 20,
+            engine='threads' if reparse else engine or 'threads',
+            requests_per_second=0 if reparse else 5.0 if requests_per_second is None else requests_per_second,
+            adaptive_concurrency=adaptive or False,
+            parser_backend=parser_backend or 'bs4',
+            process_parsing=process_parsing or reparse or False,
+            parse_workers=parse_workers,
+            base_url=base_url or BASE_URL,
+            page_source='archive' if reparse else 'network'
         )
-        self.data = DataConfig()
+        if reparse:
+            self.scraping.delay_seconds = 0
+        self.data = DataConfig(write_parquet=parquet or False, storage=storage or 'csv', metrics_dir=metrics_dir,
+                               archive_pages=False if reparse else True if archive is None else archive,
+                               parse_memo=False if reparse else True if parse_memo is None else parse_memo,
+                               transform=True if transform is None else transform,
+                               features=True if features is None else features,
+                               ml_dataset=True if ml_dataset is None else ml_dataset,
+                               ml_format=ml_format or 'npy', ml_dtype='float32' if ml_float32 else 'float64')
+        self.cache = CacheConfig(enabled=False if reparse else True if use_cache is None else use_cache)
         # Asegura que los directorios requeridos existan
         os.makedirs(self.data.base_dir, exist_ok=True)
         os.makedirs(os.path.join(self.data.base_dir, 'raw'), exist_ok=True)
@@ -4,14 +4,23 @@ Incluye URLs base, campos de datos y otros valores fijos utilizados en el pipeli
 Facilita la centralización y el mantenimiento de valores estáticos.
 """
 
+import os
+
  # URLs base para el scraping de datos
-BASE_URL = "http://ufcstats.com"
-FIGHTERS_URL = f"{BASE_URL}/statistics/fighters"
-EVENTS_COMPLETED_URL = f"{BASE_URL}/statistics/events/completed"
-EVENTS_UPCOMING_URL = f"{BASE_URL}/statistics/events/upcoming"
-EVENT_URL = f"{BASE_URL}/event-details"
-FIGHTER_URL = f"{BASE_URL}/fighter-details"
-FIGHT_URL = f"{BASE_URL}/fight-details"
+ # UFC_ETL_BASE_URL permite apuntar el pipeline a otro servidor (por ejemplo, scripts/stub_server.py)
+BASE_URL = os.environ.get('UFC_ETL_BASE_URL', "http://ufcstats.com").rstrip('/')
+FIGHTERS_PATH = "/statistics/fighters"
+EVENTS_COMPLETED_PATH = "/statistics/events/completed"
+EVENTS_UPCOMING_PATH = "/statistics/events/upcoming"
+EVENT_PATH = "/event-details"
+FIGHTER_PATH = "/fighter-details"
+FIGHT_PATH = "/fight-details"
+FIGHTERS_URL = f"{BASE_URL}{FIGHTERS_PATH}"
+EVENTS_COMPLETED_URL = f"{BASE_URL}{EVENTS_COMPLETED_PATH}"
+EVENTS_UPCOMING_URL = f"{BASE_URL}{EVENTS_UPCOMING_PATH}"
+EVENT_URL = f"{BASE_URL}{EVENT_PATH}"
+FIGHTER_URL = f"{BASE_URL}{FIGHTER_PATH}"
+FIGHT_URL = f"{BASE_URL}{FIGHT_PATH}"
 
  # Campos de datos esperados para cada entidad
 FIGHTER_FIELDS = [
@@ -20,6 +20,26 @@ class ScrapingError(UFCScraperError):
     pass
 
 
+class FetchError(ScrapingError):
+    """
+    Se lanza cuando una petición HTTP falla.
+    Conserva el código de estado (None si no hubo respuesta) y la espera solicitada por el servidor,
+    para que la política de reintentos decida si el fallo es transitorio.
+    """
+    def __init__(self, message: str, status: int = None, retry_after: float = None, timed_out: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+        self.timed_out = timed_out
+
+
+class CircuitOpenError(ScrapingError):
+    """
+    Se lanza cuando el circuit breaker de un host está abierto y la petición no llega a enviarse.
+    """
+    pass
+
+
 class ParsingError(UFCScraperError):
     """
     Se lanza cuando ocurre un error al parsear datos extraídos.
@@ -1,37 +1,26 @@
 """
 Modelo de datos para eventos (Event) en el pipeline UFC ETL.
-Define los atributos principales de un evento y métodos para su serialización y deserialización.
+Define los atributos principales de un evento como un registro compacto con __slots__ y la fecha ya convertida.
 """
-from dataclasses import dataclass
+from datetime import date
 from typing import Optional
+from .record import Record, Text, Date
 
 
-@dataclass
-class Event:
+class Event(Record):
     """
     Modelo de datos para un evento.
-    Incluye información básica de eventos de UFC, permitiendo su manejo estructurado.
+    Incluye información básica de eventos de UFC; la fecha se guarda como `datetime.date`.
     """
+    COLUMNS = (
+        ('event_id', Text()),
+        ('name', Text()),
+        ('date', Date('%B %d, %Y')),
+        ('location', Text()),
+    )
+    __slots__ = Record.slots_for(COLUMNS)
+
     event_id: str
-    name: str
-    date: Optional[str] = None
-    location: Optional[str] = None
-    
-    def to_dict(self) -> dict:
-        """
-        Convierte la instancia del evento a un diccionario, excluyendo los atributos con valor None.
-        Returns:
-            dict: Representación en diccionario del evento.
-        """
-        return {k: v for k, v in self.__dict__.items() if v is not None}
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'Event':
-        """
-        Crea una instancia de Event a partir de un diccionario, utilizando solo las claves válidas.
-        Args:
-            data (dict): Diccionario con los datos del evento.
-        Returns:
-            Event: Instancia creada a partir del diccionario.
-        """
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
\ No newline at end of file
+    name: Optional[str]
+    date: Optional[date]
+    location: Optional[str]
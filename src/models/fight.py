@@ -1,79 +1,111 @@
 """
 Modelo de datos para peleas (Fight) en el pipeline UFC ETL.
-Incluye atributos de identificación, detalles, estadísticas y métodos de serialización/deserialización.
+Incluye atributos de identificación, detalles y estadísticas de la pelea en un registro compacto con __slots__.
+Los pares 'acertados of intentados' se guardan en dos enteros (`<columna>_landed`, `<columna>_attempted`)
+y los tiempos en segundos.
 """
-from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
+from .record import Record, Text, Int, Pair, Clock, Tags
 
 
-@dataclass
-class Fight:
+class Fight(Record):
     """
     Modelo de datos para una pelea.
-    Incluye información básica, detalles y estadísticas de la pelea, permitiendo su manejo estructurado.
+    Incluye información básica, detalles y estadísticas de la pelea ya convertidos a tipos numéricos.
     """
+    COLUMNS = (
+        ('event_id', Text()),
+        ('fight_id', Text()),
+        ('fight_order', Int()),
+        # Fighters
+        ('red_id', Text()),
+        ('red_name', Text()),
+        ('blue_id', Text()),
+        ('blue_name', Text()),
+        ('winner_id', Text()),
+        # Fight details
+        ('weight_class', Text()),
+        ('referee', Text()),
+        ('round', Int()),
+        ('time', Clock()),
+        ('time_format', Text()),
+        ('method', Text()),
+        ('details', Text()),
+        ('bonus', Tags()),
+        # Statistics
+        ('kd1', Int()),
+        ('kd2', Int()),
+        ('str1', Pair()),
+        ('str2', Pair()),
+        ('td1', Pair()),
+        ('td2', Pair()),
+        ('sub1', Int()),
+        ('sub2', Int()),
+        # Extended stats
+        ('control_time1', Clock()),
+        ('control_time2', Clock()),
+        ('sig_head1', Pair()),
+        ('sig_head2', Pair()),
+        ('sig_body1', Pair()),
+        ('sig_body2', Pair()),
+        ('sig_leg1', Pair()),
+        ('sig_leg2', Pair()),
+        ('total_str1', Pair()),
+        ('total_str2', Pair()),
+        ('pass1', Int()),
+        ('pass2', Int()),
+        ('rev1', Int()),
+        ('rev2', Int()),
+    )
+    __slots__ = Record.slots_for(COLUMNS)
+
     event_id: str
     fight_id: str
-    fight_order: Optional[int] = None
-    
-    # Fighters
-    red_id: Optional[str] = None
-    red_name: Optional[str] = None
-    blue_id: Optional[str] = None
-    blue_name: Optional[str] = None
-    winner_id: Optional[str] = None
-    
-    # Fight details
-    weight_class: Optional[str] = None
-    referee: Optional[str] = None
-    round: Optional[str] = None
-    time: Optional[str] = None
-    time_format: Optional[str] = None
-    method: Optional[str] = None
-    details: Optional[str] = None
-    bonus: Optional[list[str]] = None
-    
-    # Statistics
-    kd1: str = '0'
-    kd2: str = '0'
-    str1: str = '0'
-    str2: str = '0'
-    td1: str = '0'
-    td2: str = '0'
-    sub1: str = '0'
-    sub2: str = '0'
-    
-    # Extended stats
-    control_time1: Optional[str] = None
-    control_time2: Optional[str] = None
-    sig_head1: Optional[str] = None
-    sig_head2: Optional[str] = None
-    sig_body1: Optional[str] = None
-    sig_body2: Optional[str] = None
-    sig_leg1: Optional[str] = None
-    sig_leg2: Optional[str] = None
-    total_str1: Optional[str] = None
-    total_str2: Optional[str] = None
-    pass1: Optional[str] = None
-    pass2: Optional[str] = None
-    rev1: Optional[str] = None
-    rev2: Optional[str] = None
-    
-    def to_dict(self) -> dict:
-        """
-        Convierte la instancia de la pelea a un diccionario, incluyendo todos los atributos.
-        Returns:
-            dict: Representación en diccionario de la pelea.
-        """
-        return self.__dict__
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'Fight':
-        """
-        Crea una instancia de Fight a partir de un diccionario, utilizando solo las claves válidas.
-        Args:
-            data (dict): Diccionario con los datos de la pelea.
-        Returns:
-            Fight: Instancia creada a partir del diccionario.
-        """
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
\ No newline at end of file
+    fight_order: Optional[int]
+    red_id: Optional[str]
+    red_name: Optional[str]
+    blue_id: Optional[str]
+    blue_name: Optional[str]
+    winner_id: Optional[str]
+    weight_class: Optional[str]
+    referee: Optional[str]
+    round: Optional[int]
+    time: Optional[int]
+    time_format: Optional[str]
+    method: Optional[str]
+    details: Optional[str]
+    bonus: Optional[List[str]]
+    kd1: Optional[int]
+    kd2: Optional[int]
+    str1_landed: Optional[int]
+    str1_attempted: Optional[int]
+    str2_landed: Optional[int]
+    str2_attempted: Optional[int]
+    td1_landed: Optional[int]
+    td1_attempted: Optional[int]
+    td2_landed: Optional[int]
+    td2_attempted: Optional[int]
+    sub1: Optional[int]
+    sub2: Optional[int]
+    control_time1: Optional[int]
+    control_time2: Optional[int]
+    sig_head1_landed: Optional[int]
+    sig_head1_attempted: Optional[int]
+    sig_head2_landed: Optional[int]
+    sig_head2_attempted: Optional[int]
+    sig_body1_landed: Optional[int]
+    sig_body1_attempted: Optional[int]
+    sig_body2_landed: Optional[int]
+    sig_body2_attempted: Optional[int]
+    sig_leg1_landed: Optional[int]
+    sig_leg1_attempted: Optional[int]
+    sig_leg2_landed: Optional[int]
+    sig_leg2_attempted: Optional[int]
+    total_str1_landed: Optional[int]
+    total_str1_attempted: Optional[int]
+    total_str2_landed: Optional[int]
+    total_str2_attempted: Optional[int]
+    pass1: Optional[int]
+    pass2: Optional[int]
+    rev1: Optional[int]
+    rev2: Optional[int]
@@ -1,56 +1,62 @@
 """
 Modelo de datos para luchadores (Fighter) en el pipeline UFC ETL.
-Define los atributos principales y detallados de un luchador, permitiendo su serialización y deserialización.
+Define los atributos principales y detallados de un luchador como un registro compacto con __slots__,
+con medidas, récord y estadísticas convertidos a tipos numéricos.
 """
-from dataclasses import dataclass
+from datetime import date
 from typing import Optional
+from .record import Record, Text, Int, Float, Percent, Height, Weight, Reach, Date, Bool
 
 
-@dataclass
-class Fighter:
+class Fighter(Record):
     """
     Modelo de datos para un luchador.
-    Incluye información básica y estadísticas detalladas, facilitando el manejo estructurado de los datos de luchadores.
+    La altura y el alcance se guardan en pulgadas, el peso en libras y los porcentajes como fracción (0.62).
     """
+    COLUMNS = (
+        ('fighter_id', Text()),
+        ('first', Text()),
+        ('last', Text()),
+        ('nickname', Text()),
+        ('height', Height()),
+        ('weight', Weight()),
+        ('reach', Reach()),
+        ('stance', Text()),
+        ('wins', Int()),
+        ('defeats', Int()),
+        ('draws', Int()),
+        ('belt', Bool()),
+        # Detailed stats
+        ('dob', Date('%b %d, %Y')),
+        ('slpm', Float()),
+        ('str_acc', Percent()),
+        ('sapm', Float()),
+        ('str_def', Percent()),
+        ('td_avg', Float()),
+        ('td_acc', Percent()),
+        ('td_def', Percent()),
+        ('sub_avg', Float()),
+    )
+    __slots__ = Record.slots_for(COLUMNS)
+
     fighter_id: str
-    first: Optional[str] = None
-    last: Optional[str] = None
-    nickname: Optional[str] = None
-    height: Optional[str] = None
-    weight: Optional[str] = None
-    reach: Optional[str] = None
-    stance: Optional[str] = None
-    wins: Optional[str] = None
-    defeats: Optional[str] = None
-    draws: Optional[str] = None
-    belt: Optional[bool] = None
-    
-    # Detailed stats
-    dob: Optional[str] = None
-    slpm: Optional[str] = None
-    str_acc: Optional[str] = None
-    sapm: Optional[str] = None
-    str_def: Optional[str] = None
-    td_avg: Optional[str] = None
-    td_acc: Optional[str] = None
-    td_def: Optional[str] = None
-    sub_avg: Optional[str] = None
-    
-    def to_dict(self) -> dict:
-        """
-        Convierte la instancia del luchador a un diccionario, excluyendo los atributos con valor None.
-        Returns:
-            dict: Representación en diccionario del luchador.
-        """
-        return {k: v for k, v in self.__dict__.items() if v is not None}
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'Fighter':
-        """
-        Crea una instancia de Fighter a partir de un diccionario, utilizando solo las claves válidas.
-        Args:
-            data (dict): Diccionario con los datos del luchador.
-        Returns:
-            Fighter: Instancia creada a partir del diccionario.
-        """
-        return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
\ No newline at end of file
+    first: Optional[str]
+    last: Optional[str]
+    nickname: Optional[str]
+    height: Optional[int]
+    weight: Optional[int]
+    reach: Optional[float]
+    stance: Optional[str]
+    wins: Optional[int]
+    defeats: Optional[int]
+    draws: Optional[int]
+    belt: Optional[bool]
+    dob: Optional[date]
+    slpm: Optional[float]
+    str_acc: Optional[float]
+    sapm: Optional[float]
+    str_def: Optional[float]
+    td_avg: Optional[float]
+    td_acc: Optional[float]
+    td_def: Optional[float]
+    sub_avg: Optional[float]
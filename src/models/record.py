@@ -0,0 +1,309 @@
+"""
+Base de los registros tipados y compactos del pipeline UFC ETL.
+Cada registro guarda sus valores en __slots__ ya convertidos a tipos nativos (enteros, float, fechas, segundos,
+pares acertados/intentados), sin un diccionario por instancia. Se construye desde una fila cruda de los parsers o
+los CSV con from_row() y se serializa de vuelta al formato de los CSV con to_row().
+Los registros se comportan además como un Mapping de solo lectura sobre las columnas del CSV, de modo que el
+código que trabaja con filas (CSVManager, merge_by_key, `{**fila}`...) los acepta sin cambios.
+"""
+import ast
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+def _blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and value.strip() in ('', '--'))
+
+
+class Codec(ABC):
+    """
+    Conversión entre el valor crudo de una columna y los valores tipados de sus slots.
+    """
+
+    def slots(self, name: str) -> Tuple[str, ...]:
+        return (name,)
+
+    @abstractmethod
+    def parse(self, raw: Any) -> tuple:
+        """Convierte el valor crudo en la tupla de valores de los slots."""
+        pass
+
+    @abstractmethod
+    def format(self, values: tuple) -> Any:
+        """Convierte los valores de los slots de vuelta al formato del CSV."""
+        pass
+
+
+class Text(Codec):
+    """Texto libre; las cadenas vacías se guardan como None."""
+
+    def parse(self, raw):
+        return (None if _blank(raw) else str(raw),)
+
+    def format(self, values):
+        return values[0]
+
+
+class Int(Codec):
+    """Contadores enteros ('3' -> 3)."""
+
+    def parse(self, raw):
+        if _blank(raw):
+            return (None,)
+        try:
+            return (int(float(raw)),)
+        except (TypeError, ValueError):
+            return (None,)
+
+    def format(self, values):
+        return values[0]
+
+
+class Float(Codec):
+    """Estadísticas decimales ('5.13' -> 5.13)."""
+
+    def parse(self, raw):
+        if _blank(raw):
+            return (None,)
+        try:
+            return (float(raw),)
+        except (TypeError, ValueError):
+            return (None,)
+
+    def format(self, values):
+        return values[0]
+
+
+class Percent(Codec):
+    """Porcentajes como fracción ('62%' -> 0.62)."""
+
+    def parse(self, raw):
+        if _blank(raw):
+            return (None,)
+        try:
+            return (float(str(raw).rstrip('%')) / 100,)
+        except ValueError:
+            return (None,)
+
+    def format(self, values):
+        return None if values[0] is None else f"{round(values[0] * 100, 4):g}%"
+
+
+class Pair(Codec):
+    """Golpes acertados de intentados ('16 of 19' -> 16, 19); un único número no tiene intentos."""
+
+    def slots(self, name):
+        return (f"{name}_landed", f"{name}_attempted")
+
+    def parse(self, raw):
+        if _blank(raw):
+            return (None, None)
+        parts = str(raw).split(' of ')
+        try:
+            if len(parts) == 2:
+                return (int(parts[0]), int(parts[1]))
+            return (int(parts[0]), None)
+        except ValueError:
+            return (None, None)
+
+    def format(self, values):
+        landed, attempted = values
+        if landed is None:
+            return None
+        return str(landed) if attempted is None else f"{landed} of {attempted}"
+
+
+class Clock(Codec):
+    """Tiempos 'm:ss' en segundos ('3:26' -> 206)."""
+
+    def parse(self, raw):
+        if _blank(raw):
+            return (None,)
+        minutes, _, seconds = str(raw).strip().partition(':')
+        try:
+            return (int(minutes) * 60 + int(seconds or 0),)
+        except ValueError:
+            return (None,)
+
+    def format(self, values):
+        return None if values[0] is None else f"{values[0] // 60}:{values[0] % 60:02d}"
+
+
+class Height(Codec):
+    """Altura en pulgadas ('5\\' 11"' -> 71)."""
+
+    def parse(self, raw):
+        if _blank(raw):
+            return (None,)
+        feet, _, inches = str(raw).partition("'")
+        try:
+            return (int(feet) * 12 + int(inches.strip().rstrip('"') or 0),)
+        except ValueError:
+            return (None,)
+
+    def format(self, values):
+        return None if values[0] is None else f"{values[0] // 12}' {values[0] % 12}\""
+
+
+class Weight(Codec):
+    """Peso en libras ('155 lbs.' -> 155)."""
+
+    def parse(self, raw):
+        if _blank(raw):
+            return (None,)
+        try:
+            return (int(float(str(raw).split()[0])),)
+        except (ValueError, IndexError):
+            return (None,)
+
+    def format(self, values):
+        return None if values[0] is None else f"{values[0]} lbs."
+
+
+class Reach(Codec):
+    """Alcance en pulgadas ('72.0"' -> 72.0)."""
+
+    def parse(self, raw):
+        if _blank(raw):
+            return (None,)
+        try:
+            return (float(str(raw).rstrip('"')),)
+        except ValueError:
+            return (None,)
+
+    def format(self, values):
+        return None if values[0] is None else f"{values[0]:.1f}\""
+
+
+class Date(Codec):
+    """Fechas con el formato de ufcstats indicado."""
+
+    def __init__(self, fmt: str):
+        self.fmt = fmt
+
+    def parse(self, raw):
+        if _blank(raw):
+            return (None,)
+        if isinstance(raw, date):
+            return (raw,)
+        for fmt in (self.fmt, '%Y-%m-%d'):
+            try:
+                return (datetime.strptime(str(raw).strip(), fmt).date(),)
+            except ValueError:
+                continue
+        return (None,)
+
+    def format(self, values):
+        return None if values[0] is None else values[0].strftime(self.fmt)
+
+
+class Bool(Codec):
+    """Indicadores booleanos (True, 'True', 'False')."""
+
+    def parse(self, raw):
+        if _blank(raw):
+            return (None,)
+        if isinstance(raw, bool):
+            return (raw,)
+        return (str(raw).strip().lower() == 'true',)
+
+    def format(self, values):
+        return values[0]
+
+
+class Tags(Codec):
+    """Listas de etiquetas (bonus); acepta la representación en texto que queda en los CSV."""
+
+    def parse(self, raw):
+        if _blank(raw):
+            return (None,)
+        if isinstance(raw, str):
+            try:
+                raw = ast.literal_eval(raw)
+            except (ValueError, SyntaxError):
+                return ([raw],)
+        return (list(raw) if isinstance(raw, (list, tuple)) else [raw],)
+
+    def format(self, values):
+        return values[0]
+
+
+class Record(Mapping):
+    """
+    Base de los registros con __slots__. Las subclases declaran COLUMNS como pares (columna del CSV, Codec)
+    en el orden de sus campos en src/core/constants.py; los slots se derivan de las columnas.
+    """
+    __slots__ = ()
+    COLUMNS: Tuple[Tuple[str, Codec], ...] = ()
+    _LAYOUT: Tuple[Tuple[str, Codec, Tuple[str, ...]], ...] = ()
+    _BY_COLUMN: Dict[str, Tuple[Codec, Tuple[str, ...]]] = {}
+
+    @staticmethod
+    def slots_for(columns: Tuple[Tuple[str, Codec], ...]) -> Tuple[str, ...]:
+        """Nombres de los slots de una lista de columnas."""
+        return tuple(slot for name, codec in columns for slot in codec.slots(name))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._LAYOUT = tuple((name, codec, codec.slots(name)) for name, codec in cls.COLUMNS)
+        cls._BY_COLUMN = {name: (codec, slots) for name, codec, slots in cls._LAYOUT}
+
+    def __init__(self, **values: Any):
+        for slot in self.__slots__:
+            setattr(self, slot, values.get(slot))
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'Record':
+        """
+        Crea un registro a partir de una fila cruda (parser o CSV), convirtiendo cada columna a su tipo.
+        Las columnas ausentes o no convertibles quedan como None.
+        """
+        record = cls.__new__(cls)
+        get = row.get
+        for name, codec, slots in cls._LAYOUT:
+            for slot, value in zip(slots, codec.parse(get(name))):
+                setattr(record, slot, value)
+        return record
+
+    def to_row(self) -> Dict[str, Any]:
+        """
+        Serializa el registro con las columnas y el formato de los CSV crudos.
+        """
+        return {name: codec.format(tuple(getattr(self, slot) for slot in slots))
+                for name, codec, slots in self._LAYOUT}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Devuelve los valores tipados de los slots, excluyendo los que son None.
+        """
+        values = {slot: getattr(self, slot) for slot in self.__slots__}
+        return {k: v for k, v in values.items() if v is not None}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Record':
+        """
+        Crea un registro a partir de valores ya tipados, utilizando solo las claves válidas.
+        """
+        return cls(**{k: v for k, v in data.items() if k in cls.__slots__})
+
+    def __getitem__(self, column: str) -> Any:
+        codec, slots = self._BY_COLUMN[column]
+        return codec.format(tuple(getattr(self, slot) for slot in slots))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._BY_COLUMN)
+
+    def __len__(self) -> int:
+        return len(self._LAYOUT)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__
+                           if getattr(self, slot) is not None)
+        return f"{type(self).__name__}({values})"
+
+
+def records_from_rows(record_cls: type, rows: List[Dict[str, Any]]) -> List[Record]:
+    """Convierte una lista de filas crudas en registros de `record_cls`."""
+    return [record_cls.from_row(row) for row in rows]
@@ -0,0 +1,272 @@
+"""
+Constructor del dataset simétrico para Machine Learning del pipeline UFC ETL.
+La sección 10 del notebook 04_fights_cleaning unía los luchadores a las peleas con dos pd.merge, renombraba columnas
+por sufijo y construía las perspectivas roja y azul con búsquedas en los nombres de columna (col.endswith('_red'))
+y un pd.concat, copiando el DataFrame completo varias veces. Aquí cada luchador se codifica con su posición en la
+tabla de luchadores (Index.get_indexer) y sus atributos se recogen con gathers de NumPy sobre una única matriz de
+salida preasignada: las filas [0, n) son la perspectiva de la esquina roja (A = rojo, B = azul) y las filas [n, 2n)
+la de la azul, escritas en la misma pasada. La matriz puede ser float32 y escribirse como .npy mapeado en memoria
+(se rellena directamente sobre el fichero) o como Parquet.
+Solo se incluyen datos conocidos antes de la pelea: atributos físicos, guardia y edad del luchador el día de la
+pelea, la categoría de peso, y las características y ratings previos de data/features. Las estadísticas de la
+propia pelea y las medias de carrera actuales que usaba el notebook filtran el resultado y no se incluyen.
+Requiere pandas (pip install -e .[transform]); la salida Parquet requiere además pyarrow.
+"""
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from ..core.config import ML_DTYPES
+from ..core.exceptions import ConfigurationError
+from ..utils.metrics import get_metrics
+from .features import chronological_fights
+from .transform import _require_pandas
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pandas solo es necesario para las fases de transformación y características
+    np = None
+    pd = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow solo es necesario para la salida Parquet
+    pa = None
+    pq = None
+
+
+FIGHTER_COLUMNS = ('height', 'weight', 'reach')
+FIGHTER_CATEGORIES = ('stance',)
+FIGHT_CATEGORIES = ('weight_class',)
+DAYS_PER_YEAR = 365.25
+
+EPOCH = pd.Timestamp(0) if pd is not None else None
+
+Gather = Callable[[], Tuple['np.ndarray', 'np.ndarray']]
+Block = Tuple[List[str], Gather]
+
+
+@dataclass
+class SymmetricDataset:
+    """
+    Dataset simétrico: la fila i y la fila n + i son la misma pelea vista desde la esquina roja y desde la azul.
+    Attributes:
+        values: Matriz (2n, columnas), en memoria o mapeada sobre un fichero .npy.
+        columns: Nombre de cada columna de `values`.
+        fight_ids, dates: Pelea y fecha (ISO) de las filas i y n + i.
+        categories: Categorías de cada columna codificada (<columna>_code es la posición en la lista, o nulo).
+    """
+    values: 'np.ndarray'
+    columns: List[str]
+    fight_ids: List[str]
+    dates: List[str]
+    categories: Dict[str, List[str]] = field(default_factory=dict)
+
+    def metadata(self) -> Dict[str, object]:
+        """Descripción JSON del dataset, que acompaña a la matriz .npy."""
+        return {'columns': self.columns, 'dtype': str(self.values.dtype), 'rows': len(self.values),
+                'fight_ids': self.fight_ids, 'dates': self.dates, 'categories': self.categories}
+
+
+def _gather_table(values: 'np.ndarray') -> 'np.ndarray':
+    """Añade una fila de nulos al final: el índice -1 de get_indexer (sin correspondencia) la selecciona."""
+    values = values.reshape(len(values), -1).astype(float)
+    return np.vstack([values, np.full((1, values.shape[1]), np.nan)])
+
+
+def _codes(values: 'pd.Series') -> Tuple['np.ndarray', List[str]]:
+    """Códigos (float, nulo si falta el valor) sobre las categorías ordenadas de una columna de texto."""
+    categorical = pd.Categorical(values)
+    codes = categorical.codes.astype(float)
+    codes[codes < 0] = np.nan
+    return codes, [str(c) for c in categorical.categories]
+
+
+def corner_columns(frame: 'pd.DataFrame') -> List[str]:
+    """Columnas numéricas con valor por esquina de una tabla por pelea (red_<x> y blue_<x>), sin los ids."""
+    numeric = set(frame.select_dtypes('number').columns)
+    return [c[len('red_'):] for c in frame.columns
+            if c.startswith('red_') and c in numeric and f"blue_{c[len('red_'):]}" in numeric]
+
+
+class SymmetricDatasetBuilder:
+    """
+    Construye el dataset simétrico a partir de las peleas, luchadores y eventos limpios, y opcionalmente de tablas
+    por pelea con columnas red_<x>/blue_<x> (características y ratings previos).
+    Args:
+        fighter_columns: Columnas numéricas de luchadores que se recogen para cada esquina.
+        fighter_categories: Columnas de texto de luchadores que se recogen codificadas.
+        fight_categories: Columnas de texto de la pelea, comunes a ambas perspectivas, que se codifican.
+        fight_corner_columns: Pares (columna roja, columna azul, nombre) de la tabla de peleas.
+        age (bool): Incluye la edad de cada luchador el día de la pelea.
+        dtype (str): 'float64' o 'float32'.
+    Las columnas de salida son target (1 si ganó el luchador A), is_red_corner, las comunes y <nombre>_A, <nombre>_B.
+    Solo se incluyen las peleas con ganador, en orden cronológico.
+    """
+
+    def __init__(self, fighter_columns: Sequence[str] = FIGHTER_COLUMNS,
+                 fighter_categories: Sequence[str] = FIGHTER_CATEGORIES,
+                 fight_categories: Sequence[str] = FIGHT_CATEGORIES,
+                 fight_corner_columns: Sequence[Tuple[str, str, str]] = (), age: bool = True,
+                 dtype: str = 'float64'):
+        _require_pandas()
+        if dtype not in ML_DTYPES:
+            raise ConfigurationError(f"Unknown dataset dtype '{dtype}' (expected one of {', '.join(ML_DTYPES)})")
+        self.fighter_columns = list(fighter_columns)
+        self.fighter_categories = list(fighter_categories)
+        self.fight_categories = list(fight_categories)
+        self.fight_corner_columns = list(fight_corner_columns)
+        self.age = age
+        self.dtype = np.dtype(dtype)
+
+    def build(self, fights: 'pd.DataFrame', fighters: 'pd.DataFrame', events: 'pd.DataFrame',
+              corner_frames: Sequence['pd.DataFrame'] = (),
+              allocate: Optional[Callable[[Tuple[int, int], 'np.dtype'], 'np.ndarray']] = None) -> SymmetricDataset:
+        """
+        Construye el dataset.
+        Args:
+            fights, events: Peleas y eventos limpios (data/processed).
+            fighters: Luchadores limpios indexados por fighter_id.
+            corner_frames: Tablas por pelea con fight_id y columnas red_<x>/blue_<x>.
+            allocate: Reserva la matriz de salida dada su forma y tipo (por defecto np.empty); permite rellenar
+                directamente un .npy mapeado en memoria.
+        """
+        # Solo se ordenan y filtran las columnas que se usan, no la tabla de peleas completa
+        needed = ['event_id', 'fight_id', 'fight_order', 'red_id', 'blue_id', 'winner_id'] + self.fight_categories
+        needed += [c for red, blue, _ in self.fight_corner_columns for c in (red, blue)]
+        ordered = chronological_fights(fights[needed], events)
+        ordered = ordered[(ordered['winner_id'] == ordered['red_id']) | (ordered['winner_id'] == ordered['blue_id'])]
+        red_won = (ordered['winner_id'] == ordered['red_id']).to_numpy()
+        n = len(ordered)
+
+        fighters = fighters[~fighters.index.duplicated(keep='first')]
+        red = fighters.index.get_indexer(ordered['red_id'])
+        blue = fighters.index.get_indexer(ordered['blue_id'])
+        categories: Dict[str, List[str]] = {}
+        shared = []
+        for column in self.fight_categories:
+            codes, categories[column] = _codes(ordered[column])
+            shared.append((f'{column}_code', codes))
+
+        blocks = list(self._corner_blocks(ordered, fighters, red, blue, corner_frames, categories))
+        corner = [name for names, _ in blocks for name in names]
+        columns = (['target', 'is_red_corner'] + [name for name, _ in shared]
+                   + [f'{name}_A' for name in corner] + [f'{name}_B' for name in corner])
+        out = (allocate or (lambda shape, dtype: np.empty(shape, dtype)))((2 * n, len(columns)), self.dtype)
+
+        out[:n, 0], out[n:, 0] = red_won, ~red_won
+        out[:n, 1], out[n:, 1] = 1, 0
+        for j, (_, values) in enumerate(shared, start=2):
+            out[:n, j] = out[n:, j] = values
+        a = 2 + len(shared)
+        b = a + len(corner)
+        for names, gather in blocks:
+            red_values, blue_values = gather()
+            k = len(names)
+            out[:n, a:a + k], out[:n, b:b + k] = red_values, blue_values
+            out[n:, a:a + k], out[n:, b:b + k] = blue_values, red_values
+            a, b = a + k, b + k
+
+        return SymmetricDataset(values=out, columns=columns, fight_ids=ordered['fight_id'].tolist(),
+                                dates=ordered['date'].dt.strftime('%Y-%m-%d').tolist(), categories=categories)
+
+    def _corner_blocks(self, fights: 'pd.DataFrame', fighters: 'pd.DataFrame', red: 'np.ndarray',
+                       blue: 'np.ndarray', corner_frames: Sequence['pd.DataFrame'],
+                       categories: Dict[str, List[str]]) -> Iterator[Block]:
+        """
+        Bloques de columnas por esquina: nombres y función que devuelve las matrices (n, k) de la esquina roja y
+        de la azul. Los gathers se difieren hasta escribir cada bloque, para no tener todos en memoria a la vez.
+        """
+        def gather(table: 'np.ndarray', red_rows: 'np.ndarray', blue_rows: 'np.ndarray') -> Gather:
+            return lambda: (table[red_rows], table[blue_rows])
+
+        if self.fighter_columns:
+            table = _gather_table(fighters[self.fighter_columns].apply(pd.to_numeric, errors='coerce').to_numpy())
+            yield self.fighter_columns, gather(table, red, blue)
+        for column in self.fighter_categories:
+            codes, categories[column] = _codes(fighters[column])
+            yield [f'{column}_code'], gather(_gather_table(codes), red, blue)
+        if self.age:
+            born = _gather_table((pd.to_datetime(fighters['dob'], errors='coerce') - EPOCH).dt.days.to_numpy(float))
+            day = (fights['date'] - EPOCH).dt.days.to_numpy(dtype=float)[:, None]
+            yield ['age'], lambda: ((day - born[red]) / DAYS_PER_YEAR, (day - born[blue]) / DAYS_PER_YEAR)
+        if self.fight_corner_columns:
+            reds, blues, names = zip(*self.fight_corner_columns)
+            yield list(names), lambda: (fights[list(reds)].to_numpy(dtype=float),
+                                        fights[list(blues)].to_numpy(dtype=float))
+        for frame in corner_frames:
+            names = corner_columns(frame)
+            if not names:
+                continue
+            frame = frame.drop_duplicates('fight_id').set_index('fight_id')
+            position = frame.index.get_indexer(fights['fight_id'])
+            red_table = _gather_table(frame[[f'red_{c}' for c in names]].to_numpy(dtype=float))
+            blue_table = _gather_table(frame[[f'blue_{c}' for c in names]].to_numpy(dtype=float))
+            yield names, (lambda r=red_table, b=blue_table, p=position: (r[p], b[p]))
+
+
+def load_ml_dataset(data) -> Tuple['np.ndarray', Dict[str, object]]:
+    """
+    Abre el dataset .npy del pipeline mapeado en memoria (solo lectura) junto con su descripción.
+    """
+    with open(data.ml_metadata_path, encoding='utf-8') as f:
+        metadata = json.load(f)
+    return np.load(data.ml_dataset_path, mmap_mode='r'), metadata
+
+
+class MLDatasetWriter:
+    """
+    Genera el dataset de data/ml a partir de data/processed y, si existen, de las características y ratings previos
+    de data/features, en el formato (npy o parquet) y tipo (float64 o float32) de la configuración.
+    Args:
+        data (DataConfig): Rutas y opciones de datos del pipeline.
+    """
+
+    def __init__(self, data):
+        _require_pandas()
+        if data.ml_format == 'parquet' and pa is None:
+            raise ConfigurationError("Parquet output requires pyarrow (pip install pyarrow)")
+        self.data = data
+        self.builder = SymmetricDatasetBuilder(dtype=data.ml_dtype)
+
+    def run(self) -> int:
+        """
+        Construye y escribe el dataset.
+        Returns:
+            int: Filas escritas (dos por pelea con ganador).
+        """
+        data = self.data
+        for path in (data.processed_fights_path, data.processed_fighters_path, data.processed_events_path):
+            if not os.path.exists(path):
+                print(f"⏭️ Skipping ML dataset: {path} not found")
+                return 0
+        corner_frames = [pd.read_csv(path) for path in (data.prefight_features_path, data.ratings_path)
+                         if os.path.exists(path)]
+        inputs = (pd.read_csv(data.processed_fights_path),
+                  pd.read_csv(data.processed_fighters_path, index_col='fighter_id'),
+                  pd.read_csv(data.processed_events_path))
+        os.makedirs(data.ml_dir, exist_ok=True)
+        tmp_path = f"{data.ml_dataset_path}.tmp"
+        if data.ml_format == 'npy':
+            allocate = lambda shape, dtype: np.lib.format.open_memmap(tmp_path, mode='w+', dtype=dtype, shape=shape)
+            dataset = self.builder.build(*inputs, corner_frames=corner_frames, allocate=allocate)
+            dataset.values.flush()
+        else:
+            # Orden por columnas: cada columna es contigua y Arrow la toma sin copiarla
+            allocate = lambda shape, dtype: np.empty(shape, dtype, order='F')
+            dataset = self.builder.build(*inputs, corner_frames=corner_frames, allocate=allocate)
+            table = pa.table({name: dataset.values[:, j] for j, name in enumerate(dataset.columns)})
+            pq.write_table(table, tmp_path)
+        metadata = dataset.metadata()
+        # Se libera el mapeo del fichero antes de renombrarlo
+        dataset.values = None
+        os.replace(tmp_path, data.ml_dataset_path)
+        with open(data.ml_metadata_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f)
+        rows = metadata['rows']
+        get_metrics().inc('ml_dataset_rows_total', rows)
+        print(f"🤖 ML dataset: {rows} rows x {len(dataset.columns)} columns ({data.ml_dtype}) written to "
+              f"{data.ml_dataset_path}")
+        return rows
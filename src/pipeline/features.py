@@ -0,0 +1,426 @@
+"""
+Almacén de características previas a cada pelea (feature store) del pipeline UFC ETL.
+El notebook 04_fights_cleaning unía a cada pelea histórica las medias de carrera actuales de raw_fighters.csv, que
+incluyen las peleas posteriores a ella (fuga de información futura). Aquí las peleas limpias de data/processed se
+recorren una sola vez en orden cronológico con acumuladores por luchador (golpes significativos acertados y
+recibidos, derribos, tiempo de control, rachas y fecha de la última pelea): cada fila se emite con el estado previo
+a la pelea y después se actualiza el estado, así que el coste es O(n) en el número de peleas.
+El estado de los acumuladores se guarda en data/features/state.json; la siguiente ejecución solo recorre las
+peleas nuevas y añade sus filas a data/features/prefight.csv. Si aparece una pelea anterior a la última procesada,
+si cambian las columnas de entrada de alguna pelea ya procesada (por ejemplo tras --reparse o --retry-failed) o si
+el estado no corresponde al CSV, se reconstruye todo desde el principio. Esa lógica incremental está en
+FightStreamStore, que comparte el motor de ratings (ratings.py).
+Requiere pandas (pip install -e .[transform]).
+"""
+import json
+import math
+import os
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict, fields
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+from ..utils.metrics import get_metrics
+from .transform import _require_pandas
+
+try:
+    import pandas as pd
+except ImportError:  # pandas solo es necesario para las fases de transformación y características
+    pd = None
+
+
+# Cambiar al modificar los acumuladores o las características: invalida el estado guardado
+FEATURES_VERSION = 3
+NO_CONTEST_METHODS = ('No Contest', 'Overturned')
+FEATURE_COLUMNS = (
+    'fights', 'wins', 'losses', 'draws', 'win_streak', 'loss_streak', 'days_since_last_fight', 'cage_minutes',
+    'sig_landed_per_min', 'sig_absorbed_per_min', 'sig_accuracy', 'sig_defense',
+    'td_landed_per_15', 'td_accuracy', 'td_defense', 'knockdowns_per_fight', 'control_per_fight',
+)
+KEY_COLUMNS = ('fight_id', 'event_id', 'date', 'red_id', 'blue_id')
+FEATURE_INPUT_COLUMNS = KEY_COLUMNS + (
+    'winner_id', 'method', 'round', 'time', 'time_format',
+    'str1_landed', 'str1_attempted', 'td1_landed', 'td1_attempted', 'kd1', 'control_time1',
+    'str2_landed', 'str2_attempted', 'td2_landed', 'td2_attempted', 'kd2', 'control_time2',
+)
+# Columnas de entrada de texto; el resto (salvo `date`) son numéricas
+TEXT_INPUT_COLUMNS = ('fight_id', 'event_id', 'red_id', 'blue_id', 'winner_id', 'method', 'time_format')
+
+
+@lru_cache(maxsize=None)
+def _round_minutes(time_format: Any) -> Tuple[int, ...]:
+    """Duración en minutos de cada asalto según el formato, p. ej. '3 Rnd (5-5-5)' -> (5, 5, 5)."""
+    match = re.search(r'\(([\d\-]+)\)', time_format) if isinstance(time_format, str) else None
+    return tuple(int(m) for m in match.group(1).split('-') if m) if match else ()
+
+
+def fight_seconds(round_: float, time: float, time_format: Any) -> float:
+    """
+    Segundos disputados: asaltos completos anteriores al último más el tiempo del último.
+    Si el formato tiene menos asaltos de los disputados, los restantes duran lo mismo que el último del formato.
+    """
+    if _missing(round_) or _missing(time):
+        return math.nan
+    minutes = _round_minutes(time_format)
+    previous = sum(minutes[min(i, len(minutes) - 1)] for i in range(int(round_) - 1)) if minutes else 0
+    return previous * 60 + time
+
+
+def fights_digest(fights: 'pd.DataFrame', columns: Tuple[str, ...]) -> int:
+    """
+    Huella de las columnas de entrada de un conjunto de peleas: suma módulo 2**64 del hash de cada fila, de modo que
+    no depende del orden y la de la unión de dos conjuntos es la suma de sus huellas.
+    Las columnas se llevan antes a tipos fijos (float64, texto y fechas ISO), porque el hash depende del dtype y
+    pd.read_csv lee una columna como int o float según haya o no algún NaN en todo el fichero.
+    """
+    normalized = {}
+    for column in columns:
+        values = fights[column]
+        if column == 'date':
+            values = pd.to_datetime(values).dt.strftime('%Y-%m-%d')
+        if column == 'date' or column in TEXT_INPUT_COLUMNS:
+            normalized[column] = values.astype(object).where(values.notna(), '').astype(str)
+        else:
+            normalized[column] = pd.to_numeric(values, errors='coerce').astype('float64')
+    hashes = pd.util.hash_pandas_object(pd.DataFrame(normalized, index=fights.index), index=False).to_numpy()
+    return int(hashes.sum())
+
+
+def _missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _ratio(numerator: float, denominator: float, scale: float = 1.0) -> float:
+    return numerator / denominator * scale if denominator else math.nan
+
+
+@dataclass
+class FighterState:
+    """
+    Acumuladores de la carrera de un luchador hasta la última pelea procesada.
+    Las estadísticas de golpes, derribos y control solo se acumulan en las peleas que las tienen (`stat_fights`,
+    `stat_seconds`); las peleas antiguas sin estadísticas cuentan para el récord y el tiempo en el octágono.
+    """
+    fights: int = 0
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    win_streak: int = 0
+    loss_streak: int = 0
+    last_day: Optional[int] = None
+    seconds: float = 0.0
+    stat_fights: int = 0
+    stat_seconds: float = 0.0
+    sig_landed: float = 0.0
+    sig_attempted: float = 0.0
+    sig_absorbed: float = 0.0
+    sig_faced: float = 0.0
+    td_landed: float = 0.0
+    td_attempted: float = 0.0
+    td_absorbed: float = 0.0
+    td_faced: float = 0.0
+    knockdowns: float = 0.0
+    control_seconds: float = 0.0
+
+    def features(self, day: int) -> Tuple[float, ...]:
+        """Características del luchador el día `day` (ordinal), en el orden de FEATURE_COLUMNS."""
+        minutes = self.stat_seconds / 60
+        return (
+            self.fights, self.wins, self.losses, self.draws, self.win_streak, self.loss_streak,
+            math.nan if self.last_day is None else day - self.last_day,
+            self.seconds / 60,
+            _ratio(self.sig_landed, minutes),
+            _ratio(self.sig_absorbed, minutes),
+            _ratio(self.sig_landed, self.sig_attempted),
+            1 - _ratio(self.sig_absorbed, self.sig_faced),
+            _ratio(self.td_landed, minutes, 15),
+            _ratio(self.td_landed, self.td_attempted),
+            1 - _ratio(self.td_absorbed, self.td_faced),
+            _ratio(self.knockdowns, self.stat_fights),
+            _ratio(self.control_seconds, self.stat_fights),
+        )
+
+    def record(self, result: str, day: int, seconds: float, own: Optional[Tuple[float, ...]],
+               opponent: Optional[Tuple[float, ...]]):
+        """
+        Añade una pelea a los acumuladores.
+        Args:
+            result (str): 'win', 'loss', 'draw' o 'nc' (sin resultado: no cambia el récord ni las rachas).
+            day (int): Día ordinal de la pelea.
+            seconds (float): Segundos disputados (nulo si se desconoce).
+            own, opponent: Estadísticas (sig. acertados, sig. intentados, derribos acertados, derribos intentados,
+                knockdowns, control) del luchador y de su rival, o None si la pelea no las tiene.
+        """
+        self.fights += 1
+        if result == 'win':
+            self.wins += 1
+            self.win_streak, self.loss_streak = self.win_streak + 1, 0
+        elif result == 'loss':
+            self.losses += 1
+            self.win_streak, self.loss_streak = 0, self.loss_streak + 1
+        elif result == 'draw':
+            self.draws += 1
+            self.win_streak = self.loss_streak = 0
+        self.last_day = day
+        if not _missing(seconds):
+            self.seconds += seconds
+        if own is None or opponent is None or _missing(seconds):
+            return
+        self.stat_fights += 1
+        self.stat_seconds += seconds
+        self.sig_landed += own[0]
+        self.sig_attempted += own[1]
+        self.td_landed += own[2]
+        self.td_attempted += own[3]
+        self.knockdowns += own[4]
+        self.control_seconds += own[5]
+        self.sig_absorbed += opponent[0]
+        self.sig_faced += opponent[1]
+        self.td_absorbed += opponent[2]
+        self.td_faced += opponent[3]
+
+
+class FeatureState:
+    """
+    Estado del almacén: acumuladores por luchador, peleas ya procesadas, huella de sus columnas de entrada y día de
+    la última pelea procesada.
+    """
+
+    def __init__(self):
+        self.fighters: Dict[str, FighterState] = {}
+        self.fight_ids = set()
+        self.digest = 0
+        self.last_day: Optional[int] = None
+        self.rows = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representación JSON del estado."""
+        return {
+            'version': FEATURES_VERSION,
+            'last_day': self.last_day,
+            'rows': self.rows,
+            'digest': self.digest,
+            'fight_ids': sorted(self.fight_ids),
+            'fighters': {fighter_id: list(asdict(state).values()) for fighter_id, state in self.fighters.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> Optional['FeatureState']:
+        """Estado a partir de su representación JSON, o None si es de otra versión de las características."""
+        if payload.get('version') != FEATURES_VERSION:
+            return None
+        state = cls()
+        state.last_day = payload['last_day']
+        state.rows = payload['rows']
+        state.digest = payload['digest']
+        state.fight_ids = set(payload['fight_ids'])
+        names = [f.name for f in fields(FighterState)]
+        state.fighters = {fighter_id: FighterState(**dict(zip(names, values)))
+                          for fighter_id, values in payload['fighters'].items()}
+        return state
+
+
+def chronological_fights(fights: 'pd.DataFrame', events: 'pd.DataFrame') -> 'pd.DataFrame':
+    """
+    Peleas con la fecha de su evento, en el orden en que se disputaron: por fecha y, dentro de cada evento,
+    de la última de la cartelera (fight_order más alto) al combate estelar. Se omiten las peleas sin fecha.
+    """
+    dates = pd.to_datetime(events.set_index('event_id')['date'], errors='coerce')
+    df = fights.assign(date=fights['event_id'].map(dates)).dropna(subset=['date'])
+    return df.sort_values(['date', 'event_id', 'fight_order'], ascending=[True, True, False], kind='mergesort')
+
+
+def _stats(landed: float, attempted: float, td_landed: float, td_attempted: float, knockdowns: float,
+           control: float) -> Optional[Tuple[float, ...]]:
+    values = (landed, attempted, td_landed, td_attempted, knockdowns, control)
+    return None if any(_missing(v) for v in values) else values
+
+
+def prefight_features(fights: 'pd.DataFrame', state: FeatureState) -> 'pd.DataFrame':
+    """
+    Emite una fila de características previas a la pelea por cada pelea (ya en orden cronológico) y actualiza
+    los acumuladores de `state` con su resultado. Recorre las peleas una sola vez.
+    Returns:
+        pd.DataFrame: KEY_COLUMNS más red_<característica> y blue_<característica> por cada FEATURE_COLUMNS.
+    """
+    _require_pandas()
+    rows = []
+    columns = [fights[c].tolist() for c in FEATURE_INPUT_COLUMNS]
+    for (fight_id, event_id, when, red_id, blue_id, winner_id, method, round_, time, time_format,
+         *stats) in zip(*columns):
+        day = when.toordinal()
+        red = state.fighters.setdefault(red_id, FighterState())
+        blue = state.fighters.setdefault(blue_id, FighterState())
+        rows.append((fight_id, event_id, when.date().isoformat(), red_id, blue_id)
+                    + red.features(day) + blue.features(day))
+
+        if winner_id == red_id:
+            red_result, blue_result = 'win', 'loss'
+        elif winner_id == blue_id:
+            red_result, blue_result = 'loss', 'win'
+        elif method in NO_CONTEST_METHODS:
+            red_result = blue_result = 'nc'
+        else:
+            red_result = blue_result = 'draw'
+        seconds = fight_seconds(round_, time, time_format)
+        red_stats, blue_stats = _stats(*stats[:6]), _stats(*stats[6:])
+        red.record(red_result, day, seconds, red_stats, blue_stats)
+        blue.record(blue_result, day, seconds, blue_stats, red_stats)
+        state.fight_ids.add(fight_id)
+        state.last_day = day
+    names = list(KEY_COLUMNS) + [f'{corner}_{c}' for corner in ('red', 'blue') for c in FEATURE_COLUMNS]
+    return pd.DataFrame(rows, columns=names)
+
+
+class FightStreamStore(ABC):
+    """
+    Base de los almacenes derivados del flujo de peleas limpias de data/processed. Recorre en orden cronológico las
+    peleas que aún no ha procesado, añade sus filas al CSV de salida y guarda el estado con el que continúa la
+    siguiente ejecución. El estado expone `fight_ids`, `digest` (huella de las columnas `input_columns` de esas
+    peleas), `last_day` y `rows`; si alguna pelea nueva es anterior a la última procesada, si alguna ya procesada ha
+    cambiado o desaparecido, o si el CSV no tiene las filas que indica el estado, se reconstruye todo.
+    Args:
+        data (DataConfig): Rutas de datos del pipeline.
+    """
+
+    # Columnas de las peleas de las que dependen las filas emitidas
+    input_columns: Tuple[str, ...] = KEY_COLUMNS
+
+    def __init__(self, data):
+        _require_pandas()
+        self.data = data
+
+    @property
+    @abstractmethod
+    def output_path(self) -> str:
+        """Ruta del CSV de salida."""
+        pass
+
+    @property
+    @abstractmethod
+    def state_path(self) -> str:
+        """Ruta del fichero de estado."""
+        pass
+
+    @abstractmethod
+    def new_state(self) -> Any:
+        """Estado vacío, antes de la primera pelea."""
+        pass
+
+    @abstractmethod
+    def read_state(self, path: str) -> Optional[Any]:
+        """Estado guardado, o None si no es válido para la versión actual."""
+        pass
+
+    @abstractmethod
+    def write_state(self, state: Any, f: BinaryIO):
+        """Escribe el estado en un fichero abierto en modo binario."""
+        pass
+
+    @abstractmethod
+    def emit(self, fights: 'pd.DataFrame', state: Any) -> 'pd.DataFrame':
+        """Filas de salida de las peleas (en orden cronológico), actualizando `state`."""
+        pass
+
+    def describe(self, state: Any) -> str:
+        """Resumen del estado para el mensaje de progreso."""
+        return f"{state.rows} rows in total"
+
+    def update(self, rebuild: bool = False) -> int:
+        """
+        Añade las filas de las peleas que aún no están en el almacén, o lo reconstruye entero si `rebuild`,
+        si no hay estado válido, si alguna pelea ya procesada ha cambiado o si alguna nueva es anterior a la última
+        procesada.
+        Returns:
+            int: Filas escritas.
+        """
+        data = self.data
+        for path in (data.processed_fights_path, data.processed_events_path):
+            if not os.path.exists(path):
+                print(f"⏭️ Skipping {os.path.basename(self.output_path)}: {path} not found")
+                return 0
+        ordered = chronological_fights(pd.read_csv(data.processed_fights_path),
+                                       pd.read_csv(data.processed_events_path))
+        fights = ordered
+        state = None if rebuild else self._load_state()
+        if state is not None:
+            processed = ordered['fight_id'].isin(state.fight_ids)
+            fights = ordered[~processed]
+            if (processed.sum() != len(state.fight_ids)
+                    or fights_digest(ordered[processed], self.input_columns) != state.digest):
+                print(f"⚠️ Processed fights changed since the last update of {self.output_path}, rebuilding it")
+                state, fights = None, ordered
+            elif state.last_day is not None and len(fights) and fights['date'].iloc[0].toordinal() < state.last_day:
+                print(f"⚠️ New fights predate the state of {self.output_path}, rebuilding it")
+                state, fights = None, ordered
+
+        appending = state is not None
+        if state is None:
+            state = self.new_state()
+        rows = self.emit(fights, state)
+        state.rows += len(rows)
+        state.digest = (state.digest + fights_digest(fights, self.input_columns)) % 2 ** 64
+        self._write(rows, append=appending)
+        self._save_state(state)
+        mode = 'appended to' if appending else 'written to'
+        print(f"🧮 {len(rows)} rows {mode} {self.output_path} ({self.describe(state)})")
+        return len(rows)
+
+    def _load_state(self) -> Optional[Any]:
+        # El estado solo es válido si el CSV tiene exactamente las filas que dice haber procesado
+        if not (os.path.exists(self.state_path) and os.path.exists(self.output_path)):
+            return None
+        state = self.read_state(self.state_path)
+        with open(self.output_path, encoding='utf-8') as f:
+            rows = sum(1 for _ in f) - 1
+        return state if state is not None and state.rows == rows else None
+
+    def _write(self, rows: 'pd.DataFrame', append: bool):
+        path = self.output_path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if append:
+            rows.to_csv(path, mode='a', header=False, index=False)
+            return
+        tmp_path = f"{path}.tmp"
+        rows.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    def _save_state(self, state: Any):
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            self.write_state(state, f)
+        os.replace(tmp_path, self.state_path)
+
+
+class FeatureStore(FightStreamStore):
+    """
+    Mantiene data/features/prefight.csv y el estado JSON de sus acumuladores.
+    """
+
+    input_columns = FEATURE_INPUT_COLUMNS
+
+    @property
+    def output_path(self) -> str:
+        return self.data.prefight_features_path
+
+    @property
+    def state_path(self) -> str:
+        return self.data.feature_state_path
+
+    def new_state(self) -> FeatureState:
+        return FeatureState()
+
+    def read_state(self, path: str) -> Optional[FeatureState]:
+        with open(path, encoding='utf-8') as f:
+            return FeatureState.from_dict(json.load(f))
+
+    def write_state(self, state: FeatureState, f: BinaryIO):
+        f.write(json.dumps(state.to_dict()).encode('utf-8'))
+
+    def emit(self, fights: 'pd.DataFrame', state: FeatureState) -> 'pd.DataFrame':
+        features = prefight_features(fights, state)
+        get_metrics().inc('feature_rows_total', len(features))
+        return features
+
+    def describe(self, state: FeatureState) -> str:
+        return f"{len(state.fighters)} fighters, {state.rows} rows in total"
@@ -2,73 +2,614 @@
 Orquestador principal del pipeline ETL de UFC.
 Coordina la ejecución de las distintas fases de scraping y procesamiento de datos, gestionando la configuración y el almacenamiento.
 """
-from typing import Optional
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from ..core.config import Config
+from ..core.exceptions import ConfigurationError
 from ..scrapers.fighters.scraper import FighterScraper, FighterDetailScraper
 from ..scrapers.events.scraper import EventScraper
 from ..scrapers.fights.scraper import FightScraper, FightDetailScraper
 from ..utils.data import CSVManager
+from ..utils.parquet import ParquetManager
+from ..utils.sqlite_store import SQLiteStore
+from ..utils.cache import get_shared_cache
+from ..utils.archive import get_shared_archive
+from ..utils.parse_memo import get_shared_parse_memo
+from ..utils.rate_limit import get_shared_rate_limiter
+from ..utils.dead_letter import DeadLetterQueue
+from ..utils.ledger import FetchLedger
+from ..utils.journal import CheckpointJournal
+from ..utils.metrics import get_metrics
+from ..utils.profiling import PhaseProfiler
+from .transform import DataTransformer
+from .features import FeatureStore
+from .ratings import RatingEngine
+from .dataset import MLDatasetWriter
 from ..core.constants import FIGHTER_FIELDS, EVENT_FIELDS, FIGHT_FIELDS, FIGHTER_DETAIL_FIELDS
 
 
+def reports_metrics(run: Callable) -> Callable:
+    """
+    Decorador de los puntos de entrada del orquestador: reinicia las métricas al empezar y, al terminar
+    (con éxito o no), escribe el informe JSON y el fichero de Prometheus de la ejecución.
+    Las llamadas anidadas (run_incremental delegando en run_full_pipeline) generan un único informe.
+    """
+    @wraps(run)
+    def wrapper(self, *args, **kwargs):
+        if self._reporting:
+            return run(self, *args, **kwargs)
+        self._reporting = True
+        self.metrics.reset()
+        start = time.monotonic()
+        success = False
+        try:
+            result = run(self, *args, **kwargs)
+            success = True
+            return result
+        finally:
+            self._reporting = False
+            self._write_metrics(run.__name__, success, time.monotonic() - start)
+    return wrapper
+
+
 class UFCScrapingOrchestrator:
     """
     Orquesta la ejecución completa del pipeline de scraping de UFC.
     Gestiona la configuración, la ejecución de scrapers y el almacenamiento de los datos extraídos y procesados.
     """
     
-    def __init__(self, dev_mode: Optional[bool] = None, dev_limit: Optional[int] = None):
-        self.config = Config(dev_mode=dev_mode, dev_limit=dev_limit)
+    def __init__(self, dev_mode: Optional[bool] = None, dev_limit: Optional[int] = None,
+                 use_cache: Optional[bool] = None, engine: Optional[str] = None,
+                 requests_per_second: Optional[float] = None, adaptive: Optional[bool] = None,
+                 parser_backend: Optional[str] = None, process_parsing: Optional[bool] = None,
+                 parse_workers: Optional[int] = None, resume: bool = False, parquet: Optional[bool] = None,
+                 storage: Optional[str] = None, metrics_dir: Optional[str] = None, profile: bool = False,
+                 base_url: Optional[str] = None, archive: Optional[bool] = None, reparse: bool = False,
+                 parse_memo: Optional[bool] = None, transform: Optional[bool] = None,
+                 features: Optional[bool] = None, rebuild_features: bool = False,
+                 ml_dataset: Optional[bool] = None, ml_format: Optional[str] = None, ml_float32: bool = False):
+        self.config = Config(
+            dev_mode=dev_mode,
+            dev_limit=dev_limit,
+            use_cache=use_cache,
+            engine=engine,
+            requests_per_second=requests_per_second,
+            adaptive=adaptive,
+            parser_backend=parser_backend,
+            process_parsing=process_parsing,
+            parse_workers=parse_workers,
+            parquet=parquet,
+            storage=storage,
+            metrics_dir=metrics_dir,
+            base_url=base_url,
+            archive=archive,
+            reparse=reparse,
+            parse_memo=parse_memo,
+            transform=transform,
+            features=features,
+            ml_dataset=ml_dataset,
+            ml_format=ml_format,
+            ml_float32=ml_float32
+        )
         self.csv_manager = CSVManager()
+        self.dead_letters = DeadLetterQueue()
+        self.ledger = FetchLedger()
+        self.journal = CheckpointJournal(self.config.data.checkpoints_dir)
+        self.resume = resume
+        self.rebuild_features = rebuild_features
+        self.store = SQLiteStore(self.config.data.sqlite_path) if self.config.data.storage == 'sqlite' else None
+        self.metrics = get_metrics()
+        self._reporting = False
+        self.profiler = None
+        if profile:
+            run_dir = os.path.join(self.config.data.profiles_dir, time.strftime('%Y%m%d-%H%M%S'))
+            self.profiler = PhaseProfiler(run_dir)
     
+    @reports_metrics
     def run_full_pipeline(self):
         """
         Ejecuta el pipeline completo de scraping y procesamiento de datos de UFC.
         Realiza las fases de extracción de luchadores, eventos, peleas y detalles, guardando los resultados en archivos CSV.
+        Cada evento, pelea y luchador completado se registra en el journal de checkpoints; con --resume las unidades
+        ya registradas no se vuelven a descargar y sus filas se reconstruyen desde el journal.
         """
         print("🚀 Starting UFC Stats scraping pipeline...")
-        print(f"Mode: {'Development' if self.config.scraping.dev_mode else 'Production'}")
-        if self.config.scraping.dev_mode:
-            print(f"Limit: {self.config.scraping.dev_limit}")
+        self._print_run_settings()
+        self.journal.start(resume=self.resume)
 
-        # Phase 1: Fighters
-        print("\n" + "="*50)
-        print("PHASE 1: FIGHTERS")
-        print("="*50)
-        self._scrape_fighters()
+        with self._phase("PHASE 1: FIGHTERS", 'fighters'):
+            self._scrape_fighters()
 
-        # Phase 2: Events
-        print("\n" + "="*50)
-        print("PHASE 2: EVENTS")
-        print("="*50)
-        self._scrape_events()
+        with self._phase("PHASE 2: EVENTS", 'events'):
+            self._scrape_events()
+            self._sync_store(['events', 'upcoming_events'])
 
-        # Phase 3: Fights (completed and upcoming)
-        print("\n" + "="*50)
-        print("PHASE 3: FIGHTS (COMPLETED & UPCOMING)")
-        print("="*50)
-        from ..scrapers.fights.scraper import FightScraper
-        FightScraper(self.config).scrape_all_fights_workflow()
+        with self._phase("PHASE 3: FIGHTS (COMPLETED & UPCOMING)", 'fights'):
+            FightScraper(self.config, **self._shared_state()).scrape_all_fights_workflow()
+            self._sync_store(['fights', 'upcoming_fights'])
+            self._save_dead_letters()
 
-        # Phase 4: Fighter Details
-        print("\n" + "="*50)
-        print("PHASE 4: FIGHTER DETAILS")
-        print("="*50)
-        self._scrape_fighter_details()
+        with self._phase("PHASE 4: FIGHTER DETAILS", 'fighter_details'):
+            self._scrape_fighter_details()
+            self._save_dead_letters()
 
-        # Phase 5: Fight Details
-        print("\n" + "="*50)
-        print("PHASE 5: FIGHT DETAILS")
-        print("="*50)
-        self._scrape_fight_details()
+        with self._phase("PHASE 5: FIGHT DETAILS", 'fight_details'):
+            self._scrape_fight_details()
+            self._save_dead_letters()
         
+        self.journal.clear()
+        self._export_parquet()
+        self._transform("PHASE 6: TRANSFORM")
+        self._build_features("PHASE 7: PRE-FIGHT FEATURES")
+        self._build_ml_dataset("PHASE 8: ML DATASET")
+        self._report_cache_stats()
+        self._report_archive_stats()
+        self._report_parse_memo_stats()
+        self._report_rate_limit_stats()
         print("\n🎉 Pipeline completed successfully!")
     
+    @reports_metrics
+    def run_incremental(self):
+        """
+        Actualiza los CSV crudos existentes descargando solo lo nuevo desde la última ejecución.
+        Compara el listado de eventos con raw_fights.csv para detectar eventos sin peleas, descarga el índice y
+        los detalles de sus peleas, refresca el listado de luchadores y solo pide los detalles de luchadores nuevos
+        o que han peleado en esos eventos. Los resultados se fusionan por clave en los ficheros existentes.
+        Si no existen datos previos, ejecuta el pipeline completo.
+        Con --resume reutiliza las unidades completadas en el journal de checkpoints de la ejecución interrumpida.
+        """
+        data = self.config.data
+        if not all(os.path.exists(path) for path in (data.events_path, data.fights_path, data.fighters_path)):
+            print("ℹ️ No previous raw data found, running the full pipeline instead")
+            self.run_full_pipeline()
+            return
+        
+        print("🚀 Starting incremental UFC Stats update...")
+        self._print_run_settings()
+        self.journal.start(resume=self.resume)
+        
+        with self._phase("PHASE 1: EVENTS (DIFF)", 'events'):
+            known_events = self.csv_manager.read_from_csv(data.events_path)
+            existing_fights = self.csv_manager.read_from_csv(data.fights_path)
+            scraped_event_ids = {f['event_id'] for f in existing_fights}
+            
+            EventScraper(self.config, **self._shared_state()).scrape()
+            completed_events = self.csv_manager.read_from_csv(data.events_path)
+            self.csv_manager.save_to_csv(
+                self.csv_manager.merge_by_key(known_events, completed_events, 'event_id'),
+                data.events_path,
+                EVENT_FIELDS
+            )
+            new_events = [e for e in completed_events if e['event_id'] not in scraped_event_ids]
+            print(f"🆕 {len(new_events)} completed events without fights in {data.fights_path}")
+        
+        with self._phase("PHASE 2: NEW FIGHTS", 'new_fights'):
+            new_fights = self._scrape_new_fights(new_events, existing_fights, data.fights_path)
+            if os.path.exists(data.upcoming_events_path):
+                upcoming_events = self.csv_manager.read_from_csv(data.upcoming_events_path)
+                upcoming_fights = (self.csv_manager.read_from_csv(data.upcoming_fights_path)
+                                   if os.path.exists(data.upcoming_fights_path) else [])
+                self._scrape_new_fights(upcoming_events, upcoming_fights, data.upcoming_fights_path, replace=True)
+            self._save_dead_letters()
+        
+        with self._phase("PHASE 3: FIGHTERS (NEW & ACTIVE)", 'fighters'):
+            active_ids = {f[corner] for f in new_fights for corner in ('red_id', 'blue_id') if f.get(corner)}
+            self._update_fighters(active_ids)
+            self._save_dead_letters()
+            self._sync_store()
+        
+        self.journal.clear()
+        self._export_parquet()
+        self._transform("PHASE 4: TRANSFORM")
+        self._build_features("PHASE 5: PRE-FIGHT FEATURES")
+        self._build_ml_dataset("PHASE 6: ML DATASET")
+        self._report_cache_stats()
+        self._report_archive_stats()
+        self._report_parse_memo_stats()
+        self._report_rate_limit_stats()
+        print("\n🎉 Incremental update completed successfully!")
+    
+    def _scrape_new_fights(self, events: List[Dict[str, Any]], existing_fights: List[Dict[str, Any]],
+                           fights_path: str, replace: bool = False) -> List[Dict[str, Any]]:
+        """
+        Descarga el índice de peleas de los eventos indicados y los detalles de las peleas que aún no constan
+        en `existing_fights`, y guarda el resultado en `fights_path`.
+        Con `replace` el fichero pasa a contener solo las peleas de esos eventos (carteleras próximas, que cambian
+        entre ejecuciones), reutilizando las filas ya conocidas; si no, se fusionan con las existentes por fight_id.
+        Returns:
+            List[Dict[str, Any]]: Peleas cuyos detalles se han descargado en esta ejecución.
+        """
+        if not events:
+            return []
+        
+        index_scraper = FightScraper(self.config, **self._shared_state())
+        fights_index = index_scraper.scrape_fight_index(events)
+        known = {f['fight_id']: f for f in existing_fights}
+        targets = [f for f in fights_index if f['fight_id'] not in known]
+        print(f"🆕 {len(targets)}/{len(fights_index)} fights not yet in {fights_path}")
+        
+        detail_scraper = FightDetailScraper(self.config, **self._shared_state())
+        new_fights = detail_scraper.scrape(targets) if targets else []
+        
+        if replace:
+            new_by_id = {f['fight_id']: f for f in new_fights}
+            fights = [new_by_id.get(f['fight_id']) or {**known[f['fight_id']], **f} for f in fights_index
+                      if f['fight_id'] in new_by_id or f['fight_id'] in known]
+        else:
+            fights = self.csv_manager.merge_by_key(existing_fights, new_fights, 'fight_id')
+        self.csv_manager.save_to_csv(fights, fights_path, FIGHT_FIELDS)
+        print(f"💾 Saved {len(fights)} fights ({len(new_fights)} new) to {fights_path}")
+        return new_fights
+    
+    def _update_fighters(self, active_ids: set):
+        """
+        Refresca el listado de luchadores y descarga los detalles solo de los luchadores nuevos y de los que
+        han peleado en los eventos nuevos; el resto conserva los detalles ya guardados.
+        """
+        fighters_path = self.config.data.fighters_path
+        known = {f['fighter_id']: f for f in self.csv_manager.read_from_csv(fighters_path)}
+        listing = FighterScraper(self.config, **self._shared_state()).scrape()
+        
+        # Los campos del listado (récord, peso...) se actualizan; los de detalle se conservan
+        fighters = [{**known.get(f['fighter_id'], {}), **{k: f[k] for k in FIGHTER_FIELDS}} for f in listing]
+        targets = [f for f in fighters if f['fighter_id'] not in known or f['fighter_id'] in active_ids]
+        print(f"🆕 {len(targets)} fighters need details "
+              f"({sum(f['fighter_id'] not in known for f in listing)} new, {len(active_ids)} active)")
+        
+        if targets:
+            scraper = FighterDetailScraper(self.config, **self._shared_state())
+            fighters = self.csv_manager.merge_by_key(fighters, scraper.scrape(targets), 'fighter_id')
+        
+        merged = self.csv_manager.merge_by_key(list(known.values()), fighters, 'fighter_id')
+        self.csv_manager.save_to_csv(merged, fighters_path, FIGHTER_FIELDS + FIGHTER_DETAIL_FIELDS)
+        print(f"💾 Saved {len(merged)} fighters to {fighters_path}")
+    
+    @reports_metrics
+    def reparse_archive(self):
+        """
+        Reconstruye todos los CSV crudos a partir del archivo de páginas, sin ninguna petición de red (--reparse).
+        Ejecuta las mismas fases que el pipeline completo leyendo cada página del archivo y parseándolas en un pool
+        de procesos con todos los núcleos, de modo que la corrección de un parser se propaga a todo el dataset
+        sin volver a descargarlo. Requiere crear el orquestador con reparse=True.
+        """
+        if self.config.scraping.page_source != 'archive':
+            raise ConfigurationError("reparse_archive requires UFCScrapingOrchestrator(reparse=True)")
+        path = self.config.data.archive_path
+        if not os.path.exists(path):
+            print(f"❌ No page archive found at {path}; run the pipeline with page archiving enabled first")
+            return
+        stats = get_shared_archive(path).stats()
+        breakdown = ', '.join(f"{entity_stats['pages']} {entity}" for entity, entity_stats in stats.items())
+        print(f"♻️ Re-parsing {sum(s['pages'] for s in stats.values())} archived pages from {path} ({breakdown})")
+        self.run_full_pipeline()
+    
+    @reports_metrics
+    def run_transform(self):
+        """
+        Ejecuta solo la fase de transformación sobre los CSV crudos existentes (--transform-only), seguida de la
+        actualización de las características previas y del dataset para Machine Learning si están activadas.
+        """
+        self._transform("TRANSFORM", force=True)
+        self._build_features("PRE-FIGHT FEATURES")
+        self._build_ml_dataset("ML DATASET")
+    
+    @reports_metrics
+    def retry_failed(self):
+        """
+        Reintenta únicamente las peticiones fallidas registradas en ejecuciones anteriores y
+        actualiza las filas afectadas en los CSV crudos, sin repetir el pipeline completo.
+        """
+        path = self.config.data.failed_urls_path
+        self.dead_letters = DeadLetterQueue.load(path)
+        if not len(self.dead_letters):
+            print("✅ No failed requests to retry")
+            return
+        
+        print(f"🔁 Retrying {len(self.dead_letters)} failed requests from {path}...")
+        with self.metrics.phase('retry'):
+            self._retry_failed_events()
+            self._retry_failed_fights()
+            self._retry_failed_fighters()
+            self._save_dead_letters()
+            self._sync_store()
+        
+        remaining = len(self.dead_letters)
+        if remaining:
+            print(f"⚠️ {remaining} requests still failing, kept in {path}")
+        else:
+            print("🎉 All failed requests recovered!")
+    
+    def _retry_failed_events(self):
+        """
+        Recupera el índice de peleas de los eventos fallidos y añade sus peleas (con detalles) al CSV correspondiente.
+        """
+        event_ids = {e.key for e in self.dead_letters.pending(entity='event')}
+        if not event_ids:
+            return
+        
+        upcoming_path = self.config.data.upcoming_events_path
+        upcoming_ids = set()
+        if os.path.exists(upcoming_path):
+            upcoming_ids = {e['event_id'] for e in self.csv_manager.read_from_csv(upcoming_path)}
+        
+        scraper = FightScraper(self.config, **self._shared_state())
+        recovered = scraper.retry_failed([{'event_id': event_id} for event_id in event_ids])
+        detail_scraper = FightDetailScraper(self.config, **self._shared_state())
+        for event_id, fights_index in recovered.items():
+            fights_path = (self.config.data.upcoming_fights_path if event_id in upcoming_ids
+                           else self.config.data.fights_path)
+            existing = self.csv_manager.read_from_csv(fights_path) if os.path.exists(fights_path) else []
+            known_ids = {f['fight_id'] for f in existing}
+            new_fights = [f for f in detail_scraper.scrape(fights_index) if f['fight_id'] not in known_ids]
+            self.csv_manager.save_to_csv(existing + new_fights, fights_path, FIGHT_FIELDS)
+            print(f"💾 Added {len(new_fights)} fights from event {event_id} to {fights_path}")
+    
+    def _retry_failed_fights(self):
+        """
+        Vuelve a descargar las peleas fallidas y actualiza sus filas en los CSV de peleas.
+        """
+        fight_ids = {e.key for e in self.dead_letters.pending(entity='fight')}
+        if not fight_ids:
+            return
+        
+        scraper = FightDetailScraper(self.config, **self._shared_state())
+        index_fields = ['event_id', 'fight_id', 'fight_order']
+        for fights_path in (self.config.data.fights_path, self.config.data.upcoming_fights_path):
+            if not os.path.exists(fights_path):
+                continue
+            fights = self.csv_manager.read_from_csv(fights_path)
+            # Solo se pasan los campos del índice para que los detalles nuevos no se mezclen con columnas vacías
+            targets = [{k: f[k] for k in index_fields} for f in fights if f['fight_id'] in fight_ids]
+            recovered = scraper.retry_failed(targets)
+            if not recovered:
+                continue
+            for fight in fights:
+                fight.update(recovered.get(fight['fight_id'], {}))
+            self.csv_manager.save_to_csv(fights, fights_path, FIGHT_FIELDS)
+            print(f"💾 Patched {len(recovered)} fights in {fights_path}")
+    
+    def _retry_failed_fighters(self):
+        """
+        Vuelve a descargar los detalles de los luchadores fallidos y actualiza sus filas en el CSV de luchadores.
+        """
+        fighter_ids = {e.key for e in self.dead_letters.pending(entity='fighter')}
+        fighters_path = self.config.data.fighters_path
+        if not fighter_ids or not os.path.exists(fighters_path):
+            return
+        
+        fighters = self.csv_manager.read_from_csv(fighters_path)
+        scraper = FighterDetailScraper(self.config, **self._shared_state())
+        recovered = scraper.retry_failed([f for f in fighters if f['fighter_id'] in fighter_ids])
+        if not recovered:
+            return
+        fighters = [recovered.get(f['fighter_id'], f) for f in fighters]
+        self.csv_manager.save_to_csv(fighters, fighters_path, FIGHTER_FIELDS + FIGHTER_DETAIL_FIELDS)
+        print(f"💾 Patched {len(recovered)} fighters in {fighters_path}")
+    
+    def _print_run_settings(self):
+        """
+        Muestra el modo de ejecución y los parámetros de descarga y parseo activos.
+        """
+        print(f"Mode: {'Development' if self.config.scraping.dev_mode else 'Production'}")
+        if self.config.scraping.dev_mode:
+            print(f"Limit: {self.config.scraping.dev_limit}")
+        print(f"Engine: {self.config.scraping.engine} (parser: {self.config.scraping.parser_backend}"
+              f"{', process pool' if self.config.scraping.process_parsing else ''})")
+        print(f"Rate limit: {self.config.scraping.requests_per_second} req/s "
+              f"(burst {self.config.scraping.burst}, "
+              f"{'adaptive' if self.config.scraping.adaptive_concurrency else 'fixed'} concurrency)")
+        if self.config.scraping.page_source == 'archive':
+            print(f"Pages: read from the archive {self.config.data.archive_path} (no network)")
+        elif self.config.data.archive_pages:
+            print(f"Pages: archived to {self.config.data.archive_path}")
+        if self.config.data.parse_memo:
+            print(f"Parsed rows: unchanged pages reuse the rows in {self.config.data.parse_memo_path}")
+        if self.resume:
+            print(f"Resuming from checkpoints in {self.config.data.checkpoints_dir}")
+    
+    def _shared_state(self) -> Dict[str, Any]:
+        """
+        Estado compartido por todos los scrapers de la ejecución: cola de fallos, ledger y journal de checkpoints.
+        """
+        return {'dead_letters': self.dead_letters, 'ledger': self.ledger, 'journal': self.journal}
+    
+    def _table_paths(self) -> Dict[str, str]:
+        """
+        CSV crudo correspondiente a cada tabla del almacenamiento SQLite.
+        """
+        data = self.config.data
+        return {
+            'fighters': data.fighters_path,
+            'events': data.events_path,
+            'upcoming_events': data.upcoming_events_path,
+            'fights': data.fights_path,
+            'upcoming_fights': data.upcoming_fights_path,
+        }
+    
+    def _sync_store(self, tables: Optional[List[str]] = None):
+        """
+        Carga con upserts los CSV crudos indicados (todos por defecto) en el almacenamiento SQLite, si está activo.
+        """
+        if self.store is None:
+            return
+        for table, csv_path in self._table_paths().items():
+            if (tables is None or table in tables) and os.path.exists(csv_path):
+                written = self.store.import_csv(table, csv_path)
+                print(f"🗃️ Upserted {written} rows from {csv_path} into {table}")
+    
+    @contextmanager
+    def _phase(self, title: str, name: str) -> Iterator[None]:
+        """
+        Muestra la cabecera de una fase y etiqueta con su nombre las métricas registradas durante ella.
+        Con --profile la fase se ejecuta además bajo el perfilador.
+        """
+        print("\n" + "="*50)
+        print(title)
+        print("="*50)
+        with self.metrics.phase(name), (self.profiler.profile(name) if self.profiler else nullcontext()):
+            yield
+    
+    def _write_metrics(self, run: str, success: bool, duration: float):
+        """
+        Escribe el informe JSON y el fichero de Prometheus de la ejecución y muestra el reparto entre red y parseo
+        de cada fase.
+        """
+        data = self.config.data
+        self.metrics.set('run_success', int(success), run=run)
+        self.metrics.set('run_duration_seconds', duration, run=run)
+        self.metrics.set('run_timestamp_seconds', time.time(), run=run)
+        try:
+            self.metrics.write_json(data.metrics_report_path, run=run, success=success, duration_seconds=duration)
+            self.metrics.write_prometheus(data.metrics_textfile_path)
+        except OSError as e:
+            print(f"⚠️ Could not write metrics: {e}")
+            return
+        for phase, stats in self.metrics.phase_summary().items():
+            if phase == 'none':
+                continue
+            print(f"📈 {phase}: {stats['duration_seconds']:.1f}s, {stats['requests']:.0f} requests "
+                  f"({stats['bytes'] / 1024 ** 2:.1f} MB, {stats['network_seconds']:.1f}s network), "
+                  f"{stats['pages_parsed']:.0f} pages parsed ({stats['parse_seconds']:.1f}s), "
+                  f"{stats['rows_emitted']:.0f} rows")
+        print(f"📊 Metrics written to {data.metrics_report_path} and {data.metrics_textfile_path}")
+    
+    def _transform(self, title: str, force: bool = False):
+        """
+        Genera los CSV limpios de data/processed a partir de los CSV crudos, si la fase está activada (o `force`).
+        Sin pandas instalado la fase se omite con un aviso.
+        """
+        if not (force or self.config.data.transform):
+            return
+        try:
+            transformer = DataTransformer(self.config.data)
+        except ConfigurationError as e:
+            print(f"⚠️ Skipping transform phase: {e}")
+            return
+        with self._phase(title, 'transform'):
+            transformer.run()
+    
+    def _build_features(self, title: str):
+        """
+        Extiende el almacén de características y el motor de ratings previos a cada pelea con las peleas limpias
+        nuevas (o los reconstruye con --rebuild-features), si la fase está activada.
+        Sin pandas instalado la fase se omite con un aviso.
+        """
+        if not self.config.data.features:
+            return
+        try:
+            stores = [FeatureStore(self.config.data), RatingEngine(self.config.data)]
+        except ConfigurationError as e:
+            print(f"⚠️ Skipping features phase: {e}")
+            return
+        with self._phase(title, 'features'):
+            for store in stores:
+                store.update(rebuild=self.rebuild_features)
+    
+    def _build_ml_dataset(self, title: str):
+        """
+        Genera el dataset simétrico de data/ml a partir de los datos limpios y las características previas, si la
+        fase está activada. Sin pandas (o sin pyarrow para la salida Parquet) la fase se omite con un aviso.
+        """
+        if not self.config.data.ml_dataset:
+            return
+        try:
+            writer = MLDatasetWriter(self.config.data)
+        except ConfigurationError as e:
+            print(f"⚠️ Skipping ML dataset phase: {e}")
+            return
+        with self._phase(title, 'ml_dataset'):
+            writer.run()
+    
+    def _export_parquet(self):
+        """
+        Exporta los CSV crudos a Parquet con esquema tipado, si la salida Parquet está activada.
+        """
+        data = self.config.data
+        if not data.write_parquet:
+            return
+        tables = [
+            (data.fighters_path, FIGHTER_FIELDS + FIGHTER_DETAIL_FIELDS),
+            (data.events_path, EVENT_FIELDS),
+            (data.fights_path, FIGHT_FIELDS),
+            (data.upcoming_events_path, EVENT_FIELDS),
+            (data.upcoming_fights_path, FIGHT_FIELDS),
+        ]
+        for csv_path, fields in tables:
+            if os.path.exists(csv_path):
+                parquet_path = ParquetManager.csv_to_parquet(csv_path, fields)
+                print(f"🧱 Exported {csv_path} to {parquet_path}")
+    
+    def _save_dead_letters(self):
+        """
+        Persiste la cola de peticiones fallidas para poder recuperarlas con --retry-failed.
+        """
+        path = self.config.data.failed_urls_path
+        self.dead_letters.save(path)
+        if len(self.dead_letters):
+            print(f"⚠️ {len(self.dead_letters)} failed requests saved to {path}")
+    
+    def _report_rate_limit_stats(self):
+        """
+        Muestra el estado final del control adaptativo de concurrencia, si está activo.
+        """
+        scraping = self.config.scraping
+        if not scraping.adaptive_concurrency:
+            return
+        limiter = get_shared_rate_limiter(
+            scraping.requests_per_second,
+            scraping.burst,
+            adaptive=True,
+            initial_concurrency=scraping.max_workers,
+            max_concurrency=scraping.max_concurrency,
+            latency_target=scraping.latency_target
+        )
+        stats = limiter.stats()
+        print(f"🚦 Adaptive concurrency: final limit {stats['limit']}, {stats['requests']} requests, "
+              f"{stats['throttled']} throttled, {stats['increases']} increases, {stats['decreases']} decreases")
+    
+    def _report_cache_stats(self):
+        """
+        Muestra los contadores de la caché HTTP compartida al finalizar el pipeline.
+        """
+        if not self.config.cache.enabled:
+            return
+        cache = get_shared_cache(self.config.cache.directory, self.config.cache.max_bytes)
+        stats = cache.stats()
+        print(f"🗄️ HTTP cache: {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['hit_rate']:.1f}% hit rate), {stats['evictions']} evictions, "
+              f"{stats['size_bytes'] / 1024 ** 2:.1f} MB on disk")
+    
+    def _report_archive_stats(self):
+        """
+        Muestra el contenido del archivo de páginas crudas al finalizar el pipeline, si está activo.
+        """
+        if not self.config.data.archive_pages:
+            return
+        stats = get_shared_archive(self.config.data.archive_path).stats()
+        pages = sum(s['pages'] for s in stats.values())
+        size = sum(s['bytes'] for s in stats.values())
+        compressed = sum(s['compressed_bytes'] for s in stats.values())
+        print(f"🗜️ Page archive: {pages} pages, {compressed / 1024 ** 2:.1f} MB compressed "
+              f"({size / 1024 ** 2:.1f} MB raw) in {self.config.data.archive_path}")
+    
+    def _report_parse_memo_stats(self):
+        """
+        Muestra cuántas páginas de detalle no han cambiado y han reutilizado su fila parseada, si la memoria está activa.
+        """
+        if not self.config.data.parse_memo:
+            return
+        stats = get_shared_parse_memo(self.config.data.parse_memo_path).stats()
+        print(f"♻️ Parse memo: {stats['hits']} unchanged pages reused, {stats['misses']} parsed "
+              f"({stats['hit_rate']:.1f}% reused)")
+    
     def _scrape_fighters(self):
         """
         Extrae información básica de luchadores y la almacena en el archivo correspondiente.
         """
-        scraper = FighterScraper(self.config)
+        scraper = FighterScraper(self.config, **self._shared_state())
         fighters = scraper.scrape()
         
         all_fields = FIGHTER_FIELDS + FIGHTER_DETAIL_FIELDS
@@ -78,12 +619,15 @@ class UFCScrapingOrchestrator:
             all_fields
         )
         print(f"💾 Saved {len(fighters)} fighters to {self.config.data.fighters_path}")
+        if self.store is not None:
+            # Solo se actualizan las columnas del listado: los detalles de ejecuciones anteriores se conservan
+            self.store.upsert('fighters', ({k: f[k] for k in FIGHTER_FIELDS} for f in fighters))
     
     def _scrape_events(self):
         """
         Extrae información de eventos y la almacena en el archivo correspondiente.
         """
-        scraper = EventScraper(self.config)
+        scraper = EventScraper(self.config, **self._shared_state())
         scraper.scrape()
     
     def _scrape_fighter_details(self):
@@ -93,17 +637,21 @@ class UFCScrapingOrchestrator:
         # Load existing fighters
         fighters = self.csv_manager.read_from_csv(self.config.data.fighters_path)
         
-        # Scrape details
-        scraper = FighterDetailScraper(self.config)
-        updated_fighters = scraper.scrape(fighters)
+        scraper = FighterDetailScraper(self.config, **self._shared_state())
+        if self.store is not None:
+            # Los detalles se escriben por lotes con upserts y el CSV se exporta desde la base de datos.
+            # Solo se pasan los campos del listado para que un fallo no sobrescriba detalles ya guardados
+            targets = [{k: f[k] for k in FIGHTER_FIELDS} for f in fighters]
+            with self.store.writer('fighters') as sink:
+                scraper.scrape(targets, sink=sink)
+            self.store.export_csv('fighters', self.config.data.fighters_path)
+            print(f"💾 Updated fighter details in {self.config.data.sqlite_path} and {self.config.data.fighters_path}")
+            return
         
-        # Save updated data
+        # Scrape details, streaming each fighter to a temp file that replaces the CSV once the phase completes
         all_fields = FIGHTER_FIELDS + FIGHTER_DETAIL_FIELDS
-        self.csv_manager.save_to_csv(
-            updated_fighters, 
-            self.config.data.fighters_path, 
-            all_fields
-        )
+        with self.csv_manager.open_writer(self.config.data.fighters_path, all_fields) as sink:
+            scraper.scrape(fighters, sink=sink)
         print(f"💾 Updated fighter details in {self.config.data.fighters_path}")
     
     def _scrape_fights_index(self):
@@ -114,7 +662,7 @@ class UFCScrapingOrchestrator:
         events = self.csv_manager.read_from_csv(self.config.data.events_path)
         
         # Scrape fight index
-        scraper = FightScraper(self.config)
+        scraper = FightScraper(self.config, **self._shared_state())
         fights = scraper.scrape_fight_index(events)
         
         # Save fight index
@@ -128,19 +676,39 @@ class UFCScrapingOrchestrator:
     
     def _scrape_fight_details(self):
         """
-        Extrae información detallada de peleas y actualiza el archivo correspondiente.
+        Completa los detalles de las peleas que aún no los tienen y actualiza el archivo correspondiente.
+        Las peleas cuyos detalles ya se descargaron en esta ejecución (fase 3) constan en el ledger y se omiten.
         """
         # Load fight index
         fights = self.csv_manager.read_from_csv(self.config.data.fights_path)
         
+        missing_ids = set(self.ledger.missing('fight', [f['fight_id'] for f in fights]))
+        if not missing_ids:
+            print(f"✅ All {len(fights)} fights already have details from phase 3, skipping")
+            return
+        print(f"🔎 {len(missing_ids)}/{len(fights)} fights are missing details")
+        
+        # Solo se pasan los campos del índice para que los detalles nuevos no se mezclen con columnas vacías
+        index_fields = ['event_id', 'fight_id', 'fight_order']
+        targets = [{k: f[k] for k in index_fields} for f in fights if f['fight_id'] in missing_ids]
+        
         # Scrape fight details
-        scraper = FightDetailScraper(self.config)
-        detailed_fights = scraper.scrape(fights)
+        scraper = FightDetailScraper(self.config, **self._shared_state())
+        if self.store is not None:
+            # Solo se actualizan las filas de las peleas descargadas; el CSV se exporta desde la base de datos
+            with self.store.writer('fights') as sink:
+                scraper.scrape(targets, sink=sink)
+            self.store.export_csv('fights', self.config.data.fights_path)
+            print(f"💾 Updated fight details in {self.config.data.sqlite_path} and {self.config.data.fights_path}")
+            return
+        detailed = {f['fight_id']: f for f in scraper.scrape(targets) if self.ledger.is_done('fight', f['fight_id'])}
         
         # Save detailed fight data
+        for fight in fights:
+            fight.update(detailed.get(fight['fight_id'], {}))
         self.csv_manager.save_to_csv(
-            detailed_fights, 
+            fights, 
             self.config.data.fights_path, 
             FIGHT_FIELDS
         )
-        print(f"💾 Updated fight details in {self.config.data.fights_path}")
\ No newline at end of file
+        print(f"💾 Updated details of {len(detailed)} fights in {self.config.data.fights_path}")
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""
+Motor de ratings de luchadores (Elo y Glicko) del pipeline UFC ETL.
+Consume las peleas limpias en orden cronológico y mantiene el estado en arrays de NumPy indexados por un código
+entero por luchador (rating Elo, rating y desviación Glicko, día y número de su última pelea). Las peleas se
+procesan por lotes en los que ningún luchador se repite (en la práctica, un lote por fecha de evento; los torneos
+antiguos con varias peleas por noche se dividen), y cada lote se actualiza con operaciones vectorizadas de
+gather/scatter sobre esos arrays, de modo que reconstruir desde 1993 cuesta unos cientos de operaciones de NumPy.
+Cada fila de data/features/ratings.csv contiene los ratings previos a la pelea y la probabilidad de victoria de la
+esquina roja. El estado se guarda en data/features/ratings_state.npz y las ejecuciones posteriores (por ejemplo
+tras --incremental) solo aplican las peleas nuevas; si cambia alguna pelea ya procesada se reconstruye todo.
+Requiere pandas (pip install -e .[transform]).
+"""
+import math
+from typing import BinaryIO, Dict, List, Optional
+from ..utils.metrics import get_metrics
+from .features import FightStreamStore, KEY_COLUMNS, NO_CONTEST_METHODS
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pandas solo es necesario para las fases de transformación y características
+    np = None
+    pd = None
+
+
+# Cambiar al modificar los parámetros o las fórmulas: invalida el estado guardado
+RATINGS_VERSION = 3
+ELO_START = 1500.0
+ELO_K = 32.0
+GLICKO_START = 1500.0
+GLICKO_RD_START = 350.0
+GLICKO_RD_MIN = 30.0
+# Incremento de la desviación por periodo de inactividad (30 días): de 50 a 350 en unos tres años sin pelear
+GLICKO_C = 57.7
+GLICKO_PERIOD_DAYS = 30.0
+GLICKO_Q = math.log(10) / 400
+RATING_COLUMNS = (
+    'red_elo', 'blue_elo', 'red_elo_win_prob',
+    'red_glicko', 'red_glicko_rd', 'blue_glicko', 'blue_glicko_rd', 'red_glicko_win_prob',
+)
+
+
+def _g(rd: 'np.ndarray') -> 'np.ndarray':
+    return 1 / np.sqrt(1 + 3 * GLICKO_Q ** 2 * rd ** 2 / math.pi ** 2)
+
+
+def _prefight_rd(state: 'RatingState', codes: 'np.ndarray', day: int) -> 'np.ndarray':
+    """Desviación Glicko el día de la pelea, incrementada por los periodos sin pelear desde la anterior."""
+    idle = np.where(state.seen_day[codes] < 0, 0, day - state.seen_day[codes]) / GLICKO_PERIOD_DAYS
+    return np.minimum(np.sqrt(state.rd[codes] ** 2 + GLICKO_C ** 2 * idle), GLICKO_RD_START)
+
+
+class RatingState:
+    """
+    Estado del motor de ratings en arrays indexados por el código entero de cada luchador.
+    Los arrays crecen por duplicación al aparecer luchadores nuevos.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.index: Dict[str, int] = {}
+        self.elo = np.full(capacity, ELO_START)
+        self.glicko = np.full(capacity, GLICKO_START)
+        self.rd = np.full(capacity, GLICKO_RD_START)
+        self.seen_day = np.full(capacity, -1, dtype=np.int64)
+        self.fights = np.zeros(capacity, dtype=np.int32)
+        self.fight_ids = set()
+        self.digest = 0
+        self.last_day: Optional[int] = None
+        self.rows = 0
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def codes(self, fighter_ids: List[str]) -> 'np.ndarray':
+        """Códigos enteros de los luchadores, asignando códigos nuevos a los que aún no tienen."""
+        index = self.index
+        for fighter_id in fighter_ids:
+            if fighter_id not in index:
+                index[fighter_id] = len(index)
+        if len(index) > len(self.elo):
+            self._grow(len(index))
+        return np.fromiter((index[f] for f in fighter_ids), dtype=np.int64, count=len(fighter_ids))
+
+    def _grow(self, size: int):
+        capacity = len(self.elo)
+        while capacity < size:
+            capacity *= 2
+        extra = capacity - len(self.elo)
+        self.elo = np.concatenate([self.elo, np.full(extra, ELO_START)])
+        self.glicko = np.concatenate([self.glicko, np.full(extra, GLICKO_START)])
+        self.rd = np.concatenate([self.rd, np.full(extra, GLICKO_RD_START)])
+        self.seen_day = np.concatenate([self.seen_day, np.full(extra, -1, dtype=np.int64)])
+        self.fights = np.concatenate([self.fights, np.zeros(extra, dtype=np.int32)])
+
+    def save(self, f: BinaryIO):
+        """Guarda el estado como .npz (solo las posiciones ocupadas de los arrays)."""
+        n = len(self.index)
+        np.savez(f, version=RATINGS_VERSION, fighter_ids=np.array(list(self.index), dtype=str),
+                 elo=self.elo[:n], glicko=self.glicko[:n], rd=self.rd[:n], seen_day=self.seen_day[:n],
+                 fights=self.fights[:n], fight_ids=np.array(sorted(self.fight_ids), dtype=str),
+                 digest=np.uint64(self.digest), last_day=-1 if self.last_day is None else self.last_day,
+                 rows=self.rows)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['RatingState']:
+        """Estado guardado con save(), o None si es de otra versión del motor."""
+        with np.load(path, allow_pickle=False) as saved:
+            if int(saved['version']) != RATINGS_VERSION:
+                return None
+            fighter_ids = saved['fighter_ids'].tolist()
+            state = cls(capacity=max(1024, len(fighter_ids)))
+            state.codes(fighter_ids)
+            n = len(fighter_ids)
+            state.elo[:n], state.glicko[:n], state.rd[:n] = saved['elo'], saved['glicko'], saved['rd']
+            state.seen_day[:n], state.fights[:n] = saved['seen_day'], saved['fights']
+            state.fight_ids = set(saved['fight_ids'].tolist())
+            last_day = int(saved['last_day'])
+            state.last_day = None if last_day < 0 else last_day
+            state.rows = int(saved['rows'])
+            state.digest = int(saved['digest'])
+        return state
+
+
+def _batches(red: 'np.ndarray', blue: 'np.ndarray', days: 'np.ndarray') -> List[int]:
+    """
+    Índices de inicio de los lotes: se abre uno nuevo al cambiar de día o cuando un luchador ya aparece en el lote.
+    """
+    starts, seen, current_day = [], set(), None
+    for i, (r, b, day) in enumerate(zip(red.tolist(), blue.tolist(), days.tolist())):
+        if day != current_day or r in seen or b in seen:
+            starts.append(i)
+            seen, current_day = set(), day
+        seen.update((r, b))
+    return starts
+
+
+def rate_fights(fights: 'pd.DataFrame', state: RatingState) -> 'pd.DataFrame':
+    """
+    Emite los ratings previos a cada pelea (ya en orden cronológico) y aplica sus resultados a `state`.
+    Las victorias puntúan 1, las derrotas 0 y los empates 0.5; las peleas sin resultado no cambian los ratings.
+    Returns:
+        pd.DataFrame: KEY_COLUMNS más RATING_COLUMNS.
+    """
+    n = len(fights)
+    red = state.codes(fights['red_id'].tolist())
+    blue = state.codes(fights['blue_id'].tolist())
+    days = np.fromiter((d.toordinal() for d in fights['date']), dtype=np.int64, count=n)
+    winner = fights['winner_id'].to_numpy()
+    score = np.where(winner == fights['red_id'].to_numpy(), 1.0,
+                     np.where(winner == fights['blue_id'].to_numpy(), 0.0, 0.5))
+    rated = ~(fights['winner_id'].isna().to_numpy() & fights['method'].isin(NO_CONTEST_METHODS).to_numpy())
+    out = np.empty((n, len(RATING_COLUMNS)))
+
+    starts = _batches(red, blue, days)
+    for start, end in zip(starts, starts[1:] + [n]):
+        r, b, day = red[start:end], blue[start:end], days[start]
+        s, mask = score[start:end], rated[start:end]
+
+        # Elo
+        elo_r, elo_b = state.elo[r], state.elo[b]
+        expected = 1 / (1 + 10 ** ((elo_b - elo_r) / 400))
+        state.elo[r] = np.where(mask, elo_r + ELO_K * (s - expected), elo_r)
+        state.elo[b] = np.where(mask, elo_b - ELO_K * (s - expected), elo_b)
+
+        # Glicko: la desviación crece con los periodos de inactividad antes de la pelea
+        rd_r, rd_b = _prefight_rd(state, r, day), _prefight_rd(state, b, day)
+        gl_r, gl_b = state.glicko[r], state.glicko[b]
+        win_prob = 1 / (1 + 10 ** (-_g(np.sqrt(rd_r ** 2 + rd_b ** 2)) * (gl_r - gl_b) / 400))
+        out[start:end] = np.column_stack([elo_r, elo_b, expected, gl_r, rd_r, gl_b, rd_b, win_prob])
+
+        for own, own_rd, opp, opp_rd, own_score, codes in ((gl_r, rd_r, gl_b, rd_b, s, r),
+                                                           (gl_b, rd_b, gl_r, rd_r, 1 - s, b)):
+            g = _g(opp_rd)
+            e = 1 / (1 + 10 ** (-g * (own - opp) / 400))
+            d2 = 1 / (GLICKO_Q ** 2 * g ** 2 * e * (1 - e))
+            precision = 1 / own_rd ** 2 + 1 / d2
+            new_rating = own + GLICKO_Q / precision * g * (own_score - e)
+            new_rd = np.maximum(np.sqrt(1 / precision), GLICKO_RD_MIN)
+            state.glicko[codes] = np.where(mask, new_rating, own)
+            state.rd[codes] = np.where(mask, new_rd, own_rd)
+
+        both = np.concatenate([r, b])
+        state.seen_day[both] = day
+        state.fights[both] += 1
+
+    if n:
+        state.fight_ids.update(fights['fight_id'].tolist())
+        state.last_day = int(days[-1])
+    rows = pd.DataFrame(out, columns=list(RATING_COLUMNS))
+    keys = fights[list(KEY_COLUMNS)].reset_index(drop=True)
+    keys['date'] = keys['date'].dt.strftime('%Y-%m-%d')
+    return pd.concat([keys, rows], axis=1)
+
+
+class RatingEngine(FightStreamStore):
+    """
+    Mantiene data/features/ratings.csv y el estado .npz del motor de ratings.
+    """
+
+    input_columns = KEY_COLUMNS + ('winner_id', 'method')
+
+    @property
+    def output_path(self) -> str:
+        return self.data.ratings_path
+
+    @property
+    def state_path(self) -> str:
+        return self.data.ratings_state_path
+
+    def new_state(self) -> RatingState:
+        return RatingState()
+
+    def read_state(self, path: str) -> Optional[RatingState]:
+        return RatingState.load(path)
+
+    def write_state(self, state: RatingState, f: BinaryIO):
+        state.save(f)
+
+    def emit(self, fights: 'pd.DataFrame', state: RatingState) -> 'pd.DataFrame':
+        ratings = rate_fights(fights, state)
+        get_metrics().inc('rating_rows_total', len(ratings))
+        return ratings
+
+    def describe(self, state: RatingState) -> str:
+        return f"{len(state)} fighters, {state.rows} rows in total"
@@ -0,0 +1,369 @@
+"""
+Fase de transformación del pipeline UFC ETL: genera los CSV limpios de data/processed a partir de los CSV crudos.
+Implementa de forma vectorizada la limpieza de los notebooks 02_fighters_cleaning, 03_events_cleaning y
+04_fights_cleaning. Las columnas de texto se transforman sobre sus valores distintos (tablas de mapeo categóricas:
+pd.factorize + take), con str.extract y aritmética de NumPy, en lugar de llamar a una función Python por fila.
+La salida coincide con la de los notebooks salvo en sus errores evidentes:
+  - winner_id es un identificador y no se pasa a formato título (el notebook lo dejaba sin correspondencia con
+    red_id/blue_id).
+  - full_name se construye sin quitar la subcadena 'nan' (el notebook mutilaba nombres como 'Brennan Ward').
+  - control_time1/control_time2 se convierten a segundos (el notebook los convertía antes a número y los perdía).
+  - Los pares 'acertados of intentados' se separan en <columna>_landed y <columna>_attempted, como en el modelo
+    Fight, en lugar de convertirse en nulos.
+Requiere pandas (pip install -e .[transform]).
+"""
+import os
+from datetime import date
+from typing import Any, Callable, Dict, Optional
+from ..core.exceptions import ConfigurationError
+from ..utils.metrics import get_metrics
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pandas solo es necesario para la fase de transformación
+    np = None
+    pd = None
+
+
+# Columnas de estadísticas de carrera de los luchadores
+PERCENT_STATS = ('str_acc', 'str_def', 'td_acc', 'td_def')
+RATE_STATS = ('slpm', 'sapm', 'td_avg', 'sub_avg')
+RECORD_COLUMNS = ('wins', 'defeats', 'draws')
+
+# Columnas de peleas
+FIGHT_TEXT_COLUMNS = ('red_name', 'blue_name', 'referee', 'method', 'details')
+FIGHT_COUNT_COLUMNS = ('kd1', 'kd2', 'sub1', 'sub2', 'pass1', 'pass2', 'rev1', 'rev2', 'round')
+FIGHT_CLOCK_COLUMNS = ('time', 'control_time1', 'control_time2')
+FIGHT_PAIR_COLUMNS = ('str1', 'str2', 'td1', 'td2', 'sig_head1', 'sig_head2', 'sig_body1', 'sig_body2',
+                      'sig_leg1', 'sig_leg2', 'total_str1', 'total_str2')
+FIGHT_KEY_COLUMNS = ['event_id', 'fight_id', 'red_id', 'blue_id']
+
+STANCE_LABELS = {'': 'Unknown', 'Nan': 'Unknown', 'None': 'Unknown'}
+
+# Categorías de peso femeninas (subcadena -> etiqueta); se comprueban antes que las masculinas
+WOMEN_WEIGHT_CLASSES = (
+    ('bantamweight', "Women's Bantamweight"),
+    ('featherweight', "Women's Featherweight"),
+    ('flyweight', "Women's Flyweight"),
+    ('strawweight', "Women's Strawweight"),
+)
+# Categorías masculinas y especiales, en orden de prioridad (la primera subcadena que aparece gana)
+WEIGHT_CLASSES = (
+    ('flyweight', 'Flyweight'),
+    ('bantamweight', 'Bantamweight'),
+    ('featherweight', 'Featherweight'),
+    ('lightweight', 'Lightweight'),
+    ('welterweight', 'Welterweight'),
+    ('middleweight', 'Middleweight'),
+    ('light heavyweight', 'Light Heavyweight'),
+    ('heavyweight', 'Heavyweight'),
+    ('open weight', 'Open Weight'),
+    ('catch weight', 'Catchweight'),
+    ('championship bout', 'Open Weight'),
+    ('tournament title bout', 'Open Weight'),
+)
+# Métodos de victoria (subcadena en minúsculas -> etiqueta), en orden de prioridad
+METHODS = (
+    ('ko/tko', 'KO/TKO'),
+    ('submission', 'Submission'),
+    ('decision - unanimous', 'Decision Unanimous'),
+    ('decision - split', 'Decision Split'),
+    ('decision - majority', 'Decision Majority'),
+    ('dq', 'DQ'),
+    ('draw', 'Draw'),
+    ('no contest', 'No Contest'),
+)
+
+INCH_CM = 2.54
+POUND_KG = 0.453592
+
+
+def _require_pandas():
+    if pd is None:
+        raise ConfigurationError("The transform phase requires pandas (pip install -e .[transform])")
+
+
+def by_unique(series: 'pd.Series', transform: Callable[['pd.Series'], Any]) -> Any:
+    """
+    Aplica `transform` (una función vectorizada sobre series) solo a los valores distintos de la serie y reparte el
+    resultado a todas las filas con los códigos de pd.factorize. Los nulos se transforman como un valor más.
+    Si `transform` devuelve un DataFrame, el resultado es un DataFrame con sus columnas.
+    """
+    codes, uniques = pd.factorize(series)
+    table = pd.Series(list(uniques) + [np.nan], dtype=object)
+    # El código -1 de los nulos selecciona el último elemento de la tabla, el nulo añadido
+    result = transform(table)
+    mapped = result.to_numpy()[codes]
+    if isinstance(result, pd.DataFrame):
+        return pd.DataFrame(mapped, index=series.index, columns=result.columns)
+    return pd.Series(mapped, index=series.index, name=series.name)
+
+
+def _text(values: 'pd.Series') -> 'pd.Series':
+    """Valores como str, conservando los nulos (equivale a str(valor) de los notebooks)."""
+    # astype(object): con todos los valores nulos pandas infiere float y el accesor .str dejaría de funcionar
+    return values.astype(str).where(values.notna(), np.nan).astype(object)
+
+
+def _title(values: 'pd.Series') -> 'pd.Series':
+    """Quita espacios sobrantes y pasa a formato título."""
+    return _text(values).str.strip().str.replace(r'\s+', ' ', regex=True).str.title()
+
+
+def _round1(values: 'pd.Series') -> 'pd.Series':
+    """
+    Redondea a un decimal con round() de Python: np.round difiere en empates binarios como 7.5 * 2.54.
+    Solo se aplica a la tabla de valores distintos, así que su coste no depende del número de filas.
+    """
+    return pd.Series([round(v, 1) for v in values.astype(float)], index=values.index, dtype=float)
+
+
+def _first_number(values: 'pd.Series') -> 'pd.Series':
+    return _text(values).str.extract(r'(\d+(?:\.\d+)?)', expand=False).astype(float)
+
+
+def _height_cm(values: 'pd.Series') -> 'pd.Series':
+    text = _text(values).str.strip()
+    feet_inches = text.str.extract(r"(\d+)'\s*(\d+)")
+    inches = feet_inches[0].astype(float) * 12 + feet_inches[1].astype(float)
+    # Sin el formato pies-pulgadas, el primer número se interpreta como pulgadas
+    inches = inches.fillna(text.str.extract(r'(\d+)', expand=False).astype(float))
+    return _round1(inches * INCH_CM)
+
+
+def _weight_kg(values: 'pd.Series') -> 'pd.Series':
+    return _round1(_first_number(values) * POUND_KG)
+
+
+def _reach_cm(values: 'pd.Series') -> 'pd.Series':
+    return _round1(_first_number(values) * INCH_CM)
+
+
+def _stance(values: 'pd.Series') -> 'pd.Series':
+    return _text(values).str.strip().str.title().replace(STANCE_LABELS).fillna('Unknown')
+
+
+def _nickname(values: 'pd.Series') -> 'pd.Series':
+    text = _text(values)
+    missing = text.isna() | text.str.lower().isin(['', 'nan', 'none'])
+    text = text.str.strip().str.strip('"\'')
+    return text.where(~missing & (text != ''), None)
+
+
+def _percent(values: 'pd.Series') -> 'pd.Series':
+    return pd.to_numeric(_text(values).str.replace('%', '', regex=False), errors='coerce') / 100
+
+
+def _seconds(values: 'pd.Series') -> 'pd.Series':
+    """Tiempos 'm:ss' o 'h:mm:ss' a segundos; los valores sin ':' se interpretan como número."""
+    text = _text(values).str.strip()
+    clock = text.str.extract(r'^(\d+):(\d+(?:\.\d+)?)$').astype(float)
+    long_clock = text.str.extract(r'^(\d+):(\d+):(\d+(?:\.\d+)?)$').astype(float)
+    seconds = clock[0] * 60 + clock[1]
+    seconds = seconds.fillna(long_clock[0] * 3600 + long_clock[1] * 60 + long_clock[2])
+    plain = pd.to_numeric(text.where(~text.str.contains(':', regex=False, na=False)), errors='coerce')
+    return seconds.fillna(plain)
+
+
+def _substring_labels(lower: 'pd.Series', labels, default: 'pd.Series') -> 'pd.Series':
+    """Etiqueta de la primera subcadena de `labels` contenida en cada valor, o el valor de `default`."""
+    conditions = [lower.str.contains(key, regex=False, na=False).to_numpy() for key, _ in labels]
+    choices = [label for _, label in labels]
+    return pd.Series(np.select(conditions, choices, default=default.to_numpy()), index=lower.index)
+
+
+def _weight_class(values: 'pd.Series') -> 'pd.Series':
+    text = _text(values)
+    lower = text.str.lower()
+    women = lower.str.contains('women', regex=False, na=False)
+    conditions = [(women & lower.str.contains(key, regex=False, na=False)).to_numpy()
+                  for key, _ in WOMEN_WEIGHT_CLASSES]
+    conditions += [lower.str.contains(key, regex=False, na=False).to_numpy() for key, _ in WEIGHT_CLASSES]
+    choices = [label for _, label in WOMEN_WEIGHT_CLASSES + WEIGHT_CLASSES]
+    return pd.Series(np.select(conditions, choices, default=text.to_numpy()), index=values.index)
+
+
+def _method(values: 'pd.Series') -> 'pd.Series':
+    lower = _text(values).str.strip().str.lower()
+    return _substring_labels(lower, METHODS, lower.str.title())
+
+
+def _pair(values: 'pd.Series') -> 'pd.DataFrame':
+    """Pares 'acertados of intentados' a dos columnas numéricas."""
+    return _text(values).str.extract(r'^\s*(\d+)\s+of\s+(\d+)\s*$').astype(float)
+
+
+def _parse_dates(values: 'pd.Series', fmt: str) -> 'pd.Series':
+    """Fechas con el formato de ufcstats; los valores con otro formato se interpretan como en los notebooks."""
+    parsed = pd.to_datetime(values, format=fmt, errors='coerce')
+    pending = parsed.isna() & values.notna()
+    if pending.any():
+        parsed[pending] = pd.to_datetime(values[pending], errors='coerce')
+    return parsed
+
+
+def clean_fighters(raw: 'pd.DataFrame', today: Optional[date] = None) -> 'pd.DataFrame':
+    """
+    Limpia la tabla cruda de luchadores (notebook 02): nombre completo, medidas en cm y kg, guardia normalizada,
+    récord como float, fecha de nacimiento y edad, y estadísticas con los porcentajes como fracción.
+    Args:
+        raw (pd.DataFrame): raw_fighters.csv tal como lo lee pd.read_csv.
+        today (date, opcional): Fecha de referencia para la edad (por defecto, hoy).
+    Returns:
+        pd.DataFrame: Luchadores limpios indexados por fighter_id, sin duplicados.
+    """
+    _require_pandas()
+    today = today or date.today()
+    df = raw.copy()
+
+    first = by_unique(df['first'], _title)
+    last = by_unique(df['last'], _title)
+    full_name = (first.fillna('') + ' ' + last.fillna('')).str.strip()
+    df.insert(df.columns.get_loc('first'), 'full_name', full_name)
+    df['nickname'] = by_unique(df['nickname'], _nickname)
+    df = df.drop(columns=['first', 'last'])
+
+    df['height'] = by_unique(df['height'], _height_cm)
+    df['weight'] = by_unique(df['weight'], _weight_kg)
+    df['reach'] = by_unique(df['reach'], _reach_cm)
+    df['stance'] = by_unique(df['stance'], _stance)
+
+    for column in RECORD_COLUMNS:
+        df[column] = pd.to_numeric(df[column], errors='coerce').fillna(0).clip(lower=0).astype(float)
+    df['total_fights'] = df[list(RECORD_COLUMNS)].sum(axis=1)
+
+    df['dob'] = pd.to_datetime(_text(df['dob']).str.strip(), format='%b %d, %Y', errors='coerce')
+    df['age'] = today.year - df['dob'].dt.year.astype(float)
+
+    for column in PERCENT_STATS:
+        df[column] = by_unique(df[column], _percent).astype(float)
+    for column in RATE_STATS:
+        df[column] = pd.to_numeric(df[column], errors='coerce')
+
+    excluded = {'fighter_id', 'full_name', 'nickname', 'stance', 'belt', 'dob'}
+    for column in df.columns:
+        if column not in excluded:
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype(float)
+    df['stance'] = df['stance'].astype('category')
+    df['full_name'] = df['full_name'].astype('string')
+    df['nickname'] = df['nickname'].astype('string')
+
+    df = df.set_index('fighter_id')
+    return df[~df.index.duplicated(keep='first')]
+
+
+def clean_events(raw: 'pd.DataFrame') -> 'pd.DataFrame':
+    """
+    Limpia la tabla cruda de eventos disputados (notebook 03): fecha, nombre y lugar normalizados y país.
+    Returns:
+        pd.DataFrame: Eventos indexados por event_id, sin los que no tienen id, nombre o fecha.
+    """
+    _require_pandas()
+    df = raw.copy()
+    df['date'] = _parse_dates(df['date'], '%B %d, %Y')
+    df['name'] = by_unique(df['name'], _title)
+    df['location'] = by_unique(df['location'], _title)
+    # País: lo que sigue a la última coma del lugar
+    df['country'] = by_unique(df['location'], lambda v: _text(_text(v).str.rsplit(',', n=1).str[1]).str.strip())
+
+    df = df.dropna(subset=['event_id', 'name', 'date'])
+    df['location'] = df['location'].astype('category')
+    df['country'] = df['country'].astype('category')
+    df['name'] = df['name'].astype('string')
+    return df.set_index('event_id')
+
+
+def clean_upcoming(raw: 'pd.DataFrame') -> 'pd.DataFrame':
+    """
+    Limpia la tabla cruda de eventos próximos (notebook 03) y añade la columna winner_id vacía.
+    Returns:
+        pd.DataFrame: Eventos próximos indexados por event_id, sin los que no tienen nombre o fecha.
+    """
+    _require_pandas()
+    df = raw.copy()
+    df['date'] = _parse_dates(df['date'], '%B %d, %Y')
+    df['location'] = df['location'].astype('category')
+    df['name'] = df['name'].astype('string')
+    df = df.set_index('event_id').dropna(subset=['name', 'date'])
+    df['winner_id'] = ''
+    return df
+
+
+def clean_fights(raw: 'pd.DataFrame') -> 'pd.DataFrame':
+    """
+    Limpia la tabla cruda de peleas (notebook 04): textos normalizados, contadores numéricos, tiempos en segundos,
+    categorías de peso y métodos de victoria unificados y pares de golpes separados en acertados e intentados.
+    Returns:
+        pd.DataFrame: Peleas sin duplicados por fight_id ni filas sin evento, pelea o luchadores.
+    """
+    _require_pandas()
+    df = raw.copy()
+    for column in FIGHT_TEXT_COLUMNS:
+        df[column] = by_unique(df[column], _title)
+    for column in FIGHT_COUNT_COLUMNS:
+        df[column] = pd.to_numeric(df[column], errors='coerce')
+    for column in FIGHT_CLOCK_COLUMNS:
+        df[column] = by_unique(df[column], _seconds).astype(float)
+    for column in FIGHT_PAIR_COLUMNS:
+        position = df.columns.get_loc(column)
+        pair = by_unique(df.pop(column), _pair)
+        df.insert(position, f'{column}_landed', pair[0])
+        df.insert(position + 1, f'{column}_attempted', pair[1])
+
+    df['weight_class'] = by_unique(df['weight_class'], _weight_class)
+    df['method'] = by_unique(df['method'], _method)
+    df['details'] = by_unique(df['details'], _method)
+    df['winner_id'] = df['winner_id'].replace({'': np.nan, 'None': np.nan})
+
+    df = df.drop_duplicates(subset=['fight_id'])
+    return df.dropna(subset=FIGHT_KEY_COLUMNS)
+
+
+class DataTransformer:
+    """
+    Genera los CSV de data/processed (luchadores, eventos, eventos próximos y peleas) a partir de los CSV crudos,
+    con el mismo formato que escribían los notebooks. Las tablas cuyo CSV crudo no existe se omiten.
+    Args:
+        data (DataConfig): Rutas de datos del pipeline.
+        today (date, opcional): Fecha de referencia para la edad de los luchadores.
+    """
+
+    def __init__(self, data, today: Optional[date] = None):
+        _require_pandas()
+        self.data = data
+        self.today = today
+
+    def run(self) -> Dict[str, int]:
+        """
+        Transforma todas las tablas disponibles.
+        Returns:
+            Dict[str, int]: Filas escritas por tabla.
+        """
+        data = self.data
+        os.makedirs(data.processed_dir, exist_ok=True)
+        tables = [
+            ('fighters', data.fighters_path, data.processed_fighters_path,
+             lambda df: clean_fighters(df, self.today), True),
+            ('events', data.events_path, data.processed_events_path, clean_events, True),
+            ('upcoming', data.upcoming_events_path, data.processed_upcoming_path, clean_upcoming, True),
+            ('fights', data.fights_path, data.processed_fights_path, clean_fights, False),
+        ]
+        written = {}
+        for table, raw_path, processed_path, clean, index in tables:
+            if not os.path.exists(raw_path):
+                print(f"⏭️ Skipping {table}: {raw_path} not found")
+                continue
+            clean_df = clean(pd.read_csv(raw_path))
+            self._write(clean_df, processed_path, index)
+            written[table] = len(clean_df)
+            get_metrics().inc('transform_rows_total', len(clean_df), table=table)
+            print(f"🧹 {table}: {len(clean_df)} rows written to {processed_path}")
+        return written
+
+    @staticmethod
+    def _write(df: 'pd.DataFrame', path: str, index: bool):
+        # Se escribe en un temporal y se reemplaza, para no dejar un CSV a medias si la fase se interrumpe
+        tmp_path = f"{path}.tmp"
+        df.to_csv(tmp_path, index=index)
+        os.replace(tmp_path, path)
@@ -0,0 +1,97 @@
+"""lxml parser backend helpers."""
+from typing import List, Optional, Union
+import lxml.html
+from bs4.dammit import UnicodeDammit
+from lxml import etree
+from ...utils.http import extract_id_from_url
+from ...utils.metrics import timed
+
+
+def has_class(name: str) -> str:
+    """XPath predicate matching a class token, like BeautifulSoup's class_ filter."""
+    if ' ' in name:
+        # BeautifulSoup compares multi-class filters against the whole attribute value
+        return f"normalize-space(@class)='{name}'"
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def xpath(expression: str) -> etree.XPath:
+    """Compile an XPath expression once, returning plain strings instead of smart strings."""
+    return etree.XPath(expression, smart_strings=False)
+
+
+# Text nodes rendered by BeautifulSoup's get_text(): comments are not text nodes and
+# script/style/template contents are excluded by bs4 as well
+_TEXT_NODES = xpath('descendant::text()[not(parent::script or parent::style or parent::template)]')
+
+
+def get_text(element, strip: bool = False) -> str:
+    """Equivalent of BeautifulSoup's element.get_text() / get_text(strip=True)."""
+    strings = _TEXT_NODES(element)
+    if strip:
+        return ''.join(s.strip() for s in strings)
+    return ''.join(strings)
+
+
+def first(nodes: List) -> Optional[object]:
+    """First node of an XPath result, or None."""
+    return nodes[0] if nodes else None
+
+
+def next_element_sibling(element):
+    """Equivalent of BeautifulSoup's find_next_sibling(): skips text and comments."""
+    sibling = element.getnext()
+    while sibling is not None and not isinstance(sibling.tag, str):
+        sibling = sibling.getnext()
+    return sibling
+
+
+def string_of(element) -> Optional[str]:
+    """Equivalent of BeautifulSoup's .string: the only string inside the element, if any."""
+    children = len(element)
+    if children == 0:
+        return element.text
+    if children == 1 and not element.text and not element[0].tail:
+        child = element[0]
+        if not isinstance(child.tag, str):
+            return child.text
+        return string_of(child)
+    return None
+
+
+class LxmlParserMixin:
+    """
+    Shared behaviour of the lxml parser backend.
+    Subclasses mirror their BeautifulSoup parser with precompiled XPath and must yield identical dicts.
+    """
+
+    backend = 'lxml'
+
+    _STATUS = xpath(f"descendant::i[{has_class('b-fight-details__person-status')}][1]")
+    _PERSON_LINK = xpath(f"descendant::h3[{has_class('b-fight-details__person-name')}][1]/descendant::a[1]")
+
+    @timed('parse_seconds', page='document_load')
+    def load(self, markup: Union[str, bytes]):
+        """Parse raw markup into an lxml document, decoding bytes like BeautifulSoup does."""
+        if isinstance(markup, bytes):
+            markup = UnicodeDammit(markup, is_html=True).unicode_markup or ''
+        if not markup.strip():
+            return lxml.html.document_fromstring('<html></html>')
+        return lxml.html.document_fromstring(markup)
+
+    def extract_winner_from_status(self, persons: List) -> tuple:
+        """Extract winner information from person status indicators."""
+        winner_name = None
+        winner_id = None
+
+        if len(persons) >= 2:
+            for person in persons[:2]:
+                status = first(self._STATUS(person))
+                if status is not None and 'green' in ' '.join((status.get('class') or '').split()):
+                    link = first(self._PERSON_LINK(person))
+                    if link is not None:
+                        winner_name = get_text(link).strip()
+                        winner_id = extract_id_from_url(link.get('href', ''))
+                    break
+
+        return winner_name, winner_id
@@ -1,13 +1,21 @@
 """Base parser class."""
 from abc import ABC, abstractmethod
 from bs4 import BeautifulSoup
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from ...utils.http import clean_text, extract_id_from_url
+from ...utils.metrics import timed
 
 
 class BaseParser(ABC):
     """Base class for all parsers."""
     
+    backend = 'bs4'
+    
+    @timed('parse_seconds', page='document_load')
+    def load(self, markup: Union[str, bytes]) -> BeautifulSoup:
+        """Parse raw markup into the document type expected by this parser."""
+        return BeautifulSoup(markup, 'html.parser')
+    
     def normalize_field(self, value: Any) -> Optional[str]:
         """Normalize field value."""
         if value is None:
@@ -1,26 +1,329 @@
 """Base scraper class."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Tuple, Type, Iterable, Iterator
 from ...core.config import Config
 from ...utils.http import HTTPClient
-from ...utils.concurrent import concurrent_map_with_progress
+from ...utils.async_http import AsyncHTTPClient
+from ...utils.cache import CacheEntry, get_shared_cache
+from ...utils.archive import ArchiveClient, get_shared_archive
+from ...utils.parse_memo import get_shared_parse_memo, parser_fingerprint
+from ...utils.rate_limit import get_shared_rate_limiter
+from ...utils.retry import RetryPolicy, CircuitBreakerRegistry, get_shared_circuit_breakers
+from ...utils.dead_letter import DeadLetterQueue
+from ...utils.ledger import FetchLedger
+from ...utils.journal import CheckpointJournal
+from ...utils.data import RowSink
+from ...utils.concurrent import MapResult, pipelined_map, pipelined_imap, make_process_pool, to_thread
+from ...utils.metrics import call_timed, observe_parse
+from ...models.record import Record
+from .parser import BaseParser
 
 
 class BaseScraper(ABC):
     """Base class for all scrapers."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, dead_letters: Optional[DeadLetterQueue] = None,
+                 ledger: Optional[FetchLedger] = None, journal: Optional[CheckpointJournal] = None):
         self.config = config
-        self.http_client = HTTPClient(
-            headers=config.scraping.headers,
-            delay=config.scraping.delay_seconds
+        self.dead_letters = dead_letters if dead_letters is not None else DeadLetterQueue()
+        self.ledger = ledger if ledger is not None else FetchLedger()
+        self.journal = journal
+        self._sink: Optional[RowSink] = None
+        self._rows: List[Any] = []
+        cache = None
+        if config.cache.enabled:
+            cache = get_shared_cache(config.cache.directory, config.cache.max_bytes)
+        self.rate_limiter = get_shared_rate_limiter(
+            config.scraping.requests_per_second,
+            config.scraping.burst,
+            adaptive=config.scraping.adaptive_concurrency,
+            initial_concurrency=config.scraping.max_workers,
+            max_concurrency=config.scraping.max_concurrency,
+            latency_target=config.scraping.latency_target
         )
+        if config.scraping.page_source == 'archive':
+            # Re-parse mode: pages come from the raw page archive, with no network I/O
+            self.http_client = ArchiveClient(get_shared_archive(config.data.archive_path))
+        else:
+            self.http_client = HTTPClient(
+                headers=config.scraping.headers,
+                delay=config.scraping.delay_seconds,
+                cache=cache,
+                rate_limiter=self.rate_limiter,
+                timeout=config.scraping.request_timeout,
+                retry_policy=self._retry_policy(),
+                circuit_breakers=self._circuit_breakers(),
+                archive=get_shared_archive(config.data.archive_path) if config.data.archive_pages else None
+            )
+        self.parse_memo = get_shared_parse_memo(config.data.parse_memo_path) if config.data.parse_memo else None
+        self._page_hashes: Dict[Tuple[str, str], str] = {}
     
     @abstractmethod
     def scrape(self, **kwargs) -> List[Dict[str, Any]]:
         """Main scraping method to be implemented by subclasses."""
         pass
     
+    def _make_async_client(self) -> AsyncHTTPClient:
+        """Create an async HTTP client sharing headers and cache with the sync client."""
+        return AsyncHTTPClient(
+            headers=self.config.scraping.headers,
+            cache=self.http_client.cache,
+            max_connections=self.config.scraping.async_concurrency,
+            rate_limiter=self.rate_limiter,
+            timeout=self.config.scraping.request_timeout,
+            retry_policy=self.http_client.retry_policy,
+            circuit_breakers=self.http_client.circuit_breakers,
+            archive=self.http_client.archive
+        )
+    
+    def _make_parser(self, bs4_parser: Type[BaseParser], lxml_parser: Type[BaseParser]) -> BaseParser:
+        """Instantiate the parser for the configured backend."""
+        if self.config.scraping.parser_backend == 'lxml':
+            return lxml_parser()
+        return bs4_parser()
+    
+    def _retry_policy(self) -> RetryPolicy:
+        """Build the retry policy from the scraping configuration."""
+        return RetryPolicy(
+            max_retries=self.config.scraping.max_retries,
+            backoff_base=self.config.scraping.backoff_base,
+            backoff_max=self.config.scraping.backoff_max
+        )
+    
+    def _circuit_breakers(self) -> CircuitBreakerRegistry:
+        """Process-wide per-host circuit breakers."""
+        return get_shared_circuit_breakers(
+            self.config.scraping.breaker_threshold,
+            self.config.scraping.breaker_reset_seconds
+        )
+    
+    def _record_failure(self, phase: str, entity: str, key: str, url: str, error: Exception):
+        """Log a failed page and add it to the dead-letter queue."""
+        print(f"Error processing {entity} {key}: {error}")
+        self.dead_letters.add(phase, entity, key, url, error)
+    
+    def _record_success(self, entity: str, key: str, payload: Any = None):
+        """
+        Clear a previously failed page once it has been scraped successfully and mark it in the run ledger.
+        The payload, if any, is checkpointed in the journal so a resumed run can reuse it.
+        """
+        self.dead_letters.remove(entity, key)
+        self.ledger.mark(entity, key)
+        if self.journal is not None and payload is not None:
+            self.journal.record(entity, key, payload.to_row() if isinstance(payload, Record) else payload)
+    
+    def _shared_state(self) -> Dict[str, Any]:
+        """Run-wide state to hand over to the scrapers this one creates."""
+        return {'dead_letters': self.dead_letters, 'ledger': self.ledger, 'journal': self.journal}
+    
+    def _split_resumed(self, entity: str, items: List[Dict[str, Any]],
+                       key_field: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        When resuming, split items into those still pending and the payloads already checkpointed in the journal.
+        Restored items are marked as done in the run ledger.
+        """
+        if self.journal is None or not self.journal.resuming:
+            return items, {}
+        completed = self.journal.completed(entity)
+        restored = {}
+        for item in items:
+            key = item.get(key_field)
+            if key in completed:
+                restored[key] = completed[key]
+                self._record_success(entity, key)
+        if restored:
+            print(f"⏩ Resuming: {len(restored)}/{len(items)} {entity}s restored from checkpoint")
+        return [item for item in items if item.get(key_field) not in restored], restored
+    
+    def _join_resumed(self, items: List[Dict[str, Any]], key_field: str, restored: Dict[str, Any],
+                      results: List[Any], restore: Callable[[Dict[str, Any], Any], Any]) -> List[Any]:
+        """
+        Interleave restored payloads with the freshly scraped results, preserving the original item order.
+        Results must line up one-to-one with the pending items returned by _split_resumed.
+        """
+        if not restored:
+            return results
+        fresh = iter(results)
+        joined = []
+        for item in items:
+            key = item.get(key_field)
+            joined.append(restore(item, restored[key]) if key in restored else next(fresh, None))
+        return [row for row in joined if row is not None]
+    
+    def _retry_dead_letters(self, phase: str, items: List[Dict[str, Any]], key_field: str,
+                            fetch: Callable[[Dict[str, Any]], Any]) -> Dict[str, Any]:
+        """
+        Retry the failed items of a phase once, at the end of the phase.
+        Returns the recovered results keyed by item id; items that fail again stay in the queue.
+        """
+        items_by_key = {item.get(key_field): item for item in items}
+        failed = [e for e in self.dead_letters.pending(phase=phase) if e.key in items_by_key]
+        if not failed:
+            return {}
+        
+        print(f"🔁 Retrying {len(failed)} failed requests from {phase}...")
+        recovered = {}
+        for entry in failed:
+            try:
+                recovered[entry.key] = fetch(items_by_key[entry.key])
+                self._record_success(entry.entity, entry.key, recovered[entry.key])
+            except Exception as e:
+                self.dead_letters.add(entry.phase, entry.entity, entry.key, entry.url, e)
+        
+        print(f"🔁 Recovered {len(recovered)}/{len(failed)} failed requests from {phase}")
+        return recovered
+    
+    def _retry_item(self, phase: str, entity: str, key_field: str, url: Callable[[str], str],
+                    item: Dict[str, Any], fetch: Callable[[Dict[str, Any]], Any]) -> Any:
+        """
+        Retry a failed item once, when the ordered consumer reaches it, so its row keeps its position.
+        Returns the recovered row, or the item itself if it fails again (it stays in the dead-letter queue).
+        """
+        key = item.get(key_field)
+        try:
+            row = fetch(item)
+        except Exception as e:
+            self.dead_letters.add(phase, entity, key, url(key), e)
+            return item
+        self._record_success(entity, key, row)
+        print(f"🔁 Recovered {entity} {key}")
+        return row
+    
+    def _accept_result(self, result: MapResult, phase: str, entity: str, key_field: str,
+                       url: Callable[[str], str], restored: Dict[str, Any]) -> bool:
+        """
+        Book-keep a result as the ordered consumer reaches it and return whether it succeeded.
+        Successes are marked done (and checkpointed unless restored from the journal); failures are logged
+        and added to the dead-letter queue.
+        """
+        key = result.item.get(key_field)
+        if result.ok:
+            if key and key not in restored:
+                self._record_success(entity, key, result.value)
+            return True
+        self._record_failure(phase, entity, key, url(key), result.error)
+        return False
+    
+    @staticmethod
+    def _merge_results(results: Iterable[MapResult], merge: Callable[[Any, Any], Any]) -> Iterator[MapResult]:
+        """Apply merge(item, value) to the successful results of a stream; merge errors turn into failures."""
+        for result in results:
+            if result.ok:
+                try:
+                    result.value = merge(result.item, result.value)
+                except Exception as e:
+                    result.value, result.error = None, e
+            yield result
+    
+    def _open_stream(self, sink: Optional[RowSink]):
+        """Start a scrape call whose rows go to `sink` in input order (None keeps them for the return value)."""
+        self._sink = sink
+        self._rows = []
+    
+    def _emit_row(self, row: Any):
+        """Write a finished row to the sink, or keep it for the return value when there is no sink."""
+        if row is None:
+            return
+        if self._sink is not None:
+            self._sink.write(row)
+        else:
+            self._rows.append(row)
+    
+    def _close_stream(self) -> List[Any]:
+        """End the scrape call and return the kept rows (empty when they went to a sink)."""
+        rows = self._rows
+        self._sink, self._rows = None, []
+        return rows
+    
+    def _use_async_engine(self) -> bool:
+        """Whether detail scraping should run on the asyncio engine."""
+        return self.config.scraping.engine == 'async'
+    
+    def _use_process_parsing(self) -> bool:
+        """Whether downloaded pages should be parsed in a separate process pool."""
+        return self.config.scraping.process_parsing
+    
+    def _pipelined_map(self, fetch: Callable[[Any], Any], parse: Callable[[Any], Any], items: List[Any],
+                       merge: Callable[[Any, Any], Any], on_error: Callable[[Any, Exception], Any]) -> List[Any]:
+        """Run threaded downloads feeding the parser process pool, sized from the scraping configuration."""
+        return pipelined_map(
+            fetch,
+            parse,
+            items,
+            merge=merge,
+            on_error=on_error,
+            fetch_workers=self.config.scraping.pool_size,
+            parse_workers=self.config.scraping.parse_workers,
+            queue_size=self.config.scraping.parse_queue_size,
+            progress_callback=self._progress_callback
+        )
+    
+    def _pipelined_imap(self, fetch: Callable[[Any], Any], parse: Callable[[Any], Any],
+                        items: List[Any]) -> Iterator[MapResult]:
+        """Streaming, ordered counterpart of _pipelined_map."""
+        return pipelined_imap(
+            fetch,
+            parse,
+            items,
+            fetch_workers=self.config.scraping.pool_size,
+            parse_workers=self.config.scraping.parse_workers,
+            queue_size=self.config.scraping.parse_queue_size
+        )
+    
+    def _make_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Process pool for the async engine's parse stage, or None to parse in the event loop."""
+        if not self._use_process_parsing():
+            return None
+        return make_process_pool(self.config.scraping.parse_workers)
+    
+    async def _parse_async(self, pool: Optional[ProcessPoolExecutor], parse: Callable[[Any], Any], payload: Any) -> Any:
+        """Parse a downloaded page in the process pool without blocking the event loop."""
+        if pool is None:
+            return parse(payload)
+        parsed, seconds = await asyncio.get_running_loop().run_in_executor(pool, call_timed, parse, payload)
+        observe_parse(parse, seconds)
+        return parsed
+    
+    def _reuse_parsed(self, entity: str, key: str, page: CacheEntry) -> Optional[Any]:
+        """
+        Row parsed in a previous run from a page with the same content hash and the same parser code, else None.
+        On a miss the page hash is kept so that _remember_parsed can store the freshly parsed row.
+        """
+        if self.parse_memo is None:
+            return None
+        row = self.parse_memo.lookup(entity, key, page.content_hash, parser_fingerprint(type(self.parser)))
+        if row is None:
+            self._page_hashes[(entity, key)] = page.content_hash
+        return row
+    
+    def _remember_parsed(self, entity: str, key: str, row: Any):
+        """Store a freshly parsed row along with the hash of the page it was parsed from."""
+        digest = self._page_hashes.pop((entity, key), None)
+        if self.parse_memo is not None and digest is not None and row is not None:
+            self.parse_memo.remember(entity, key, digest, parser_fingerprint(type(self.parser)), row)
+    
+    def _parse_page(self, entity: str, key: str, page: CacheEntry, parse: Callable[[str], Any]) -> Any:
+        """Parse a downloaded page, skipping the parser when the page is unchanged since the previous run."""
+        row = self._reuse_parsed(entity, key, page)
+        if row is None:
+            row = parse(page.text)
+            self._remember_parsed(entity, key, row)
+        return row
+    
+    async def _parse_page_async(self, pool: Optional[ProcessPoolExecutor], entity: str, key: str,
+                                page: CacheEntry, parse: Callable[[str], Any]) -> Any:
+        """
+        Async counterpart of _parse_page, parsing changed pages in the process pool when there is one.
+        The parse memo is a SQLite database, so its lookups and writes run in worker threads, off the event loop.
+        """
+        row = await to_thread(self._reuse_parsed, entity, key, page)
+        if row is None:
+            row = await self._parse_async(pool, parse, page.text)
+            await to_thread(self._remember_parsed, entity, key, row)
+        return row
+    
     def _apply_dev_limit(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Apply development mode limits."""
         if self.config.scraping.dev_mode and self.config.scraping.dev_limit:
@@ -0,0 +1,77 @@
+"""
+Backend lxml del parser de eventos (Event).
+Reproduce campo a campo la salida de EventParser usando XPath precompilado sobre árboles lxml.
+"""
+from typing import Dict, Any, List
+from ..base.lxml_parser import LxmlParserMixin, has_class, xpath, first, get_text
+from ...utils.http import extract_id_from_url, clean_text
+from ...utils.metrics import timed
+from .parser import EventParser
+
+
+class LxmlEventParser(LxmlParserMixin, EventParser):
+    """
+    Parser de eventos basado en lxml.
+    Mantiene la misma interfaz y el mismo diccionario de salida que EventParser.
+    """
+
+    _ROWS = xpath(f"descendant::table[{has_class('b-statistics__table-events')}][1]/descendant::tr")
+    _CELLS = xpath("descendant::td")
+    _CONTENT = xpath(f"descendant::i[{has_class('b-statistics__table-content')}][1]")
+    _LINK = xpath("descendant::a[@href][1]")
+    _DATE = xpath(f"descendant::span[{has_class('b-statistics__date')}][1]")
+
+    @timed('parse_seconds', page='events_listing')
+    def parse_events_table(self, doc, event_type: str) -> List[Dict[str, Any]]:
+        """
+        Extrae la tabla de eventos desde el HTML y la convierte en una lista de diccionarios.
+        Args:
+            doc: Documento lxml de la página de eventos.
+            event_type (str): Tipo de evento (completado o próximo).
+        Returns:
+            List[Dict[str, Any]]: Lista de diccionarios con los datos de cada evento.
+        """
+        events = []
+
+        for row in self._ROWS(doc)[1:]:  # Skip header
+            if 'b-statistics__table-row_type_first' in (row.get('class') or '').split():
+                continue
+            event_data = self._extract_event_data(row, event_type)
+            if event_data:
+                events.append(event_data)
+
+        return events
+
+    def _extract_event_data(self, event_row, event_type: str) -> Dict[str, Any]:
+        """
+        Extrae los datos de un evento individual a partir de una fila de la tabla.
+        Args:
+            event_row: Fila lxml de la tabla de eventos.
+            event_type (str): Tipo de evento.
+        Returns:
+            Dict[str, Any]: Diccionario con los datos del evento, o None si hay error.
+        """
+        try:
+            cells = self._CELLS(event_row)
+            if len(cells) < 2:
+                return None
+
+            content = first(self._CONTENT(cells[0]))
+            if content is None:
+                return None
+
+            link_tag = first(self._LINK(content))
+            date_tag = first(self._DATE(content))
+            if link_tag is None or date_tag is None:
+                return None
+
+            return {
+                'event_id': extract_id_from_url(link_tag.get('href')),
+                'name': clean_text(get_text(link_tag)),
+                'date': clean_text(get_text(date_tag)),
+                'location': clean_text(get_text(cells[1]))
+            }
+
+        except Exception as e:
+            print(f"Error extracting event data: {e}")
+            return None
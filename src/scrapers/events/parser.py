@@ -6,6 +6,7 @@ from bs4 import BeautifulSoup
 from typing import Dict, Any, List
 from ..base.parser import BaseParser
 from ...utils.http import extract_id_from_url, clean_text
+from ...utils.metrics import timed
 
 
 class EventParser(BaseParser):
@@ -14,6 +15,7 @@ class EventParser(BaseParser):
     Proporciona métodos para extraer información de eventos desde tablas HTML.
     """
     
+    @timed('parse_seconds', page='events_listing')
     def parse_events_table(self, soup: BeautifulSoup, event_type: str) -> List[Dict[str, Any]]:
         """
         Extrae la tabla de eventos desde el HTML y la convierte en una lista de diccionarios.
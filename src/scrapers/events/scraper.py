@@ -5,7 +5,8 @@ Incluye lógica para extraer eventos completados y próximos, y guardar los resu
 from typing import List, Dict, Any
 from ..base.scraper import BaseScraper
 from .parser import EventParser
-from ...core.constants import EVENTS_COMPLETED_URL, EVENTS_UPCOMING_URL
+from .lxml_parser import LxmlEventParser
+from ...models.event import Event
 
 
 class EventScraper(BaseScraper):
@@ -14,9 +15,9 @@ class EventScraper(BaseScraper):
     Permite obtener eventos completados y próximos, y almacenarlos de forma estructurada.
     """
     
-    def __init__(self, config):
-        super().__init__(config)
-        self.parser = EventParser()
+    def __init__(self, config, **kwargs):
+        super().__init__(config, **kwargs)
+        self.parser = self._make_parser(EventParser, LxmlEventParser)
     
     def scrape(self) -> List[Dict[str, Any]]:
         """
@@ -31,7 +32,7 @@ class EventScraper(BaseScraper):
 
         # Scrape completed events
         completed_events = self._scrape_events_from_url(
-            f"{EVENTS_COMPLETED_URL}?page=all",
+            f"{self.config.scraping.events_completed_url}?page=all",
             "completed"
         )
         # Save completed events immediately
@@ -44,7 +45,7 @@ class EventScraper(BaseScraper):
 
         # Scrape upcoming events
         upcoming_events = self._scrape_events_from_url(
-            f"{EVENTS_UPCOMING_URL}?page=all",
+            f"{self.config.scraping.events_upcoming_url}?page=all",
             "upcoming"
         )
         # Save upcoming events immediately
@@ -63,16 +64,16 @@ class EventScraper(BaseScraper):
             url (str): URL de la página de eventos.
             event_type (str): Tipo de evento (completado o próximo).
         Returns:
-            List[Dict[str, Any]]: Lista de eventos extraídos.
+            List[Event]: Registros de los eventos extraídos.
         """
         print(f"Scraping {event_type} events...")
         
-        soup = self.http_client.get_soup(url)
-        if not soup:
+        doc = self.parser.load(self.http_client.get_content(url))
+        if doc is None:
             print(f"Error accessing {event_type} events")
             return []
         
-        events = self.parser.parse_events_table(soup, event_type)
+        events = [Event.from_row(row) for row in self.parser.parse_events_table(doc, event_type)]
         print(f"Found {len(events)} {event_type} events")
         
         return events
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+Backend lxml del parser de luchadores (Fighter).
+Reproduce campo a campo la salida de FighterParser usando XPath precompilado sobre árboles lxml.
+"""
+from typing import Dict, Any, List, Union
+from ..base.lxml_parser import LxmlParserMixin, has_class, xpath, first, get_text
+from ...utils.http import extract_id_from_url
+from ...utils.metrics import timed
+from .parser import FighterParser
+
+
+FIELD_NAMES = [
+    'first', 'last', 'nickname', 'height', 'weight',
+    'reach', 'stance', 'wins', 'defeats', 'draws'
+]
+
+STATS_MAPPING = {
+    'SLpM': 'slpm',
+    'Str. Acc.': 'str_acc',
+    'SApM': 'sapm',
+    'Str. Def': 'str_def',
+    'TD Avg.': 'td_avg',
+    'TD Acc.': 'td_acc',
+    'TD Def.': 'td_def',
+    'Sub. Avg.': 'sub_avg'
+}
+
+
+class LxmlFighterParser(LxmlParserMixin, FighterParser):
+    """
+    Parser de luchadores basado en lxml.
+    Mantiene la misma interfaz y el mismo diccionario de salida que FighterParser.
+    """
+
+    _TABLE_ROWS = xpath(
+        f"descendant::table[{has_class('b-statistics__table')}][1]"
+        f"/descendant::tr[{has_class('b-statistics__table-row')}]"
+    )
+    _CELLS = xpath("descendant::td")
+    _LINK_HREF = xpath("descendant::a[@href][1]/@href")
+    _IMAGE_SRC = xpath("descendant::img[@src][1]/@src")
+    _INFO_BOXES = xpath(f"descendant::div[{has_class('b-list__info-box')}]")
+    _ITEMS = xpath("descendant::li")
+    _TITLE = xpath("descendant::i[1]")
+    _MIDDLE_LEFT = xpath(
+        f"descendant::div[{has_class('b-list__info-box b-list__info-box_style_middle-width js-guide clearfix')}][1]"
+        f"/descendant::div[{has_class('b-list__info-box-left')}][1]"
+    )
+
+    @timed('parse_seconds', page='fighters_listing')
+    def parse_fighters_table(self, doc) -> List[Dict[str, Any]]:
+        """
+        Extrae la tabla de luchadores desde el HTML y la convierte en una lista de diccionarios.
+        Args:
+            doc: Documento lxml de la página de luchadores.
+        Returns:
+            List[Dict[str, Any]]: Lista de diccionarios con los datos de cada luchador.
+        """
+        fighters = []
+
+        for row in self._TABLE_ROWS(doc):
+            cols = self._CELLS(row)
+            if not cols:
+                continue
+
+            href = self._LINK_HREF(cols[0])
+            if not href:
+                continue
+
+            fighter_id = extract_id_from_url(href[0])
+            if not fighter_id:
+                continue
+
+            values = [
+                self.normalize_field(get_text(cols[i])) if len(cols) > i else None
+                for i in range(len(FIELD_NAMES))
+            ]
+
+            belt = False
+            if len(cols) > 10:
+                src = self._IMAGE_SRC(cols[10])
+                if src and 'belt.png' in src[0]:
+                    belt = True
+
+            fighter = {'fighter_id': fighter_id, 'belt': belt}
+            fighter.update(dict(zip(FIELD_NAMES, values)))
+            fighters.append(fighter)
+
+        return fighters
+
+    @timed('parse_seconds', page='fighter_details')
+    def parse_fighter_details(self, html: Union[str, bytes]) -> Dict[str, Any]:
+        """
+        Extrae información detallada de un luchador a partir del HTML de su página de detalles.
+        Args:
+            html (str): HTML de la página de detalles del luchador.
+        Returns:
+            Dict[str, Any]: Diccionario con los campos detallados del luchador.
+        """
+        doc = self.load(html)
+        details = {}
+
+        for box in self._INFO_BOXES(doc):
+            for li in self._ITEMS(box):
+                title = first(self._TITLE(li))
+                if title is not None and 'DOB' in get_text(title):
+                    dob_text = get_text(li, strip=True).replace('DOB:', '').strip()
+                    details['dob'] = self.normalize_field(dob_text)
+                    break
+
+        left_section = first(self._MIDDLE_LEFT(doc))
+        if left_section is not None:
+            for li in self._ITEMS(left_section):
+                title = first(self._TITLE(li))
+                if title is None:
+                    continue
+
+                title_text = get_text(title).strip()
+                for stat_key, field_name in STATS_MAPPING.items():
+                    if title_text.startswith(stat_key):
+                        value_text = get_text(li, strip=True)
+                        if ':' in value_text:
+                            value = value_text.split(':', 1)[1].strip()
+                            details[field_name] = self.normalize_field(value)
+                        break
+
+        return details
@@ -7,6 +7,7 @@ from bs4 import BeautifulSoup
 from typing import Dict, Any, List
 from ..base.parser import BaseParser
 from ...utils.http import extract_id_from_url
+from ...utils.metrics import timed
 
 
 class FighterParser(BaseParser):
@@ -15,6 +16,7 @@ class FighterParser(BaseParser):
     Proporciona métodos para extraer información básica y detallada de luchadores desde tablas y páginas HTML.
     """
     
+    @timed('parse_seconds', page='fighters_listing')
     def parse_fighters_table(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """
         Extrae la tabla de luchadores desde el HTML y la convierte en una lista de diccionarios.
@@ -73,6 +75,7 @@ class FighterParser(BaseParser):
         
         return fighters
     
+    @timed('parse_seconds', page='fighter_details')
     def parse_fighter_details(self, html: str) -> Dict[str, Any]:
         """
         Extrae información detallada de un luchador a partir del HTML de su página de detalles.
@@ -2,11 +2,15 @@
 Implementación del scraper de luchadores (Fighter) para el pipeline UFC ETL.
 Incluye lógica para extraer información básica y detallada de luchadores, utilizando concurrencia y manejo de datos estructurados.
 """
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Optional, Union
 from ..base.scraper import BaseScraper
 from .parser import FighterParser
-from ...core.constants import FIGHTERS_URL, ALPHABET
-from ...utils.concurrent import concurrent_map, concurrent_map_with_progress
+from .lxml_parser import LxmlFighterParser
+from ...core.constants import ALPHABET
+from ...models.fighter import Fighter
+from ...utils.concurrent import concurrent_map, imap, async_imap, to_thread, MapResult, Parsed
+from ...utils.data import RowSink
 
 
 class FighterScraper(BaseScraper):
@@ -15,9 +19,9 @@ class FighterScraper(BaseScraper):
     Permite obtener información básica de todos los luchadores, procesando por letra y utilizando concurrencia.
     """
     
-    def __init__(self, config):
-        super().__init__(config)
-        self.parser = FighterParser()
+    def __init__(self, config, **kwargs):
+        super().__init__(config, **kwargs)
+        self.parser = self._make_parser(FighterParser, LxmlFighterParser)
     
     def scrape(self) -> List[Dict[str, Any]]:
         """
@@ -35,7 +39,7 @@ class FighterScraper(BaseScraper):
         all_results = concurrent_map(
             scrape_letter, 
             ALPHABET, 
-            max_workers=self.config.scraping.max_workers
+            max_workers=self.config.scraping.pool_size
         )
         
         # Flatten results
@@ -55,15 +59,15 @@ class FighterScraper(BaseScraper):
         Args:
             letter (str): Letra a consultar.
         Returns:
-            List[Dict[str, Any]]: Lista de luchadores extraídos para la letra dada.
+            List[Fighter]: Registros de los luchadores extraídos para la letra dada.
         """
-        url = f"{FIGHTERS_URL}?char={letter}&page=all"
-        soup = self.http_client.get_soup(url)
+        url = f"{self.config.scraping.fighters_url}?char={letter}&page=all"
+        doc = self.parser.load(self.http_client.get_content(url))
         
-        if not soup:
+        if doc is None:
             return []
         
-        fighters = self.parser.parse_fighters_table(soup)
+        fighters = [Fighter.from_row(row) for row in self.parser.parse_fighters_table(doc)]
         print(f"Letter {letter.upper()}: {len(fighters)} fighters")
         
         return fighters
@@ -72,68 +76,175 @@ class FighterScraper(BaseScraper):
 class FighterDetailScraper(BaseScraper):
     """
     Scraper especializado en la extracción de información detallada de luchadores.
-    Utiliza concurrencia y muestra el progreso de la extracción.
+    Utiliza concurrencia (hilos o asyncio según la configuración) y muestra el progreso de la extracción.
     """
     
-    def __init__(self, config):
-        super().__init__(config)
-        self.parser = FighterParser()
+    def __init__(self, config, **kwargs):
+        super().__init__(config, **kwargs)
+        self.parser = self._make_parser(FighterParser, LxmlFighterParser)
     
-    def scrape(self, fighters_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def scrape(self, fighters_data: List[Dict[str, Any]],
+               sink: Optional[RowSink] = None) -> List[Dict[str, Any]]:
         """
         Extrae información detallada de luchadores a partir de una lista de datos básicos.
         Fusiona los detalles extraídos con los datos originales y muestra el progreso.
         Args:
             fighters_data (List[Dict[str, Any]]): Lista de diccionarios con datos básicos de luchadores.
+            sink (RowSink, opcional): Escritor (CSV o SQLite) al que se envía cada luchador en el orden de entrada;
+                los fallidos se reintentan una vez al llegarles el turno y, si vuelven a fallar, se escriben con sus
+                datos básicos.
         Returns:
-            List[Dict[str, Any]]: Lista de luchadores con información detallada.
+            List[Dict[str, Any]]: Lista de luchadores con información detallada, o lista vacía si se indica `sink`
+                (las filas solo se escriben en él, sin retenerlas en memoria).
         """
+        if self._use_async_engine():
+            return asyncio.run(self.scrape_async(fighters_data, sink))
+        
         print("📊 Scraping fighter details...")
         
         fighters_data = self._apply_dev_limit(fighters_data)
+        _, restored = self._split_resumed('fighter', fighters_data, 'fighter_id')
+        self._open_stream(sink)
         
-        def scrape_fighter_details(fighter_data: Dict[str, Any], idx: int = None) -> Dict[str, Any]:
+        def scrape_fighter_details(fighter_data: Dict[str, Any]) -> Dict[str, Any]:
             fighter_id = fighter_data.get('fighter_id')
             if not fighter_id:
-                return fighter_data
-            
-            details = self._scrape_single_fighter_details(fighter_id)
-            if details:
-                # Merge details with existing data
-                updated_fighter = {**fighter_data, **details}
-                if idx is not None:
-                    print(f"Processed fighter {fighter_id} ({idx+1}/{len(fighters_data)})")
-                return updated_fighter
-            
-            return fighter_data
+                return {}
+            if fighter_id in restored:
+                return restored[fighter_id]
+            return self._fetch_fighter_details(fighter_id)
         
-        # Use concurrent processing with progress
-        updated_fighters = concurrent_map_with_progress(
-            scrape_fighter_details,
-            fighters_data,
-            max_workers=self.config.scraping.max_workers,
-            progress_callback=self._progress_callback
-        )
+        def download(fighter_data: Dict[str, Any]) -> Union[str, Parsed, None]:
+            fighter_id = fighter_data.get('fighter_id')
+            if fighter_id in restored:
+                return Parsed(restored[fighter_id])
+            return self._download_fighter_page(fighter_data)
+        
+        # Results arrive in input order, so rows are written in that same order
+        if self._use_process_parsing():
+            results = self._merge_results(
+                self._pipelined_imap(download, self.parser.parse_fighter_details, fighters_data),
+                self._on_fighter_parsed
+            )
+        else:
+            results = imap(scrape_fighter_details, fighters_data, max_workers=self.config.scraping.pool_size)
         
-        print(f"✅ Fighter details updated: {len(updated_fighters)}")
-        return updated_fighters
+        for result in results:
+            self._finish_fighter(result, restored, len(fighters_data))
+        
+        print(f"✅ Fighter details updated: {len(fighters_data)}")
+        return self._close_stream()
     
-    def _scrape_single_fighter_details(self, fighter_id: str) -> Dict[str, Any]:
+    async def scrape_async(self, fighters_data: List[Dict[str, Any]],
+                           sink: Optional[RowSink] = None) -> List[Dict[str, Any]]:
         """
-        Extrae los detalles de un solo luchador a partir de su identificador.
+        Versión asyncio de scrape: descarga todas las páginas de luchadores en un único hilo,
+        con hasta `async_concurrency` peticiones en vuelo. Produce las mismas filas que la versión con hilos.
         Args:
-            fighter_id (str): Identificador del luchador.
+            fighters_data (List[Dict[str, Any]]): Lista de diccionarios con datos básicos de luchadores.
+            sink (RowSink, opcional): Escritor (CSV o SQLite) al que se envía cada luchador en el orden de entrada.
         Returns:
-            Dict[str, Any]: Diccionario con los detalles extraídos del luchador.
+            List[Dict[str, Any]]: Lista de luchadores con información detallada, o lista vacía si se indica `sink`.
         """
-        from ...core.constants import FIGHTER_URL
+        print("📊 Scraping fighter details (async)...")
         
-        url = f"{FIGHTER_URL}/{fighter_id}"
+        fighters_data = self._apply_dev_limit(fighters_data)
+        _, restored = self._split_resumed('fighter', fighters_data, 'fighter_id')
+        self._open_stream(sink)
+        
+        parse_pool = self._make_parse_pool()
+        async with self._make_async_client() as client:
+            async def scrape_fighter_details(fighter_data: Dict[str, Any]) -> Dict[str, Any]:
+                fighter_id = fighter_data.get('fighter_id')
+                if not fighter_id:
+                    return {}
+                if fighter_id in restored:
+                    return restored[fighter_id]
+                page = await client.get_page(self._fighter_url(fighter_id))
+                return await self._parse_page_async(parse_pool, 'fighter', fighter_id, page,
+                                                    self.parser.parse_fighter_details)
+            
+            try:
+                results = async_imap(scrape_fighter_details, fighters_data,
+                                     concurrency=self.config.scraping.async_concurrency)
+                async for result in results:
+                    if result.ok:
+                        self._finish_fighter(result, restored, len(fighters_data))
+                        continue
+                    # Failed fighters are retried off the event loop, with the synchronous client
+                    await to_thread(self._finish_fighter, result, restored, len(fighters_data))
+            finally:
+                if parse_pool is not None:
+                    parse_pool.shutdown()
         
-        try:
-            html = self.http_client.get_html(url)
-            details = self.parser.parse_fighter_details(html)
-            return details
-        except Exception as e:
-            print(f"Error scraping fighter {fighter_id}: {e}")
-            return {}
\ No newline at end of file
+        print(f"✅ Fighter details updated: {len(fighters_data)}")
+        return self._close_stream()
+    
+    def _finish_fighter(self, result: MapResult, restored: Dict[str, Any], total: int):
+        """
+        Escribe la fila de un luchador cuando le llega el turno en el orden de entrada. Si su descarga o parseo
+        falló, lo reintenta una vez y, si vuelve a fallar, escribe sus datos básicos.
+        """
+        if self._accept_result(result, 'fighter_details', 'fighter', 'fighter_id', self._fighter_url, restored):
+            self._emit_row(self._merge_fighter_details(result.item, result.value, result.index, total))
+        else:
+            self._emit_row(self._retry_item('fighter_details', 'fighter', 'fighter_id', self._fighter_url,
+                                            result.item, self._fetch_merged_fighter))
+        self._progress_callback(result.index + 1, total)
+    
+    def _merge_fighter_details(self, fighter_data: Dict[str, Any], details: Dict[str, Any],
+                               idx: int = None, total: int = 0) -> Dict[str, Any]:
+        """
+        Fusiona los detalles extraídos con los datos básicos del luchador en un registro Fighter tipado.
+        Si no se obtuvieron detalles, devuelve los datos originales sin modificar.
+        """
+        if not details:
+            return fighter_data
+        
+        if idx is not None:
+            print(f"Processed fighter {fighter_data['fighter_id']} ({idx+1}/{total})")
+        return Fighter.from_row({**fighter_data, **details})
+    
+    def retry_failed(self, fighters_data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Reintenta los luchadores de la lista que figuran en la cola de peticiones fallidas.
+        Returns:
+            Dict[str, Dict[str, Any]]: Filas recuperadas indexadas por fighter_id.
+        """
+        return self._retry_dead_letters('fighter_details', fighters_data, 'fighter_id', self._fetch_merged_fighter)
+    
+    def _fetch_merged_fighter(self, fighter_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Descarga los detalles de un luchador y los fusiona con sus datos básicos; lanza la excepción si fallan."""
+        details = self._fetch_fighter_details(fighter_data['fighter_id'])
+        return self._merge_fighter_details(fighter_data, details)
+    
+    def _fighter_url(self, fighter_id: str) -> str:
+        """URL de la página de un luchador sobre la URL base configurada."""
+        return f"{self.config.scraping.fighter_url}/{fighter_id}"
+    
+    def _fetch_fighter_details(self, fighter_id: str) -> Dict[str, Any]:
+        """
+        Descarga y parsea la página de detalles de un luchador; si la página no ha cambiado desde la ejecución
+        anterior, reutiliza los detalles ya parseados. Lanza la excepción original si la descarga o el parseo fallan.
+        """
+        page = self.http_client.get_page(self._fighter_url(fighter_id))
+        return self._parse_page('fighter', fighter_id, page, self.parser.parse_fighter_details)
+    
+    def _download_fighter_page(self, fighter_data: Dict[str, Any]) -> Union[str, Parsed, None]:
+        """
+        Etapa de descarga: devuelve el HTML de la página del luchador, los detalles ya parseados (Parsed) si la
+        página no ha cambiado desde la ejecución anterior, o None si no tiene identificador.
+        """
+        fighter_id = fighter_data.get('fighter_id')
+        if not fighter_id:
+            return None
+        page = self.http_client.get_page(self._fighter_url(fighter_id))
+        details = self._reuse_parsed('fighter', fighter_id, page)
+        return Parsed(details) if details is not None else page.text
+    
+    def _on_fighter_parsed(self, fighter_data: Dict[str, Any], details: Dict[str, Any]) -> Dict[str, Any]:
+        """Memoriza los detalles parseados en el pool de procesos para la siguiente ejecución."""
+        if details is None:
+            return {}
+        self._remember_parsed('fighter', fighter_data['fighter_id'], details)
+        return details
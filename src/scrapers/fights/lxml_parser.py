@@ -0,0 +1,284 @@
+"""
+Backend lxml del parser de peleas (Fight).
+Reproduce campo a campo la salida de FightParser usando XPath precompilado sobre árboles lxml,
+que es varias veces más rápido que BeautifulSoup con 'html.parser'.
+"""
+import re
+from typing import Dict, Any, List, Union
+from ..base.lxml_parser import LxmlParserMixin, has_class, xpath, first, get_text, next_element_sibling, string_of
+from ...utils.http import extract_id_from_url, clean_text
+from ...utils.metrics import timed
+from .parser import FightParser
+
+
+BONUS_MAP = {
+    'belt.png': 'BELT',
+    'ko.png': 'KO',
+    'fight.png': 'FIGHT',
+    'perf.png': 'PERF',
+    'sub.png': 'SUB',
+}
+
+
+class LxmlFightParser(LxmlParserMixin, FightParser):
+    """
+    Parser de peleas basado en lxml.
+    Mantiene la misma interfaz y el mismo diccionario de salida que FightParser.
+    """
+
+    _EVENT_TABLE_BODY = xpath(f"descendant::table[{has_class('b-fight-details__table')}][1]/descendant::tbody[1]")
+    _ROWS = xpath("descendant::tr")
+    _CELLS = xpath("descendant::td")
+    _EVENT_LINK = xpath(f"descendant::h2[{has_class('b-content__title')}][1]/descendant::a[@href][1]/@href")
+    _PERSONS = xpath(f"descendant::div[{has_class('b-fight-details__person')}]")
+    _PERSON_LINK_FIRST = xpath(f"descendant::h3[{has_class('b-fight-details__person-name')}][1]/descendant::a[1]")
+    _FIGHT_TITLE = xpath(f"descendant::i[{has_class('b-fight-details__fight-title')}][1]")
+    _IMAGES = xpath("descendant::img[@src]")
+    _CONTENT = xpath(f"descendant::div[{has_class('b-fight-details__content')}][1]")
+    _FIRST_TABLE = xpath("descendant::table[1]")
+    _TEXT_ITEMS = xpath(f"descendant::i[{has_class('b-fight-details__text-item')}]")
+    _TEXT_ITEMS_FIRST = xpath(f"descendant::i[{has_class('b-fight-details__text-item_first')}]")
+    _LABEL = xpath(f"descendant::i[{has_class('b-fight-details__label')}][1]")
+    _SPAN = xpath("descendant::span[1]")
+    _DETAILS_SECTIONS = xpath(f"descendant::p[{has_class('b-fight-details__text')}]")
+    _TBODY = xpath("descendant::tbody[1]")
+    _FIRST_ROW = xpath("descendant::tr[1]")
+    _TABLE_TEXT = xpath(f"descendant::p[{has_class('b-fight-details__table-text')}]")
+    _COLLAPSE_LINKS = xpath(f"descendant::p[{has_class('b-fight-details__collapse-link_tot')}]")
+    _NEXT_TABLE = xpath("(descendant::table | following::table)[1]")
+
+    @timed('parse_seconds', page='event_fights')
+    def parse_event_fights(self, doc, event_id: str) -> List[Dict[str, Any]]:
+        """
+        Extrae la lista de peleas de una página de evento.
+        Args:
+            doc: Documento lxml de la página del evento.
+            event_id (str): Identificador del evento.
+        Returns:
+            List[Dict[str, Any]]: Lista de diccionarios con los datos mínimos de cada pelea.
+        """
+        fights = []
+        tbody = first(self._EVENT_TABLE_BODY(doc))
+        if tbody is None:
+            return fights
+
+        for idx, row in enumerate(self._ROWS(tbody)):
+            if len(self._CELLS(row)) < 10:
+                continue
+
+            fight_id = row.get('data-link')
+            if fight_id:
+                fight_id = extract_id_from_url(fight_id)
+
+            if not fight_id:
+                continue
+
+            fights.append({
+                'event_id': event_id,
+                'fight_id': fight_id,
+                'fight_order': idx + 1
+            })
+
+        return fights
+
+    @timed('parse_seconds', page='fight_details')
+    def parse_fight_details(self, html: Union[str, bytes]) -> Dict[str, Any]:
+        """
+        Extrae información detallada de una pelea a partir del HTML de la página de detalles.
+        Args:
+            html (str): HTML de la página de detalles de la pelea.
+        Returns:
+            Dict[str, Any]: Diccionario con todos los campos estructurados de la pelea.
+        """
+        doc = self.load(html)
+        fight = {}
+
+        event_href = self._EVENT_LINK(doc)
+        if event_href:
+            fight['event_id'] = extract_id_from_url(event_href[0])
+
+        self._extract_fighter_info(doc, fight)
+
+        fight_title = first(self._FIGHT_TITLE(doc))
+        if fight_title is not None:
+            fight['weight_class'] = get_text(fight_title, strip=True)
+            bonus_types = []
+            for img in self._IMAGES(fight_title):
+                src = img.get('src').lower()
+                for key, value in BONUS_MAP.items():
+                    if src.endswith(key):
+                        bonus_types.append(value)
+            fight['bonus'] = bonus_types or None
+
+        if self._is_upcoming_fight(doc):
+            return self._fill_empty_fields(fight)
+
+        self._extract_fight_details(doc, fight)
+
+        if 'bonus' not in fight:
+            fight['bonus'] = None
+
+        self._extract_fight_statistics(doc, fight)
+        self._extract_significant_strikes(doc, fight)
+
+        return self._fill_empty_fields(fight)
+
+    def _extract_fighter_info(self, doc, fight: Dict[str, Any]):
+        """
+        Extrae información de los luchadores participantes en la pelea (nombres e IDs, ganador).
+        """
+        persons = self._PERSONS(doc)
+        if len(persons) < 2:
+            return
+
+        for person, corner in zip(persons, ('red', 'blue')):
+            link = first(self._PERSON_LINK_FIRST(person))
+            if link is not None:
+                fight[f'{corner}_name'] = get_text(link).strip()
+                fight[f'{corner}_id'] = extract_id_from_url(link.get('href', ''))
+
+        winner_name, winner_id = self.extract_winner_from_status(persons)
+        if winner_id:
+            fight['winner_id'] = winner_id
+        elif winner_name:
+            if winner_name == fight.get('red_name'):
+                fight['winner_id'] = fight.get('red_id', '')
+            elif winner_name == fight.get('blue_name'):
+                fight['winner_id'] = fight.get('blue_id', '')
+
+    def _is_upcoming_fight(self, doc) -> bool:
+        """
+        Verifica si la pelea es próxima (sin estadísticas detalladas disponibles).
+        """
+        return not self._CONTENT(doc) or not self._FIRST_TABLE(doc)
+
+    def _extract_fight_details(self, doc, fight: Dict[str, Any]):
+        """
+        Extrae detalles de la pelea como método de victoria, round, tiempo, formato y árbitro.
+        """
+        fight_content = first(self._CONTENT(doc))
+        if fight_content is None:
+            return
+
+        for item in self._TEXT_ITEMS_FIRST(fight_content) + self._TEXT_ITEMS(fight_content):
+            self._parse_fight_detail_item(item, fight)
+
+        self._extract_details_section(fight_content, fight)
+
+    def _parse_fight_detail_item(self, item, fight: Dict[str, Any]):
+        """
+        Parsea un ítem individual de detalle de pelea (método, round, tiempo, formato, árbitro).
+        """
+        label_tag = first(self._LABEL(item))
+        if label_tag is None:
+            return
+
+        label_text = get_text(label_tag, strip=True).lower().replace(':', '')
+        full_text = get_text(item, strip=True)
+
+        if label_text == 'method':
+            method_element = next_element_sibling(label_tag)
+            if method_element is not None and method_element.tag == 'i':
+                fight['method'] = clean_text(get_text(method_element, strip=True))
+            else:
+                method_match = re.search(r'Method:\s*(.+?)(?:\s+Round:|$)', full_text)
+                if method_match:
+                    fight['method'] = clean_text(method_match.group(1))
+
+        elif label_text == 'round':
+            round_match = re.search(r'Round:\s*(\d+)', full_text)
+            if round_match:
+                fight['round'] = round_match.group(1)
+
+        elif label_text == 'time':
+            time_match = re.search(r'Time:\s*(\d+:\d+)', full_text)
+            if time_match:
+                fight['time'] = time_match.group(1)
+
+        elif label_text == 'time format':
+            format_match = re.search(r'Time format:\s*(.+?)(?:\s+Referee:|$)', full_text)
+            if format_match:
+                fight['time_format'] = clean_text(format_match.group(1))
+
+        elif label_text == 'referee':
+            referee_span = first(self._SPAN(item))
+            if referee_span is not None:
+                fight['referee'] = clean_text(get_text(referee_span, strip=True))
+            else:
+                referee_match = re.search(r'Referee:\s*(.+)', full_text)
+                if referee_match:
+                    fight['referee'] = clean_text(referee_match.group(1))
+
+    def _extract_details_section(self, fight_content, fight: Dict[str, Any]):
+        """
+        Extrae la sección de detalles específicos del método de victoria.
+        """
+        for section in self._DETAILS_SECTIONS(fight_content):
+            details_label = first(self._LABEL(section))
+            if details_label is not None and 'details' in get_text(details_label, strip=True).lower():
+                details_match = re.search(r'Details:\s*(.+)', get_text(section, strip=True), re.IGNORECASE)
+                if details_match:
+                    fight['details'] = clean_text(details_match.group(1))
+                    break
+
+    def _first_data_cells(self, table) -> List:
+        """Celdas de la primera fila del primer tbody de una tabla de estadísticas."""
+        tbody = first(self._TBODY(table))
+        if tbody is None:
+            return []
+        row = first(self._FIRST_ROW(tbody))
+        if row is None:
+            return []
+        return self._CELLS(row)
+
+    def _extract_fight_statistics(self, doc, fight: Dict[str, Any]):
+        """
+        Extrae las estadísticas principales de la pelea desde la tabla principal de estadísticas.
+        """
+        stats_table = first(self._FIRST_TABLE(doc))
+        if stats_table is None:
+            return
+
+        cols = self._first_data_cells(stats_table)
+        if len(cols) < 10:
+            return
+
+        # Mismo mapeo de columnas que FightParser._extract_fight_statistics
+        for field, col in (('kd', 1), ('str', 2), ('td', 5), ('sub', 7), ('rev', 8),
+                           ('control_time', 9), ('total_str', 4)):
+            fight[f'{field}1'] = self._get_stat_for_fighter(cols[col], 0)
+            fight[f'{field}2'] = self._get_stat_for_fighter(cols[col], 1)
+
+    def _get_stat_for_fighter(self, col, fighter_idx: int) -> str:
+        """
+        Extrae una estadística específica para un luchador (0 = rojo, 1 = azul) de una columna de la tabla.
+        """
+        ps = self._TABLE_TEXT(col)
+
+        if len(ps) >= 2:
+            return get_text(ps[fighter_idx], strip=True)
+        elif len(ps) == 1:
+            return get_text(ps[0], strip=True) if fighter_idx == 0 else '0'
+        else:
+            return '0'
+
+    def _extract_significant_strikes(self, doc, fight: Dict[str, Any]):
+        """
+        Extrae el desglose de golpes significativos (cabeza, cuerpo, pierna) de la tabla correspondiente.
+        """
+        sig_strikes_section = next(
+            (p for p in self._COLLAPSE_LINKS(doc) if 'Significant Strikes' in (string_of(p) or '')),
+            None
+        )
+        if sig_strikes_section is None:
+            return
+
+        sig_table = first(self._NEXT_TABLE(sig_strikes_section))
+        if sig_table is None:
+            return
+
+        sig_cols = self._first_data_cells(sig_table)
+        if len(sig_cols) >= 9:
+            for field, col in (('sig_head', 3), ('sig_body', 4), ('sig_leg', 5)):
+                fight[f'{field}1'] = self._get_stat_for_fighter(sig_cols[col], 0)
+                fight[f'{field}2'] = self._get_stat_for_fighter(sig_cols[col], 1)
@@ -7,6 +7,7 @@ from bs4 import BeautifulSoup
 from typing import Dict, Any, List, Optional
 from ..base.parser import BaseParser
 from ...utils.http import extract_id_from_url, clean_text
+from ...utils.metrics import timed
 
 
 class FightParser(BaseParser):
@@ -15,6 +16,7 @@ class FightParser(BaseParser):
     Proporciona métodos para extraer información de peleas, detalles, estadísticas y desgloses desde páginas HTML de eventos y peleas.
     """
     
+    @timed('parse_seconds', page='event_fights')
     def parse_event_fights(self, soup: BeautifulSoup, event_id: str) -> List[Dict[str, Any]]:
         """
         Extrae la lista de peleas de una página de evento.
@@ -57,6 +59,7 @@ class FightParser(BaseParser):
         
         return fights
     
+    @timed('parse_seconds', page='fight_details')
     def parse_fight_details(self, html: str) -> Dict[str, Any]:
         """
         Extrae información detallada de una pelea a partir del HTML de la página de detalles.
@@ -2,11 +2,15 @@
 Implementación del scraper de peleas (Fight) para el pipeline UFC ETL.
 Incluye lógica para extraer índices y detalles de peleas, utilizando concurrencia y manejo de archivos CSV.
 """
-from typing import List, Dict, Any
+import asyncio
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple, Union
 from ..base.scraper import BaseScraper
 from .parser import FightParser
-from ...core.constants import EVENT_URL, FIGHT_URL
-from ...utils.concurrent import concurrent_map_with_progress
+from .lxml_parser import LxmlFightParser
+from ...models.fight import Fight
+from ...utils.concurrent import concurrent_map_with_progress, imap, async_imap, to_thread, MapResult, Parsed
+from ...utils.data import RowSink
 
 
 
@@ -41,15 +45,16 @@ class FightScraper(BaseScraper):
         events = events_df.to_dict(orient='records')
         fights_index = self.scrape_fight_index(events)
     # Extrae los detalles de cada pelea a partir de la información disponible
-        detail_scraper = FightDetailScraper(self.config)
-        fights = detail_scraper.scrape(fights_index)
-        CSVManager.save_to_csv(fights, output_csv, FIGHT_FIELDS)
-        print(f"💾 Saved {len(fights)} fights (with details) to {output_csv}")
+        detail_scraper = FightDetailScraper(self.config, **self._shared_state())
+    # Las peleas se escriben en el CSV en el orden del índice a medida que se completan; el fichero anterior se sustituye al terminar
+        with CSVManager.open_writer(output_csv, FIGHT_FIELDS) as sink:
+            detail_scraper.scrape(fights_index, sink=sink)
+        print(f"💾 Saved {sink.rows_written} fights (with details) to {output_csv}")
     """Scraper for fight index data."""
     
-    def __init__(self, config):
-        super().__init__(config)
-        self.parser = FightParser()
+    def __init__(self, config, **kwargs):
+        super().__init__(config, **kwargs)
+        self.parser = self._make_parser(FightParser, LxmlFightParser)
     
     def scrape(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -72,38 +77,47 @@ class FightScraper(BaseScraper):
         """
         print("⚔️ Scraping fight index from events...")
         
-        events = self._apply_dev_limit(events)
+        all_events = self._apply_dev_limit(events)
+    # Al reanudar, los eventos ya registrados en el journal no se vuelven a descargar
+        events, restored = self._split_resumed('event', all_events, 'event_id')
         
         def process_event(event_data: Dict[str, Any], idx: int = None) -> List[Dict[str, Any]]:
             event_id = event_data.get('event_id')
             if not event_id:
                 return []
             
-            url = f"{EVENT_URL}/{event_id}"
-            event_name = event_data.get('name', '')
-            
             try:
-                soup = self.http_client.get_soup(url)
-                if soup:
-                    fights = self.parser.parse_event_fights(soup, event_id)
-                    if idx is not None:
-                        print(f"Event {event_id} ({event_name}): {len(fights)} fights ({idx+1}/{len(events)})")
-                    return fights
-                else:
-                    print(f"Failed to fetch event {event_id}")
-                    return []
-                    
+                fights = self._fetch_event_fights(event_data)
             except Exception as e:
-                print(f"Error processing event {event_id}: {e}")
+                self._record_failure('fight_index', 'event', event_id, self._event_url(event_id), e)
                 return []
+            self._record_success('event', event_id, fights)
+            
+            if idx is not None:
+                print(f"Event {event_id} ({event_data.get('name', '')}): {len(fights)} fights ({idx+1}/{len(events)})")
+            return fights
         
     # Utiliza procesamiento concurrente para acelerar la extracción de datos
-        all_fights_nested = concurrent_map_with_progress(
-            process_event,
-            events,
-            max_workers=self.config.scraping.max_workers,
-            progress_callback=self._progress_callback
-        )
+        if self._use_process_parsing():
+            all_fights_nested = self._pipelined_map(
+                self._download_event_page,
+                partial(parse_event_page, self.parser),
+                events,
+                merge=self._on_event_parsed,
+                on_error=self._on_event_failed
+            )
+        else:
+            all_fights_nested = concurrent_map_with_progress(
+                process_event,
+                events,
+                max_workers=self.config.scraping.pool_size,
+                progress_callback=self._progress_callback
+            )
+        all_fights_nested = self._join_resumed(all_events, 'event_id', restored, all_fights_nested,
+                                               lambda event_data, fights: fights)
+        
+    # Reintenta al final de la fase los eventos que fallaron
+        all_fights_nested.extend(self.retry_failed(events).values())
         
     # Aplana los resultados y elimina duplicados para obtener una lista única de peleas
         all_fights = []
@@ -122,64 +136,231 @@ class FightScraper(BaseScraper):
         print(f"✅ Total fights extracted (without duplicates): {len(deduplicated_fights)}")
         
         return deduplicated_fights
+    
+    def retry_failed(self, events: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Reintenta los eventos de la lista que figuran en la cola de peticiones fallidas.
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Índice de peleas recuperado para cada event_id.
+        """
+        return self._retry_dead_letters('fight_index', events, 'event_id', self._fetch_event_fights)
+    
+    def _event_url(self, event_id: str) -> str:
+        """URL de la página de un evento sobre la URL base configurada."""
+        return f"{self.config.scraping.event_url}/{event_id}"
+    
+    def _fetch_event_fights(self, event_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Descarga la página de un evento y extrae su índice de peleas.
+        Lanza la excepción original si la descarga o el parseo fallan.
+        """
+        return parse_event_page(self.parser, self._download_event_page(event_data))
+    
+    def _download_event_page(self, event_data: Dict[str, Any]) -> Tuple[bytes, str]:
+        """
+        Etapa de descarga: devuelve el cuerpo de la página del evento junto a su identificador,
+        o None si el evento no tiene identificador.
+        """
+        event_id = event_data.get('event_id')
+        if not event_id:
+            return None
+        return self.http_client.get_content(self._event_url(event_id)), event_id
+    
+    def _on_event_parsed(self, event_data: Dict[str, Any], fights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Registra como correcto un evento parseado en el pool de procesos."""
+        if fights is None:
+            return []
+        self._record_success('event', event_data['event_id'], fights)
+        print(f"Event {event_data['event_id']} ({event_data.get('name', '')}): {len(fights)} fights")
+        return fights
+    
+    def _on_event_failed(self, event_data: Dict[str, Any], error: Exception) -> List[Dict[str, Any]]:
+        """Registra en la cola de peticiones fallidas un evento cuya descarga o parseo falló."""
+        event_id = event_data['event_id']
+        self._record_failure('fight_index', 'event', event_id, self._event_url(event_id), error)
+        return []
 
 
 class FightDetailScraper(BaseScraper):
     """
     Scraper especializado en la extracción de información detallada de peleas.
-    Utiliza concurrencia y muestra el progreso de la extracción.
+    Utiliza concurrencia (hilos o asyncio según la configuración) y muestra el progreso de la extracción.
     """
     
-    def __init__(self, config):
-        super().__init__(config)
-        self.parser = FightParser()
+    def __init__(self, config, **kwargs):
+        super().__init__(config, **kwargs)
+        self.parser = self._make_parser(FightParser, LxmlFightParser)
     
-    def scrape(self, fights_index: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def scrape(self, fights_index: List[Dict[str, Any]], sink: Optional[RowSink] = None) -> List[Dict[str, Any]]:
         """
         Extrae información detallada de peleas a partir de un índice de peleas.
         Fusiona los detalles extraídos con los datos originales y muestra el progreso.
         Args:
             fights_index (List[Dict[str, Any]]): Lista de diccionarios con el índice de peleas.
+            sink (RowSink, opcional): Escritor (CSV o SQLite) al que se envía cada pelea en el orden del índice;
+                las fallidas se reintentan una vez al llegarles el turno y, si vuelven a fallar, se escribe su fila
+                del índice.
         Returns:
-            List[Dict[str, Any]]: Lista de peleas con información detallada.
+            List[Dict[str, Any]]: Lista de peleas con información detallada, o lista vacía si se indica `sink`
+                (las filas solo se escriben en él, sin retenerlas en memoria).
         """
+        if self._use_async_engine():
+            return asyncio.run(self.scrape_async(fights_index, sink))
+        
         print("🥊 Scraping detailed fight information...")
         
         fights_index = self._apply_dev_limit(fights_index)
+        _, restored = self._split_resumed('fight', fights_index, 'fight_id')
+        self._open_stream(sink)
         
-        def process_fight(fight_data: Dict[str, Any], idx: int = None) -> Dict[str, Any]:
+        def process_fight(fight_data: Dict[str, Any]) -> Dict[str, Any]:
             fight_id = fight_data.get('fight_id')
             if not fight_id:
                 return fight_data
-            
-            url = f"{FIGHT_URL}/{fight_id}"
+            if fight_id in restored:
+                return self._combine_fight_details(fight_data, restored[fight_id])
+            return self._fetch_fight_details(fight_data)
+        
+        def download(fight_data: Dict[str, Any]) -> Union[str, Parsed, None]:
+            fight_id = fight_data.get('fight_id')
+            if fight_id in restored:
+                return Parsed(restored[fight_id])
+            return self._download_fight_page(fight_data)
+        
+    # Los resultados llegan en el orden del índice, de modo que las filas se escriben en ese mismo orden
+        if self._use_process_parsing():
+            results = self._merge_results(
+                self._pipelined_imap(download, self.parser.parse_fight_details, fights_index),
+                self._on_fight_parsed
+            )
+        else:
+            results = imap(process_fight, fights_index, max_workers=self.config.scraping.pool_size)
+        
+        for result in results:
+            self._finish_fight(result, restored, len(fights_index))
+        
+        print(f"✅ Fight details scraped: {len(fights_index)}")
+        return self._close_stream()
+    
+    async def scrape_async(self, fights_index: List[Dict[str, Any]],
+                           sink: Optional[RowSink] = None) -> List[Dict[str, Any]]:
+        """
+        Versión asyncio de scrape: descarga todas las páginas de detalle en un único hilo,
+        con hasta `async_concurrency` peticiones en vuelo. Produce las mismas filas que la versión con hilos.
+        Args:
+            fights_index (List[Dict[str, Any]]): Lista de diccionarios con el índice de peleas.
+            sink (RowSink, opcional): Escritor (CSV o SQLite) al que se envía cada pelea en el orden del índice.
+        Returns:
+            List[Dict[str, Any]]: Lista de peleas con información detallada, o lista vacía si se indica `sink`.
+        """
+        print("🥊 Scraping detailed fight information (async)...")
+        
+        fights_index = self._apply_dev_limit(fights_index)
+        _, restored = self._split_resumed('fight', fights_index, 'fight_id')
+        self._open_stream(sink)
+        
+        parse_pool = self._make_parse_pool()
+        async with self._make_async_client() as client:
+            async def process_fight(fight_data: Dict[str, Any]) -> Dict[str, Any]:
+                fight_id = fight_data.get('fight_id')
+                if not fight_id:
+                    return fight_data
+                if fight_id in restored:
+                    return self._combine_fight_details(fight_data, restored[fight_id])
+                page = await client.get_page(self._fight_url(fight_id))
+                fight_details = await self._parse_page_async(parse_pool, 'fight', fight_id, page,
+                                                             self.parser.parse_fight_details)
+                return self._combine_fight_details(fight_data, fight_details)
             
             try:
-                html = self.http_client.get_html(url)
-                fight_details = self.parser.parse_fight_details(html)
-                
-                # Fusiona los detalles de la pelea con los datos del índice, preservando los campos originales
-                merged_fight = {**fight_details, **fight_data}
-                
-                # Asegura que los campos fight_id y event_id provengan del índice original
-                merged_fight['fight_id'] = fight_data['fight_id']
-                merged_fight['event_id'] = fight_data['event_id']
-                if 'fight_order' in fight_data:
-                    merged_fight['fight_order'] = fight_data['fight_order']
-                                
-                return merged_fight
-                
-            except Exception as e:
-                print(f"Error processing fight {fight_id}: {e}")
-                return fight_data
+                results = async_imap(process_fight, fights_index, concurrency=self.config.scraping.async_concurrency)
+                async for result in results:
+                    if result.ok:
+                        self._finish_fight(result, restored, len(fights_index))
+                        continue
+                    # Las peleas fallidas se reintentan fuera del bucle de eventos, con el cliente síncrono
+                    await to_thread(self._finish_fight, result, restored, len(fights_index))
+            finally:
+                if parse_pool is not None:
+                    parse_pool.shutdown()
+        
+        print(f"✅ Fight details scraped: {len(fights_index)}")
+        return self._close_stream()
+    
+    def _finish_fight(self, result: MapResult, restored: Dict[str, Any], total: int):
+        """
+        Escribe la fila de una pelea cuando le llega el turno en el orden del índice. Si su descarga o parseo
+        falló, la reintenta una vez y, si vuelve a fallar, escribe su fila del índice.
+        """
+        if self._accept_result(result, 'fight_details', 'fight', 'fight_id', self._fight_url, restored):
+            self._emit_row(result.value)
+        else:
+            self._emit_row(self._retry_item('fight_details', 'fight', 'fight_id', self._fight_url,
+                                            result.item, self._fetch_fight_details))
+        self._progress_callback(result.index + 1, total)
+    
+    def retry_failed(self, fights_index: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Reintenta las peleas de la lista que figuran en la cola de peticiones fallidas.
+        Returns:
+            Dict[str, Dict[str, Any]]: Filas recuperadas indexadas por fight_id.
+        """
+        return self._retry_dead_letters('fight_details', fights_index, 'fight_id', self._fetch_fight_details)
+    
+    def _fight_url(self, fight_id: str) -> str:
+        """URL de la página de una pelea sobre la URL base configurada."""
+        return f"{self.config.scraping.fight_url}/{fight_id}"
+    
+    def _fetch_fight_details(self, fight_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Descarga la página de una pelea y la fusiona con los datos del índice; si la página no ha cambiado desde la
+        ejecución anterior, reutiliza los detalles ya parseados. Lanza la excepción original si la descarga o el
+        parseo fallan.
+        """
+        fight_id = fight_data['fight_id']
+        page = self.http_client.get_page(self._fight_url(fight_id))
+        fight_details = self._parse_page('fight', fight_id, page, self.parser.parse_fight_details)
+        return self._combine_fight_details(fight_data, fight_details)
+    
+    def _combine_fight_details(self, fight_data: Dict[str, Any], fight_details: Dict[str, Any]) -> Fight:
+        """
+        Fusiona los detalles ya parseados de una pelea con los datos del índice, preservando los campos originales.
+        El resultado es un registro Fight con las estadísticas ya convertidas a enteros y segundos.
+        """
+        merged_fight = {**fight_details, **fight_data}
         
-    # Utiliza procesamiento concurrente mostrando el progreso de la extracción
-        detailed_fights = concurrent_map_with_progress(
-            process_fight,
-            fights_index,
-            max_workers=self.config.scraping.max_workers,
-            progress_callback=self._progress_callback
-        )
+        # Asegura que los campos fight_id y event_id provengan del índice original
+        merged_fight['fight_id'] = fight_data['fight_id']
+        merged_fight['event_id'] = fight_data['event_id']
+        if 'fight_order' in fight_data:
+            merged_fight['fight_order'] = fight_data['fight_order']
         
-        print(f"✅ Fight details scraped: {len(detailed_fights)}")
-        return detailed_fights
\ No newline at end of file
+        return Fight.from_row(merged_fight)
+    
+    def _download_fight_page(self, fight_data: Dict[str, Any]) -> Union[str, Parsed, None]:
+        """
+        Etapa de descarga: devuelve el HTML de la página de la pelea, los detalles ya parseados (Parsed) si la
+        página no ha cambiado desde la ejecución anterior, o None si no tiene identificador.
+        """
+        fight_id = fight_data.get('fight_id')
+        if not fight_id:
+            return None
+        page = self.http_client.get_page(self._fight_url(fight_id))
+        fight_details = self._reuse_parsed('fight', fight_id, page)
+        return Parsed(fight_details) if fight_details is not None else page.text
+    
+    def _on_fight_parsed(self, fight_data: Dict[str, Any], fight_details: Dict[str, Any]) -> Dict[str, Any]:
+        """Fusiona los detalles parseados en el pool de procesos y los memoriza para la siguiente ejecución."""
+        if fight_details is None:
+            return fight_data
+        self._remember_parsed('fight', fight_data['fight_id'], fight_details)
+        return self._combine_fight_details(fight_data, fight_details)
+
+
+def parse_event_page(parser: FightParser, page: Tuple[bytes, str]) -> List[Dict[str, Any]]:
+    """
+    Parsea una página de evento descargada (cuerpo, event_id) y devuelve su índice de peleas.
+    Es una función de módulo para poder ejecutarse en el pool de procesos de parseo.
+    """
+    content, event_id = page
+    return parser.parse_event_fights(parser.load(content), event_id)
@@ -0,0 +1,254 @@
+"""
+Archivo de páginas crudas del pipeline UFC ETL.
+Guarda comprimida cada página descargada en una base de datos SQLite, indexada por tipo de entidad e identificador
+(evento, pelea, luchador o página de listado), junto con la URL, la fecha de descarga y el hash de su contenido.
+A diferencia de la caché HTTP, las entradas no expiran ni se desalojan: el archivo conserva la última versión de
+cada página para poder reconstruir los CSV crudos sin red (--reparse) tras corregir un parser.
+Las páginas se comprimen con zstd si el paquete zstandard está instalado y, si no, con zlib; cada fila registra
+su códec, de modo que un mismo archivo puede contener ambos formatos.
+"""
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+from bs4 import BeautifulSoup
+from ..core.constants import (
+    FIGHTERS_PATH, EVENTS_COMPLETED_PATH, EVENTS_UPCOMING_PATH, EVENT_PATH, FIGHTER_PATH, FIGHT_PATH
+)
+from ..core.exceptions import ConfigurationError, FetchError
+from .cache import CacheEntry, content_hash
+from .metrics import get_metrics
+
+try:
+    import zstandard
+except ImportError:  # zstandard es opcional: sin él se comprime con zlib
+    zstandard = None
+
+
+# Ruta de la URL -> tipo de entidad de las páginas de detalle
+_DETAIL_ENTITIES = {EVENT_PATH: 'event', FIGHT_PATH: 'fight', FIGHTER_PATH: 'fighter'}
+
+
+def classify_url(url: str) -> Optional[Tuple[str, str]]:
+    """
+    Tipo de entidad e identificador de una URL de ufcstats, o None si no es una página archivable.
+        /statistics/events/completed -> ('events_listing', 'completed')
+        /statistics/fighters?char=a  -> ('fighters_listing', 'a')
+        /fight-details/<id>          -> ('fight', '<id>')
+    """
+    parts = urlsplit(url)
+    path = parts.path.rstrip('/')
+    if path == EVENTS_COMPLETED_PATH:
+        return 'events_listing', 'completed'
+    if path == EVENTS_UPCOMING_PATH:
+        return 'events_listing', 'upcoming'
+    if path == FIGHTERS_PATH:
+        return 'fighters_listing', parse_qs(parts.query).get('char', [''])[0].lower()
+    prefix, _, key = path.rpartition('/')
+    entity = _DETAIL_ENTITIES.get(prefix)
+    if entity is None or not key:
+        return None
+    return entity, key
+
+
+class PageArchive:
+    """
+    Archivo SQLite de páginas comprimidas, seguro para uso desde varios hilos.
+    Args:
+        path (str): Ruta del fichero SQLite (se crea al archivar la primera página).
+        codec (str, opcional): 'zstd' o 'zlib'; por defecto, zstd si está disponible.
+        level (int, opcional): Nivel de compresión; por defecto, 3 para zstd y 6 para zlib.
+    """
+
+    def __init__(self, path: str, codec: Optional[str] = None, level: Optional[int] = None):
+        if codec is None:
+            codec = 'zstd' if zstandard is not None else 'zlib'
+        if codec == 'zstd' and zstandard is None:
+            raise ConfigurationError("The zstd archive codec requires zstandard (pip install zstandard)")
+        if codec not in ('zstd', 'zlib'):
+            raise ConfigurationError(f"Unknown archive codec '{codec}' (expected zstd or zlib)")
+        self.path = path
+        self.codec = codec
+        self.level = level if level is not None else (3 if codec == 'zstd' else 6)
+        self._lock = threading.Lock()
+
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connection(self, create: bool = True) -> Optional[sqlite3.Connection]:
+        # El fichero se crea al archivar la primera página: construir un scraper no deja archivos vacíos.
+        # Debe llamarse con el lock adquirido
+        if self._db is None:
+            if not create and not os.path.exists(self.path):
+                return None
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS pages (
+                    entity TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    codec TEXT NOT NULL,
+                    encoding TEXT,
+                    size INTEGER NOT NULL,
+                    body BLOB NOT NULL,
+                    PRIMARY KEY (entity, key)
+                )"""
+            )
+        return self._db
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        """Ejecuta una consulta de lectura; sin fichero todavía, no hay filas."""
+        with self._lock:
+            db = self._connection(create=False)
+            return db.execute(sql, params).fetchall() if db is not None else []
+
+    def store(self, url: str, body: bytes, encoding: Optional[str] = None) -> bool:
+        """
+        Archiva la página de una URL. Si la versión archivada tiene el mismo contenido no se reescribe.
+        Returns:
+            bool: True si la página era nueva o ha cambiado; False si no se ha archivado (sin cambios o URL
+                no archivable).
+        """
+        identity = classify_url(url)
+        if identity is None:
+            return False
+        entity, key = identity
+        digest = content_hash(body)
+        rows = self._query('SELECT content_hash FROM pages WHERE entity = ? AND key = ?', (entity, key))
+        if rows and rows[0][0] == digest:
+            return False
+
+        compressed = self._compress(body)
+        with self._lock:
+            self._connection().execute(
+                'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (entity, key, url, time.time(), digest, self.codec, encoding, len(body), compressed)
+            )
+        get_metrics().inc('archive_pages_written_total', entity=entity)
+        get_metrics().inc('archive_bytes_written_total', len(compressed), entity=entity)
+        return True
+
+    def get(self, entity: str, key: str) -> Optional[CacheEntry]:
+        """Página archivada de una entidad, descomprimida, o None si no existe."""
+        rows = self._query('SELECT codec, encoding, body FROM pages WHERE entity = ? AND key = ?', (entity, key))
+        if not rows:
+            return None
+        codec, encoding, body = rows[0]
+        return CacheEntry(body=self._decompress(codec, body), encoding=encoding)
+
+    def get_url(self, url: str) -> Optional[CacheEntry]:
+        """Página archivada correspondiente a una URL, o None si no existe."""
+        identity = classify_url(url)
+        return self.get(*identity) if identity is not None else None
+
+    def hash_of(self, entity: str, key: str) -> Optional[str]:
+        """Hash del contenido archivado de una entidad, o None si no existe."""
+        rows = self._query('SELECT content_hash FROM pages WHERE entity = ? AND key = ?', (entity, key))
+        return rows[0][0] if rows else None
+
+    def keys(self, entity: str) -> List[str]:
+        """Identificadores archivados de un tipo de entidad."""
+        return [row[0] for row in self._query('SELECT key FROM pages WHERE entity = ? ORDER BY key', (entity,))]
+
+    def iter_pages(self, entity: str) -> Iterator[Tuple[str, CacheEntry]]:
+        """Recorre las páginas archivadas de un tipo de entidad como pares (identificador, página)."""
+        for key in self.keys(entity):
+            entry = self.get(entity, key)
+            if entry is not None:
+                yield key, entry
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Número de páginas, tamaño original y tamaño comprimido por tipo de entidad."""
+        rows = self._query(
+            'SELECT entity, COUNT(*), SUM(size), SUM(LENGTH(body)) FROM pages GROUP BY entity ORDER BY entity'
+        )
+        return {entity: {'pages': count, 'bytes': size, 'compressed_bytes': compressed}
+                for entity, count, size, compressed in rows}
+
+    def __len__(self) -> int:
+        rows = self._query('SELECT COUNT(*) FROM pages')
+        return rows[0][0] if rows else 0
+
+    def close(self):
+        """Cierra la base de datos."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _compress(self, body: bytes) -> bytes:
+        if self.codec == 'zstd':
+            return zstandard.ZstdCompressor(level=self.level).compress(body)
+        return zlib.compress(body, self.level)
+
+    @staticmethod
+    def _decompress(codec: str, body: bytes) -> bytes:
+        if codec == 'zstd':
+            if zstandard is None:
+                raise ConfigurationError("Archived page is zstd-compressed; install zstandard to read it")
+            return zstandard.ZstdDecompressor().decompress(body)
+        return zlib.decompress(body)
+
+
+class ArchiveClient:
+    """
+    Cliente con la interfaz de HTTPClient que sirve las páginas desde el archivo, sin red (modo --reparse).
+    Las páginas que no están archivadas fallan con FetchError (404), igual que una página inexistente.
+    """
+
+    cache = None
+
+    def __init__(self, archive: PageArchive):
+        self.archive = archive
+
+    def get_soup(self, url: str) -> Optional[BeautifulSoup]:
+        """Get BeautifulSoup object for URL."""
+        return BeautifulSoup(self._fetch(url).body, 'html.parser')
+
+    def get_content(self, url: str) -> bytes:
+        """Get raw response body for URL."""
+        return self._fetch(url).body
+
+    def get_html(self, url: str) -> str:
+        """Get raw HTML for URL."""
+        return self._fetch(url).text
+
+    def get_page(self, url: str) -> CacheEntry:
+        """Get the response body with its encoding and content hash."""
+        return self._fetch(url)
+
+    def _fetch(self, url: str) -> CacheEntry:
+        entry = self.archive.get_url(url)
+        if entry is None:
+            raise FetchError(f"{url} is not in the page archive {self.archive.path}", status=404)
+        get_metrics().inc('archive_pages_read_total')
+        return entry
+
+    def delay_request(self):
+        """Sin red no hay que espaciar las peticiones."""
+        pass
+
+
+_shared_archives: Dict[str, PageArchive] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_archive(path: str) -> PageArchive:
+    """
+    Devuelve la instancia de archivo compartida para una ruta, creándola si no existe.
+    Todos los clientes HTTP del proceso comparten así la conexión a la base de datos.
+    """
+    key = os.path.abspath(path)
+    with _shared_lock:
+        archive = _shared_archives.get(key)
+        if archive is None:
+            archive = PageArchive(path)
+            _shared_archives[key] = archive
+        return archive
@@ -0,0 +1,154 @@
+"""Asyncio HTTP utilities for scraping."""
+import asyncio
+import time
+from typing import Optional
+from bs4 import BeautifulSoup
+from requests.compat import chardet
+from requests.utils import get_encoding_from_headers
+from ..core.exceptions import ConfigurationError, ScrapingError, FetchError
+from .archive import PageArchive
+from .cache import CacheEntry, ResponseCache
+from .rate_limit import RateLimiter, parse_retry_after
+from .retry import RetryPolicy, CircuitBreakerRegistry
+from .metrics import get_metrics
+from .concurrent import to_thread
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only required by the async engine
+    aiohttp = None
+
+
+class AsyncHTTPClient:
+    """Asyncio counterpart of HTTPClient, sharing its cache and decoding rules."""
+
+    def __init__(self, headers: dict, cache: Optional[ResponseCache] = None, max_connections: int = 100,
+                 rate_limiter: Optional[RateLimiter] = None, timeout: Optional[float] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 archive: Optional[PageArchive] = None):
+        if aiohttp is None:
+            raise ConfigurationError("The async engine requires aiohttp (pip install aiohttp)")
+        self.headers = headers
+        self.cache = cache
+        self.max_connections = max_connections
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        self.circuit_breakers = circuit_breakers
+        self.archive = archive
+        self._session = None
+
+    async def __aenter__(self) -> 'AsyncHTTPClient':
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        self._session = aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_soup(self, url: str) -> Optional[BeautifulSoup]:
+        """Get BeautifulSoup object for URL."""
+        entry = await self._fetch(url)
+        return BeautifulSoup(entry.body, 'html.parser')
+
+    async def get_content(self, url: str) -> bytes:
+        """Get raw response body for URL."""
+        entry = await self._fetch(url)
+        return entry.body
+
+    async def get_html(self, url: str) -> str:
+        """Get raw HTML for URL."""
+        entry = await self._fetch(url)
+        return entry.text
+
+    async def get_page(self, url: str) -> CacheEntry:
+        """Get the response body with its encoding and content hash."""
+        return await self._fetch(url)
+
+    async def _fetch(self, url: str) -> CacheEntry:
+        """
+        Fetch URL body, serving it from the response cache when available and retrying transient errors.
+        Cache and archive lookups and writes hit the disk, so they run in worker threads, off the event loop.
+        """
+        if self._session is None:
+            raise ScrapingError("AsyncHTTPClient must be used as an async context manager")
+
+        if self.cache is not None:
+            cached = await to_thread(self.cache.get, url)
+            if cached is not None:
+                get_metrics().inc('http_cache_hits_total')
+                await self._archive(url, cached)
+                return cached
+
+        breaker = self.circuit_breakers.for_url(url) if self.circuit_breakers else None
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request()
+            try:
+                entry = await self._request_once(url)
+            except FetchError as e:
+                retryable = self.retry_policy.is_retryable_status(e.status)
+                if breaker is not None:
+                    if retryable:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                if not retryable or attempt >= self.retry_policy.max_retries:
+                    raise
+                get_metrics().inc('http_retries_total')
+                await asyncio.sleep(self.retry_policy.delay_for(attempt, e.retry_after))
+                attempt += 1
+                continue
+            if breaker is not None:
+                breaker.record_success()
+            break
+
+        if self.cache is not None:
+            await to_thread(self.cache.set, url, entry.body, entry.encoding)
+        await self._archive(url, entry)
+        return entry
+
+    async def _archive(self, url: str, entry: CacheEntry):
+        """Store the page in the raw page archive, if enabled."""
+        if self.archive is not None:
+            await to_thread(self.archive.store, url, entry.body, entry.encoding)
+
+    async def _request_once(self, url: str) -> CacheEntry:
+        """Perform a single rate-limited GET request."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        start = time.monotonic()
+        status = None
+        retry_after = None
+        timed_out = False
+        body = b''
+        try:
+            async with self._session.get(url) as response:
+                status = response.status
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                response.raise_for_status()
+                body = await response.read()
+                headers = response.headers
+        except asyncio.TimeoutError:
+            timed_out = True
+            raise FetchError(f"Failed to fetch {url}: timed out", timed_out=True)
+        except aiohttp.ClientError as e:
+            raise FetchError(f"Failed to fetch {url}: {e}", status=status, retry_after=retry_after)
+        finally:
+            elapsed = time.monotonic() - start
+            if self.rate_limiter is not None:
+                self.rate_limiter.release(elapsed, status, timed_out, retry_after)
+            get_metrics().record_request(elapsed, status, len(body), timed_out)
+
+        # Same decoding rules as requests, so both engines yield identical text
+        encoding = get_encoding_from_headers(headers) or chardet.detect(body)['encoding']
+        return CacheEntry(body=body, encoding=encoding)
@@ -0,0 +1,259 @@
+"""
+Caché persistente en disco para las respuestas HTTP del scraper de UFC.
+Almacena el HTML descargado direccionado por el hash de su URL, aplica un TTL distinto según el tipo de página,
+desaloja las entradas menos usadas (LRU) cuando se supera el presupuesto de disco y lleva contadores de aciertos y fallos.
+"""
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List, Optional
+
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+
+@dataclass
+class CacheRule:
+    """
+    Regla de expiración para las URLs que coinciden con un patrón.
+    Un TTL de None indica que la entrada no expira nunca. Si se define `stable_marker` y el cuerpo
+    de la respuesta no lo contiene, la página se considera aún cambiante y se usa `unstable_ttl`.
+    """
+    pattern: str
+    ttl: Optional[float]
+    stable_marker: Optional[str] = None
+    unstable_ttl: Optional[float] = None
+
+    def matches(self, url: str) -> bool:
+        """Indica si la regla se aplica a la URL dada."""
+        return re.search(self.pattern, url) is not None
+
+    def ttl_for(self, body: bytes) -> Optional[float]:
+        """Devuelve el TTL aplicable según el contenido de la respuesta."""
+        if self.stable_marker and self.stable_marker.encode() not in body:
+            return self.unstable_ttl
+        return self.ttl
+
+
+# Las peleas y eventos ya disputados no cambian; los listados y las páginas de luchadores sí
+DEFAULT_CACHE_RULES = [
+    CacheRule(r'/statistics/events/upcoming', 10 * MINUTE),
+    CacheRule(r'/statistics/events/completed', HOUR),
+    CacheRule(r'/statistics/fighters', DAY),
+    CacheRule(r'/event-details/', None, stable_marker='b-flag_style_green', unstable_ttl=HOUR),
+    CacheRule(r'/fight-details/', None, stable_marker='b-fight-details__content', unstable_ttl=HOUR),
+    CacheRule(r'/fighter-details/', DAY),
+]
+
+
+def content_hash(body: bytes) -> str:
+    """Hash BLAKE2b de 128 bits del cuerpo de una página."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """Respuesta almacenada en la caché: cuerpo en bytes y codificación original."""
+    body: bytes
+    encoding: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """Cuerpo decodificado con la codificación original de la respuesta."""
+        return self.body.decode(self.encoding or 'utf-8', errors='replace')
+
+    @cached_property
+    def content_hash(self) -> str:
+        """Hash del cuerpo, calculado una sola vez, para detectar si la página ha cambiado."""
+        return content_hash(self.body)
+
+
+class ResponseCache:
+    """
+    Caché de respuestas HTTP en disco con TTL por tipo de URL y desalojo LRU.
+    Los cuerpos se guardan como ficheros nombrados por el SHA-256 de la URL y los metadatos
+    (tamaño, expiración, último acceso) en un índice SQLite. Es segura para uso desde varios hilos.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2 * 1024 ** 3,
+                 rules: Optional[List[CacheRule]] = None, default_ttl: Optional[float] = DAY):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rules = DEFAULT_CACHE_RULES if rules is None else rules
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'expired': 0, 'writes': 0, 'evictions': 0}
+
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(
+            os.path.join(directory, 'index.sqlite'),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                encoding TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                expires_at REAL
+            )"""
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)')
+        self._total_bytes = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        """Clave de la caché para una URL (SHA-256 hexadecimal)."""
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def ttl_for(self, url: str, body: bytes) -> Optional[float]:
+        """Determina el TTL de una respuesta aplicando la primera regla que coincide con la URL."""
+        for rule in self.rules:
+            if rule.matches(url):
+                return rule.ttl_for(body)
+        return self.default_ttl
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        Recupera la respuesta almacenada para una URL.
+        Devuelve None si no existe, si ha expirado o si el fichero del cuerpo se ha perdido.
+        """
+        key = self.key_for(url)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                'SELECT encoding, expires_at FROM entries WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self._counters['misses'] += 1
+                return None
+
+            encoding, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._counters['expired'] += 1
+                self._counters['misses'] += 1
+                self._delete(key)
+                return None
+
+            try:
+                with open(self._path_for(key), 'rb') as f:
+                    body = f.read()
+            except OSError:
+                self._counters['misses'] += 1
+                self._delete(key)
+                return None
+
+            self._db.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (now, key))
+            self._counters['hits'] += 1
+        return CacheEntry(body=body, encoding=encoding)
+
+    def set(self, url: str, body: bytes, encoding: Optional[str] = None):
+        """
+        Almacena la respuesta de una URL calculando su expiración según las reglas configuradas.
+        Si el total supera el presupuesto de disco, desaloja las entradas menos usadas.
+        """
+        key = self.key_for(url)
+        path = self._path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Escritura atómica: un fallo a mitad nunca deja un cuerpo truncado en la caché
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+
+        now = time.time()
+        ttl = self.ttl_for(url, body)
+        expires_at = None if ttl is None else now + ttl
+        with self._lock:
+            previous = self._db.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+            if previous:
+                self._total_bytes -= previous[0]
+            self._db.execute(
+                'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, url, len(body), encoding, now, now, expires_at)
+            )
+            self._total_bytes += len(body)
+            self._counters['writes'] += 1
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def invalidate(self, url: str):
+        """Elimina la entrada de una URL, si existe."""
+        with self._lock:
+            self._delete(self.key_for(url))
+
+    def clear(self):
+        """Vacía la caché por completo."""
+        with self._lock:
+            keys = [row[0] for row in self._db.execute('SELECT key FROM entries')]
+            for key in keys:
+                self._delete(key)
+
+    def stats(self) -> Dict[str, float]:
+        """Devuelve los contadores de uso y el estado actual de la caché."""
+        with self._lock:
+            entries = self._db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+            stats = dict(self._counters)
+            stats['entries'] = entries
+            stats['size_bytes'] = self._total_bytes
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] / lookups * 100) if lookups else 0
+        return stats
+
+    def close(self):
+        """Cierra el índice SQLite."""
+        with self._lock:
+            self._db.close()
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _delete(self, key: str):
+        # Debe llamarse con el lock adquirido
+        row = self._db.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+        if row:
+            self._total_bytes -= row[0]
+            self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+        try:
+            os.remove(self._path_for(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        # Debe llamarse con el lock adquirido; deja margen para no desalojar en cada escritura
+        target = int(self.max_bytes * 0.9)
+        rows = self._db.execute('SELECT key FROM entries ORDER BY accessed_at ASC').fetchall()
+        for (key,) in rows:
+            if self._total_bytes <= target:
+                break
+            self._delete(key)
+            self._counters['evictions'] += 1
+
+
+_shared_caches: Dict[str, ResponseCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache(directory: str, max_bytes: int) -> ResponseCache:
+    """
+    Devuelve la instancia de caché compartida para un directorio, creándola si no existe.
+    Todos los scrapers del proceso comparten así índice y contadores.
+    """
+    key = os.path.abspath(directory)
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = ResponseCache(directory, max_bytes=max_bytes)
+            _shared_caches[key] = cache
+        return cache
@@ -1,15 +1,125 @@
 """
 Utilidades para concurrencia y procesamiento paralelo en el proyecto UFC ETL.
-Incluye funciones para ejecutar tareas en paralelo utilizando hilos y para realizar seguimiento de progreso.
+Incluye funciones para ejecutar tareas en paralelo utilizando hilos, procesos o asyncio y para realizar seguimiento de progreso.
+Las tareas enviadas a los hilos se ejecutan en una copia del contexto de quien las envía, de modo que conservan las
+variables de contexto (como la fase activa de las métricas).
 """
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Callable, Any, Iterator
+import asyncio
+import contextvars
+import multiprocessing
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from functools import partial
+from typing import List, Callable, Any, Iterable, Iterator, AsyncIterator, Awaitable, Dict, Optional, Tuple
 import logging
+from .metrics import get_metrics, call_timed, observe_parse
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class MapResult:
+    """
+    Resultado de un elemento en imap/async_imap: su índice en la entrada, el elemento y el valor devuelto,
+    o la excepción que produjo en `error`.
+    """
+    index: int
+    item: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Indica si el elemento se procesó sin error."""
+        return self.error is None
+
+
+@dataclass
+class Parsed:
+    """
+    Resultado ya parseado que la etapa de descarga de pipelined_map puede devolver en lugar de la página
+    (por ejemplo, una fila reutilizada de una ejecución anterior): se pasa a merge sin ocupar el pool de procesos.
+    """
+    value: Any
+
+
+def imap(
+    func: Callable,
+    items: Iterable[Any],
+    max_workers: int = 10,
+    window: Optional[int] = None,
+    ordered: bool = True,
+    pass_index: bool = False
+) -> Iterator[MapResult]:
+    """
+    Aplica una función a los elementos de un iterable en un pool de hilos y devuelve los resultados en streaming.
+    Solo hay `window` elementos a la vez entre enviados y pendientes de entregar (por defecto, el doble de hilos):
+    la entrada se consume a medida que se entregan resultados, de modo que la memoria no depende de su tamaño.
+    Con `ordered` los resultados se entregan en el orden de entrada; sin él, en el orden en que terminan.
+    Si el consumidor se interrumpe (KeyboardInterrupt, excepción o abandono del iterador), las tareas aún no
+    iniciadas se cancelan y el pool se cierra sin esperar.
+    Args:
+        func (Callable): Función a aplicar a cada elemento.
+        items (Iterable[Any]): Elementos a procesar; se leen de forma perezosa.
+        max_workers (int): Número máximo de hilos concurrentes.
+        window (int, opcional): Máximo de elementos en vuelo más resultados retenidos para mantener el orden.
+        ordered (bool): Si los resultados deben entregarse en el orden de entrada.
+        pass_index (bool): Si la función recibe el índice del elemento como segundo argumento.
+    Yields:
+        MapResult: Resultado de cada elemento, con el valor o la excepción producida.
+    """
+    window = max(1, window or max_workers * 2)
+    source = enumerate(items)
+    exhausted = False
+    in_flight: Dict[Future, Tuple[int, Any]] = {}
+    pending: Dict[int, MapResult] = {}
+    next_index = 0
+    metrics = get_metrics()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def fill():
+        nonlocal exhausted
+        while not exhausted and len(in_flight) + len(pending) < window:
+            try:
+                idx, item = next(source)
+            except StopIteration:
+                exhausted = True
+                return
+            args = (item, idx) if pass_index else (item,)
+            future = executor.submit(contextvars.copy_context().run, func, *args)
+            in_flight[future] = (idx, item)
+
+    try:
+        fill()
+        while in_flight:
+            metrics.set_max('queue_depth_max', len(in_flight), queue='thread_pool')
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, item = in_flight.pop(future)
+                error = future.exception()
+                result = MapResult(idx, item, None if error else future.result(), error)
+                if ordered:
+                    pending[idx] = result
+                else:
+                    yield result
+            while next_index in pending:
+                yield pending.pop(next_index)
+                next_index += 1
+            fill()
+    except BaseException:
+        # Future.cancel solo afecta a las tareas aún no iniciadas (shutdown(cancel_futures) no existe en 3.8)
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+        raise
+    executor.shutdown(wait=True)
+
+
 def concurrent_map(func: Callable, items: List[Any], max_workers: int = 10) -> List[Any]:
     """
     Ejecuta una función sobre una lista de elementos de forma concurrente utilizando hilos.
@@ -19,21 +129,15 @@ def concurrent_map(func: Callable, items: List[Any], max_workers: int = 10) -> L
         items (List[Any]): Lista de elementos a procesar.
         max_workers (int): Número máximo de hilos concurrentes.
     Returns:
-        List[Any]: Lista de resultados exitosos (excluye los que generaron error).
+        List[Any]: Lista de resultados exitosos (excluye los que generaron error), en orden de finalización.
     """
     results = []
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_item = {executor.submit(func, item): item for item in items}
-        for future in as_completed(future_to_item):
-            item = future_to_item[future]
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error procesando {item}: {e}")
-                results.append(None)
-    # Se filtran los resultados para eliminar aquellos que sean None (errores)
-    return [r for r in results if r is not None]
+    for result in imap(func, items, max_workers=max_workers, ordered=False):
+        if not result.ok:
+            logger.error(f"Error procesando {result.item}: {result.error}")
+        elif result.value is not None:
+            results.append(result.value)
+    return results
 
 
 def concurrent_map_with_progress(
@@ -55,21 +159,314 @@ def concurrent_map_with_progress(
     """
     results = []
     total = len(items)
+    for completed, result in enumerate(imap(func, items, max_workers=max_workers, pass_index=True), 1):
+        if not result.ok:
+            logger.error(f"Error procesando {result.item}: {result.error}")
+        elif result.value is not None:
+            results.append(result.value)
+        if progress_callback:
+            progress_callback(completed, total)
+    return results
+
+
+async def async_imap(
+    func: Callable[..., Awaitable[Any]],
+    items: Iterable[Any],
+    concurrency: int = 50,
+    window: Optional[int] = None,
+    ordered: bool = True,
+    pass_index: bool = False
+) -> AsyncIterator[MapResult]:
+    """
+    Contraparte asyncio de imap: ejecuta hasta `concurrency` corrutinas a la vez en un único hilo y entrega
+    los resultados en streaming. Las tareas se crean a medida que hay hueco en la ventana, en lugar de crearlas
+    todas al principio; si el consumidor se interrumpe o se cancela, las tareas en vuelo se cancelan.
+    Args:
+        func (Callable): Corrutina a aplicar a cada elemento.
+        items (Iterable[Any]): Elementos a procesar; se leen de forma perezosa.
+        concurrency (int): Número máximo de corrutinas ejecutándose a la vez.
+        window (int, opcional): Máximo de tareas en vuelo más resultados retenidos (por defecto, 2 * concurrency).
+        ordered (bool): Si los resultados deben entregarse en el orden de entrada.
+        pass_index (bool): Si la corrutina recibe el índice del elemento como segundo argumento.
+    Yields:
+        MapResult: Resultado de cada elemento, con el valor o la excepción producida.
+    """
+    window = max(concurrency, window or concurrency * 2)
+    source = enumerate(items)
+    exhausted = False
+    in_flight: Dict[asyncio.Task, Tuple[int, Any]] = {}
+    pending: Dict[int, MapResult] = {}
+    next_index = 0
+    metrics = get_metrics()
+
+    def fill():
+        nonlocal exhausted
+        while not exhausted and len(in_flight) < concurrency and len(in_flight) + len(pending) < window:
+            try:
+                idx, item = next(source)
+            except StopIteration:
+                exhausted = True
+                return
+            task = asyncio.ensure_future(func(item, idx) if pass_index else func(item))
+            in_flight[task] = (idx, item)
+
+    try:
+        fill()
+        while in_flight:
+            metrics.set_max('queue_depth_max', len(in_flight), queue='async_tasks')
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                idx, item = in_flight.pop(task)
+                error = task.exception()
+                result = MapResult(idx, item, None if error else task.result(), error)
+                if ordered:
+                    pending[idx] = result
+                else:
+                    yield result
+            while next_index in pending:
+                yield pending.pop(next_index)
+                next_index += 1
+            fill()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+async def async_map_with_progress(
+    func: Callable[..., Awaitable[Any]],
+    items: List[Any],
+    concurrency: int = 50,
+    progress_callback: Callable[[int, int], None] = None
+) -> List[Any]:
+    """
+    Contraparte asyncio de concurrent_map_with_progress: ejecuta una corrutina por elemento en un único hilo,
+    con un máximo de `concurrency` tareas en vuelo.
+    Args:
+        func (Callable): Corrutina a aplicar a cada elemento (debe aceptar el índice como segundo argumento).
+        items (List[Any]): Lista de elementos a procesar.
+        concurrency (int): Número máximo de corrutinas ejecutándose a la vez.
+        progress_callback (Callable, opcional): Función callback para reportar progreso (completados, total).
+    Returns:
+        List[Any]: Lista de resultados exitosos (excluye los que generaron error), ordenados por índice original.
+    """
+    results = []
+    total = len(items)
     completed = 0
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_item = {executor.submit(func, item, idx): (item, idx) 
-                          for idx, item in enumerate(items)}
-        for future in as_completed(future_to_item):
-            item, idx = future_to_item[future]
+    async for result in async_imap(func, items, concurrency=concurrency, pass_index=True):
+        completed += 1
+        if not result.ok:
+            logger.error(f"Error procesando {result.item}: {result.error}")
+        elif result.value is not None:
+            results.append(result.value)
+        if progress_callback:
+            progress_callback(completed, total)
+    return results
+
+
+async def to_thread(func: Callable, *args: Any) -> Any:
+    """
+    Ejecuta una llamada bloqueante en el pool de hilos por defecto del bucle de eventos, con una copia del contexto
+    actual, sin bloquear el bucle (equivalente a asyncio.to_thread, disponible desde Python 3.9).
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(None, partial(context.run, func, *args))
+
+
+def default_parse_workers() -> int:
+    """Número de procesos de parseo por defecto: uno por núcleo disponible."""
+    return os.cpu_count() or 1
+
+
+def make_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Crea un pool de procesos para las etapas de parseo.
+    Usa el método 'spawn' porque los procesos se crean mientras hay hilos de descarga activos,
+    y hacer fork de un proceso con hilos puede heredar locks bloqueados.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers or default_parse_workers(),
+        mp_context=multiprocessing.get_context('spawn')
+    )
+
+
+def pipelined_imap(
+    fetch: Callable[[Any], Any],
+    parse: Callable[[Any], Any],
+    items: Iterable[Any],
+    fetch_workers: int = 10,
+    parse_workers: Optional[int] = None,
+    queue_size: int = 64,
+    window: Optional[int] = None
+) -> Iterator[MapResult]:
+    """
+    Ejecuta un pipeline de dos etapas: descarga en un pool de hilos (E/S) y parseo en un pool de procesos (CPU),
+    y entrega los resultados en streaming y en el orden de entrada, como imap.
+    Los hilos de descarga depositan las páginas en una cola acotada a `queue_size`; cuando la cola está llena
+    se bloquean, de modo que el número de páginas descargadas pendientes de parsear (y la memoria) se mantiene
+    constante aunque la red sea más rápida que el parseo. Solo hay `window` elementos a la vez entre enviados y
+    pendientes de entregar, por lo que la entrada se consume a medida que se entregan resultados.
+    Args:
+        fetch (Callable): Descarga un elemento y devuelve la carga a parsear; si devuelve None no se parsea
+            (el valor es None) y si devuelve un Parsed su valor se entrega sin parsear.
+        parse (Callable): Función serializable (pickle) que convierte la carga en el resultado parseado.
+        items (Iterable[Any]): Elementos a procesar; se leen de forma perezosa.
+        fetch_workers (int): Número de hilos de descarga.
+        parse_workers (int, opcional): Número de procesos de parseo (por defecto, uno por núcleo).
+        queue_size (int): Capacidad de la cola entre ambas etapas.
+        window (int, opcional): Máximo de elementos en vuelo más resultados retenidos para mantener el orden
+            (por defecto, lo que cabe en la cola, los hilos de descarga y el pool de procesos).
+    Yields:
+        MapResult: Resultado de cada elemento, con el valor parseado o la excepción de la descarga o el parseo.
+    """
+    parse_workers = parse_workers or default_parse_workers()
+    queue_size = max(1, queue_size)
+    window = max(1, window or queue_size + fetch_workers + 2 * parse_workers)
+    handoff = queue.Queue(maxsize=queue_size)
+    finished: 'queue.Queue[MapResult]' = queue.Queue()
+    # Limita también las tareas enviadas al pool de procesos, cuya cola interna no está acotada
+    parse_slots = threading.BoundedSemaphore(parse_workers * 2)
+    stop = threading.Event()
+    source = enumerate(items)
+    exhausted = False
+    submitted = 0
+    fetch_futures: 'deque[Future]' = deque()
+    pending: Dict[int, MapResult] = {}
+    next_index = 0
+    metrics = get_metrics()
+
+    def fetch_stage(idx: int, item: Any):
+        if stop.is_set():
+            return
+        try:
+            entry = (idx, item, fetch(item), None)
+        except Exception as e:
+            entry = (idx, item, None, e)
+        while not stop.is_set():
             try:
-                result = future.result()
-                results.append((idx, result))
-                completed += 1
-                if progress_callback:
-                    progress_callback(completed, total)
+                handoff.put(entry, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def parse_done(idx: int, item: Any, future):
+        try:
+            error = future.exception()
+            parsed = None
+            if error is None:
+                parsed, seconds = future.result()
+                observe_parse(parse, seconds)
+            finished.put(MapResult(idx, item, parsed, error))
+        finally:
+            parse_slots.release()
+
+    def dispatch():
+        # Pasa las páginas descargadas al pool de procesos a medida que hay hueco en él
+        while not stop.is_set():
+            try:
+                idx, item, payload, error = handoff.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if error is not None or payload is None:
+                finished.put(MapResult(idx, item, None, error))
+                continue
+            if isinstance(payload, Parsed):
+                finished.put(MapResult(idx, item, payload.value))
+                continue
+            parse_slots.acquire()
+            try:
+                future = parse_pool.submit(call_timed, parse, payload)
             except Exception as e:
-                logger.error(f"Error procesando {item}: {e}")
-                completed += 1
-    # Ordena los resultados por índice y extrae los valores finales
-    results.sort(key=lambda x: x[0])
-    return [r[1] for r in results if r[1] is not None]
+                parse_slots.release()
+                finished.put(MapResult(idx, item, None, e))
+                continue
+            future.add_done_callback(partial(contextvars.copy_context().run, parse_done, idx, item))
+
+    def fill():
+        nonlocal exhausted, submitted
+        while not exhausted and submitted - next_index < window:
+            try:
+                idx, item = next(source)
+            except StopIteration:
+                exhausted = True
+                return
+            fetch_futures.append(fetch_pool.submit(contextvars.copy_context().run, fetch_stage, idx, item))
+            submitted += 1
+        while fetch_futures and fetch_futures[0].done():
+            fetch_futures.popleft()
+
+    fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers)
+    parse_pool = make_process_pool(parse_workers)
+    dispatcher = threading.Thread(target=contextvars.copy_context().run, args=(dispatch,), name='parse-dispatcher',
+                                  daemon=True)
+    dispatcher.start()
+    try:
+        fill()
+        while next_index < submitted:
+            metrics.set_max('queue_depth_max', handoff.qsize(), queue='parse_handoff')
+            result = finished.get()
+            pending[result.index] = result
+            while next_index in pending:
+                yield pending.pop(next_index)
+                next_index += 1
+            fill()
+    finally:
+        # En caso de interrupción, desbloquea los hilos que esperan para encolar y descarta las descargas pendientes
+        stop.set()
+        dispatcher.join()
+        for future in fetch_futures:
+            future.cancel()
+        fetch_pool.shutdown(wait=True)
+        parse_pool.shutdown(wait=True)
+
+
+def pipelined_map(
+    fetch: Callable[[Any], Any],
+    parse: Callable[[Any], Any],
+    items: List[Any],
+    merge: Callable[[Any, Any], Any] = None,
+    on_error: Callable[[Any, Exception], Any] = None,
+    fetch_workers: int = 10,
+    parse_workers: Optional[int] = None,
+    queue_size: int = 64,
+    progress_callback: Callable[[int, int], None] = None
+) -> List[Any]:
+    """
+    Ejecuta pipelined_imap sobre una lista y reúne los resultados, combinándolos en el proceso principal.
+    Args:
+        fetch (Callable): Descarga un elemento y devuelve la carga a parsear; si devuelve None o un Parsed,
+            no se parsea.
+        parse (Callable): Función serializable (pickle) que convierte la carga en el resultado parseado.
+        items (List[Any]): Lista de elementos a procesar.
+        merge (Callable, opcional): Combina (elemento, resultado parseado) en el proceso principal.
+        on_error (Callable, opcional): Devuelve el valor a usar cuando la descarga o el parseo de un elemento fallan.
+        fetch_workers (int): Número de hilos de descarga.
+        parse_workers (int, opcional): Número de procesos de parseo (por defecto, uno por núcleo).
+        queue_size (int): Capacidad de la cola entre ambas etapas.
+        progress_callback (Callable, opcional): Función callback para reportar progreso (completados, total).
+    Returns:
+        List[Any]: Lista de resultados exitosos (excluye los que generaron error), ordenados por índice original.
+    """
+    total = len(items)
+    if not total:
+        return []
+    results = []
+    stream = pipelined_imap(fetch, parse, items, fetch_workers=fetch_workers, parse_workers=parse_workers,
+                            queue_size=queue_size)
+    for completed, result in enumerate(stream, 1):
+        try:
+            if not result.ok:
+                raise result.error
+            value = merge(result.item, result.value) if merge else result.value
+        except Exception as e:
+            if on_error is None:
+                logger.error(f"Error procesando {result.item}: {e}")
+                value = None
+            else:
+                value = on_error(result.item, e)
+        if value is not None:
+            results.append(value)
+        if progress_callback:
+            progress_callback(completed, total)
+    return results
@@ -3,8 +3,22 @@ Utilidades para operaciones con archivos CSV.
 Incluye funciones para guardar, leer y copiar datos en formato CSV de manera robusta y consistente.
 """
 import csv
-from typing import List, Dict, Any
+import os
+import queue
+import tempfile
+import threading
+from typing import List, Dict, Any, Iterable, Optional, Protocol
 from pathlib import Path
+from .metrics import get_metrics
+
+
+class RowSink(Protocol):
+    """
+    Destino de filas en streaming (CSVStreamWriter, SQLiteRowWriter...) al que los scrapers envían cada fila completada.
+    """
+    
+    def write(self, row: Dict[str, Any]):
+        ...
 
 
 class CSVManager:
@@ -18,31 +32,39 @@ class CSVManager:
         Guarda una lista de diccionarios en un archivo CSV, asegurando formato y consistencia en los nombres de columnas.
         Si el directorio de destino no existe, lo crea automáticamente.
         Convierte valores None a cadenas vacías para evitar errores de escritura.
+        La escritura se hace sobre un fichero temporal que sustituye al destino solo al completarse,
+        de modo que un fallo a mitad de escritura conserva el fichero anterior.
         """
         if not data:
             # Si no hay datos, no realiza ninguna acción
             return
-            
-        # Asegura que el directorio de destino exista antes de guardar el archivo
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
-        
-        # Normaliza los nombres de las columnas a minúsculas para mantener consistencia
-        fieldnames_lower = [f.lower() for f in fieldnames]
-        
-        # Convierte los valores None a cadenas vacías para evitar errores en la escritura del CSV
-        normalized_data = []
-        for row in data:
-            normalized_row = {}
-            for key, value in row.items():
-                key_lower = key.lower()
-                normalized_row[key_lower] = '' if value is None else str(value)
-            normalized_data.append(normalized_row)
         
-        # Escribe el archivo CSV en disco con los datos proporcionados
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames_lower, restval='')
-            writer.writeheader()
-            writer.writerows(normalized_data)
+        with CSVStreamWriter(filename, fieldnames) as writer:
+            writer.write_rows(data)
+    
+    @staticmethod
+    def open_writer(filename: str, fieldnames: List[str], flush_every: int = 500) -> 'CSVStreamWriter':
+        """
+        Abre un escritor CSV en streaming para volcar filas a medida que se generan.
+        Debe usarse como gestor de contexto: al salir sin errores se confirma el fichero y, si hay una excepción,
+        se descarta y el destino queda intacto.
+        """
+        return CSVStreamWriter(filename, fieldnames, flush_every)
+    
+    @staticmethod
+    def merge_by_key(existing: List[Dict[str, Any]], updates: List[Dict[str, Any]],
+                     key: str) -> List[Dict[str, Any]]:
+        """
+        Fusiona filas nuevas con las existentes usando la columna `key` como clave.
+        Las filas existentes conservan su posición y se sustituyen si llega una versión nueva;
+        las filas con claves desconocidas se añaden al final en el orden recibido.
+        """
+        updates_by_key = {row[key]: row for row in updates}
+        merged = [updates_by_key.pop(row[key], row) for row in existing]
+        for row in updates:
+            if row[key] in updates_by_key:
+                merged.append(updates_by_key.pop(row[key]))
+        return merged
     
     @staticmethod
     def read_from_csv(filename: str) -> List[Dict[str, str]]:
@@ -66,3 +88,97 @@ class CSVManager:
                     writer.writerow(row)
                     if i >= n:
                         break
+
+
+class CSVStreamWriter:
+    """
+    Escritor CSV en streaming con confirmación atómica.
+    Las filas se normalizan y escriben una a una en un fichero temporal junto al destino (volcándolo cada
+    `flush_every` filas), por lo que la memoria usada no depende del tamaño del dataset. Al confirmar, el
+    temporal se sincroniza en disco y sustituye al destino con un renombrado atómico; si se aborta, se elimina.
+    Es seguro escribir desde varios hilos a la vez.
+    """
+    
+    def __init__(self, filename: str, fieldnames: List[str], flush_every: int = 500):
+        self.filename = filename
+        self.fieldnames = [f.lower() for f in fieldnames]
+        self.flush_every = flush_every
+        self.rows_written = 0
+        self._lock = threading.Lock()
+        
+        # El temporal se crea en el mismo directorio para que el renombrado final sea atómico
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(filename)),
+            prefix=f".{os.path.basename(filename)}.",
+            suffix='.tmp'
+        )
+        # mkstemp crea el temporal con permisos 0600; al confirmar se aplican los del destino
+        self._mode = os.stat(filename).st_mode & 0o777 if os.path.exists(filename) else 0o644
+        self._file = os.fdopen(fd, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, restval='')
+        self._writer.writeheader()
+    
+    def write(self, row: Dict[str, Any]):
+        """
+        Normaliza una fila (claves en minúsculas, None como cadena vacía) y la escribe.
+        Los registros tipados de src/models se serializan con su to_row().
+        """
+        if hasattr(row, 'to_row'):
+            row = row.to_row()
+        normalized_row = {key.lower(): '' if value is None else str(value) for key, value in row.items()}
+        with self._lock:
+            self._writer.writerow(normalized_row)
+            self.rows_written += 1
+            if self.rows_written % self.flush_every == 0:
+                self._file.flush()
+    
+    def write_rows(self, rows: Iterable[Dict[str, Any]]):
+        """
+        Escribe todas las filas de un iterable (lista, generador...) sin materializarlo.
+        """
+        for row in rows:
+            self.write(row)
+    
+    def consume(self, rows: 'queue.Queue', sentinel: Optional[Any] = None):
+        """
+        Escribe las filas que llegan por una cola hasta recibir el centinela.
+        """
+        while True:
+            row = rows.get()
+            if row is sentinel:
+                return
+            self.write(row)
+    
+    def commit(self):
+        """
+        Sincroniza el fichero temporal en disco y lo renombra sobre el destino.
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            os.chmod(self._tmp_path, self._mode)
+            os.replace(self._tmp_path, self.filename)
+            get_metrics().inc('rows_emitted_total', self.rows_written, table=Path(self.filename).stem, sink='csv')
+    
+    def abort(self):
+        """
+        Descarta el fichero temporal dejando intacto el destino.
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.close()
+            os.remove(self._tmp_path)
+    
+    def __enter__(self) -> 'CSVStreamWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
@@ -0,0 +1,91 @@
+"""
+Cola de peticiones fallidas (dead-letter) para el scraper de UFC.
+Registra las páginas que no se pudieron descargar o parsear tras agotar los reintentos, para
+reintentarlas al final de cada fase y persistirlas en disco de cara a una recuperación posterior.
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass
+class FailedFetch:
+    """
+    Petición fallida: fase del pipeline, tipo de entidad ('fight', 'fighter' o 'event'),
+    identificador, URL, último error y número de intentos acumulados.
+    """
+    phase: str
+    entity: str
+    key: str
+    url: str
+    error: str
+    attempts: int = 1
+    failed_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+
+class DeadLetterQueue:
+    """
+    Conjunto de peticiones fallidas indexado por (entidad, identificador), seguro para hilos.
+    Volver a registrar una entrada existente incrementa su número de intentos.
+    """
+
+    def __init__(self, entries: Optional[List[FailedFetch]] = None):
+        self._entries: Dict[Tuple[str, str], FailedFetch] = {}
+        self._lock = threading.Lock()
+        for entry in entries or []:
+            self._entries[(entry.entity, entry.key)] = entry
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def add(self, phase: str, entity: str, key: str, url: str, error: Exception):
+        """Registra un fallo para la entidad indicada."""
+        with self._lock:
+            current = self._entries.get((entity, key))
+            attempts = current.attempts + 1 if current else 1
+            self._entries[(entity, key)] = FailedFetch(
+                phase=phase, entity=entity, key=key, url=url, error=str(error), attempts=attempts
+            )
+
+    def remove(self, entity: str, key: str):
+        """Elimina una entrada tras recuperarla con éxito."""
+        with self._lock:
+            self._entries.pop((entity, key), None)
+
+    def pending(self, phase: Optional[str] = None, entity: Optional[str] = None) -> List[FailedFetch]:
+        """Devuelve una copia de las entradas pendientes, opcionalmente filtradas por fase o entidad."""
+        with self._lock:
+            return [
+                e for e in self._entries.values()
+                if (phase is None or e.phase == phase) and (entity is None or e.entity == entity)
+            ]
+
+    def save(self, path: str):
+        """
+        Persiste la cola en formato JSONL mediante escritura atómica.
+        Si no quedan entradas pendientes, elimina el fichero existente.
+        """
+        entries = self.pending()
+        if not entries:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(asdict(entry), ensure_ascii=False) + '\n')
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'DeadLetterQueue':
+        """Carga una cola persistida; devuelve una cola vacía si el fichero no existe."""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = [FailedFetch(**json.loads(line)) for line in f if line.strip()]
+        return cls(entries)
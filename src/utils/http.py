@@ -3,35 +3,122 @@ import time
 import requests
 from bs4 import BeautifulSoup
 from typing import Optional
-from ..core.exceptions import ScrapingError
+from ..core.exceptions import FetchError
+from .archive import PageArchive
+from .cache import CacheEntry, ResponseCache
+from .rate_limit import RateLimiter, parse_retry_after
+from .retry import RetryPolicy, CircuitBreakerRegistry
+from .metrics import get_metrics
 
 
 class HTTPClient:
     """HTTP client for UFC scraping."""
     
-    def __init__(self, headers: dict, delay: float = 3.0):
+    def __init__(self, headers: dict, delay: float = 3.0, cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None, timeout: Optional[float] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 archive: Optional[PageArchive] = None):
         self.headers = headers
         self.delay = delay
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        self.circuit_breakers = circuit_breakers
+        self.archive = archive
         self._session = requests.Session()
         self._session.headers.update(headers)
     
     def get_soup(self, url: str) -> Optional[BeautifulSoup]:
         """Get BeautifulSoup object for URL."""
-        try:
-            response = self._session.get(url)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
-        except requests.RequestException as e:
-            raise ScrapingError(f"Failed to fetch {url}: {e}")
+        return BeautifulSoup(self._fetch(url).body, 'html.parser')
+    
+    def get_content(self, url: str) -> bytes:
+        """Get raw response body for URL."""
+        return self._fetch(url).body
     
     def get_html(self, url: str) -> str:
         """Get raw HTML for URL."""
+        return self._fetch(url).text
+    
+    def get_page(self, url: str) -> CacheEntry:
+        """Get the response body with its encoding and content hash."""
+        return self._fetch(url)
+    
+    def _fetch(self, url: str) -> CacheEntry:
+        """Fetch URL body, serving it from the response cache when available and retrying transient errors."""
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                get_metrics().inc('http_cache_hits_total')
+                self._archive(url, cached)
+                return cached
+        
+        breaker = self.circuit_breakers.for_url(url) if self.circuit_breakers else None
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request()
+            try:
+                entry = self._request_once(url)
+            except FetchError as e:
+                retryable = self.retry_policy.is_retryable_status(e.status)
+                if breaker is not None:
+                    if retryable:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                if not retryable or attempt >= self.retry_policy.max_retries:
+                    raise
+                get_metrics().inc('http_retries_total')
+                time.sleep(self.retry_policy.delay_for(attempt, e.retry_after))
+                attempt += 1
+                continue
+            if breaker is not None:
+                breaker.record_success()
+            break
+        
+        if self.cache is not None:
+            self.cache.set(url, entry.body, entry.encoding)
+        self._archive(url, entry)
+        return entry
+
+    def _archive(self, url: str, entry: CacheEntry):
+        """Store the page in the raw page archive, if enabled."""
+        if self.archive is not None:
+            self.archive.store(url, entry.body, entry.encoding)
+    
+    def _request_once(self, url: str) -> CacheEntry:
+        """Perform a single rate-limited GET request."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        start = time.monotonic()
+        status = None
+        retry_after = None
+        timed_out = False
+        nbytes = 0
         try:
-            response = self._session.get(url)
+            response = self._session.get(url, timeout=self.timeout)
+            status = response.status_code
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
             response.raise_for_status()
-            return response.text
+            nbytes = len(response.content)
+        except requests.Timeout as e:
+            timed_out = True
+            raise FetchError(f"Failed to fetch {url}: {e}", timed_out=True)
         except requests.RequestException as e:
-            raise ScrapingError(f"Failed to fetch {url}: {e}")
+            raise FetchError(f"Failed to fetch {url}: {e}", status=status, retry_after=retry_after)
+        finally:
+            elapsed = time.monotonic() - start
+            if self.rate_limiter is not None:
+                self.rate_limiter.release(elapsed, status, timed_out, retry_after)
+            get_metrics().record_request(elapsed, status, nbytes, timed_out)
+        
+        return CacheEntry(
+            body=response.content,
+            encoding=response.encoding or response.apparent_encoding
+        )
     
     def delay_request(self):
         """Add delay between requests."""
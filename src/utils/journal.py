@@ -0,0 +1,119 @@
+"""
+Diario de checkpoints (journal) del pipeline de scraping de UFC.
+Registra en ficheros JSONL de solo escritura al final cada unidad de trabajo completada (evento, pelea o
+luchador) con su resultado en cuanto termina, de modo que una ejecución interrumpida pueda reanudarse
+con --resume sin volver a descargar lo ya procesado.
+"""
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, TextIO
+
+
+class CheckpointJournal:
+    """
+    Journal de unidades completadas, con un fichero JSONL por tipo de entidad ('event', 'fight', 'fighter').
+    Cada línea contiene la clave de la unidad y su resultado; si una clave aparece varias veces, prevalece la última.
+    Las escrituras se vuelcan al sistema operativo en cada registro y se sincronizan en disco cada `sync_every`.
+    El journal permanece inactivo (no registra nada) hasta que se llama a start().
+    """
+
+    def __init__(self, directory: str, sync_every: int = 100):
+        self.directory = directory
+        self.sync_every = sync_every
+        self.active = False
+        self.resuming = False
+        self._files: Dict[str, TextIO] = {}
+        self._completed: Dict[str, Dict[str, Any]] = {}
+        self._unsynced = 0
+        self._lock = threading.Lock()
+
+    def start(self, resume: bool = False):
+        """
+        Activa el journal para una ejecución.
+        Sin `resume` descarta los checkpoints de ejecuciones anteriores; con `resume` los conserva para reutilizarlos.
+        """
+        with self._lock:
+            self._close_files()
+            self._completed = {}
+            if not resume and os.path.isdir(self.directory):
+                for name in os.listdir(self.directory):
+                    if name.endswith('.jsonl'):
+                        os.remove(os.path.join(self.directory, name))
+            os.makedirs(self.directory, exist_ok=True)
+            self.active = True
+            self.resuming = resume
+
+    def record(self, entity: str, key: str, payload: Any):
+        """Añade una unidad completada al journal de su entidad."""
+        if not self.active:
+            return
+        line = json.dumps({'key': key, 'payload': payload}, ensure_ascii=False) + '\n'
+        with self._lock:
+            f = self._files.get(entity)
+            if f is None:
+                f = open(self._path(entity), 'a', encoding='utf-8')
+                self._files[entity] = f
+            f.write(line)
+            f.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.sync_every:
+                self._sync()
+            if entity in self._completed:
+                self._completed[entity][key] = payload
+
+    def completed(self, entity: str) -> Dict[str, Any]:
+        """
+        Devuelve las unidades completadas de una entidad (clave -> resultado) leídas del journal.
+        Ignora una última línea truncada por una interrupción a mitad de escritura.
+        """
+        with self._lock:
+            if entity not in self._completed:
+                self._completed[entity] = self._load(entity)
+            return dict(self._completed[entity])
+
+    def clear(self):
+        """Elimina los checkpoints tras completar la ejecución con éxito y desactiva el journal."""
+        with self._lock:
+            self._close_files()
+            self._completed = {}
+            if os.path.isdir(self.directory):
+                for name in os.listdir(self.directory):
+                    if name.endswith('.jsonl'):
+                        os.remove(os.path.join(self.directory, name))
+            self.active = False
+            self.resuming = False
+
+    def close(self):
+        """Sincroniza y cierra los ficheros abiertos."""
+        with self._lock:
+            self._close_files()
+
+    def _load(self, entity: str) -> Dict[str, Any]:
+        path = self._path(entity)
+        entries: Dict[str, Any] = {}
+        if not os.path.exists(path):
+            return entries
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                entries[entry['key']] = entry['payload']
+        return entries
+
+    def _path(self, entity: str) -> str:
+        return os.path.join(self.directory, f"{entity}.jsonl")
+
+    def _sync(self):
+        for f in self._files.values():
+            os.fsync(f.fileno())
+        self._unsynced = 0
+
+    def _close_files(self):
+        if self._files:
+            self._sync()
+        for f in self._files.values():
+            f.close()
+        self._files = {}
@@ -0,0 +1,42 @@
+"""
+Registro de descargas completadas durante una ejecución del pipeline (fetch ledger).
+Permite que fases posteriores sepan qué entidades ya se descargaron y parsearon con éxito
+en esta ejecución, para no volver a pedir las mismas páginas.
+"""
+import threading
+from typing import Dict, Iterable, List, Set
+
+
+class FetchLedger:
+    """
+    Conjunto de entidades ('fight', 'fighter', 'event') descargadas con éxito, seguro para hilos.
+    Es un registro en memoria: solo describe la ejecución actual.
+    """
+
+    def __init__(self):
+        self._done: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(keys) for keys in self._done.values())
+
+    def mark(self, entity: str, key: str):
+        """Registra una entidad descargada y parseada correctamente."""
+        with self._lock:
+            self._done.setdefault(entity, set()).add(key)
+
+    def is_done(self, entity: str, key: str) -> bool:
+        """Indica si la entidad ya se completó en esta ejecución."""
+        with self._lock:
+            return key in self._done.get(entity, ())
+
+    def done(self, entity: str) -> Set[str]:
+        """Devuelve una copia de los identificadores completados para un tipo de entidad."""
+        with self._lock:
+            return set(self._done.get(entity, ()))
+
+    def missing(self, entity: str, keys: Iterable[str]) -> List[str]:
+        """Filtra los identificadores que aún no se han completado, conservando el orden."""
+        done = self.done(entity)
+        return [key for key in keys if key not in done]
@@ -0,0 +1,315 @@
+"""
+Métricas de rendimiento del pipeline UFC ETL.
+Un registro compartido por todo el proceso acumula contadores, gauges e histogramas etiquetados: peticiones HTTP por
+código de estado, bytes descargados, latencias, tiempo de parseo por tipo de página, filas emitidas y profundidad
+máxima de las colas. Mientras una fase del orquestador está activa, todas las métricas llevan su nombre en la
+etiqueta `phase`, de modo que puede verse si una fase lenta estuvo limitada por la red o por el parseo. La fase
+activa es una variable de contexto: es propia del hilo o la tarea que la abre, y los pools de src/utils/concurrent.py
+la propagan a los hilos que crean.
+Al terminar cada ejecución se escribe un informe JSON y un fichero en formato de texto de Prometheus para el
+textfile collector de node_exporter.
+"""
+import contextvars
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+NAMESPACE = 'ufc_etl'
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PARSE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Descripción de cada métrica (línea HELP del formato de Prometheus)
+METRIC_HELP = {
+    'http_requests_total': 'HTTP requests sent, by response status',
+    'http_response_bytes_total': 'Bytes downloaded in HTTP response bodies',
+    'http_request_seconds': 'HTTP request latency in seconds',
+    'http_cache_hits_total': 'Requests served from the on-disk response cache',
+    'http_retries_total': 'HTTP requests retried after a transient error',
+    'parse_seconds': 'Time spent parsing a page, by page type',
+    'rows_emitted_total': 'Rows written to the raw outputs, by table and sink',
+    'queue_depth_max': 'Peak depth of the internal work queues',
+    'phase_duration_seconds': 'Wall-clock duration of each pipeline phase',
+    'run_success': 'Whether the last run finished without errors',
+    'run_duration_seconds': 'Wall-clock duration of the last run',
+    'run_timestamp_seconds': 'Unix time at which the last run finished',
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """
+    Histograma acumulativo con límites fijos, como los de Prometheus.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Pares (límite superior, observaciones acumuladas) sin el bucket +Inf."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsRegistry:
+    """
+    Registro de métricas seguro para hilos.
+    Cada serie se identifica por nombre y etiquetas; la fase activa se añade como etiqueta `phase`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._phase: 'contextvars.ContextVar[Optional[str]]' = contextvars.ContextVar('metrics_phase', default=None)
+        self.reset()
+
+    def reset(self):
+        """Descarta todas las series registradas."""
+        with self._lock:
+            self._counters: Dict[Tuple[str, LabelKey], float] = {}
+            self._gauges: Dict[Tuple[str, LabelKey], float] = {}
+            self._histograms: Dict[Tuple[str, LabelKey], Histogram] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: Any):
+        """Incrementa un contador."""
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels: Any):
+        """Fija el valor de un gauge."""
+        key = self._key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def set_max(self, name: str, value: float, **labels: Any):
+        """Actualiza un gauge solo si el valor supera al registrado (picos de profundidad de cola)."""
+        key = self._key(name, labels)
+        with self._lock:
+            if value > self._gauges.get(key, float('-inf')):
+                self._gauges[key] = value
+
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...] = LATENCY_BUCKETS, **labels: Any):
+        """Añade una observación a un histograma."""
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Etiqueta con `phase=name` las métricas registradas dentro del bloque, en el contexto actual y en los hilos
+        que se lancen desde él con los pools de concurrent.py, y mide su duración.
+        """
+        token = self._phase.set(name)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._phase.reset(token)
+            self.set('phase_duration_seconds', time.monotonic() - start, phase=name)
+
+    def record_request(self, seconds: float, status: Optional[int], nbytes: int = 0, timed_out: bool = False):
+        """
+        Registra una petición HTTP: código de estado ('timeout' o 'error' si no hubo respuesta), latencia y bytes.
+        """
+        label = str(status) if status is not None else ('timeout' if timed_out else 'error')
+        self.inc('http_requests_total', status=label)
+        self.observe('http_request_seconds', seconds)
+        if nbytes:
+            self.inc('http_response_bytes_total', nbytes)
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Copia serializable de todas las series.
+        """
+        with self._lock:
+            return {
+                'counters': [{'name': n, 'labels': dict(l), 'value': v} for (n, l), v in self._counters.items()],
+                'gauges': [{'name': n, 'labels': dict(l), 'value': v} for (n, l), v in self._gauges.items()],
+                'histograms': [
+                    {'name': n, 'labels': dict(l), 'count': h.count, 'sum': h.sum,
+                     'buckets': {str(bound): count for bound, count in h.cumulative()}}
+                    for (n, l), h in self._histograms.items()
+                ],
+            }
+
+    def phase_summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Resumen por fase: duración, peticiones, bytes, segundos de red y de parseo y filas emitidas.
+        Los segundos de red suman la latencia de todas las peticiones, por lo que con concurrencia pueden superar
+        la duración de la fase; lo relevante es su proporción frente a los segundos de parseo.
+        """
+        summary: Dict[str, Dict[str, float]] = {}
+
+        def entry(labels: LabelKey) -> Dict[str, float]:
+            phase = dict(labels).get('phase', 'none')
+            return summary.setdefault(phase, {
+                'duration_seconds': 0.0, 'requests': 0, 'bytes': 0,
+                'network_seconds': 0.0, 'parse_seconds': 0.0, 'pages_parsed': 0, 'rows_emitted': 0,
+            })
+
+        with self._lock:
+            for (name, labels), value in self._counters.items():
+                if name == 'http_requests_total':
+                    entry(labels)['requests'] += value
+                elif name == 'http_response_bytes_total':
+                    entry(labels)['bytes'] += value
+                elif name == 'rows_emitted_total':
+                    entry(labels)['rows_emitted'] += value
+            for (name, labels), histogram in self._histograms.items():
+                if name == 'http_request_seconds':
+                    entry(labels)['network_seconds'] += histogram.sum
+                elif name == 'parse_seconds':
+                    entry(labels)['parse_seconds'] += histogram.sum
+                    entry(labels)['pages_parsed'] += histogram.count
+            for (name, labels), value in self._gauges.items():
+                if name == 'phase_duration_seconds':
+                    entry(labels)['duration_seconds'] = value
+        return summary
+
+    def write_json(self, path: str, **extra: Any):
+        """
+        Escribe el informe JSON de la ejecución (resumen por fase y todas las series) de forma atómica.
+        """
+        report = {**extra, 'phases': self.phase_summary(), **self.snapshot()}
+        _write_atomic(path, json.dumps(report, indent=2, default=str))
+
+    def to_prometheus(self) -> str:
+        """
+        Serializa las series en el formato de texto de Prometheus (exposition format 0.0.4).
+        """
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        declared = set()
+
+        def declare(name: str, kind: str):
+            if name not in declared:
+                declared.add(name)
+                lines.append(f"# HELP {NAMESPACE}_{name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {NAMESPACE}_{name} {kind}")
+
+        for kind, series in (('counter', snapshot['counters']), ('gauge', snapshot['gauges'])):
+            for s in sorted(series, key=lambda s: (s['name'], sorted(s['labels'].items()))):
+                declare(s['name'], kind)
+                lines.append(f"{NAMESPACE}_{s['name']}{_format_labels(s['labels'])} {_format_value(s['value'])}")
+        for s in sorted(snapshot['histograms'], key=lambda s: (s['name'], sorted(s['labels'].items()))):
+            declare(s['name'], 'histogram')
+            metric = f"{NAMESPACE}_{s['name']}"
+            for bound, count in s['buckets'].items():
+                lines.append(f"{metric}_bucket{_format_labels({**s['labels'], 'le': bound})} {count}")
+            lines.append(f"{metric}_bucket{_format_labels({**s['labels'], 'le': '+Inf'})} {s['count']}")
+            lines.append(f"{metric}_sum{_format_labels(s['labels'])} {_format_value(s['sum'])}")
+            lines.append(f"{metric}_count{_format_labels(s['labels'])} {s['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str):
+        """
+        Escribe el fichero .prom de forma atómica, como exige el textfile collector de node_exporter.
+        """
+        _write_atomic(path, self.to_prometheus())
+
+    def _key(self, name: str, labels: Dict[str, Any]) -> Tuple[str, LabelKey]:
+        phase = self._phase.get()
+        if phase is not None and 'phase' not in labels:
+            labels = {**labels, 'phase': phase}
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    def escape(value: str) -> str:
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{k}="{escape(v)}"' for k, v in sorted(labels.items())) + '}'
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _write_atomic(path: str, text: str):
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    # El temporal no termina en la extensión del destino (.prom, .json): node_exporter solo lee los *.prom
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Devuelve el registro de métricas compartido por todo el proceso."""
+    return _registry
+
+
+def timed(name: str, buckets: Tuple[float, ...] = PARSE_BUCKETS, **labels: Any) -> Callable:
+    """
+    Decorador que registra la duración de cada llamada en el histograma `name` del registro compartido.
+    Las etiquetas quedan disponibles en el atributo `metric_labels` de la función decorada.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _registry.observe(name, time.perf_counter() - start, buckets, **labels)
+        wrapper.metric_labels = labels
+        return wrapper
+    return decorator
+
+
+def call_timed(func: Callable, *args: Any) -> Tuple[Any, float]:
+    """
+    Llama a `func` y devuelve (resultado, segundos). Es serializable, de modo que puede enviarse a un pool de
+    procesos y la duración se registra después en el proceso principal, que es el que escribe el informe.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def observe_parse(parse: Callable, seconds: float):
+    """
+    Registra en el proceso principal el tiempo de un parseo ejecutado en un pool de procesos.
+    El tipo de página se toma de las etiquetas del parser decorado o, si no tiene, del nombre de la función.
+    """
+    labels = getattr(parse, 'metric_labels', None)
+    if labels is None:
+        func = getattr(parse, 'func', parse)
+        labels = {'page': getattr(func, '__name__', 'unknown').replace('parse_', '', 1)}
+    _registry.observe('parse_seconds', seconds, PARSE_BUCKETS, **labels)
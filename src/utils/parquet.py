@@ -0,0 +1,135 @@
+"""
+Utilidades para guardar los datos crudos en formato Parquet con un esquema tipado.
+El esquema de cada tabla se deriva de los codecs de los registros tipados (src/models): cada slot del registro es
+una columna, de modo que los pares 'acertados of intentados' se guardan en dos enteros (`<columna>_landed`,
+`<columna>_attempted`), los tiempos en segundos, la altura y el alcance en pulgadas, el peso en libras, los
+porcentajes como fracción y las fechas como date32. Las columnas repetitivas (categoría de peso, método, árbitro...)
+se guardan como diccionario, de modo que los ficheros ocupan menos y se cargan sin volver a convertir tipos.
+Requiere pyarrow (pip install pyarrow, o el extra 'parquet').
+"""
+import os
+import tempfile
+from typing import List, Dict, Any, Optional, Tuple
+from pathlib import Path
+from ..core.exceptions import ConfigurationError
+from ..models.event import Event
+from ..models.fight import Fight
+from ..models.fighter import Fighter
+from ..models.record import Codec, Text, Int, Float, Percent, Pair, Clock, Height, Weight, Reach, Date, Bool, Tags
+from .data import CSVManager
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow solo es necesario para la salida Parquet
+    pa = None
+    pq = None
+
+
+# Codec de cada columna de los CSV crudos; las columnas no listadas se guardan como texto
+CODECS: Dict[str, Codec] = {name: codec for record in (Fighter, Event, Fight) for name, codec in record.COLUMNS}
+# Columnas de texto con pocos valores distintos, guardadas como diccionario
+CATEGORY_COLUMNS = frozenset({'stance', 'location', 'weight_class', 'referee', 'method', 'time_format'})
+
+
+def _slot_type(codec: Codec) -> 'pa.DataType':
+    """Tipo Arrow de los slots de un codec."""
+    types = {
+        Text: pa.string(),
+        Int: pa.int32(), Pair: pa.int32(), Clock: pa.int32(), Height: pa.int32(), Weight: pa.int32(),
+        Float: pa.float64(), Percent: pa.float64(), Reach: pa.float64(),
+        Date: pa.date32(),
+        Bool: pa.bool_(),
+        Tags: pa.list_(pa.string()),
+    }
+    return types[type(codec)]
+
+
+def _layout(fieldnames: List[str]) -> List[Tuple[str, Codec, Tuple[str, ...]]]:
+    """(columna, codec, slots) de cada campo de una tabla, con los nombres en minúsculas."""
+    layout = []
+    for name in fieldnames:
+        codec = CODECS.get(name.lower(), Text())
+        layout.append((name.lower(), codec, codec.slots(name.lower())))
+    return layout
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ConfigurationError("Parquet output requires pyarrow (pip install pyarrow)")
+
+
+def build_schema(fieldnames: List[str]) -> 'pa.Schema':
+    """
+    Construye el esquema Arrow de una tabla a partir de sus nombres de campo, con una columna por slot.
+    """
+    _require_pyarrow()
+    fields = []
+    for name, codec, slots in _layout(fieldnames):
+        kind = pa.dictionary(pa.int32(), pa.string()) if name in CATEGORY_COLUMNS else _slot_type(codec)
+        fields.extend((slot, kind) for slot in slots)
+    return pa.schema(fields)
+
+
+class ParquetManager:
+    """
+    Clase gestora de la salida Parquet, análoga a CSVManager.
+    """
+
+    @staticmethod
+    def save_to_parquet(data: List[Dict[str, Any]], filename: str, fieldnames: List[str]):
+        """
+        Guarda una lista de diccionarios (o registros) en un fichero Parquet con el esquema tipado de sus campos.
+        Cada valor se convierte con el codec de su columna, el mismo que usan los registros de src/models.
+        Las claves se normalizan a minúsculas y los valores ausentes o no convertibles se guardan como nulos.
+        El fichero se escribe en un temporal que sustituye al destino al completarse.
+        """
+        if not data:
+            return
+
+        schema = build_schema(fieldnames)
+        layout = _layout(fieldnames)
+        columns: Dict[str, List[Any]] = {field.name: [] for field in schema}
+        for row in data:
+            row = {key.lower(): value for key, value in row.items()}
+            for name, codec, slots in layout:
+                for slot, value in zip(slots, codec.parse(row.get(name))):
+                    columns[slot].append(value)
+        table = pa.Table.from_arrays([pa.array(columns[field.name], type=field.type) for field in schema],
+                                     schema=schema)
+
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)),
+                                        prefix=f".{os.path.basename(filename)}.", suffix='.tmp')
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, filename)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def read_from_parquet(filename: str, columns: Optional[List[str]] = None):
+        """
+        Lee un fichero Parquet como DataFrame de pandas; las columnas diccionario se cargan como 'category'.
+        """
+        _require_pyarrow()
+        return pq.read_table(filename, columns=columns).to_pandas()
+
+    @staticmethod
+    def csv_to_parquet(csv_path: str, fieldnames: List[str], parquet_path: Optional[str] = None) -> str:
+        """
+        Convierte uno de los CSV crudos en Parquet (por defecto, mismo nombre con extensión .parquet).
+        Returns:
+            str: Ruta del fichero Parquet generado.
+        """
+        parquet_path = parquet_path or parquet_path_for(csv_path)
+        ParquetManager.save_to_parquet(CSVManager.read_from_csv(csv_path), parquet_path, fieldnames)
+        return parquet_path
+
+
+def parquet_path_for(csv_path: str) -> str:
+    """Ruta Parquet equivalente a un CSV crudo."""
+    return os.path.splitext(csv_path)[0] + '.parquet'
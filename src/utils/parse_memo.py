@@ -0,0 +1,157 @@
+"""
+Memoria de filas parseadas del pipeline UFC ETL.
+Guarda, por entidad e identificador, la fila que produjo el parser junto con el hash del contenido de la página
+y la huella del parser que la generó. Si en la siguiente ejecución la página descargada tiene el mismo hash y el
+parser no ha cambiado, el scraper reutiliza la fila y no vuelve a parsear: el coste de CPU del parseo es
+proporcional a las páginas que realmente han cambiado (por ejemplo, unas pocas de los ~4.000 luchadores por semana).
+La huella cubre los módulos de la jerarquía de clases del parser y, de forma transitiva, los módulos del proyecto de
+los que dependen (helpers como clean_text de src/utils/http.py); --reparse y --no-parse-memo parsean siempre.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+from .metrics import get_metrics
+
+
+def _parser_modules(parser_class: type) -> List[ModuleType]:
+    """
+    Módulos del proyecto (mismo paquete raíz que el parser) de los que depende un parser: los de su jerarquía de
+    clases y, de forma transitiva, los que definen las funciones, clases y módulos que importan.
+    """
+    package = parser_class.__module__.split('.')[0]
+    pending = [sys.modules[cls.__module__] for cls in parser_class.__mro__ if cls is not object]
+    found: Dict[str, ModuleType] = {}
+    while pending:
+        module = pending.pop()
+        if module.__name__ in found or module.__name__.split('.')[0] != package:
+            continue
+        found[module.__name__] = module
+        for value in vars(module).values():
+            name = value.__name__ if isinstance(value, ModuleType) else getattr(value, '__module__', None)
+            if isinstance(name, str) and name in sys.modules:
+                pending.append(sys.modules[name])
+    return [found[name] for name in sorted(found)]
+
+
+@lru_cache(maxsize=None)
+def parser_fingerprint(parser_class: type) -> str:
+    """
+    Huella del código de un parser: hash de los ficheros fuente de los módulos del proyecto de los que depende
+    (su jerarquía de clases y los helpers que importan). Cualquier cambio en ellos invalida las filas memorizadas.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{parser_class.__module__}.{parser_class.__qualname__}".encode('utf-8'))
+    for module in _parser_modules(parser_class):
+        path = getattr(module, '__file__', None)
+        if path is None:
+            continue
+        digest.update(module.__name__.encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ParseMemo:
+    """
+    Almacén SQLite de filas parseadas, seguro para uso desde varios hilos.
+    Args:
+        path (str): Ruta del fichero SQLite (se crea al memorizar la primera fila).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connection(self, create: bool = True) -> Optional[sqlite3.Connection]:
+        # Debe llamarse con el lock adquirido
+        if self._db is None:
+            if not create and not os.path.exists(self.path):
+                return None
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS parsed (
+                    entity TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    parser TEXT NOT NULL,
+                    row TEXT NOT NULL,
+                    PRIMARY KEY (entity, key)
+                )"""
+            )
+        return self._db
+
+    def lookup(self, entity: str, key: str, digest: str, parser: str) -> Optional[Dict[str, Any]]:
+        """
+        Fila memorizada de una entidad si la página tenía el mismo hash y la parseó el mismo parser; si no, None.
+        """
+        with self._lock:
+            db = self._connection(create=False)
+            row = db.execute(
+                'SELECT content_hash, parser, row FROM parsed WHERE entity = ? AND key = ?', (entity, key)
+            ).fetchone() if db is not None else None
+            if row is None or row[0] != digest or row[1] != parser:
+                self.misses += 1
+                row = None
+            else:
+                self.hits += 1
+        if row is None:
+            get_metrics().inc('parse_memo_misses_total', entity=entity)
+            return None
+        get_metrics().inc('parse_memo_hits_total', entity=entity)
+        return json.loads(row[2])
+
+    def remember(self, entity: str, key: str, digest: str, parser: str, row: Dict[str, Any]):
+        """Memoriza la fila parseada de una entidad, sustituyendo la anterior."""
+        payload = json.dumps(row, ensure_ascii=False)
+        with self._lock:
+            self._connection().execute(
+                'INSERT OR REPLACE INTO parsed VALUES (?, ?, ?, ?, ?)', (entity, key, digest, parser, payload)
+            )
+
+    def stats(self) -> Dict[str, float]:
+        """Filas reutilizadas y páginas parseadas de nuevo desde que se creó la instancia."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses,
+                    'hit_rate': self.hits / total * 100 if total else 0.0}
+
+    def __len__(self) -> int:
+        with self._lock:
+            db = self._connection(create=False)
+            return db.execute('SELECT COUNT(*) FROM parsed').fetchone()[0] if db is not None else 0
+
+    def close(self):
+        """Cierra la base de datos."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_shared_memos: Dict[str, ParseMemo] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_parse_memo(path: str) -> ParseMemo:
+    """
+    Devuelve la instancia de memoria compartida para una ruta, creándola si no existe.
+    """
+    key = os.path.abspath(path)
+    with _shared_lock:
+        memo = _shared_memos.get(key)
+        if memo is None:
+            memo = ParseMemo(path)
+            _shared_memos[key] = memo
+        return memo
@@ -0,0 +1,156 @@
+"""
+Modo de perfilado del pipeline UFC ETL (--profile).
+Cada fase del orquestador se ejecuta bajo cProfile (en el hilo principal y en los hilos que se crean durante la fase),
+tracemalloc y un muestreador de pilas. Por fase se escriben en el directorio de perfiles:
+  - <fase>.pstats: estadísticas de cProfile, legibles con pstats o snakeviz.
+  - <fase>.collapsed: pilas muestreadas en formato "collapsed" (marco;marco;marco muestras), que consumen
+    flamegraph.pl, speedscope o inferno.
+  - <fase>.allocations.txt: los `top_n` puntos del código con más memoria asignada y el pico de la fase.
+El parseo en el pool de procesos (--process-parsing) se ejecuta fuera del proceso y no aparece en los perfiles.
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+
+class StackSampler:
+    """
+    Muestrea periódicamente las pilas de todos los hilos del proceso y las acumula en formato collapsed.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                # Los hilos de un mismo pool comparten nombre salvo el sufijo numérico
+                thread_name = names.get(thread_id, 'thread').rsplit('_', 1)[0]
+                self.samples[';'.join([thread_name] + stack[::-1])] += 1
+
+    def collapsed(self) -> str:
+        """Pilas acumuladas, una por línea, con su número de muestras."""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class PhaseProfiler:
+    """
+    Perfila las fases del pipeline y escribe sus resultados en `directory`.
+    Args:
+        directory (str): Directorio de salida (se crea si no existe).
+        top_n (int): Número de puntos de asignación y de funciones a informar por fase.
+        sample_interval (float): Segundos entre muestras de pilas.
+    """
+
+    def __init__(self, directory: str, top_n: int = 25, sample_interval: float = 0.005):
+        self.directory = directory
+        self.top_n = top_n
+        self.sample_interval = sample_interval
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def profile(self, phase: str) -> Iterator[None]:
+        """
+        Perfila el bloque como la fase `phase` y escribe sus ficheros al terminar, aunque la fase falle.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread_profiles = []
+        sampler = StackSampler(self.sample_interval)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        else:
+            # Reinicia el trazado para que el pico sea el de esta fase (reset_peak no existe en Python 3.8)
+            frames = tracemalloc.get_traceback_limit()
+            tracemalloc.stop()
+            tracemalloc.start(frames)
+        main_profile = cProfile.Profile()
+        sampler.start()
+        threading.setprofile(self._profile_new_thread)
+        main_profile.enable()
+        try:
+            yield
+        finally:
+            main_profile.disable()
+            threading.setprofile(None)
+            sampler.stop()
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            self._write(phase, main_profile, sampler, snapshot, peak)
+
+    def _profile_new_thread(self, frame, event, arg):
+        # Primer evento de un hilo creado durante la fase: se sustituye este hook por un perfilador propio del hilo
+        profile = cProfile.Profile()
+        with self._lock:
+            self._thread_profiles.append(profile)
+        profile.enable()
+
+    def _write(self, phase: str, main_profile: cProfile.Profile, sampler: StackSampler,
+               snapshot: tracemalloc.Snapshot, peak: int):
+        base = os.path.join(self.directory, phase)
+        stats = pstats.Stats(main_profile)
+        with self._lock:
+            thread_profiles, self._thread_profiles = self._thread_profiles, []
+        for profile in thread_profiles:
+            try:
+                stats.add(profile)
+            except TypeError:
+                # Hilo que no llegó a registrar ninguna llamada
+                continue
+        stats.dump_stats(f"{base}.pstats")
+
+        with open(f"{base}.collapsed", 'w', encoding='utf-8') as f:
+            f.write(sampler.collapsed())
+
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        top = snapshot.statistics('lineno')[:self.top_n]
+        with open(f"{base}.allocations.txt", 'w', encoding='utf-8') as f:
+            f.write(f"Peak traced memory: {peak / 1024 ** 2:.1f} MB\n")
+            f.write(f"Top {len(top)} allocation sites:\n")
+            for stat in top:
+                frame = stat.traceback[0]
+                f.write(f"{stat.size / 1024:10.1f} KB {stat.count:8d} blocks  {frame.filename}:{frame.lineno}\n")
+
+        summary = io.StringIO()
+        pstats.Stats(f"{base}.pstats", stream=summary).sort_stats('tottime').print_stats(5)
+        print(f"🔬 Profile of phase '{phase}' written to {base}.* (peak memory {peak / 1024 ** 2:.1f} MB)")
+        top_functions = [line for line in summary.getvalue().splitlines() if line.strip()][-5:]
+        for line in top_functions:
+            print(f"   {line.strip()}")
+
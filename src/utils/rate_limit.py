@@ -0,0 +1,218 @@
+"""
+Limitación de tasa compartida por todos los clientes HTTP del scraper de UFC.
+Combina un token bucket (peticiones por segundo con ráfaga) con un control adaptativo de concurrencia
+AIMD: aumenta el número de peticiones en vuelo mientras la latencia y los errores se mantienen sanos
+y lo reduce multiplicativamente ante respuestas 429/5xx o timeouts.
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class TokenBucket:
+    """
+    Token bucket seguro para hilos.
+    Repone `rate` fichas por segundo hasta un máximo de `burst`; cada petición consume una ficha.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserva una ficha y devuelve los segundos que hay que esperar antes de usarla.
+        El saldo puede quedar negativo: las esperas de peticiones concurrentes se encadenan sin solaparse.
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+
+    def acquire(self):
+        """Bloquea el hilo actual hasta disponer de una ficha."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Espera de forma asíncrona hasta disponer de una ficha."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Detiene la emisión de fichas durante `seconds` (por ejemplo, al recibir Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Límite de peticiones en vuelo con ajuste AIMD (aumento aditivo, reducción multiplicativa).
+    Cada ventana de `limit` respuestas sanas (sin error y con latencia bajo el objetivo) suma una
+    unidad al límite; un 429, un 5xx o un timeout lo multiplica por `decrease_factor`. Las reducciones
+    se agrupan durante `cooldown` segundos para no castigar varias veces la misma congestión.
+    """
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = 64,
+                 latency_target: float = 2.0, decrease_factor: float = 0.5, cooldown: float = 2.0):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._in_flight = 0
+        self._healthy_streak = 0
+        self._last_decrease = 0.0
+        self._counters = {'requests': 0, 'throttled': 0, 'increases': 0, 'decreases': 0}
+        self._condition = threading.Condition()
+
+    def try_acquire(self) -> bool:
+        """Ocupa un hueco si hay capacidad disponible, sin bloquear."""
+        with self._condition:
+            if self._in_flight < self.limit:
+                self._in_flight += 1
+                return True
+            return False
+
+    def acquire(self):
+        """Bloquea el hilo actual hasta que haya un hueco disponible."""
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    async def acquire_async(self, poll_interval: float = 0.01):
+        """Espera de forma asíncrona a que haya un hueco disponible."""
+        while not self.try_acquire():
+            await asyncio.sleep(poll_interval)
+
+    def release(self, latency: float, throttled: bool = False):
+        """
+        Libera un hueco y ajusta el límite según el resultado de la petición.
+        Args:
+            latency (float): Duración de la petición en segundos.
+            throttled (bool): True si la respuesta fue 429/5xx o la petición agotó el tiempo.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._counters['requests'] += 1
+            if throttled:
+                self._counters['throttled'] += 1
+                self._healthy_streak = 0
+                now = time.monotonic()
+                if now - self._last_decrease >= self.cooldown:
+                    self.limit = max(self.minimum, int(self.limit * self.decrease_factor))
+                    self._last_decrease = now
+                    self._counters['decreases'] += 1
+            elif latency <= self.latency_target:
+                self._healthy_streak += 1
+                if self._healthy_streak >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self._healthy_streak = 0
+                    self._counters['increases'] += 1
+            else:
+                # Latencia alta: no se castiga, pero tampoco se sigue aumentando
+                self._healthy_streak = 0
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        """Devuelve el límite actual y los contadores de ajuste."""
+        with self._condition:
+            stats = dict(self._counters)
+            stats['limit'] = self.limit
+            stats['in_flight'] = self._in_flight
+            return stats
+
+
+class RateLimiter:
+    """
+    Limitador de tasa del proceso: token bucket más, opcionalmente, concurrencia adaptativa.
+    HTTPClient y AsyncHTTPClient llaman a `acquire` antes de cada petición de red y a `release`
+    al terminarla, informando de la latencia y del código de estado.
+    """
+
+    def __init__(self, requests_per_second: float, burst: int = 1,
+                 concurrency: Optional[AdaptiveConcurrencyLimiter] = None):
+        self.bucket = TokenBucket(requests_per_second, burst)
+        self.concurrency = concurrency
+
+    def acquire(self):
+        """Espera un hueco de concurrencia (si es adaptativo) y una ficha del bucket."""
+        if self.concurrency is not None:
+            self.concurrency.acquire()
+        self.bucket.acquire()
+
+    async def acquire_async(self):
+        """Versión asíncrona de acquire."""
+        if self.concurrency is not None:
+            await self.concurrency.acquire_async()
+        await self.bucket.acquire_async()
+
+    def release(self, latency: float, status: Optional[int] = None, timed_out: bool = False,
+                retry_after: Optional[float] = None):
+        """
+        Informa del resultado de una petición.
+        Args:
+            latency (float): Duración de la petición en segundos.
+            status (int, opcional): Código HTTP de la respuesta (None si no hubo respuesta).
+            timed_out (bool): True si la petición agotó el tiempo de espera.
+            retry_after (float, opcional): Segundos indicados por la cabecera Retry-After.
+        """
+        throttled = timed_out or (status is not None and (status == 429 or status >= 500))
+        if retry_after:
+            self.bucket.pause(retry_after)
+        if self.concurrency is not None:
+            self.concurrency.release(latency, throttled)
+
+    def stats(self) -> Dict[str, int]:
+        """Devuelve los contadores del control adaptativo (vacío si no está activo)."""
+        return self.concurrency.stats() if self.concurrency is not None else {}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convierte la cabecera Retry-After (en segundos) a float; ignora el formato de fecha."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+_shared_limiters: Dict[Tuple, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(requests_per_second: float, burst: int, adaptive: bool = False,
+                            initial_concurrency: int = 5, max_concurrency: int = 64,
+                            latency_target: float = 2.0) -> RateLimiter:
+    """
+    Devuelve el limitador compartido por todos los clientes HTTP del proceso para esta configuración.
+    """
+    key = (requests_per_second, burst, adaptive, initial_concurrency, max_concurrency, latency_target)
+    with _shared_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            concurrency = None
+            if adaptive:
+                concurrency = AdaptiveConcurrencyLimiter(
+                    initial=initial_concurrency,
+                    maximum=max_concurrency,
+                    latency_target=latency_target
+                )
+            limiter = RateLimiter(requests_per_second, burst, concurrency)
+            _shared_limiters[key] = limiter
+        return limiter
@@ -0,0 +1,134 @@
+"""
+Políticas de resiliencia para las peticiones HTTP del scraper de UFC.
+Incluye reintentos con backoff exponencial y jitter, y un circuit breaker por host que deja de
+enviar peticiones a un servidor que falla de forma continuada hasta que transcurre un tiempo de enfriamiento.
+"""
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from ..core.exceptions import CircuitOpenError
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Política de reintentos con backoff exponencial y jitter completo.
+    El intento n (empezando en 0) espera un valor aleatorio entre 0 y min(backoff_max, backoff_base * 2^n).
+    """
+    max_retries: int = 3
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    jitter: bool = True
+
+    def delay_for(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Calcula la espera antes del siguiente intento.
+        Si el servidor indicó Retry-After, nunca se espera menos de lo solicitado.
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        delay = random.uniform(0, ceiling) if self.jitter else ceiling
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    @staticmethod
+    def is_retryable_status(status: Optional[int]) -> bool:
+        """Los errores de red (sin estado), 429 y 5xx son transitorios; el resto de 4xx no."""
+        return status is None or status == 429 or status >= 500
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker para un host.
+    Tras `failure_threshold` fallos consecutivos se abre y rechaza peticiones durante `reset_timeout`
+    segundos; después deja pasar una petición de prueba (semiabierto) y se cierra si tiene éxito.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, host: str, failure_threshold: int = 10, reset_timeout: float = 60.0):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """
+        Comprueba si se puede enviar una petición al host.
+        Raises:
+            CircuitOpenError: Si el circuito está abierto o ya hay una petición de prueba en curso.
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"Circuit open for {self.host} ({self._failures} consecutive failures, "
+                        f"retrying in {remaining:.0f}s)"
+                    )
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    raise CircuitOpenError(f"Circuit half-open for {self.host}, trial request in flight")
+                self._trial_in_flight = True
+
+    def record_success(self):
+        """Registra una petición correcta y cierra el circuito."""
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self.state = self.CLOSED
+
+    def record_failure(self):
+        """Registra un fallo transitorio y abre el circuito si se alcanza el umbral."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class CircuitBreakerRegistry:
+    """Conjunto de circuit breakers indexados por host, compartido por todos los clientes HTTP."""
+
+    def __init__(self, failure_threshold: int = 10, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        """Devuelve el circuit breaker del host de la URL, creándolo si no existe."""
+        host = urlparse(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+                self._breakers[host] = breaker
+            return breaker
+
+
+_shared_registries: Dict[tuple, CircuitBreakerRegistry] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_circuit_breakers(failure_threshold: int, reset_timeout: float) -> CircuitBreakerRegistry:
+    """Devuelve el registro de circuit breakers compartido por el proceso para esta configuración."""
+    key = (failure_threshold, reset_timeout)
+    with _shared_lock:
+        registry = _shared_registries.get(key)
+        if registry is None:
+            registry = CircuitBreakerRegistry(failure_threshold, reset_timeout)
+            _shared_registries[key] = registry
+        return registry
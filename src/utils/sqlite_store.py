@@ -0,0 +1,219 @@
+"""
+Almacenamiento de los datos crudos en SQLite.
+Cada tabla está indexada por su identificador (fighter_id, event_id, fight_id) y se escribe con upserts por lotes
+(INSERT ... ON CONFLICT DO UPDATE) que solo modifican las filas y columnas recibidas, de modo que completar los
+detalles de unos luchadores o refrescar un evento no obliga a reescribir el dataset entero.
+La exportación a CSV es una única consulta recorrida en streaming.
+"""
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from ..core.constants import FIGHTER_FIELDS, FIGHTER_DETAIL_FIELDS, EVENT_FIELDS, FIGHT_FIELDS
+from ..core.exceptions import ValidationError
+from .data import CSVManager
+from .metrics import get_metrics
+
+
+# Tabla -> (clave primaria, columnas, columnas indexadas)
+TABLES = {
+    'fighters': ('fighter_id', FIGHTER_FIELDS + FIGHTER_DETAIL_FIELDS, []),
+    'events': ('event_id', EVENT_FIELDS, []),
+    'upcoming_events': ('event_id', EVENT_FIELDS, []),
+    'fights': ('fight_id', FIGHT_FIELDS, ['event_id', 'red_id', 'blue_id']),
+    'upcoming_fights': ('fight_id', FIGHT_FIELDS, ['event_id', 'red_id', 'blue_id']),
+}
+
+
+def _column_list(columns: Iterable[str]) -> str:
+    return ', '.join(f'"{c}"' for c in columns)
+
+
+class SQLiteStore:
+    """
+    Almacén SQLite de las tablas crudas del pipeline.
+    Los valores se guardan como texto, igual que en los CSV (None se guarda como NULL y se exporta vacío).
+    La conexión se comparte entre hilos protegida por un lock.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._lock = threading.Lock()
+        self._create_tables()
+
+    def _create_tables(self):
+        with self._lock, self._conn:
+            for table, (key, columns, indexed) in TABLES.items():
+                column_defs = ', '.join(
+                    f'"{c}" TEXT PRIMARY KEY' if c == key else f'"{c}" TEXT' for c in columns
+                )
+                self._conn.execute(f'CREATE TABLE IF NOT EXISTS {table} ({column_defs})')
+                for column in indexed:
+                    self._conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ("{column}")')
+
+    def upsert(self, table: str, rows: Iterable[Dict[str, Any]], batch_size: int = 500) -> int:
+        """
+        Inserta o actualiza filas por clave en lotes de `batch_size`.
+        Solo se actualizan las columnas presentes en cada fila; las claves que no son columnas de la tabla se ignoran.
+        Returns:
+            int: Número de filas escritas.
+        """
+        key, columns, _ = self._table(table)
+        known = set(columns)
+        written = 0
+        batch: List[Dict[str, Any]] = []
+        for row in rows:
+            if hasattr(row, 'to_row'):
+                row = row.to_row()
+            normalized = {k.lower(): v for k, v in row.items() if k.lower() in known}
+            if not normalized.get(key):
+                raise ValidationError(f"Row without {key} cannot be stored in {table}")
+            batch.append(normalized)
+            if len(batch) >= batch_size:
+                written += self._write_batch(table, key, batch)
+                batch = []
+        if batch:
+            written += self._write_batch(table, key, batch)
+        get_metrics().inc('rows_emitted_total', written, table=table, sink='sqlite')
+        return written
+
+    def _write_batch(self, table: str, key: str, rows: List[Dict[str, Any]]) -> int:
+        # Agrupa las filas por conjunto de columnas para usar una sentencia preparada por grupo
+        groups: Dict[tuple, List[tuple]] = {}
+        for row in rows:
+            cols = tuple(row)
+            groups.setdefault(cols, []).append(tuple(None if v is None else str(v) for v in row.values()))
+        with self._lock, self._conn:
+            for cols, values in groups.items():
+                updates = ', '.join(f'"{c}"=excluded."{c}"' for c in cols if c != key)
+                conflict = f'DO UPDATE SET {updates}' if updates else 'DO NOTHING'
+                self._conn.executemany(
+                    f'INSERT INTO {table} ({_column_list(cols)}) '
+                    f'VALUES ({", ".join("?" for _ in cols)}) ON CONFLICT("{key}") {conflict}',
+                    values
+                )
+        return len(rows)
+
+    def fetch(self, table: str, keys: Optional[Iterable[str]] = None,
+              columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Devuelve las filas de una tabla (todas o las de `keys`) en orden de inserción.
+        """
+        return list(self.iter_rows(table, keys, columns))
+
+    def iter_rows(self, table: str, keys: Optional[Iterable[str]] = None,
+                  columns: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre las filas de una tabla en orden de inserción sin cargarlas todas en memoria.
+        """
+        key, table_columns, _ = self._table(table)
+        columns = columns or table_columns
+        select = f'SELECT {_column_list(columns)} FROM {table}'
+        if keys is None:
+            with self._lock:
+                cursor = self._conn.execute(f'{select} ORDER BY rowid')
+                rows = cursor.fetchmany(1000)
+            while rows:
+                for values in rows:
+                    yield dict(zip(columns, values))
+                with self._lock:
+                    rows = cursor.fetchmany(1000)
+            return
+        keys = list(keys)
+        # Consulta por bloques para no superar el límite de parámetros de SQLite
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            with self._lock:
+                result = self._conn.execute(
+                    f'{select} WHERE "{key}" IN ({", ".join("?" for _ in chunk)}) ORDER BY rowid', chunk
+                ).fetchall()
+            for values in result:
+                yield dict(zip(columns, values))
+
+    def count(self, table: str) -> int:
+        """Número de filas de una tabla."""
+        self._table(table)
+        with self._lock:
+            return self._conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+    def import_csv(self, table: str, csv_path: str) -> int:
+        """
+        Carga (con upsert) uno de los CSV crudos en su tabla.
+        """
+        return self.upsert(table, CSVManager.read_from_csv(csv_path))
+
+    def export_csv(self, table: str, csv_path: str) -> int:
+        """
+        Exporta una tabla a CSV con una consulta en streaming y escritura atómica.
+        Returns:
+            int: Número de filas exportadas.
+        """
+        _, columns, _ = self._table(table)
+        with CSVManager.open_writer(csv_path, columns) as writer:
+            writer.write_rows(self.iter_rows(table))
+        return writer.rows_written
+
+    def writer(self, table: str, batch_size: int = 200) -> 'SQLiteRowWriter':
+        """
+        Abre un escritor por lotes compatible con el `sink` de los scrapers de detalle.
+        """
+        self._table(table)
+        return SQLiteRowWriter(self, table, batch_size)
+
+    def close(self):
+        """Cierra la conexión."""
+        with self._lock:
+            self._conn.close()
+
+    def _table(self, table: str):
+        if table not in TABLES:
+            raise ValidationError(f"Unknown table '{table}' (expected one of {', '.join(TABLES)})")
+        return TABLES[table]
+
+
+class SQLiteRowWriter:
+    """
+    Acumula filas desde varios hilos y las escribe en SQLite con upserts de `batch_size` filas.
+    Debe usarse como gestor de contexto para volcar el último lote al terminar.
+    """
+
+    def __init__(self, store: SQLiteStore, table: str, batch_size: int = 200):
+        self.store = store
+        self.table = table
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def write(self, row: Dict[str, Any]):
+        """Añade una fila al lote actual y lo escribe si está completo."""
+        with self._lock:
+            self._buffer.append(row)
+            if len(self._buffer) >= self.batch_size:
+                self._flush()
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]):
+        """Añade todas las filas de un iterable."""
+        for row in rows:
+            self.write(row)
+
+    def flush(self):
+        """Escribe el lote pendiente."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            self.rows_written += self.store.upsert(self.table, self._buffer)
+            self._buffer = []
+
+    def __enter__(self) -> 'SQLiteRowWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Las filas completadas se conservan aunque la fase falle: cada lote es una unidad válida
+        self.flush()
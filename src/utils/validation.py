@@ -1,9 +1,187 @@
 """
 Utilidades para la validación de datos en el proyecto UFC ETL.
 Incluye validadores para asegurar la integridad y consistencia de los datos extraídos y procesados.
+Además de los validadores por registro, DataValidator valida tablas completas por columnas: cada comprobación
+(nulos, rangos, formatos y unicidad) es una operación vectorizada que produce una máscara de filas erróneas, y los
+formatos y rangos se evalúan solo sobre los valores distintos de cada columna (pd.factorize, una vez por columna),
+como en la fase de transformación. Las comprobaciones entre tablas (luchadores y eventos referenciados por las peleas) se resuelven
+con búsquedas en tablas hash (Series.isin sobre el conjunto de ids). El resultado es un ValidationReport
+serializable a JSON. La validación por columnas requiere pandas (pip install -e .[transform]).
 """
-from typing import Dict, Any, List, Optional
-from ..core.exceptions import ValidationError
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple, Union
+from ..core.exceptions import ConfigurationError, ValidationError
+from .metrics import get_metrics
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pandas solo es necesario para la validación por columnas
+    np = None
+    pd = None
+
+
+# Valores que ufcstats y CSVManager usan para un dato ausente
+MISSING_VALUES = ('', '--', 'None')
+
+REQUIRED_FIELDS = {
+    'fighter': ('fighter_id',),
+    'event': ('event_id', 'name'),
+    'fight': ('event_id', 'fight_id'),
+}
+UNIQUE_FIELDS = {
+    'fighter': ('fighter_id',),
+    'event': ('event_id',),
+    'fight': ('fight_id',),
+}
+
+CLOCK_FORMAT = r'^\d+(?::\d+){1,2}(?:\.\d+)?$'
+PAIR_FORMAT = r'^\s*\d+\s+of\s+\d+\s*$'
+PERCENT_FORMAT = r'^\d+(?:\.\d+)?%$'
+# Formatos de los CSV crudos (expresiones regulares); los valores ausentes no se comprueban
+FORMATS = {
+    'fighter': {
+        'height': r'^\d+\' ?\d+"$',
+        'weight': r'^\d+(?:\.\d+)? lbs\.$',
+        'reach': r'^\d+(?:\.\d+)?"$',
+        'dob': r'^[A-Z][a-z]{2} \d{1,2}, \d{4}$',
+        'str_acc': PERCENT_FORMAT, 'str_def': PERCENT_FORMAT, 'td_acc': PERCENT_FORMAT, 'td_def': PERCENT_FORMAT,
+    },
+    'event': {
+        'date': r'^[A-Z][a-z]+ \d{1,2}, \d{4}$',
+    },
+    'fight': {
+        'time': CLOCK_FORMAT, 'control_time1': CLOCK_FORMAT, 'control_time2': CLOCK_FORMAT,
+        **{column: PAIR_FORMAT for column in ('str1', 'str2', 'td1', 'td2', 'sig_head1', 'sig_head2', 'sig_body1',
+                                              'sig_body2', 'sig_leg1', 'sig_leg2', 'total_str1', 'total_str2')},
+    },
+}
+# Rangos numéricos (mínimo, máximo o None) de los CSV crudos; un valor no numérico está fuera de rango
+RANGES = {
+    'fighter': {'wins': (0, None), 'defeats': (0, None), 'draws': (0, None)},
+    'fight': {
+        'fight_order': (1, None), 'round': (1, 5),
+        **{column: (0, None) for column in ('kd1', 'kd2', 'sub1', 'sub2', 'pass1', 'pass2', 'rev1', 'rev2')},
+    },
+}
+# Integridad referencial: (tabla, columna) debe existir en (tabla referenciada, columna)
+REFERENCES = (
+    ('fight', 'red_id', 'fighter', 'fighter_id'),
+    ('fight', 'blue_id', 'fighter', 'fighter_id'),
+    ('fight', 'winner_id', 'fighter', 'fighter_id'),
+    ('fight', 'event_id', 'event', 'event_id'),
+)
+# Filas de ejemplo que se guardan por comprobación fallida
+EXAMPLE_ROWS = 5
+
+Frame = Union['pd.DataFrame', List[Dict[str, Any]]]
+
+
+def _require_pandas():
+    if pd is None:
+        raise ConfigurationError("Columnar validation requires pandas (pip install -e .[transform])")
+
+
+def _unique_values(values: 'pd.Series') -> Tuple['np.ndarray', 'pd.Series', 'np.ndarray']:
+    """Códigos de pd.factorize, valores distintos y máscara de los distintos que no son un dato ausente."""
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques, dtype=object)
+    return codes, uniques, ~uniques.str.strip().isin(MISSING_VALUES).to_numpy()
+
+
+def _in_range(low: Optional[float], high: Optional[float]) -> Callable[['pd.Series'], 'pd.Series']:
+    def check(values: 'pd.Series') -> 'pd.Series':
+        numbers = pd.to_numeric(values, errors='coerce')
+        ok = numbers.notna()
+        if low is not None:
+            ok &= numbers >= low
+        if high is not None:
+            ok &= numbers <= high
+        return ok
+    return check
+
+
+@dataclass
+class CheckResult:
+    """
+    Resultado de una comprobación sobre una columna.
+    Attributes:
+        table: Tipo de datos ('fighter', 'event', 'fight').
+        check: 'required', 'name', 'unique', 'format', 'range' o 'reference'.
+        column: Columna comprobada ('first/last/name' en la comprobación de nombre).
+        failed: Filas que no la cumplen.
+        rows: Posiciones (desde 0) de las primeras filas erróneas.
+        values: Valores de esas filas.
+    """
+    table: str
+    check: str
+    column: str
+    failed: int
+    rows: List[int] = field(default_factory=list)
+    values: List[str] = field(default_factory=list)
+
+
+@dataclass
+class TableReport:
+    """
+    Resumen de validación de una tabla: filas totales y filas con al menos una comprobación fallida.
+    """
+    table: str
+    total: int
+    invalid: int
+
+    @property
+    def valid(self) -> int:
+        return self.total - self.invalid
+
+    @property
+    def success_rate(self) -> float:
+        return (self.valid / self.total * 100) if self.total > 0 else 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Estadísticas con el formato histórico de validate_dataset."""
+        return {'total': self.total, 'valid': self.valid, 'invalid': self.invalid, 'success_rate': self.success_rate}
+
+
+@dataclass
+class ValidationReport:
+    """
+    Informe de validación de un conjunto de tablas, serializable a JSON.
+    Attributes:
+        tables: Resumen por tabla.
+        checks: Resultado de cada comprobación ejecutada (también las superadas, con failed = 0).
+        seconds: Duración de la validación.
+    """
+    tables: Dict[str, TableReport] = field(default_factory=dict)
+    checks: List[CheckResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(check.failed == 0 for check in self.checks)
+
+    @property
+    def failures(self) -> List[CheckResult]:
+        return [check for check in self.checks if check.failed]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'ok': self.ok,
+            'seconds': round(self.seconds, 4),
+            'tables': {name: table.stats() for name, table in self.tables.items()},
+            'checks': [asdict(check) for check in self.checks],
+        }
+
+    def write_json(self, path: str):
+        """Escribe el informe en `path` (en un temporal que luego se reemplaza)."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_path, path)
 
 
 class DataValidator:
@@ -11,6 +189,7 @@ class DataValidator:
     Clase utilitaria para validar la integridad y consistencia de los datos extraídos.
     Proporciona métodos estáticos para validar entidades como luchadores, eventos y peleas,
     así como conjuntos completos de datos. Lanza excepciones específicas en caso de errores de validación.
+    Los conjuntos completos se validan por columnas (validate_tables), incluidas las referencias entre tablas.
     """
     
     @staticmethod
@@ -76,48 +255,142 @@ class DataValidator:
         return True
     
     @staticmethod
-    def validate_dataset(data: List[Dict[str, Any]], data_type: str) -> Dict[str, int]:
+    def validate_dataset(data: Frame, data_type: str) -> Dict[str, Any]:
         """
         Valida un conjunto completo de datos de un tipo específico (luchador, evento o pelea).
-        Aplica la función de validación correspondiente a cada elemento y recopila estadísticas de éxito.
-        Imprime advertencias para los primeros errores encontrados.
+        Ejecuta por columnas las comprobaciones de la tabla (validate_tables) y recopila estadísticas de éxito.
+        Imprime advertencias para las primeras comprobaciones fallidas.
         Args:
-            data (List[Dict[str, Any]]): Lista de diccionarios con los datos a validar.
+            data (List[Dict[str, Any]] | pd.DataFrame): Registros o tabla con los datos a validar.
             data_type (str): Tipo de datos ('fighter', 'event', 'fight').
         Returns:
-            Dict[str, int]: Estadísticas de validación (total, válidos, inválidos, tasa de éxito).
+            Dict[str, Any]: Estadísticas de validación (total, válidos, inválidos, tasa de éxito).
         """
-        validation_funcs = {
-            'fighter': DataValidator.validate_fighter,
-            'event': DataValidator.validate_event,
-            'fight': DataValidator.validate_fight
-        }
-        
-        validator = validation_funcs.get(data_type)
-        if not validator:
+        if data_type not in REQUIRED_FIELDS:
             raise ValidationError(f"Unknown data type: {data_type}")
-        
-        total = len(data)
-        valid = 0
-        errors = []
-        
-        for i, item in enumerate(data):
-            try:
-                validator(item)
-                valid += 1
-            except ValidationError as e:
-                errors.append(f"Row {i}: {str(e)}")
-        
-        if errors:
+
+        report = DataValidator.validate_tables(**{f'{data_type}s': data})
+        failures = report.failures
+        if failures:
             print(f"Validation warnings for {data_type} data:")
-            for error in errors[:10]:  # Muestra solo los primeros 10 errores para evitar saturar la salida
-                print(f"  - {error}")
-            if len(errors) > 10:
-                print(f"  ... and {len(errors) - 10} more errors")
-        
-        return {
-            'total': total,
-            'valid': valid,
-            'invalid': total - valid,
-            'success_rate': (valid / total * 100) if total > 0 else 0
-        }
\ No newline at end of file
+            for check in failures[:10]:  # Muestra solo las primeras 10 comprobaciones para evitar saturar la salida
+                print(f"  - {check.check} {check.column}: {check.failed} rows (e.g. rows {check.rows})")
+            if len(failures) > 10:
+                print(f"  ... and {len(failures) - 10} more failed checks")
+
+        return report.tables[data_type].stats()
+
+    @staticmethod
+    def validate_tables(fighters: Optional[Frame] = None, events: Optional[Frame] = None,
+                        fights: Optional[Frame] = None) -> ValidationReport:
+        """
+        Valida por columnas las tablas indicadas y, si están ambas, las referencias de las peleas a luchadores
+        y eventos. Cada fila cuenta como inválida si falla al menos una comprobación.
+        Args:
+            fighters, events, fights (List[Dict[str, Any]] | pd.DataFrame): Tablas crudas (las omitidas no se validan).
+        Returns:
+            ValidationReport: Resumen por tabla y resultado de cada comprobación.
+        """
+        start = time.perf_counter()
+        frames = {table: DataValidator._frame(data)
+                  for table, data in (('fighter', fighters), ('event', events), ('fight', fights)) if data is not None}
+        invalid = {table: np.zeros(len(frame), dtype=bool) for table, frame in frames.items()}
+        report = ValidationReport()
+
+        def record(table: str, check: str, column: str, mask: 'np.ndarray'):
+            invalid[table] |= mask
+            rows = np.flatnonzero(mask)
+            examples = rows[:EXAMPLE_ROWS]
+            values = frames[table][column].iloc[examples].tolist() if len(rows) and column in frames[table] else []
+            report.checks.append(CheckResult(table, check, column, len(rows), examples.tolist(), values))
+
+        for table, frame in frames.items():
+            for check, column, mask in DataValidator._table_checks(frame, table):
+                record(table, check, column, mask)
+        for table, column, mask in DataValidator._reference_checks(frames):
+            record(table, 'reference', column, mask)
+
+        report.tables = {table: TableReport(table, len(frame), int(invalid[table].sum()))
+                         for table, frame in frames.items()}
+        report.seconds = time.perf_counter() - start
+        for check in report.failures:
+            get_metrics().inc('validation_failures_total', check.failed, table=check.table, check=check.check)
+        return report
+
+    @staticmethod
+    def validate_files(data) -> ValidationReport:
+        """
+        Valida los CSV crudos de data/raw (luchadores, eventos y peleas); los que no existen se omiten.
+        Args:
+            data (DataConfig): Rutas de datos del pipeline.
+        """
+        _require_pandas()
+        tables = {}
+        for table, path in (('fighters', data.fighters_path), ('events', data.events_path),
+                            ('fights', data.fights_path)):
+            if os.path.exists(path):
+                tables[table] = pd.read_csv(path, dtype=str, keep_default_na=False)
+        return DataValidator.validate_tables(**tables)
+
+    @staticmethod
+    def _frame(data: Frame) -> 'pd.DataFrame':
+        """Tabla con todos los valores como texto y los nulos como cadena vacía."""
+        _require_pandas()
+        frame = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        return frame.fillna('').astype(str)
+
+    @staticmethod
+    def _present(values: 'pd.Series') -> 'np.ndarray':
+        codes, _, present = _unique_values(values)
+        return present[codes]
+
+    @staticmethod
+    def _table_checks(frame: 'pd.DataFrame', data_type: str) -> Iterator[Tuple[str, str, 'np.ndarray']]:
+        """
+        Comprobación, columna y máscara de filas erróneas de cada comprobación de una tabla. Cada columna se
+        factoriza una sola vez y los formatos y rangos se evalúan sobre sus valores distintos.
+        """
+        n = len(frame)
+        factorized: Dict[str, Tuple['np.ndarray', 'pd.Series', 'np.ndarray']] = {}
+
+        def unique_values(column: str) -> Tuple['np.ndarray', 'pd.Series', 'np.ndarray']:
+            if column not in factorized:
+                factorized[column] = _unique_values(frame[column])
+            return factorized[column]
+
+        def has(column: str) -> 'np.ndarray':
+            if column not in frame:
+                return np.zeros(n, dtype=bool)
+            codes, _, present = unique_values(column)
+            return present[codes]
+
+        def fails(column: str, check: Callable[['pd.Series'], 'pd.Series']) -> 'np.ndarray':
+            codes, uniques, present = unique_values(column)
+            return (present & ~np.asarray(check(uniques), dtype=bool))[codes]
+
+        for column in REQUIRED_FIELDS[data_type]:
+            yield 'required', column, ~has(column)
+        if data_type == 'fighter':
+            yield 'name', 'first/last/name', ~((has('first') & has('last')) | has('name'))
+        for column in UNIQUE_FIELDS[data_type]:
+            if column in frame:
+                yield 'unique', column, frame[column].duplicated().to_numpy() & has(column)
+        for column, pattern in FORMATS.get(data_type, {}).items():
+            if column in frame:
+                yield 'format', column, fails(column, lambda v: v.str.match(pattern))
+        for column, (low, high) in RANGES.get(data_type, {}).items():
+            if column in frame:
+                yield 'range', column, fails(column, _in_range(low, high))
+
+    @staticmethod
+    def _reference_checks(frames: Dict[str, 'pd.DataFrame']) -> Iterator[Tuple[str, str, 'np.ndarray']]:
+        """Filas cuyo valor no existe en la tabla referenciada, con un conjunto hash de las claves de esta."""
+        for table, column, parent, key in REFERENCES:
+            if table not in frames or parent not in frames:
+                continue
+            if column not in frames[table] or key not in frames[parent]:
+                continue
+            keys = frames[parent][key]
+            known = set(keys[DataValidator._present(keys)])
+            values = frames[table][column]
+            yield table, column, DataValidator._present(values) & ~values.isin(known).to_numpy()
@@ -0,0 +1,168 @@
+"""
+Benchmarks de los parsers sobre el corpus de páginas de tests/fixtures/pages.
+Miden páginas por segundo y memoria máxima de cada función de parseo con ambos backends (bs4 y lxml).
+Cada caso se mide en varias rondas cortas, y en cada una el ritmo se divide por el de un bucle de calibración de
+Python puro medido justo antes y justo después; se compara la mediana de las rondas, relativa a la velocidad de la
+máquina en ese momento y no en páginas/s absolutas. Los resultados se guardan en .benchmarks/parsers.json y se comparan con
+tests/benchmarks/baseline.json: un ritmo relativo inferior o una memoria superior a la línea base en más de
+--parser-bench-tolerance hace fallar la prueba.
+    pytest tests/benchmarks --parser-bench                          # comparar con la línea base
+    pytest tests/benchmarks --parser-bench-save-baseline            # actualizar la línea base
+"""
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+import pytest
+from src.scrapers.fighters.parser import FighterParser
+from src.scrapers.fighters.lxml_parser import LxmlFighterParser
+from src.scrapers.events.parser import EventParser
+from src.scrapers.events.lxml_parser import LxmlEventParser
+from src.scrapers.fights.parser import FightParser
+from src.scrapers.fights.lxml_parser import LxmlFightParser
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..', '..')
+PAGES_DIR = os.path.join(ROOT_DIR, 'tests', 'fixtures', 'pages')
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+RESULTS_PATH = os.path.join(ROOT_DIR, '.benchmarks', 'parsers.json')
+
+# Rondas por caso, duración mínima de cada tramo de una ronda y número mínimo de llamadas por tramo
+ROUNDS = 9
+ROUND_SECONDS = 0.05
+MIN_ITERATIONS = 3
+
+# Trabajo fijo del bucle de calibración: celdas de tabla como las del corpus
+CALIBRATION_TEXT = ' '.join(f'<td class="c{i % 7}">{i} of {i * 3}</td>' for i in range(2000))
+
+BACKENDS = {
+    'bs4': {'fighter': FighterParser, 'event': EventParser, 'fight': FightParser},
+    'lxml': {'fighter': LxmlFighterParser, 'event': LxmlEventParser, 'fight': LxmlFightParser},
+}
+
+# Caso -> (parser, página del corpus, función de parseo)
+CASES = {
+    'parse_fighters_table': ('fighter', 'fighters_listing.html',
+                             lambda p, page: p.parse_fighters_table(p.load(page))),
+    'parse_fighter_details': ('fighter', 'fighter_details.html',
+                              lambda p, page: p.parse_fighter_details(page)),
+    'parse_events_table': ('event', 'events_listing.html',
+                           lambda p, page: p.parse_events_table(p.load(page), 'completed')),
+    'parse_event_fights': ('fight', 'event_details.html',
+                           lambda p, page: p.parse_event_fights(p.load(page), 'event')),
+    'parse_fight_details[completed]': ('fight', 'fight_details_completed.html',
+                                       lambda p, page: p.parse_fight_details(page)),
+    'parse_fight_details[upcoming]': ('fight', 'fight_details_upcoming.html',
+                                      lambda p, page: p.parse_fight_details(page)),
+    'parse_fight_details[no_contest]': ('fight', 'fight_details_no_contest.html',
+                                        lambda p, page: p.parse_fight_details(page)),
+}
+
+
+def calibration_loop() -> dict:
+    """Trabajo fijo de Python puro (troceado de texto y diccionarios) que sirve de unidad de velocidad de la máquina."""
+    counts = {}
+    for cell in CALIBRATION_TEXT.split('</td>'):
+        key = cell.partition('>')[0]
+        counts[key] = counts.get(key, 0) + len(cell.split(' of '))
+    return counts
+
+
+def rate(func) -> float:
+    """Llamadas por segundo durante al menos ROUND_SECONDS y MIN_ITERATIONS llamadas."""
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < ROUND_SECONDS or count < MIN_ITERATIONS:
+        func()
+        count += 1
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def measure(parser, parse, page: bytes) -> dict:
+    """
+    Ritmo (páginas/s), ritmo relativo a la calibración (páginas por ejecución del bucle de calibración) y memoria
+    máxima (KiB) de un único parseo. Cada ronda mide el parseo entre dos tramos de calibración, de modo que ambos
+    ven la misma carga de la máquina; se toma la mediana de las ROUNDS rondas.
+    """
+    run = lambda: parse(parser, page)
+    run()  # calentamiento
+    calibration_loop()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rates, ratios = [], []
+    for _ in range(ROUNDS):
+        before = rate(calibration_loop)
+        pages_per_sec = rate(run)
+        after = rate(calibration_loop)
+        rates.append(pages_per_sec)
+        ratios.append(pages_per_sec / ((before + after) / 2))
+    return {'pages_per_sec': round(statistics.median(rates), 2), 'relative': round(statistics.median(ratios), 4),
+            'peak_kib': round(peak / 1024, 1)}
+
+
+@pytest.fixture(scope='session')
+def results(request):
+    """Acumula los resultados de la sesión y los guarda (y, si se pide, los fija como línea base) al terminar."""
+    collected = {}
+    yield collected
+    if not collected:
+        return
+    report = {'python': platform.python_version(), 'machine': platform.machine(), 'results': collected}
+    os.makedirs(os.path.dirname(RESULTS_PATH), exist_ok=True)
+    with open(RESULTS_PATH, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    if request.config.getoption('--parser-bench-save-baseline'):
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+@pytest.fixture(scope='session')
+def baseline():
+    """Línea base guardada, o un diccionario vacío si aún no existe."""
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, encoding='utf-8') as f:
+        return json.load(f)['results']
+
+
+@pytest.mark.parser_bench
+class TestParserBenchmarks:
+    """
+    Benchmarks de rendimiento y memoria de las funciones de parseo.
+    """
+
+    @pytest.mark.parametrize('backend', list(BACKENDS))
+    @pytest.mark.parametrize('case', list(CASES))
+    def test_parser_throughput(self, case, backend, results, baseline, request):
+        """
+        Mide un caso y falla si su ritmo relativo o su memoria empeoran respecto a la línea base más allá de la
+        tolerancia.
+        """
+        parser_kind, page_name, parse = CASES[case]
+        with open(os.path.join(PAGES_DIR, page_name), 'rb') as f:
+            page = f.read()
+
+        key = f"{backend}.{case}"
+        measured = measure(BACKENDS[backend][parser_kind](), parse, page)
+        results[key] = measured
+        print(f"{key}: {measured['pages_per_sec']:.1f} pages/s (relative {measured['relative']:.4f}), peak {measured['peak_kib']:.1f} KiB")
+
+        reference = baseline.get(key)
+        if reference is None or request.config.getoption('--parser-bench-save-baseline'):
+            return
+        tolerance = request.config.getoption('--parser-bench-tolerance')
+        regressions = []
+        if measured['relative'] < reference['relative'] * (1 - tolerance):
+            regressions.append(f"relative throughput {measured['relative']:.4f} vs baseline {reference['relative']:.4f} "
+                               f"({measured['pages_per_sec']:.1f} pages/s)")
+        if measured['peak_kib'] > reference['peak_kib'] * (1 + tolerance):
+            regressions.append(f"peak memory {measured['peak_kib']:.1f} KiB vs baseline {reference['peak_kib']:.1f}")
+        if regressions:
+            pytest.fail(f"PERFORMANCE REGRESSION in {key}: " + '; '.join(regressions), pytrace=False)
@@ -0,0 +1,48 @@
+"""
+Configuración común de pytest: opciones de la batería de benchmarks de parseo y servidor local de pruebas.
+Los benchmarks (marcados con `parser_bench`) solo se ejecutan con --parser-bench; sin la opción se omiten.
+Las opciones y el marcador no se llaman `benchmark` para no chocar con los de pytest-benchmark.
+"""
+import threading
+import pytest
+from scripts.stub_server import StubServer
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('parser_bench', 'parser benchmarks')
+    group.addoption('--parser-bench', action='store_true',
+                    help='Run the parser benchmarks and compare them with the stored baseline')
+    group.addoption('--parser-bench-save-baseline', action='store_true',
+                    help='Run the parser benchmarks and store the results as the new baseline')
+    group.addoption('--parser-bench-tolerance', type=float, default=0.25,
+                    help='Allowed calibrated slowdown / memory growth before a benchmark fails (default: 0.25)')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--parser-bench') or config.getoption('--parser-bench-save-baseline'):
+        return
+    skip = pytest.mark.skip(reason='benchmarks only run with --parser-bench')
+    for item in items:
+        if 'parser_bench' in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def stub_server(monkeypatch, tmp_path):
+    """
+    Arranca servidores locales (scripts/stub_server.py) con `stub_server(site, faults=None)`, cada uno en un hilo,
+    con el directorio de trabajo en tmp_path para que data/ quede aislado; al terminar la prueba se apagan.
+    """
+    monkeypatch.chdir(tmp_path)
+    started = []
+
+    def start(site, faults=None) -> StubServer:
+        server = StubServer(site, faults)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        started.append(server)
+        return server
+
+    yield start
+    for server in started:
+        server.shutdown()
+        server.server_close()
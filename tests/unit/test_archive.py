@@ -0,0 +1,83 @@
+"""
+Pruebas del archivo de páginas crudas y del modo --reparse, que reconstruye los CSV sin red.
+"""
+import pytest
+from scripts.stub_server import SyntheticSite
+from src.pipeline.orchestrator import UFCScrapingOrchestrator
+from src.utils.archive import PageArchive, classify_url, content_hash
+
+
+class TestPageArchive:
+    """
+    Pruebas unitarias del archivo de páginas.
+    """
+
+    def test_classifies_ufcstats_urls(self):
+        """
+        Prueba que las URLs se indexan por tipo de entidad e identificador, con independencia del host.
+        """
+        assert classify_url('http://ufcstats.com/fight-details/abc123') == ('fight', 'abc123')
+        assert classify_url('http://127.0.0.1:8000/event-details/e1') == ('event', 'e1')
+        assert classify_url('http://ufcstats.com/statistics/fighters?char=B&page=all') == ('fighters_listing', 'b')
+        assert classify_url('http://ufcstats.com/statistics/events/upcoming?page=all') == ('events_listing', 'upcoming')
+        assert classify_url('http://ufcstats.com/statistics/unknown') is None
+
+    def test_stores_compressed_pages_once_per_content(self, tmp_path):
+        """
+        Prueba que una página se recupera intacta y que solo se reescribe cuando cambia su contenido.
+        """
+        archive = PageArchive(str(tmp_path / 'pages.sqlite'), codec='zlib')
+        body = ('<html><body>' + 'Significant Strikes ' * 500 + '</body></html>').encode('utf-8')
+        url = 'http://ufcstats.com/fight-details/f1'
+
+        assert archive.store(url, body, 'utf-8')
+        assert not archive.store(url, body, 'utf-8')
+        assert archive.get('fight', 'f1').text == body.decode('utf-8')
+        assert archive.hash_of('fight', 'f1') == content_hash(body)
+        assert archive.stats()['fight']['compressed_bytes'] < len(body) / 10
+
+        assert archive.store(url, body + b'<!-- updated -->')
+        assert archive.get_url(url).body.endswith(b'<!-- updated -->')
+        assert len(archive) == 1
+        archive.close()
+
+
+def read_rows(path: str) -> list:
+    """Cabecera y filas ordenadas de un CSV (las fases concurrentes escriben en orden de finalización)."""
+    with open(path, encoding='utf-8') as f:
+        header, *rows = f.read().splitlines()
+    return [header] + sorted(rows)
+
+
+@pytest.fixture
+def site(stub_server):
+    return stub_server(SyntheticSite(events=3, fights_per_event=3, fighters=30, upcoming=1))
+
+
+class TestReparse:
+    """
+    Pruebas del modo --reparse.
+    """
+
+    def test_reparse_rebuilds_identical_csvs_offline(self, site):
+        """
+        Prueba que los CSV reconstruidos desde el archivo, con el servidor apagado, tienen las mismas filas que los descargados.
+        """
+        orchestrator = UFCScrapingOrchestrator(use_cache=False, requests_per_second=0, base_url=site.base_url)
+        orchestrator.config.scraping.delay_seconds = 0
+        orchestrator.run_full_pipeline()
+        data = orchestrator.config.data
+        paths = [data.fighters_path, data.events_path, data.upcoming_events_path,
+                 data.fights_path, data.upcoming_fights_path]
+        scraped = {}
+        for path in paths:
+            scraped[path] = read_rows(path)
+        site.shutdown()
+        requests = site.stats_snapshot()['requests']
+
+        reparser = UFCScrapingOrchestrator(reparse=True, parse_workers=2, base_url=site.base_url)
+        reparser.reparse_archive()
+
+        assert site.stats_snapshot()['requests'] == requests
+        for path in paths:
+            assert read_rows(path) == scraped[path], path
@@ -0,0 +1,155 @@
+"""
+Pruebas unitarias para el motor asyncio de scraping de detalles.
+Levantan un servidor HTTP local que imita las páginas de ufcstats y comprueban que los motores
+de hilos y asyncio producen exactamente las mismas filas.
+"""
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from src.core.config import Config
+from src.scrapers.fights import scraper as fights_scraper
+from src.scrapers.fighters import scraper as fighters_scraper
+
+pytest.importorskip('aiohttp')
+
+
+FIGHT_PAGE = """
+<html><body>
+<h2 class="b-content__title"><a href="/event-details/{event_id}">UFC Test Event</a></h2>
+<div class="b-fight-details__person">
+    <i class="b-fight-details__person-status b-fight-details__person-status_style_green">W</i>
+    <h3 class="b-fight-details__person-name"><a href="/fighter-details/red{fight_id}">Red Fighter</a></h3>
+</div>
+<div class="b-fight-details__person">
+    <i class="b-fight-details__person-status b-fight-details__person-status_style_gray">L</i>
+    <h3 class="b-fight-details__person-name"><a href="/fighter-details/blue{fight_id}">Blue Fighter</a></h3>
+</div>
+<i class="b-fight-details__fight-title">Lightweight Bout</i>
+</body></html>
+"""
+
+FIGHTER_PAGE = """
+<html><body>
+<div class="b-list__info-box">
+    <ul><li><i class="b-list__box-item-title">DOB:</i> Jan 01, 1990</li></ul>
+</div>
+</body></html>
+"""
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Sirve páginas de pelea y luchador generadas a partir del identificador de la URL."""
+
+    def do_GET(self):
+        entity_id = self.path.rsplit('/', 1)[-1]
+        if self.path.startswith('/fight-details/'):
+            body = FIGHT_PAGE.format(event_id='evt', fight_id=entity_id)
+        elif self.path.startswith('/fighter-details/'):
+            body = FIGHTER_PAGE
+        else:
+            self.send_error(404)
+            return
+        payload = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def offline_config(base_url: str, **kwargs) -> Config:
+    """Configuración sin caché, archivo de páginas, memoria de parseo ni límite de tasa, dirigida al servidor local."""
+    return Config(use_cache=False, archive=False, parse_memo=False, requests_per_second=0, base_url=base_url,
+                  **kwargs)
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield base_url
+    server.shutdown()
+    server.server_close()
+
+
+class TestAsyncEngine:
+    """
+    Pruebas de equivalencia entre los motores de hilos y asyncio.
+    """
+
+    def test_fight_details_match_threaded_engine(self, stub_server):
+        """
+        Prueba que ambos motores generan filas idénticas y en el mismo orden para los detalles de peleas.
+        """
+        fights_index = [
+            {'event_id': 'evt', 'fight_id': f'f{i}', 'fight_order': i + 1} for i in range(30)
+        ]
+
+        threaded = fights_scraper.FightDetailScraper(offline_config(stub_server)).scrape(fights_index)
+        async_rows = fights_scraper.FightDetailScraper(offline_config(stub_server, engine='async')).scrape(fights_index)
+
+        assert len(threaded) == 30
+        assert async_rows == threaded
+        assert threaded[0]['red_id'] == 'redf0'
+        assert threaded[0]['winner_id'] == 'redf0'
+
+    def test_fighter_details_match_threaded_engine(self, stub_server):
+        """
+        Prueba que ambos motores generan filas idénticas para los detalles de luchadores.
+        """
+        fighters = [{'fighter_id': f'id{i}', 'first': 'A', 'last': 'B'} for i in range(10)]
+
+        threaded = fighters_scraper.FighterDetailScraper(offline_config(stub_server)).scrape(fighters)
+        async_rows = fighters_scraper.FighterDetailScraper(offline_config(stub_server, engine='async')).scrape(fighters)
+
+        assert async_rows == threaded
+        assert threaded[0]['dob'] == 'Jan 01, 1990'
+
+    def test_process_parsing_matches_threaded_engine(self, stub_server):
+        """
+        Prueba que parsear en un pool de procesos (hilos y asyncio) no cambia las filas generadas.
+        """
+        fights_index = [
+            {'event_id': 'evt', 'fight_id': f'f{i}', 'fight_order': i + 1} for i in range(12)
+        ]
+
+        threaded = fights_scraper.FightDetailScraper(offline_config(stub_server)).scrape(fights_index)
+        pipelined = fights_scraper.FightDetailScraper(
+            offline_config(stub_server, process_parsing=True, parse_workers=2)
+        ).scrape(fights_index)
+        async_pooled = fights_scraper.FightDetailScraper(
+            offline_config(stub_server, engine='async', process_parsing=True, parse_workers=2)
+        ).scrape(fights_index)
+
+        assert pipelined == threaded
+        assert async_pooled == threaded
+
+    def test_disk_io_runs_off_the_event_loop(self, stub_server, monkeypatch, tmp_path):
+        """
+        Prueba que la caché HTTP, el archivo de páginas y la memoria de parseo se usan desde hilos de trabajo,
+        sin bloquear el hilo del bucle de eventos.
+        """
+        from src.utils.archive import PageArchive
+        from src.utils.cache import ResponseCache
+        from src.utils.parse_memo import ParseMemo
+        monkeypatch.chdir(tmp_path)
+        calls = []
+        for cls, name in ((ResponseCache, 'get'), (ResponseCache, 'set'), (PageArchive, 'store'),
+                          (ParseMemo, 'lookup'), (ParseMemo, 'remember')):
+            def spy(*args, __original=getattr(cls, name), __name=name, **kwargs):
+                calls.append((__name, threading.current_thread() is threading.main_thread()))
+                return __original(*args, **kwargs)
+            monkeypatch.setattr(cls, name, spy)
+
+        config = Config(requests_per_second=0, base_url=stub_server, engine='async')
+        fights_index = [{'event_id': 'evt', 'fight_id': f'f{i}', 'fight_order': i + 1} for i in range(4)]
+        rows = fights_scraper.FightDetailScraper(config).scrape(fights_index)
+
+        assert [r['red_id'] for r in rows] == ['redf0', 'redf1', 'redf2', 'redf3']
+        assert {name for name, _ in calls} == {'get', 'set', 'store', 'lookup', 'remember'}
+        assert not any(on_loop for _, on_loop in calls)
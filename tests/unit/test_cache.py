@@ -0,0 +1,65 @@
+"""
+Pruebas unitarias para la caché HTTP persistente del pipeline UFC ETL.
+Validan el almacenamiento, la expiración por TTL, el desalojo LRU y los contadores de uso.
+"""
+import time
+from src.utils.cache import ResponseCache, CacheRule
+
+
+class TestResponseCache:
+    """
+    Pruebas unitarias para la caché de respuestas en disco.
+    """
+
+    def test_set_and_get(self, tmp_path):
+        """
+        Prueba que una respuesta almacenada se recupera intacta y cuenta como acierto.
+        """
+        cache = ResponseCache(str(tmp_path))
+        url = 'http://ufcstats.com/fight-details/abc'
+        cache.set(url, '<html>ñ</html>'.encode('utf-8'), 'utf-8')
+
+        entry = cache.get(url)
+        assert entry.text == '<html>ñ</html>'
+        assert cache.get('http://ufcstats.com/fight-details/missing') is None
+
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['entries'] == 1
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """
+        Prueba que las entradas expiradas no se devuelven y se eliminan del índice.
+        """
+        cache = ResponseCache(str(tmp_path), rules=[CacheRule(r'/upcoming', 0.01)])
+        url = 'http://ufcstats.com/statistics/events/upcoming'
+        cache.set(url, b'<html></html>')
+        time.sleep(0.02)
+
+        assert cache.get(url) is None
+        assert cache.stats()['expired'] == 1
+        assert cache.stats()['entries'] == 0
+
+    def test_stable_marker_selects_ttl(self):
+        """
+        Prueba que una página sin el marcador de estabilidad usa el TTL corto.
+        """
+        rule = CacheRule(r'/fight-details/', None, stable_marker='b-fight-details__content', unstable_ttl=60)
+        assert rule.ttl_for(b'<div class="b-fight-details__content"></div>') is None
+        assert rule.ttl_for(b'<div></div>') == 60
+
+    def test_lru_eviction_under_budget(self, tmp_path):
+        """
+        Prueba que al superar el presupuesto se desaloja la entrada usada hace más tiempo.
+        """
+        cache = ResponseCache(str(tmp_path), max_bytes=250)
+        cache.set('http://a', b'a' * 100)
+        cache.set('http://b', b'b' * 100)
+        cache.get('http://a')
+        cache.set('http://c', b'c' * 100)
+
+        assert cache.get('http://b') is None
+        assert cache.get('http://a') is not None
+        assert cache.get('http://c') is not None
+        assert cache.stats()['evictions'] == 1
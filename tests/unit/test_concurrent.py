@@ -0,0 +1,121 @@
+"""
+Pruebas unitarias para los mapas en streaming con ventana acotada (imap y async_imap).
+"""
+import asyncio
+import random
+import threading
+import time
+import pytest
+from src.utils.concurrent import imap, async_imap
+
+
+class TestImap:
+    """
+    Pruebas unitarias para imap y async_imap.
+    """
+
+    def test_window_bounds_consumed_input_and_errors_are_reported(self):
+        """
+        Prueba que la entrada se consume de forma perezosa dentro de la ventana, que el orden se conserva
+        y que los errores llegan como resultados estructurados.
+        """
+        pulled = 0
+
+        def source():
+            nonlocal pulled
+            for i in range(2000):
+                pulled += 1
+                yield i
+
+        def work(item):
+            if item % 500 == 7:
+                raise ValueError(f"bad {item}")
+            time.sleep(random.random() / 5000)
+            return item * 2
+
+        delivered = 0
+        errors = []
+        for result in imap(work, source(), max_workers=4, window=8):
+            assert result.index == delivered
+            assert pulled - delivered <= 8
+            delivered += 1
+            if result.ok:
+                assert result.value == result.item * 2
+            else:
+                errors.append((result.item, str(result.error)))
+        assert delivered == 2000
+        assert errors == [(i, f"bad {i}") for i in (7, 507, 1007, 1507)]
+
+    def test_unordered_and_interrupt_cancels_pending(self):
+        """
+        Prueba el modo sin orden y que interrumpir al consumidor cancela los elementos no iniciados.
+        """
+        results = sorted(r.value for r in imap(lambda x: x + 1, range(50), max_workers=3, ordered=False))
+        assert results == list(range(1, 51))
+
+        started = []
+        lock = threading.Lock()
+
+        def slow(item):
+            with lock:
+                started.append(item)
+            time.sleep(0.05)
+            return item
+
+        with pytest.raises(KeyboardInterrupt):
+            for _ in imap(slow, range(1000), max_workers=2, window=4):
+                raise KeyboardInterrupt
+        time.sleep(0.2)
+        assert len(started) <= 4
+
+    def test_interrupt_never_runs_queued_items(self):
+        """
+        Prueba que al interrumpir el iterador se propaga la excepción original y que los elementos
+        que esperaban en la cola del pool no llegan a ejecutarse.
+        """
+        started = []
+        running = threading.Event()
+        release = threading.Event()
+        finished = threading.Event()
+
+        def work(item):
+            started.append(item)
+            if item == 1:
+                running.set()
+                release.wait(5)
+                finished.set()
+            return item
+
+        results = imap(work, range(100), max_workers=1, window=6)
+        assert next(results).value == 0
+        assert running.wait(5)
+        with pytest.raises(KeyboardInterrupt):
+            results.throw(KeyboardInterrupt)
+        release.set()
+        assert finished.wait(5)
+        time.sleep(0.1)
+        assert started == [0, 1]
+
+    def test_async_imap_limits_concurrency(self):
+        """
+        Prueba que async_imap no supera la concurrencia indicada y entrega los resultados en orden.
+        """
+        running = peak = 0
+
+        async def work(item, idx):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(random.random() / 1000)
+            running -= 1
+            if idx == 3:
+                raise RuntimeError('boom')
+            return item
+
+        async def collect():
+            return [r async for r in async_imap(work, range(200), concurrency=5, pass_index=True)]
+
+        results = asyncio.run(collect())
+        assert [r.index for r in results] == list(range(200))
+        assert peak <= 5
+        assert not results[3].ok and isinstance(results[3].error, RuntimeError)
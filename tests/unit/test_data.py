@@ -0,0 +1,66 @@
+"""
+Pruebas unitarias para el guardado de CSV y el escritor en streaming con confirmación atómica.
+"""
+import queue
+import threading
+import pytest
+from src.utils.data import CSVManager
+
+
+class TestCSVStreamWriter:
+    """
+    Pruebas unitarias para CSVStreamWriter y save_to_csv.
+    """
+
+    def test_save_normalizes_rows(self, tmp_path):
+        """
+        Prueba que save_to_csv pasa las claves a minúsculas, escribe None como vacío y no deja temporales.
+        """
+        path = tmp_path / 'raw' / 'rows.csv'
+        CSVManager.save_to_csv([{'ID': 1, 'name': None}, {'id': 2}], str(path), ['Id', 'Name'])
+
+        assert CSVManager.read_from_csv(str(path)) == [{'id': '1', 'name': ''}, {'id': '2', 'name': ''}]
+        assert [p.name for p in path.parent.iterdir()] == ['rows.csv']
+
+    def test_failure_keeps_previous_file(self, tmp_path):
+        """
+        Prueba que una excepción a mitad de escritura conserva intacto el fichero anterior.
+        """
+        path = str(tmp_path / 'rows.csv')
+        CSVManager.save_to_csv([{'id': 'old'}], path, ['id'])
+
+        def rows():
+            yield {'id': 'new'}
+            raise RuntimeError('crash')
+
+        with pytest.raises(RuntimeError):
+            with CSVManager.open_writer(path, ['id']) as writer:
+                writer.write_rows(rows())
+
+        assert CSVManager.read_from_csv(path) == [{'id': 'old'}]
+        assert [p.name for p in tmp_path.iterdir()] == ['rows.csv']
+
+    def test_consumes_rows_from_queue(self, tmp_path):
+        """
+        Prueba que el escritor vuelca las filas que varios productores dejan en una cola.
+        """
+        path = str(tmp_path / 'rows.csv')
+        rows = queue.Queue(maxsize=4)
+
+        def produce(start):
+            for i in range(start, start + 50):
+                rows.put({'id': i})
+
+        producers = [threading.Thread(target=produce, args=(start,)) for start in (0, 50)]
+        with CSVManager.open_writer(path, ['id'], flush_every=7) as writer:
+            for producer in producers:
+                producer.start()
+            consumer = threading.Thread(target=writer.consume, args=(rows,))
+            consumer.start()
+            for producer in producers:
+                producer.join()
+            rows.put(None)
+            consumer.join()
+
+        assert writer.rows_written == 100
+        assert sorted(int(r['id']) for r in CSVManager.read_from_csv(path)) == list(range(100))
@@ -0,0 +1,121 @@
+"""
+Pruebas del dataset simétrico para Machine Learning: equivalencia con el notebook, simetría y escritura en data/ml.
+"""
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from src.core.config import DataConfig
+from src.pipeline.dataset import MLDatasetWriter, SymmetricDatasetBuilder, load_ml_dataset, pa
+from scripts.benchmark_dataset import notebook_dataset
+
+
+def make_tables():
+    """Luchadores, eventos y peleas limpias, con un luchador desconocido, un empate y estadísticas por esquina."""
+    fighters = pd.DataFrame({
+        'fighter_id': ['a', 'b', 'c', 'd'],
+        'height': [180.0, 175.0, np.nan, 190.0],
+        'weight': [77.0, 70.0, 84.0, 93.0],
+        'reach': [185.0, np.nan, 188.0, 196.0],
+        'stance': ['Orthodox', 'Southpaw', None, 'Orthodox'],
+        'dob': ['1990-01-01', '1985-06-15', None, '1992-03-10'],
+    }).set_index('fighter_id')
+    events = pd.DataFrame({'event_id': ['e1', 'e2'], 'date': ['2020-01-01', '2021-01-01']})
+    fights = pd.DataFrame({
+        'event_id': ['e2', 'e1', 'e1', 'e2'],
+        'fight_id': ['x3', 'x1', 'x2', 'x4'],
+        'fight_order': [1, 2, 1, 2],
+        'red_id': ['a', 'a', 'c', 'd'],
+        'blue_id': ['b', 'b', 'd', 'z'],
+        'winner_id': ['b', 'a', None, 'd'],
+        'weight_class': ['Welterweight', 'Welterweight', 'Middleweight', None],
+        'str1': [10.0, 20.0, 5.0, 7.0],
+        'str2': [30.0, 15.0, 6.0, 8.0],
+    })
+    return fights, fighters, events
+
+
+class TestSymmetricDatasetBuilder:
+    """
+    Pruebas del constructor del dataset simétrico.
+    """
+
+    def test_rows_are_mirrored(self):
+        """
+        Prueba que la fila n + i es la fila i con las esquinas intercambiadas y el objetivo invertido.
+        """
+        fights, fighters, events = make_tables()
+        dataset = SymmetricDatasetBuilder(fight_corner_columns=[('str1', 'str2', 'str')]).build(fights, fighters, events)
+        values, columns = dataset.values, dataset.columns
+        n = len(dataset.fight_ids)
+        a = [j for j, c in enumerate(columns) if c.endswith('_A')]
+        b = [j for j, c in enumerate(columns) if c.endswith('_B')]
+
+        # En la misma cartelera, un fight_order mayor es una pelea anterior
+        assert dataset.fight_ids == ['x1', 'x4', 'x3'] and dataset.dates[0] == '2020-01-01'
+        assert values.shape == (6, len(columns))
+        np.testing.assert_array_equal(values[:n, 0], [1, 1, 0])
+        np.testing.assert_array_equal(values[n:, 0], 1 - values[:n, 0])
+        np.testing.assert_array_equal(values[n:][:, a], values[:n][:, b])
+        np.testing.assert_array_equal(values[n:][:, b], values[:n][:, a])
+        np.testing.assert_array_equal(values[:, columns.index('weight_class_code')], [0, np.nan, 0] * 2)
+        # El luchador desconocido 'z' no tiene atributos y la edad se calcula el día de la pelea
+        assert np.isnan(values[1, columns.index('height_B')])
+        assert values[0, columns.index('age_A')] == pytest.approx(30, abs=0.01)
+        assert dataset.categories['stance'] == ['Orthodox', 'Southpaw']
+
+    def test_matches_notebook_merges(self):
+        """
+        Prueba que los gathers dan los mismos valores que los merges y renombrados del notebook.
+        """
+        fights, fighters, events = make_tables()
+        decisive = fights[fights['winner_id'].isin(['a', 'b', 'd'])]
+        builder = SymmetricDatasetBuilder(fighter_columns=['height', 'weight', 'reach'], fighter_categories=(),
+                                          fight_categories=(), fight_corner_columns=[('str1', 'str2', 'str')],
+                                          age=False)
+        dataset = builder.build(decisive, fighters, events)
+        ordered = decisive.set_index('fight_id').loc[dataset.fight_ids].reset_index()
+        expected = notebook_dataset(ordered, fighters, ['height', 'weight', 'reach'])
+        np.testing.assert_array_equal(dataset.values, expected[dataset.columns].to_numpy(dtype=float))
+
+
+class TestMLDatasetWriter:
+    """
+    Pruebas de la escritura del dataset en data/ml.
+    """
+
+    def write(self, tmp_path, **options) -> DataConfig:
+        fights, fighters, events = make_tables()
+        data = DataConfig(base_dir=str(tmp_path), **options)
+        os.makedirs(data.processed_dir)
+        fights.to_csv(data.processed_fights_path, index=False)
+        fighters.to_csv(data.processed_fighters_path)
+        events.to_csv(data.processed_events_path, index=False)
+        os.makedirs(data.features_dir)
+        pd.DataFrame({'fight_id': ['x1', 'x3'], 'red_wins': [0, 1], 'blue_wins': [0, 0]}).to_csv(
+            data.prefight_features_path, index=False)
+        assert MLDatasetWriter(data).run() == 6
+        return data
+
+    def test_float32_npy_is_memory_mapped(self, tmp_path):
+        """
+        Prueba que el .npy float32 se abre mapeado en memoria e incluye las columnas previas de data/features.
+        """
+        data = self.write(tmp_path, ml_dtype='float32')
+        values, metadata = load_ml_dataset(data)
+
+        assert isinstance(values, np.memmap) and values.dtype == np.float32
+        assert metadata['rows'] == 6 and metadata['dtype'] == 'float32'
+        column = metadata['columns'].index('wins_A')
+        np.testing.assert_array_equal(values[:, column], [0, np.nan, 1, 0, np.nan, 0])
+        assert not os.path.exists(f"{data.ml_dataset_path}.tmp")
+
+    @pytest.mark.skipif(pa is None, reason="pyarrow not installed")
+    def test_parquet_output(self, tmp_path):
+        """
+        Prueba que la salida Parquet tiene las mismas columnas y valores que el .npy.
+        """
+        npy = load_ml_dataset(self.write(tmp_path / 'npy'))[0]
+        data = self.write(tmp_path / 'parquet', ml_format='parquet')
+        table = pd.read_parquet(data.ml_dataset_path)
+        np.testing.assert_array_equal(table.to_numpy(), npy)
@@ -0,0 +1,185 @@
+"""
+Pruebas del almacén de características previas a cada pelea: sin información futura y actualizable por incrementos.
+"""
+import math
+import os
+import random
+import pandas as pd
+import pytest
+from src.core.config import DataConfig
+from src.pipeline.features import (
+    FeatureState, FeatureStore, FighterState, chronological_fights, fight_seconds, prefight_features
+)
+
+
+def make_history(events: int = 12, fighters: int = 8, seed: int = 7):
+    """Eventos y peleas limpias aleatorias, con empates, sin resultado y peleas antiguas sin estadísticas."""
+    rng = random.Random(seed)
+    event_rows, fight_rows = [], []
+    for e in range(events):
+        event_rows.append({'event_id': f'e{e:02d}', 'date': f'2020-{e // 28 + 1:02d}-{e % 28 + 1:02d}'})
+        ids = rng.sample([f'f{i}' for i in range(fighters)], 4)
+        for order, (red, blue) in enumerate([(ids[0], ids[1]), (ids[2], ids[3])], start=1):
+            winner = rng.choice([red, blue, red, blue, None])
+            stats = {}
+            for corner in ('1', '2'):
+                attempted = rng.randint(10, 90)
+                td_attempted = rng.randint(0, 6)
+                stats.update({f'str{corner}_landed': rng.randint(0, attempted), f'str{corner}_attempted': attempted,
+                              f'td{corner}_landed': rng.randint(0, td_attempted),
+                              f'td{corner}_attempted': td_attempted,
+                              f'kd{corner}': rng.randint(0, 1), f'control_time{corner}': rng.randint(0, 300)})
+            if e < 2:
+                stats = {k: math.nan for k in stats}
+            fight_rows.append({
+                'event_id': f'e{e:02d}', 'fight_id': f'x{e:02d}{order}', 'fight_order': order,
+                'red_id': red, 'blue_id': blue, 'winner_id': winner,
+                'method': 'Decision Unanimous' if winner else rng.choice(['Draw', 'No Contest']),
+                'round': rng.randint(1, 3), 'time': float(rng.randint(10, 300)), 'time_format': '3 Rnd (5-5-5)',
+                **stats,
+            })
+    return pd.DataFrame(fight_rows), pd.DataFrame(event_rows)
+
+
+def naive_features(fights: pd.DataFrame, events: pd.DataFrame) -> pd.DataFrame:
+    """Referencia cuadrática: para cada pelea, rehace la carrera de cada luchador con sus peleas anteriores."""
+    ordered = chronological_fights(fights, events).reset_index(drop=True)
+    rows = []
+    for i in range(len(ordered)):
+        fight = ordered.iloc[[i]]
+        history = ordered.iloc[:i]
+        state = FeatureState()
+        for fighter_id in (fight['red_id'].iloc[0], fight['blue_id'].iloc[0]):
+            past = history[(history['red_id'] == fighter_id) | (history['blue_id'] == fighter_id)]
+            replay = FeatureState()
+            prefight_features(past, replay)
+            state.fighters[fighter_id] = replay.fighters.get(fighter_id, FighterState())
+        rows.append(prefight_features(fight, state))
+    return pd.concat(rows, ignore_index=True)
+
+
+def write_processed(data: DataConfig, fights: pd.DataFrame, events: pd.DataFrame):
+    os.makedirs(data.processed_dir, exist_ok=True)
+    fights.to_csv(data.processed_fights_path, index=False)
+    events.to_csv(data.processed_events_path, index=False)
+
+
+class TestPrefightFeatures:
+    """
+    Pruebas de las características previas a cada pelea.
+    """
+
+    def test_features_only_use_previous_fights(self):
+        """
+        Prueba que el recorrido único coincide con recalcular cada pelea a partir solo de las peleas anteriores.
+        """
+        fights, events = make_history()
+        single_pass = prefight_features(chronological_fights(fights, events), FeatureState())
+        pd.testing.assert_frame_equal(single_pass, naive_features(fights, events))
+
+    def test_accumulators(self):
+        """
+        Prueba el récord, las rachas, los días de descanso y las tasas tras una victoria, una derrota y un sin resultado.
+        """
+        fighter = FighterState()
+        fighter.record('win', 100, 600.0, (30, 60, 2, 4, 1, 120), (10, 40, 0, 2, 0, 0))
+        fighter.record('win', 200, math.nan, None, None)
+        fighter.record('nc', 250, 60.0, (5, 10, 0, 0, 0, 0), (5, 10, 1, 1, 0, 30))
+        features = dict(zip(['fights', 'wins', 'losses', 'draws', 'win_streak', 'loss_streak', 'days',
+                             'cage_minutes', 'slpm', 'sapm', 'acc', 'defense', 'td15', 'td_acc', 'td_def', 'kd',
+                             'control'], fighter.features(300)))
+
+        assert (features['fights'], features['wins'], features['win_streak'], features['days']) == (3, 2, 2, 50)
+        assert features['cage_minutes'] == 11
+        assert features['slpm'] == pytest.approx(35 / 11)
+        assert features['defense'] == pytest.approx(1 - 15 / 50)
+        assert features['td15'] == pytest.approx(2 / 11 * 15)
+        assert features['td_def'] == pytest.approx(1 - 1 / 3)
+        assert features['control'] == 60
+        fighter.record('loss', 300, 300.0, None, None)
+        assert (fighter.win_streak, fighter.loss_streak) == (0, 1)
+
+    def test_fight_seconds(self):
+        """
+        Prueba el tiempo disputado con formatos de asaltos iguales, distintos y sin límite.
+        """
+        assert fight_seconds(3, 90.0, '3 Rnd (5-5-5)') == 690
+        assert fight_seconds(2, 30.0, '1 Rnd + OT (12-3)') == 750
+        assert fight_seconds(3, 10.0, 'Unlimited Rnd (10)') == 1210
+        assert fight_seconds(1, 45.0, 'No Time Limit') == 45
+        assert math.isnan(fight_seconds(math.nan, 45.0, '3 Rnd (5-5-5)'))
+
+
+class TestFeatureStore:
+    """
+    Pruebas de la persistencia incremental del almacén.
+    """
+
+    def test_new_events_extend_the_store(self, tmp_path):
+        """
+        Prueba que añadir eventos nuevos solo recorre sus peleas y deja el mismo CSV que una reconstrucción completa.
+        """
+        fights, events = make_history()
+        data = DataConfig(base_dir=str(tmp_path))
+        write_processed(data, fights[fights['event_id'] < 'e08'], events)
+        assert FeatureStore(data).update() == 16
+
+        write_processed(data, fights, events)
+        assert FeatureStore(data).update() == 8
+        incremental = pd.read_csv(data.prefight_features_path)
+
+        assert FeatureStore(data).update(rebuild=True) == 24
+        pd.testing.assert_frame_equal(incremental, pd.read_csv(data.prefight_features_path))
+
+    def test_older_fights_trigger_a_rebuild(self, tmp_path):
+        """
+        Prueba que una pelea anterior a la última procesada, o un CSV que no corresponde al estado, reconstruyen todo.
+        """
+        fights, events = make_history()
+        data = DataConfig(base_dir=str(tmp_path))
+        write_processed(data, fights[fights['event_id'] != 'e03'], events)
+        FeatureStore(data).update()
+
+        write_processed(data, fights, events)
+        assert FeatureStore(data).update() == 24
+
+        with open(data.prefight_features_path, 'a', encoding='utf-8') as f:
+            f.write('truncated,row\n')
+        assert FeatureStore(data).update() == 24
+
+    def test_changed_fights_trigger_a_rebuild(self, tmp_path):
+        """
+        Prueba que cambiar o quitar una pelea ya procesada (p. ej. tras --reparse) reconstruye el almacén entero.
+        """
+        fights, events = make_history()
+        data = DataConfig(base_dir=str(tmp_path))
+        write_processed(data, fights, events)
+        assert FeatureStore(data).update() == 24
+        assert FeatureStore(data).update() == 0
+
+        fights.loc[fights['fight_id'] == 'x051', 'str1_landed'] += 1
+        write_processed(data, fights, events)
+        assert FeatureStore(data).update() == 24
+        expected = prefight_features(chronological_fights(fights, events), FeatureState())
+        assert pd.read_csv(data.prefight_features_path)['blue_sig_absorbed_per_min'].tolist() == pytest.approx(
+            expected['blue_sig_absorbed_per_min'].tolist(), nan_ok=True)
+
+        write_processed(data, fights[fights['fight_id'] != 'x051'], events)
+        assert FeatureStore(data).update() == 23
+
+    def test_new_missing_values_do_not_trigger_a_rebuild(self, tmp_path):
+        """
+        Prueba que una pelea nueva con `round` vacío, que hace que pd.read_csv lea la columna como float en vez de
+        int, no cambia la huella de las peleas ya procesadas: la actualización añade filas sin reconstruir.
+        """
+        fights, events = make_history()
+        data = DataConfig(base_dir=str(tmp_path))
+        write_processed(data, fights[fights['event_id'] < 'e08'], events)
+        assert FeatureStore(data).update() == 16
+        assert pd.read_csv(data.processed_fights_path)['round'].dtype.kind == 'i'
+
+        fights['round'] = fights['round'].astype(float)
+        fights.loc[fights['fight_id'] == 'x111', 'round'] = math.nan
+        write_processed(data, fights, events)
+        assert pd.read_csv(data.processed_fights_path)['round'].dtype.kind == 'f'
+        assert FeatureStore(data).update() == 8
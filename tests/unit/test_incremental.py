@@ -0,0 +1,159 @@
+"""
+Pruebas unitarias para el modo incremental del orquestador.
+Levantan un servidor local que imita ufcstats con un evento nuevo y comprueban que solo se
+descargan las páginas nuevas y que los resultados se fusionan con los CSV existentes.
+"""
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from src.core.constants import EVENT_FIELDS, FIGHT_FIELDS, FIGHTER_FIELDS, FIGHTER_DETAIL_FIELDS
+from src.pipeline.orchestrator import UFCScrapingOrchestrator
+from src.utils.data import CSVManager
+
+
+def events_listing(event_ids):
+    rows = ''.join(
+        f'<tr class="b-statistics__table-row"><td><i class="b-statistics__table-content">'
+        f'<a href="/event-details/{event_id}">Event {event_id}</a>'
+        f'<span class="b-statistics__date">January 01, 2025</span></i></td><td>Las Vegas</td></tr>'
+        for event_id in event_ids
+    )
+    return f'<table class="b-statistics__table-events"><tr><th>Name</th></tr>{rows}</table>'
+
+
+def event_page(fight_ids):
+    cells = '<td></td>' * 10
+    rows = ''.join(f'<tr data-link="/fight-details/{fight_id}">{cells}</tr>' for fight_id in fight_ids)
+    return f'<table class="b-fight-details__table"><tbody>{rows}</tbody></table>'
+
+
+FIGHT_PAGE = """
+<div class="b-fight-details__person">
+    <h3 class="b-fight-details__person-name"><a href="/fighter-details/{red}">Red</a></h3>
+</div>
+<div class="b-fight-details__person">
+    <h3 class="b-fight-details__person-name"><a href="/fighter-details/{blue}">Blue</a></h3>
+</div>
+"""
+
+FIGHTERS_LISTING = """
+<table class="b-statistics__table">
+<tr class="b-statistics__table-row"><td><a href="/fighter-details/old1">Old</a></td><td>One</td></tr>
+<tr class="b-statistics__table-row"><td><a href="/fighter-details/new1">New</a></td><td>One</td></tr>
+</table>
+"""
+
+FIGHTER_PAGE = '<div class="b-list__info-box"><ul><li><i>DOB:</i> Jan 01, 1990</li></ul></div>'
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    """Sirve un evento conocido (e1) y uno nuevo (e2) con una pelea entre old1 y new1."""
+
+    requests = []
+    base_url = None
+
+    def do_GET(self):
+        SiteHandler.requests.append(self.path)
+        path = self.path.split('?')[0]
+        if path == '/statistics/events/completed':
+            body = events_listing(['e2', 'e1'])
+        elif path == '/statistics/events/upcoming':
+            body = events_listing([])
+        elif path.startswith('/event-details/'):
+            body = event_page(['f2'] if path.endswith('e2') else ['f1'])
+        elif path.startswith('/fight-details/'):
+            body = FIGHT_PAGE.format(red='old1', blue='new1')
+        elif path == '/statistics/fighters':
+            body = FIGHTERS_LISTING if 'char=a' in self.path else ''
+        elif path.startswith('/fighter-details/'):
+            body = FIGHTER_PAGE
+        else:
+            self.send_error(404)
+            return
+        payload = f'<html><body>{body}</body></html>'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site(monkeypatch, tmp_path):
+    SiteHandler.requests = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SiteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    SiteHandler.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.chdir(tmp_path)
+    yield SiteHandler.requests
+    server.shutdown()
+    server.server_close()
+
+
+class TestIncrementalMode:
+    """
+    Pruebas del modo incremental del orquestador.
+    """
+
+    def test_only_new_event_is_scraped_and_merged(self, site):
+        """
+        Prueba que solo se descargan el evento nuevo, su pelea y sus luchadores, y que los CSV se fusionan por clave.
+        """
+        orchestrator = UFCScrapingOrchestrator(use_cache=False, requests_per_second=0, base_url=SiteHandler.base_url)
+        data = orchestrator.config.data
+        CSVManager.save_to_csv([{'event_id': 'e1', 'name': 'Event e1'}], data.events_path, EVENT_FIELDS)
+        CSVManager.save_to_csv([{'event_id': 'e1', 'fight_id': 'f1', 'fight_order': '1', 'method': 'SUB'}],
+                               data.fights_path, FIGHT_FIELDS)
+        CSVManager.save_to_csv([{'fighter_id': 'old1', 'first': 'Old', 'dob': 'Feb 02, 1980', 'slpm': '1.0'},
+                                {'fighter_id': 'gone', 'first': 'Retired', 'dob': 'Mar 03, 1970'}],
+                               data.fighters_path, FIGHTER_FIELDS + FIGHTER_DETAIL_FIELDS)
+
+        orchestrator.run_incremental()
+
+        fetched = [p for p in site if not p.startswith('/statistics/')]
+        assert sorted(fetched) == ['/event-details/e2', '/fight-details/f2',
+                                   '/fighter-details/new1', '/fighter-details/old1']
+
+        fights = CSVManager.read_from_csv(data.fights_path)
+        assert [f['fight_id'] for f in fights] == ['f1', 'f2']
+        assert fights[0]['method'] == 'SUB'
+        assert fights[1]['red_id'] == 'old1'
+
+        fighters = {f['fighter_id']: f for f in CSVManager.read_from_csv(data.fighters_path)}
+        assert set(fighters) == {'old1', 'gone', 'new1'}
+        assert fighters['old1']['dob'] == 'Jan 01, 1990'
+        assert fighters['old1']['slpm'] == '1.0'
+        assert fighters['gone']['dob'] == 'Mar 03, 1970'
+        assert fighters['new1']['dob'] == 'Jan 01, 1990'
+        assert {e['event_id'] for e in CSVManager.read_from_csv(data.events_path)} == {'e1', 'e2'}
+
+    def test_run_writes_metrics_report(self, site):
+        """
+        Prueba que la ejecución escribe el informe JSON y el fichero de Prometheus con métricas por fase.
+        """
+        orchestrator = UFCScrapingOrchestrator(use_cache=False, requests_per_second=0, base_url=SiteHandler.base_url)
+        data = orchestrator.config.data
+        CSVManager.save_to_csv([{'event_id': 'e1', 'name': 'Event e1'}], data.events_path, EVENT_FIELDS)
+        CSVManager.save_to_csv([{'event_id': 'e1', 'fight_id': 'f1', 'fight_order': '1'}],
+                               data.fights_path, FIGHT_FIELDS)
+        CSVManager.save_to_csv([{'fighter_id': 'old1'}], data.fighters_path, FIGHTER_FIELDS + FIGHTER_DETAIL_FIELDS)
+
+        orchestrator.run_incremental()
+
+        with open(data.metrics_report_path, encoding='utf-8') as f:
+            report = json.load(f)
+        assert report['run'] == 'run_incremental' and report['success'] is True
+        phases = report['phases']
+        assert phases['new_fights']['requests'] == 2
+        assert phases['new_fights']['pages_parsed'] >= 2
+        assert phases['new_fights']['rows_emitted'] >= 2
+        assert phases['fighters']['requests'] == len(site) - phases['events']['requests'] - 2
+        with open(data.metrics_textfile_path, encoding='utf-8') as f:
+            prom = f.read()
+        assert 'ufc_etl_run_success{run="run_incremental"} 1' in prom
+        assert 'ufc_etl_parse_seconds_count{page="fight_details",phase="new_fights"} 1' in prom
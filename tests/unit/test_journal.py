@@ -0,0 +1,124 @@
+"""
+Pruebas unitarias para el journal de checkpoints y la reanudación de fases con --resume.
+"""
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from src.core.config import Config
+from src.core.constants import FIGHT_FIELDS
+from src.scrapers.fights.scraper import FightDetailScraper
+from src.utils.data import CSVManager
+from src.utils.journal import CheckpointJournal
+
+
+FIGHT_PAGE = """
+<html><body>
+<div class="b-fight-details__person">
+    <h3 class="b-fight-details__person-name"><a href="/fighter-details/red{fight_id}">Red Fighter</a></h3>
+</div>
+<div class="b-fight-details__person">
+    <h3 class="b-fight-details__person-name"><a href="/fighter-details/blue{fight_id}">Blue Fighter</a></h3>
+</div>
+</body></html>
+"""
+
+
+class FightPageHandler(BaseHTTPRequestHandler):
+    """Sirve páginas de pelea y registra las rutas solicitadas."""
+
+    requests = []
+    base_url = None
+
+    def do_GET(self):
+        FightPageHandler.requests.append(self.path)
+        payload = FIGHT_PAGE.format(fight_id=self.path.rsplit('/', 1)[-1]).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fight_server(monkeypatch, tmp_path):
+    FightPageHandler.requests = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FightPageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    FightPageHandler.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.chdir(tmp_path)
+    yield FightPageHandler.requests
+    server.shutdown()
+    server.server_close()
+
+
+class TestCheckpointJournal:
+    """
+    Pruebas unitarias para el journal de checkpoints.
+    """
+
+    def test_survives_truncated_last_line(self, tmp_path):
+        """
+        Prueba que las unidades registradas se recuperan tras una interrupción a mitad de escritura.
+        """
+        journal = CheckpointJournal(str(tmp_path))
+        journal.start()
+        journal.record('fight', 'f1', {'fight_id': 'f1', 'method': 'KO/TKO'})
+        journal.record('fight', 'f2', {'fight_id': 'f2'})
+        journal.close()
+        with open(tmp_path / 'fight.jsonl', 'a', encoding='utf-8') as f:
+            f.write('{"key": "f3", "payl')
+
+        resumed = CheckpointJournal(str(tmp_path))
+        resumed.start(resume=True)
+        assert resumed.completed('fight') == {'f1': {'fight_id': 'f1', 'method': 'KO/TKO'}, 'f2': {'fight_id': 'f2'}}
+        assert resumed.completed('fighter') == {}
+
+    def test_fresh_start_discards_previous_run(self, tmp_path):
+        """
+        Prueba que una ejecución sin --resume descarta los checkpoints anteriores y que clear los elimina.
+        """
+        journal = CheckpointJournal(str(tmp_path))
+        journal.start()
+        journal.record('event', 'e1', [])
+        journal.start()
+        assert journal.completed('event') == {}
+        journal.record('event', 'e2', [])
+        journal.clear()
+        journal.record('event', 'e3', [])
+        assert not list(tmp_path.iterdir())
+
+
+class TestResume:
+    """
+    Pruebas de la reanudación de un scraper de detalles a partir del journal, escribiendo las filas en streaming.
+    """
+
+    def test_resumed_scrape_only_fetches_pending_fights(self, fight_server):
+        """
+        Prueba que las peleas del journal no se descargan de nuevo y que sus filas se escriben en su posición.
+        """
+        config = Config(use_cache=False, requests_per_second=0, base_url=FightPageHandler.base_url)
+        journal = CheckpointJournal(config.data.checkpoints_dir)
+        journal.start()
+        journal.record('fight', 'f1', {'event_id': 'evt', 'fight_id': 'f1', 'fight_order': 1, 'red_id': 'journaled'})
+        journal.close()
+
+        journal.start(resume=True)
+        scraper = FightDetailScraper(config, journal=journal)
+        with CSVManager.open_writer(config.data.fights_path, FIGHT_FIELDS) as sink:
+            fights = scraper.scrape([
+                {'event_id': 'evt', 'fight_id': 'f1', 'fight_order': 1},
+                {'event_id': 'evt', 'fight_id': 'f2', 'fight_order': 2},
+            ], sink=sink)
+
+        assert fight_server == ['/fight-details/f2']
+        assert scraper.ledger.is_done('fight', 'f1')
+        assert set(journal.completed('fight')) == {'f1', 'f2'}
+        # Con un sink las filas no se retienen: se escriben en el orden del índice, restauradas incluidas
+        assert fights == []
+        rows = CSVManager.read_from_csv(config.data.fights_path)
+        assert [(r['fight_id'], r['red_id']) for r in rows] == [('f1', 'journaled'), ('f2', 'redf2')]
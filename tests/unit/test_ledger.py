@@ -0,0 +1,123 @@
+"""
+Pruebas unitarias para el ledger de descargas y la fase 5 incremental del orquestador.
+"""
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from src.core.constants import FIGHT_FIELDS
+from src.pipeline.orchestrator import UFCScrapingOrchestrator
+from src.utils.data import CSVManager
+from src.utils.ledger import FetchLedger
+
+
+FIGHT_PAGE = """
+<html><body>
+<div class="b-fight-details__person">
+    <h3 class="b-fight-details__person-name"><a href="/fighter-details/red{fight_id}">Red Fighter</a></h3>
+</div>
+<div class="b-fight-details__person">
+    <h3 class="b-fight-details__person-name"><a href="/fighter-details/blue{fight_id}">Blue Fighter</a></h3>
+</div>
+</body></html>
+"""
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    """Sirve páginas de pelea y cuenta las peticiones recibidas por ruta."""
+
+    requests = []
+    base_url = None
+
+    def do_GET(self):
+        CountingHandler.requests.append(self.path)
+        payload = FIGHT_PAGE.format(fight_id=self.path.rsplit('/', 1)[-1]).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def counting_server(monkeypatch, tmp_path):
+    CountingHandler.requests = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    CountingHandler.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.chdir(tmp_path)
+    yield CountingHandler.requests
+    server.shutdown()
+    server.server_close()
+
+
+class TestFetchLedger:
+    """
+    Pruebas unitarias para el ledger de descargas completadas.
+    """
+
+    def test_missing_keeps_order(self):
+        """
+        Prueba que missing devuelve solo las entidades no completadas, en el orden original.
+        """
+        ledger = FetchLedger()
+        ledger.mark('fight', 'b')
+        ledger.mark('fighter', 'c')
+        assert ledger.missing('fight', ['a', 'b', 'c']) == ['a', 'c']
+        assert ledger.is_done('fighter', 'c')
+        assert len(ledger) == 2
+
+
+class TestIncrementalFightDetails:
+    """
+    Pruebas de la fase 5 del orquestador apoyada en el ledger.
+    """
+
+    def test_phase_five_only_fetches_missing_fights(self, counting_server):
+        """
+        Prueba que la fase 5 solo descarga las peleas sin detalles y conserva el resto de filas intactas.
+        """
+        orchestrator = UFCScrapingOrchestrator(use_cache=False, requests_per_second=0, base_url=CountingHandler.base_url)
+        fights = [
+            {'event_id': 'evt', 'fight_id': 'done', 'fight_order': '1', 'red_id': 'kept', 'method': 'KO/TKO'},
+            {'event_id': 'evt', 'fight_id': 'todo', 'fight_order': '2'},
+        ]
+        CSVManager.save_to_csv(fights, orchestrator.config.data.fights_path, FIGHT_FIELDS)
+        orchestrator.ledger.mark('fight', 'done')
+
+        orchestrator._scrape_fight_details()
+
+        assert counting_server == ['/fight-details/todo']
+        rows = {f['fight_id']: f for f in CSVManager.read_from_csv(orchestrator.config.data.fights_path)}
+        assert rows['done']['red_id'] == 'kept'
+        assert rows['done']['method'] == 'KO/TKO'
+        assert rows['todo']['red_id'] == 'redtodo'
+        assert orchestrator.ledger.is_done('fight', 'todo')
+
+        orchestrator._scrape_fight_details()
+        assert counting_server == ['/fight-details/todo']
+
+    def test_phase_five_upserts_into_sqlite_store(self, counting_server):
+        """
+        Prueba que con almacenamiento SQLite la fase 5 solo actualiza la fila descargada y exporta el CSV.
+        """
+        orchestrator = UFCScrapingOrchestrator(use_cache=False, requests_per_second=0, base_url=CountingHandler.base_url, storage='sqlite')
+        fights = [
+            {'event_id': 'evt', 'fight_id': 'done', 'fight_order': '1', 'red_id': 'kept', 'method': 'KO/TKO'},
+            {'event_id': 'evt', 'fight_id': 'todo', 'fight_order': '2'},
+        ]
+        CSVManager.save_to_csv(fights, orchestrator.config.data.fights_path, FIGHT_FIELDS)
+        orchestrator._sync_store(['fights'])
+        orchestrator.ledger.mark('fight', 'done')
+
+        orchestrator._scrape_fight_details()
+
+        assert counting_server == ['/fight-details/todo']
+        stored = {f['fight_id']: f for f in orchestrator.store.fetch('fights')}
+        assert stored['done']['method'] == 'KO/TKO'
+        assert stored['todo']['red_id'] == 'redtodo'
+        rows = CSVManager.read_from_csv(orchestrator.config.data.fights_path)
+        assert [(r['fight_id'], r['red_id']) for r in rows] == [('done', 'kept'), ('todo', 'redtodo')]
@@ -0,0 +1,120 @@
+"""
+Pruebas unitarias para el registro de métricas y su exportación.
+"""
+import json
+import threading
+from src.utils.concurrent import imap
+from src.utils.metrics import MetricsRegistry, call_timed, observe_parse, get_metrics, timed
+
+
+class TestMetricsRegistry:
+    """
+    Pruebas unitarias para MetricsRegistry.
+    """
+
+    def test_phase_labels_and_summary(self, tmp_path):
+        """
+        Prueba que las métricas registradas dentro de una fase llevan su etiqueta y se resumen por fase.
+        """
+        metrics = MetricsRegistry()
+        with metrics.phase('fight_details'):
+            metrics.record_request(0.2, 200, nbytes=1000)
+            metrics.record_request(0.3, 429)
+            metrics.record_request(5.0, None, timed_out=True)
+            metrics.observe('parse_seconds', 0.004, page='fight_details')
+            metrics.inc('rows_emitted_total', 2, table='raw_fights', sink='csv')
+            metrics.set_max('queue_depth_max', 3, queue='parse_handoff')
+            metrics.set_max('queue_depth_max', 1, queue='parse_handoff')
+        metrics.record_request(0.1, 200, nbytes=10)
+
+        summary = metrics.phase_summary()
+        assert summary['fight_details']['requests'] == 3
+        assert summary['fight_details']['bytes'] == 1000
+        assert summary['fight_details']['network_seconds'] == 5.5
+        assert summary['fight_details']['pages_parsed'] == 1
+        assert summary['fight_details']['rows_emitted'] == 2
+        assert summary['none']['requests'] == 1
+
+        path = str(tmp_path / 'metrics' / 'run_report.json')
+        metrics.write_json(path, run='test')
+        report = json.loads(open(path).read())
+        assert report['run'] == 'test'
+        gauges = {(g['name'], g['labels'].get('queue')): g['value'] for g in report['gauges']}
+        assert gauges[('queue_depth_max', 'parse_handoff')] == 3
+
+    def test_prometheus_text_format(self, tmp_path):
+        """
+        Prueba el formato de texto de Prometheus: HELP/TYPE, etiquetas ordenadas y buckets acumulativos.
+        """
+        metrics = MetricsRegistry()
+        with metrics.phase('fighters'):
+            for seconds in (0.01, 0.2, 0.7, 60):
+                metrics.record_request(seconds, 200, nbytes=5)
+            metrics.inc('rows_emitted_total', 1, table='say "hi"', sink='csv')
+
+        text = metrics.to_prometheus()
+        assert '# TYPE ufc_etl_http_requests_total counter' in text
+        assert 'ufc_etl_http_requests_total{phase="fighters",status="200"} 4' in text
+        assert 'ufc_etl_http_response_bytes_total{phase="fighters"} 20' in text
+        assert '# TYPE ufc_etl_http_request_seconds histogram' in text
+        assert 'ufc_etl_http_request_seconds_bucket{le="0.05",phase="fighters"} 1' in text
+        assert 'ufc_etl_http_request_seconds_bucket{le="1.0",phase="fighters"} 3' in text
+        assert 'ufc_etl_http_request_seconds_bucket{le="+Inf",phase="fighters"} 4' in text
+        assert 'ufc_etl_http_request_seconds_count{phase="fighters"} 4' in text
+        assert 'table="say \\"hi\\""' in text
+        assert text.count('# TYPE ufc_etl_http_request_seconds ') == 1
+
+        path = str(tmp_path / 'ufc_etl.prom')
+        metrics.write_prometheus(path)
+        assert open(path).read() == text
+        # El temporal de la escritura atómica no debe parecer un .prom al textfile collector
+        assert [p.name for p in tmp_path.iterdir()] == ['ufc_etl.prom']
+
+    def test_parse_timing_in_and_out_of_process(self):
+        """
+        Prueba el decorador de tiempos de parseo y el registro de parseos medidos en otro proceso.
+        """
+        metrics = get_metrics()
+        metrics.reset()
+
+        @timed('parse_seconds', page='fight_details')
+        def parse_fight_details(html):
+            return len(html)
+
+        assert parse_fight_details('abc') == 3
+        result, seconds = call_timed(parse_fight_details, 'abcd')
+        observe_parse(parse_fight_details, seconds)
+        assert result == 4
+
+        def parse_event_page(page):
+            return page
+        observe_parse(parse_event_page, 0.5)
+
+        histograms = {h['labels']['page']: h for h in metrics.snapshot()['histograms']}
+        assert histograms['fight_details']['count'] == 3
+        assert histograms['event_page']['sum'] == 0.5
+        metrics.reset()
+
+    def test_phase_is_per_thread_and_propagated_to_pools(self):
+        """
+        Prueba que la fase de un hilo no etiqueta las métricas de otro y que los hilos de imap heredan la del suyo.
+        """
+        metrics = MetricsRegistry()
+        entered, release = threading.Event(), threading.Event()
+
+        def other_phase():
+            with metrics.phase('fighters'):
+                entered.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=other_phase)
+        thread.start()
+        entered.wait(5)
+        metrics.inc('outside_total')
+        with metrics.phase('fight_details'):
+            list(imap(lambda item: metrics.inc('worker_total'), range(4), max_workers=2))
+        release.set()
+        thread.join()
+
+        counters = {(c['name'], c['labels'].get('phase')): c['value'] for c in metrics.snapshot()['counters']}
+        assert counters == {('outside_total', None): 1, ('worker_total', 'fight_details'): 4}
@@ -0,0 +1,89 @@
+"""
+Pruebas unitarias para los registros tipados de src/models.
+"""
+import os
+import sys
+from datetime import date
+import pytest
+from src.core.constants import FIGHT_FIELDS, FIGHTER_FIELDS, FIGHTER_DETAIL_FIELDS
+from src.models.event import Event
+from src.models.fight import Fight
+from src.models.fighter import Fighter
+from src.scrapers.fights.parser import FightParser
+from src.utils.data import CSVManager
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'pages')
+
+
+def completed_fight_row():
+    """Fila de pelea como la que produce el scraper a partir de una página de detalle del corpus."""
+    with open(os.path.join(PAGES_DIR, 'fight_details_completed.html'), encoding='utf-8') as f:
+        details = FightParser().parse_fight_details(f.read())
+    return {**details, 'event_id': 'evt', 'fight_id': 'fgt', 'fight_order': 3}
+
+
+class TestRecords:
+    """
+    Pruebas unitarias para Fight, Fighter y Event.
+    """
+
+    def test_fight_stats_are_typed(self):
+        """
+        Prueba que los pares acertados/intentados, los tiempos y los contadores se convierten a números.
+        """
+        row = completed_fight_row()
+        fight = Fight.from_row(row)
+
+        landed, attempted = (int(v) for v in row['str1'].split(' of '))
+        assert (fight.str1_landed, fight.str1_attempted) == (landed, attempted)
+        minutes, seconds = row['control_time1'].split(':')
+        assert fight.control_time1 == int(minutes) * 60 + int(seconds)
+        assert fight.kd1 == int(row['kd1']) and fight.round == int(row['round'])
+        assert fight.fight_order == 3
+        assert not hasattr(fight, '__dict__')
+
+    def test_round_trip_to_csv_format(self, tmp_path):
+        """
+        Prueba que to_row() reproduce las columnas de la fila cruda y que los escritores aceptan registros.
+        """
+        row = completed_fight_row()
+        fight = Fight.from_row(row)
+
+        assert list(fight.to_row()) == FIGHT_FIELDS
+        for column in ('str1', 'sig_head2', 'control_time1', 'time', 'method', 'bonus'):
+            assert fight[column] == row[column]
+        assert {**fight}['fight_id'] == 'fgt'
+
+        path = str(tmp_path / 'raw_fights.csv')
+        CSVManager.save_to_csv([fight], path, FIGHT_FIELDS)
+        assert Fight.from_row(CSVManager.read_from_csv(path)[0]) == fight
+
+    def test_fighter_and_event_units(self):
+        """
+        Prueba medidas, porcentajes, fechas y valores ausentes de luchadores y eventos.
+        """
+        fighter = Fighter.from_row({'fighter_id': 'a', 'height': '5\' 11"', 'weight': '155 lbs.', 'reach': '72.0"',
+                                    'wins': '27', 'belt': 'False', 'dob': 'Jul 07, 1987', 'str_acc': '62%',
+                                    'slpm': '5.13', 'td_def': '--', 'stance': ''})
+        assert (fighter.height, fighter.weight, fighter.reach) == (71, 155, 72.0)
+        assert fighter.wins == 27 and fighter.belt is False
+        assert fighter.dob == date(1987, 7, 7)
+        assert fighter.str_acc == pytest.approx(0.62) and fighter.slpm == 5.13
+        assert fighter.td_def is None and fighter.stance is None
+        assert fighter.to_row()['height'] == '5\' 11"' and fighter['str_acc'] == '62%'
+        assert list(fighter) == FIGHTER_FIELDS + FIGHTER_DETAIL_FIELDS
+
+        event = Event.from_row({'event_id': 'e', 'name': 'UFC 322', 'date': 'November 15, 2025'})
+        assert event.date == date(2025, 11, 15)
+        assert event.to_row() == {'event_id': 'e', 'name': 'UFC 322', 'date': 'November 15, 2025', 'location': None}
+
+    def test_fight_is_smaller_than_dict_row(self):
+        """
+        Prueba que un registro ocupa menos memoria que la fila equivalente de cadenas.
+        """
+        row = completed_fight_row()
+        fight = Fight.from_row(row)
+        dict_size = sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row.values())
+        record_size = sys.getsizeof(fight) + sum(sys.getsizeof(getattr(fight, s)) for s in Fight.__slots__
+                                                 if isinstance(getattr(fight, s), (str, list)))
+        assert record_size * 2 < dict_size
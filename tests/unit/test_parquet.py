@@ -0,0 +1,82 @@
+"""
+Pruebas unitarias para la salida Parquet tipada.
+"""
+import os
+import pytest
+from src.core.constants import FIGHT_FIELDS, FIGHTER_FIELDS, FIGHTER_DETAIL_FIELDS
+from src.models.fight import Fight
+from src.scrapers.fights.parser import FightParser
+from src.utils.data import CSVManager
+from src.utils.parquet import ParquetManager
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'pages')
+
+
+def fight_rows(copies: int):
+    """Filas de peleas como las del pipeline, a partir de las páginas de detalle del corpus."""
+    parser = FightParser()
+    rows = []
+    for page in ('fight_details_completed.html', 'fight_details_no_contest.html'):
+        with open(os.path.join(PAGES_DIR, page), encoding='utf-8') as f:
+            details = parser.parse_fight_details(f.read())
+        for i in range(copies):
+            rows.append({**details, 'fight_id': f"{page[:12]}{i:05d}", 'fight_order': i % 14 + 1})
+    return rows
+
+
+class TestParquetManager:
+    """
+    Pruebas unitarias para ParquetManager.
+    """
+
+    def test_fights_from_csv_are_typed(self, tmp_path):
+        """
+        Prueba que los CSV de peleas se convierten con enteros, pares separados, segundos, listas y diccionarios.
+        """
+        csv_path = str(tmp_path / 'raw_fights.csv')
+        CSVManager.save_to_csv(fight_rows(500), csv_path, FIGHT_FIELDS)
+
+        parquet_path = ParquetManager.csv_to_parquet(csv_path, FIGHT_FIELDS)
+        df = ParquetManager.read_from_parquet(parquet_path)
+
+        assert parquet_path == str(tmp_path / 'raw_fights.parquet')
+        assert list(df.columns) == list(Fight.slots_for(Fight.COLUMNS))
+        assert str(df['kd1'].dtype) == 'int32'
+        assert str(df['method'].dtype) == 'category'
+        assert str(df['referee'].dtype) == 'category'
+        assert list(df.loc[0, 'bonus']) == ['BELT', 'PERF']
+        # Los pares se separan en acertados e intentados y los tiempos se guardan en segundos
+        assert (df.loc[0, 'str1_landed'], df.loc[0, 'str1_attempted']) == (16, 19)
+        assert str(df['str1_landed'].dtype) == 'int32'
+        assert df.loc[0, 'time'] == Fight.from_row(fight_rows(1)[0]).time
+        assert str(df['control_time1'].dtype) == 'int32'
+        assert os.path.getsize(parquet_path) * 3 < os.path.getsize(csv_path)
+
+    def test_fighters_missing_values_become_nulls(self, tmp_path):
+        """
+        Prueba porcentajes, fechas, booleanos, medidas y valores vacíos en la tabla de luchadores.
+        """
+        path = str(tmp_path / 'raw_fighters.parquet')
+        fighters = [
+            {'fighter_id': 'a', 'wins': '13', 'belt': True, 'dob': 'Jul 07, 1987', 'str_acc': '62%', 'slpm': '5.13',
+             'height': '5\' 11"', 'weight': '155 lbs.', 'reach': '72.0"'},
+            {'fighter_id': 'b', 'wins': '', 'belt': 'False', 'dob': '--', 'str_acc': None, 'slpm': 'n/a',
+             'height': '--', 'weight': '', 'reach': '--'},
+        ]
+        ParquetManager.save_to_parquet(fighters, path, FIGHTER_FIELDS + FIGHTER_DETAIL_FIELDS)
+
+        table = pq.read_table(path)
+        assert table.schema.field('wins').type == pa.int32()
+        assert table.schema.field('dob').type == pa.date32()
+        rows = table.to_pylist()
+        assert rows[0]['str_acc'] == pytest.approx(0.62)
+        assert rows[0]['dob'].isoformat() == '1987-07-07'
+        assert rows[0]['belt'] is True and rows[1]['belt'] is False
+        assert (rows[0]['height'], rows[0]['weight'], rows[0]['reach']) == (71, 155, 72.0)
+        assert table.schema.field('height').type == pa.int32()
+        assert rows[1]['height'] is None and rows[1]['weight'] is None and rows[1]['reach'] is None
+        assert rows[1]['wins'] is None and rows[1]['dob'] is None and rows[1]['slpm'] is None
+        assert rows[1]['nickname'] is None
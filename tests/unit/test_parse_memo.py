@@ -0,0 +1,119 @@
+"""
+Pruebas de la memoria de filas parseadas: las páginas de detalle sin cambios no se vuelven a parsear.
+"""
+import pytest
+from scripts.stub_server import SyntheticSite, StubServer
+from src.core.config import Config
+from src.scrapers.fighters.lxml_parser import LxmlFighterParser
+from src.scrapers.fighters.parser import FighterParser
+from src.scrapers.fighters.scraper import FighterScraper, FighterDetailScraper
+from src.utils.parse_memo import ParseMemo, _parser_modules, get_shared_parse_memo, parser_fingerprint
+
+
+class ChangingSite(SyntheticSite):
+    """Sitio sintético en el que se puede modificar la página de un luchador entre ejecuciones."""
+
+    changed = set()
+
+    def page(self, path, query):
+        body = super().page(path, query)
+        if body is not None and path.rsplit('/', 1)[-1] in self.changed:
+            body = body.replace('</body>', '<!-- updated --></body>')
+        return body
+
+
+class CountingParser(FighterParser):
+    """Parser BeautifulSoup que cuenta las páginas de luchadores que parsea."""
+
+    calls = 0
+
+    def parse_fighter_details(self, html):
+        CountingParser.calls += 1
+        return super().parse_fighter_details(html)
+
+
+@pytest.fixture
+def site(stub_server):
+    ChangingSite.changed = set()
+    CountingParser.calls = 0
+    return stub_server(ChangingSite(events=1, fights_per_event=2, fighters=12, upcoming=0))
+
+
+def scrape_details(server: StubServer, **kwargs) -> list:
+    """Extrae el listado y los detalles de los luchadores con el parser que cuenta sus llamadas."""
+    config = Config(use_cache=False, archive=False, requests_per_second=0, base_url=server.base_url, **kwargs)
+    config.scraping.delay_seconds = 0
+    fighters = FighterScraper(config).scrape()
+    scraper = FighterDetailScraper(config)
+    scraper.parser = CountingParser()
+    return sorted(scraper.scrape(fighters), key=lambda f: f['fighter_id'])
+
+
+class TestParseMemo:
+    """
+    Pruebas de la memoria de filas parseadas.
+    """
+
+    def test_lookup_requires_same_hash_and_parser(self, tmp_path):
+        """
+        Prueba que una fila solo se reutiliza con el mismo hash de página y la misma huella de parser.
+        """
+        memo = ParseMemo(str(tmp_path / 'parsed.sqlite'))
+        bs4, lxml = parser_fingerprint(FighterParser), parser_fingerprint(LxmlFighterParser)
+        assert memo.lookup('fighter', 'f1', 'h1', bs4) is None
+        memo.remember('fighter', 'f1', 'h1', bs4, {'height': "5' 11\"", 'dob': None})
+
+        assert memo.lookup('fighter', 'f1', 'h1', bs4) == {'height': "5' 11\"", 'dob': None}
+        assert memo.lookup('fighter', 'f1', 'h2', bs4) is None
+        assert memo.lookup('fighter', 'f1', 'h1', lxml) is None
+        assert bs4 != lxml
+        assert memo.stats()['hits'] == 1
+        memo.close()
+
+    def test_fingerprint_covers_imported_helpers(self, tmp_path, monkeypatch):
+        """
+        Prueba que la huella cambia al modificar un helper importado por el parser, no solo su jerarquía de clases.
+        """
+        package = tmp_path / 'memo_probe'
+        package.mkdir()
+        (package / '__init__.py').write_text('')
+        (package / 'helpers.py').write_text('def clean(text):\n    return text.strip()\n')
+        (package / 'parser.py').write_text(
+            'from .helpers import clean\n\n\nclass ProbeParser:\n    def parse(self, text):\n        return clean(text)\n'
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        from memo_probe.parser import ProbeParser
+        before = parser_fingerprint(ProbeParser)
+
+        (package / 'helpers.py').write_text('def clean(text):\n    return text.strip().lower()\n')
+        parser_fingerprint.cache_clear()
+        assert parser_fingerprint(ProbeParser) != before
+        assert 'src.utils.http' in [m.__name__ for m in _parser_modules(FighterParser)]
+
+    def test_unchanged_pages_skip_the_parser(self, site):
+        """
+        Prueba que una segunda ejecución solo parsea las páginas modificadas y produce las mismas filas.
+        """
+        first = scrape_details(site)
+        assert CountingParser.calls == 12
+
+        changed = first[0]['fighter_id']
+        ChangingSite.changed = {changed}
+        CountingParser.calls = 0
+        second = scrape_details(site)
+
+        assert CountingParser.calls == 1
+        assert second == first
+
+    def test_process_parsing_reuses_rows(self, site):
+        """
+        Prueba que con el parseo en el pool de procesos las páginas sin cambios no llegan al pool.
+        """
+        first = scrape_details(site, process_parsing=True, parse_workers=2)
+        memo = ParseMemo('data/raw/parsed.sqlite')
+        assert len(memo) == 12
+        memo.close()
+
+        second = scrape_details(site, process_parsing=True, parse_workers=2)
+        assert second == first
+        assert get_shared_parse_memo('data/raw/parsed.sqlite').stats()['hits'] == 12
@@ -0,0 +1,113 @@
+"""
+Pruebas de paridad entre los backends de parseo BeautifulSoup y lxml.
+Usan el corpus de páginas de tests/fixtures/pages (reconstrucciones de las plantillas de ufcstats)
+y exigen que ambos backends produzcan exactamente los mismos diccionarios.
+"""
+import json
+import os
+import pytest
+from src.scrapers.fighters.parser import FighterParser
+from src.scrapers.fighters.lxml_parser import LxmlFighterParser
+from src.scrapers.events.parser import EventParser
+from src.scrapers.events.lxml_parser import LxmlEventParser
+from src.scrapers.fights.parser import FightParser
+from src.scrapers.fights.lxml_parser import LxmlFightParser
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'pages')
+
+FIGHT_PAGES = ['fight_details_completed.html', 'fight_details_upcoming.html', 'fight_details_no_contest.html']
+
+
+def read_page(name: str) -> bytes:
+    with open(os.path.join(PAGES_DIR, name), 'rb') as f:
+        return f.read()
+
+
+def assert_identical(expected, actual):
+    """Compara igualdad y serialización (incluido el orden de las claves)."""
+    assert actual == expected
+    assert json.dumps(actual, ensure_ascii=False) == json.dumps(expected, ensure_ascii=False)
+
+
+class TestParserParity:
+    """
+    Pruebas de equivalencia de los parsers lxml frente a los parsers BeautifulSoup.
+    """
+
+    @pytest.mark.parametrize('page', FIGHT_PAGES)
+    def test_fight_details(self, page):
+        """
+        Prueba los detalles de peleas completadas, próximas y sin resultado (NC).
+        """
+        html = read_page(page).decode('utf-8')
+        expected = FightParser().parse_fight_details(html)
+        assert expected['red_id']
+        assert_identical(expected, LxmlFightParser().parse_fight_details(html))
+
+    def test_event_fights(self):
+        """
+        Prueba el índice de peleas de una página de evento.
+        """
+        bs4_parser, lxml_parser = FightParser(), LxmlFightParser()
+        page = read_page('event_details.html')
+        expected = bs4_parser.parse_event_fights(bs4_parser.load(page), 'evt')
+        assert len(expected) == 13
+        assert_identical(expected, lxml_parser.parse_event_fights(lxml_parser.load(page), 'evt'))
+
+    def test_fighters_table(self):
+        """
+        Prueba el listado de luchadores por letra, con valores vacíos, acentos y cinturones.
+        """
+        bs4_parser, lxml_parser = FighterParser(), LxmlFighterParser()
+        page = read_page('fighters_listing.html')
+        expected = bs4_parser.parse_fighters_table(bs4_parser.load(page))
+        assert len(expected) == 140
+        assert_identical(expected, lxml_parser.parse_fighters_table(lxml_parser.load(page)))
+
+    def test_fighter_details(self):
+        """
+        Prueba la fecha de nacimiento y las estadísticas de carrera de un luchador.
+        """
+        html = read_page('fighter_details.html').decode('utf-8')
+        expected = FighterParser().parse_fighter_details(html)
+        assert expected['dob'] == 'Jul 07, 1987'
+        assert_identical(expected, LxmlFighterParser().parse_fighter_details(html))
+
+    def test_events_table(self):
+        """
+        Prueba el listado de eventos, omitiendo la fila destacada del próximo evento.
+        """
+        bs4_parser, lxml_parser = EventParser(), LxmlEventParser()
+        page = read_page('events_listing.html')
+        expected = bs4_parser.parse_events_table(bs4_parser.load(page), 'completed')
+        assert len(expected) == 159
+        assert_identical(expected, lxml_parser.parse_events_table(lxml_parser.load(page), 'completed'))
+
+    @pytest.mark.parametrize('html', [
+        '',
+        '<html><body></body></html>',
+        '<html><body><table><tbody><tr><td>x</td></tr></tbody></table></body></html>',
+        # Comentarios y scripts no forman parte del texto extraído
+        '<div class="b-fight-details__content"><p class="b-fight-details__text">'
+        '<i class="b-fight-details__text-item_first"><i class="b-fight-details__label">Method:</i>'
+        '<!-- ko --><i>KO/<script>var x;</script>TKO</i></i>'
+        '<i class="b-fight-details__text-item"><i class="b-fight-details__label">Referee:</i>Herb\r\n Dean</i>'
+        '</p></div><table></table>',
+    ])
+    def test_fight_details_edge_cases(self, html):
+        """
+        Prueba documentos vacíos, incompletos y con comentarios o scripts intercalados.
+        """
+        assert_identical(FightParser().parse_fight_details(html), LxmlFightParser().parse_fight_details(html))
+
+    def test_bytes_are_decoded_like_beautifulsoup(self):
+        """
+        Prueba que el backend lxml decodifica bytes latin-1 igual que BeautifulSoup.
+        """
+        html = ('<html><head><meta charset="iso-8859-1"></head><body>'
+                '<div class="b-list__info-box"><ul><li><i>DOB:</i> Procházka, 1992</li></ul></div>'
+                '</body></html>').encode('iso-8859-1')
+        bs4_parser, lxml_parser = FighterParser(), LxmlFighterParser()
+        expected = bs4_parser.parse_fighter_details(str(bs4_parser.load(html)))
+        assert expected['dob'] == 'Procházka, 1992'
+        assert_identical(expected, lxml_parser.parse_fighter_details(html))
@@ -0,0 +1,63 @@
+"""
+Pruebas unitarias para el pipeline de descarga con hilos y parseo en un pool de procesos.
+"""
+import threading
+import time
+from src.utils.concurrent import pipelined_map
+
+
+class TestPipelinedMap:
+    """
+    Pruebas unitarias para pipelined_map.
+    """
+
+    def test_results_keep_order_and_errors_use_fallback(self):
+        """
+        Prueba que los resultados conservan el orden original y que los fallos usan el valor de on_error.
+        """
+        def fetch(item):
+            if item == 3:
+                raise ValueError('boom')
+            if item == 5:
+                return None
+            return 'x' * item
+
+        results = pipelined_map(
+            fetch, len, list(range(8)),
+            merge=lambda item, parsed: (item, parsed),
+            on_error=lambda item, error: (item, str(error)),
+            fetch_workers=4, parse_workers=2, queue_size=2
+        )
+
+        assert results == [(0, 0), (1, 1), (2, 2), (3, 'boom'), (4, 4), (5, None), (6, 6), (7, 7)]
+
+    def test_bounded_queue_applies_backpressure(self):
+        """
+        Prueba que las descargas se frenan cuando el parseo es más lento, manteniendo acotadas las páginas pendientes.
+        """
+        lock = threading.Lock()
+        pending = 0
+        max_pending = 0
+
+        def fetch(item):
+            nonlocal pending, max_pending
+            with lock:
+                pending += 1
+                max_pending = max(max_pending, pending)
+            return 0.02
+
+        def merge(item, parsed):
+            nonlocal pending
+            with lock:
+                pending -= 1
+            return item
+
+        fetch_workers, parse_workers, queue_size = 8, 1, 2
+        results = pipelined_map(
+            fetch, time.sleep, list(range(40)), merge=merge,
+            fetch_workers=fetch_workers, parse_workers=parse_workers, queue_size=queue_size
+        )
+
+        assert results == list(range(40))
+        # Cola + una página por hilo de descarga + tareas en el pool + la que tiene el despachador
+        assert max_pending <= queue_size + fetch_workers + 2 * parse_workers + 1
@@ -0,0 +1,44 @@
+"""
+Pruebas unitarias para el perfilador por fases (--profile).
+"""
+import pstats
+import time
+from src.utils.concurrent import concurrent_map
+from src.utils.profiling import PhaseProfiler
+
+
+def busy_parse(item):
+    """Trabajo de CPU con asignaciones, ejecutado en los hilos del pool."""
+    deadline = time.perf_counter() + 0.02
+    rows = []
+    while time.perf_counter() < deadline:
+        rows.append(str(item) * 50)
+    return len(rows)
+
+
+class TestPhaseProfiler:
+    """
+    Pruebas unitarias para PhaseProfiler.
+    """
+
+    def test_phase_outputs_include_worker_threads(self, tmp_path):
+        """
+        Prueba que una fase genera .pstats con las funciones de los hilos, pilas collapsed y asignaciones.
+        """
+        profiler = PhaseProfiler(str(tmp_path / 'profiles'), top_n=5, sample_interval=0.001)
+        with profiler.profile('fight_details'):
+            assert len(concurrent_map(busy_parse, list(range(12)), max_workers=3)) == 12
+            kept = [bytearray(1024) for _ in range(2000)]
+
+        base = tmp_path / 'profiles' / 'fight_details'
+        stats = pstats.Stats(str(base) + '.pstats')
+        assert any(func[2] == 'busy_parse' for func in stats.stats)
+
+        collapsed = (tmp_path / 'profiles' / 'fight_details.collapsed').read_text().splitlines()
+        assert collapsed and all(line.rsplit(' ', 1)[1].isdigit() for line in collapsed)
+        assert any('busy_parse (test_profiling.py' in line for line in collapsed)
+
+        allocations = (tmp_path / 'profiles' / 'fight_details.allocations.txt').read_text()
+        assert allocations.startswith('Peak traced memory:')
+        assert 'test_profiling.py' in allocations
+        assert len(kept) == 2000
@@ -0,0 +1,101 @@
+"""
+Pruebas unitarias para el limitador de tasa compartido del pipeline UFC ETL.
+Validan el token bucket y el ajuste AIMD de la concurrencia adaptativa.
+"""
+import time
+from src.utils.rate_limit import TokenBucket, AdaptiveConcurrencyLimiter, RateLimiter
+
+
+class TestTokenBucket:
+    """
+    Pruebas unitarias para el token bucket.
+    """
+
+    def test_burst_then_rate(self):
+        """
+        Prueba que la ráfaga se sirve sin espera y las siguientes fichas se espacian según la tasa.
+        """
+        bucket = TokenBucket(rate=10, burst=3)
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert 0.05 < bucket.reserve() <= 0.1
+        assert 0.15 < bucket.reserve() <= 0.2
+
+    def test_pause_delays_tokens(self):
+        """
+        Prueba que una pausa (Retry-After) retrasa la siguiente ficha aunque haya saldo.
+        """
+        bucket = TokenBucket(rate=100, burst=10)
+        bucket.pause(0.5)
+        assert bucket.reserve() > 0.4
+
+    def test_zero_rate_disables_limit(self):
+        """
+        Prueba que una tasa nula desactiva la limitación.
+        """
+        bucket = TokenBucket(rate=0)
+        assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """
+    Pruebas unitarias para el control AIMD de concurrencia.
+    """
+
+    def test_additive_increase_on_healthy_window(self):
+        """
+        Prueba que una ventana completa de respuestas sanas suma una unidad al límite.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=4, latency_target=1.0)
+        for _ in range(2):
+            limiter.acquire()
+            limiter.release(latency=0.1)
+        assert limiter.limit == 3
+
+    def test_multiplicative_decrease_with_cooldown(self):
+        """
+        Prueba que un 429 reduce el límite a la mitad y que los fallos simultáneos no lo reducen de nuevo.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial=8, cooldown=60)
+        for _ in range(3):
+            limiter.acquire()
+        for _ in range(3):
+            limiter.release(latency=0.1, throttled=True)
+        assert limiter.limit == 4
+        assert limiter.stats()['throttled'] == 3
+
+    def test_slow_responses_do_not_increase(self):
+        """
+        Prueba que las respuestas lentas no aumentan el límite.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial=1, latency_target=0.5)
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(latency=2.0)
+        assert limiter.limit == 1
+
+
+class TestRateLimiter:
+    """
+    Pruebas unitarias para la fachada del limitador de tasa.
+    """
+
+    def test_server_errors_back_off(self):
+        """
+        Prueba que respuestas 5xx y timeouts cuentan como congestión.
+        """
+        limiter = RateLimiter(0, concurrency=AdaptiveConcurrencyLimiter(initial=8, cooldown=0))
+        limiter.acquire()
+        limiter.release(0.1, status=503)
+        limiter.acquire()
+        limiter.release(0.1, timed_out=True)
+        assert limiter.stats()['limit'] == 2
+
+    def test_retry_after_pauses_bucket(self):
+        """
+        Prueba que Retry-After detiene la emisión de fichas.
+        """
+        limiter = RateLimiter(100, burst=10)
+        limiter.release(0.1, status=429, retry_after=0.2)
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.15
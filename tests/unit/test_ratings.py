@@ -0,0 +1,126 @@
+"""
+Pruebas del motor de ratings Elo/Glicko: lotes vectorizados equivalentes a aplicar las peleas una a una.
+"""
+import math
+import os
+import random
+import numpy as np
+import pandas as pd
+from src.core.config import DataConfig
+from src.pipeline.features import chronological_fights
+from src.pipeline.ratings import (
+    ELO_K, GLICKO_C, GLICKO_PERIOD_DAYS, GLICKO_Q, GLICKO_RD_MIN, GLICKO_RD_START, RATING_COLUMNS,
+    RatingEngine, RatingState, rate_fights
+)
+
+
+def make_fights(events: int = 40, fighters: int = 12, seed: int = 3):
+    """Peleas aleatorias con empates, sin resultado y un torneo en el que un luchador pelea dos veces la misma noche."""
+    rng = random.Random(seed)
+    event_rows, fight_rows = [], []
+    for e in range(events):
+        event_rows.append({'event_id': f'e{e:02d}', 'date': (pd.Timestamp('1993-11-12') + pd.Timedelta(days=45 * e))})
+        ids = rng.sample([f'f{i}' for i in range(fighters)], 4)
+        pairs = [(ids[0], ids[1]), (ids[2], ids[3])]
+        if e % 10 == 0:
+            # Torneo: el ganador de la primera pelea de la cartelera disputa también la final
+            pairs = [(ids[0], ids[2]), (ids[0], ids[1]), (ids[2], ids[3])]
+        for order, (red, blue) in enumerate(pairs, start=1):
+            winner = rng.choice([red, blue, red, None])
+            fight_rows.append({
+                'event_id': f'e{e:02d}', 'fight_id': f'x{e:02d}{order}', 'fight_order': order,
+                'red_id': red, 'blue_id': blue, 'winner_id': winner,
+                'method': 'KO/TKO' if winner else rng.choice(['Draw', 'No Contest']),
+            })
+    fights, events = pd.DataFrame(fight_rows), pd.DataFrame(event_rows)
+    return chronological_fights(fights, events)
+
+
+def sequential_ratings(fights: pd.DataFrame) -> np.ndarray:
+    """Referencia escalar: Elo y Glicko aplicados pelea a pelea con diccionarios."""
+    elo, glicko, rd, seen = {}, {}, {}, {}
+    g = lambda x: 1 / math.sqrt(1 + 3 * GLICKO_Q ** 2 * x ** 2 / math.pi ** 2)
+    out = []
+    for fight in fights.itertuples():
+        day = fight.date.toordinal()
+        red, blue = fight.red_id, fight.blue_id
+        score = 1.0 if fight.winner_id == red else 0.0 if fight.winner_id == blue else 0.5
+        rated = not (pd.isna(fight.winner_id) and fight.method == 'No Contest')
+        pre = {}
+        for f in (red, blue):
+            idle = (day - seen[f]) / GLICKO_PERIOD_DAYS if f in seen else 0
+            pre[f] = (elo.get(f, 1500.0), glicko.get(f, 1500.0),
+                      min(math.sqrt(rd.get(f, GLICKO_RD_START) ** 2 + GLICKO_C ** 2 * idle), GLICKO_RD_START))
+        (er, gr, rr), (eb, gb, rb) = pre[red], pre[blue]
+        expected = 1 / (1 + 10 ** ((eb - er) / 400))
+        win_prob = 1 / (1 + 10 ** (-g(math.sqrt(rr ** 2 + rb ** 2)) * (gr - gb) / 400))
+        out.append([er, eb, expected, gr, rr, gb, rb, win_prob])
+        for f, own, own_rd, opp, opp_rd, s in ((red, gr, rr, gb, rb, score), (blue, gb, rb, gr, rr, 1 - score)):
+            seen[f] = day
+            if not rated:
+                glicko[f], rd[f] = own, own_rd
+                continue
+            e = 1 / (1 + 10 ** (-g(opp_rd) * (own - opp) / 400))
+            precision = 1 / own_rd ** 2 + GLICKO_Q ** 2 * g(opp_rd) ** 2 * e * (1 - e)
+            glicko[f] = own + GLICKO_Q / precision * g(opp_rd) * (s - e)
+            rd[f] = max(math.sqrt(1 / precision), GLICKO_RD_MIN)
+        if rated:
+            elo[red], elo[blue] = er + ELO_K * (score - expected), eb - ELO_K * (score - expected)
+    return np.array(out)
+
+
+class TestRatingEngine:
+    """
+    Pruebas del motor de ratings.
+    """
+
+    def test_batches_match_sequential_updates(self):
+        """
+        Prueba que los lotes vectorizados dan los mismos ratings previos que aplicar las peleas una a una.
+        """
+        fights = make_fights()
+        ratings = rate_fights(fights, RatingState(capacity=4))
+        np.testing.assert_allclose(ratings[list(RATING_COLUMNS)].to_numpy(), sequential_ratings(fights))
+        assert ratings['fight_id'].tolist() == fights['fight_id'].tolist()
+        assert ratings.loc[0, 'red_elo_win_prob'] == 0.5
+
+    def test_state_roundtrip_and_incremental_update(self, tmp_path):
+        """
+        Prueba que el estado guardado en .npz continúa exactamente igual que una reconstrucción completa.
+        """
+        fights = make_fights()
+        events = fights[['event_id', 'date']].drop_duplicates()
+        data = DataConfig(base_dir=str(tmp_path))
+        os.makedirs(data.processed_dir)
+        events.to_csv(data.processed_events_path, index=False)
+
+        fights[fights['event_id'] < 'e25'].to_csv(data.processed_fights_path, index=False)
+        RatingEngine(data).update()
+        fights.to_csv(data.processed_fights_path, index=False)
+        appended = RatingEngine(data).update()
+        incremental = pd.read_csv(data.ratings_path)
+
+        assert appended == (fights['event_id'] >= 'e25').sum()
+        assert RatingEngine(data).update(rebuild=True) == len(fights)
+        pd.testing.assert_frame_equal(incremental, pd.read_csv(data.ratings_path))
+        assert len(RatingState.load(data.ratings_state_path)) == fights[['red_id', 'blue_id']].stack().nunique()
+
+    def test_changed_result_triggers_a_rebuild(self, tmp_path):
+        """
+        Prueba que cambiar el ganador de una pelea ya procesada (p. ej. tras --retry-failed) recalcula los ratings.
+        """
+        fights = make_fights()
+        events = fights[['event_id', 'date']].drop_duplicates()
+        data = DataConfig(base_dir=str(tmp_path))
+        os.makedirs(data.processed_dir)
+        events.to_csv(data.processed_events_path, index=False)
+        fights.to_csv(data.processed_fights_path, index=False)
+        RatingEngine(data).update()
+        assert RatingEngine(data).update() == 0
+
+        first = fights.index[0]
+        fights.loc[first, 'winner_id'] = fights.loc[first, 'blue_id']
+        fights.to_csv(data.processed_fights_path, index=False)
+        assert RatingEngine(data).update() == len(fights)
+        np.testing.assert_allclose(pd.read_csv(data.ratings_path)[list(RATING_COLUMNS)].to_numpy(),
+                                   sequential_ratings(fights))
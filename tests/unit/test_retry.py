@@ -0,0 +1,156 @@
+"""
+Pruebas unitarias para los reintentos, el circuit breaker y la cola de peticiones fallidas.
+"""
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from src.core.exceptions import CircuitOpenError, FetchError
+from src.utils.dead_letter import DeadLetterQueue
+from src.utils.http import HTTPClient
+from src.utils.retry import RetryPolicy, CircuitBreaker, CircuitBreakerRegistry
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Responde 503 a las dos primeras peticiones de cada ruta y 200 a partir de la tercera."""
+
+    calls = {}
+
+    def do_GET(self):
+        count = FlakyHandler.calls.get(self.path, 0) + 1
+        FlakyHandler.calls[self.path] = count
+        if self.path.startswith('/missing'):
+            self.send_error(404)
+            return
+        if count <= 2:
+            self.send_error(503)
+            return
+        payload = b'<html>ok</html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    FlakyHandler.calls = {}
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestRetryPolicy:
+    """
+    Pruebas unitarias para la política de reintentos.
+    """
+
+    def test_backoff_is_bounded_and_honours_retry_after(self):
+        """
+        Prueba que el backoff respeta el máximo y nunca espera menos que Retry-After.
+        """
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+        assert all(0 <= policy.delay_for(attempt) <= 4.0 for attempt in range(10))
+        assert policy.delay_for(0, retry_after=10) == 10
+        assert RetryPolicy(jitter=False, backoff_base=0.5).delay_for(2) == 2.0
+
+    def test_retryable_statuses(self):
+        """
+        Prueba la clasificación de errores transitorios.
+        """
+        assert RetryPolicy.is_retryable_status(None)
+        assert RetryPolicy.is_retryable_status(429)
+        assert RetryPolicy.is_retryable_status(502)
+        assert not RetryPolicy.is_retryable_status(404)
+
+
+class TestCircuitBreaker:
+    """
+    Pruebas unitarias para el circuit breaker por host.
+    """
+
+    def test_opens_after_threshold_and_recovers(self):
+        """
+        Prueba que el circuito se abre tras el umbral y se cierra tras una prueba correcta.
+        """
+        breaker = CircuitBreaker('ufcstats.com', failure_threshold=2, reset_timeout=0)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        breaker.before_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_open_circuit_rejects_requests(self):
+        """
+        Prueba que un circuito abierto rechaza peticiones hasta que vence el enfriamiento.
+        """
+        breaker = CircuitBreaker('ufcstats.com', failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+
+class TestHTTPClientRetries:
+    """
+    Pruebas de reintentos del cliente HTTP contra un servidor local inestable.
+    """
+
+    def test_transient_errors_are_retried(self, flaky_server):
+        """
+        Prueba que dos respuestas 503 seguidas se recuperan con reintentos.
+        """
+        client = HTTPClient({}, retry_policy=RetryPolicy(max_retries=3, backoff_base=0.01),
+                            circuit_breakers=CircuitBreakerRegistry())
+        assert client.get_html(f"{flaky_server}/fight-details/abc") == '<html>ok</html>'
+        assert FlakyHandler.calls['/fight-details/abc'] == 3
+
+    def test_client_errors_are_not_retried(self, flaky_server):
+        """
+        Prueba que un 404 falla inmediatamente conservando el código de estado.
+        """
+        client = HTTPClient({}, retry_policy=RetryPolicy(max_retries=3, backoff_base=0.01))
+        with pytest.raises(FetchError) as exc_info:
+            client.get_html(f"{flaky_server}/missing")
+        assert exc_info.value.status == 404
+        assert FlakyHandler.calls['/missing'] == 1
+
+
+class TestDeadLetterQueue:
+    """
+    Pruebas unitarias para la cola de peticiones fallidas.
+    """
+
+    def test_attempts_accumulate_and_persist(self, tmp_path):
+        """
+        Prueba que los fallos repetidos suman intentos y que la cola sobrevive a guardar y cargar.
+        """
+        queue = DeadLetterQueue()
+        queue.add('fight_details', 'fight', 'f1', 'http://x/fight-details/f1', Exception('timeout'))
+        queue.add('fight_details', 'fight', 'f1', 'http://x/fight-details/f1', Exception('503'))
+        queue.add('fighter_details', 'fighter', 'p1', 'http://x/fighter-details/p1', Exception('503'))
+
+        path = str(tmp_path / 'failed_urls.jsonl')
+        queue.save(path)
+        loaded = DeadLetterQueue.load(path)
+
+        assert len(loaded) == 2
+        fight = loaded.pending(entity='fight')[0]
+        assert fight.attempts == 2
+        assert fight.error == '503'
+
+        loaded.remove('fight', 'f1')
+        loaded.remove('fighter', 'p1')
+        loaded.save(path)
+        assert len(DeadLetterQueue.load(path)) == 0
@@ -0,0 +1,70 @@
+"""
+Pruebas unitarias para el almacenamiento SQLite con upserts por clave.
+"""
+import threading
+import pytest
+from src.core.exceptions import ValidationError
+from src.utils.data import CSVManager
+from src.utils.sqlite_store import SQLiteStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteStore(str(tmp_path / 'ufc.sqlite'))
+    yield store
+    store.close()
+
+
+class TestSQLiteStore:
+    """
+    Pruebas unitarias para SQLiteStore y SQLiteRowWriter.
+    """
+
+    def test_partial_upsert_keeps_other_columns(self, store):
+        """
+        Prueba que actualizar los detalles de un luchador conserva las columnas del listado y el resto de filas.
+        """
+        store.upsert('fighters', [
+            {'fighter_id': 'a', 'first': 'Jon', 'wins': 27},
+            {'fighter_id': 'b', 'first': 'Alex', 'wins': 11},
+        ])
+        store.upsert('fighters', [{'fighter_id': 'a', 'dob': 'Jul 19, 1987', 'unknown_column': 'ignored'}])
+        store.upsert('fighters', [{'fighter_id': 'c', 'first': 'Ilia', 'belt': True}])
+
+        rows = store.fetch('fighters', columns=['fighter_id', 'first', 'wins', 'dob', 'belt'])
+        assert rows == [
+            {'fighter_id': 'a', 'first': 'Jon', 'wins': '27', 'dob': 'Jul 19, 1987', 'belt': None},
+            {'fighter_id': 'b', 'first': 'Alex', 'wins': '11', 'dob': None, 'belt': None},
+            {'fighter_id': 'c', 'first': 'Ilia', 'wins': None, 'dob': None, 'belt': 'True'},
+        ]
+        assert store.fetch('fighters', keys=['c'], columns=['first']) == [{'first': 'Ilia'}]
+        with pytest.raises(ValidationError):
+            store.upsert('fighters', [{'first': 'No id'}])
+
+    def test_batched_writer_from_threads_and_csv_export(self, store, tmp_path):
+        """
+        Prueba el escritor por lotes desde varios hilos y la exportación a CSV en orden de inserción.
+        """
+        store.upsert('fights', [{'fight_id': f"f{i:03d}", 'event_id': 'evt', 'fight_order': i} for i in range(100)])
+
+        with store.writer('fights', batch_size=16) as writer:
+            threads = [
+                threading.Thread(target=writer.write_rows,
+                                 args=([{'fight_id': f"f{i:03d}", 'method': 'KO/TKO', 'bonus': ['PERF']}
+                                        for i in range(start, 100, 4)],))
+                for start in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert writer.rows_written == 100
+
+        path = str(tmp_path / 'raw_fights.csv')
+        assert store.export_csv('fights', path) == 100
+        rows = CSVManager.read_from_csv(path)
+        assert [r['fight_id'] for r in rows] == [f"f{i:03d}" for i in range(100)]
+        assert rows[7]['fight_order'] == '7'
+        assert rows[7]['method'] == 'KO/TKO'
+        assert rows[7]['bonus'] == "['PERF']"
+        assert rows[7]['referee'] == ''
@@ -0,0 +1,94 @@
+"""
+Pruebas del servidor local que imita ufcstats (scripts/stub_server.py) dirigiendo los scrapers a él con base_url.
+"""
+from scripts.stub_server import SyntheticSite, StubServer, Faults
+from src.core.config import Config
+from src.scrapers.events.scraper import EventScraper
+from src.scrapers.fights.scraper import FightScraper, FightDetailScraper
+from src.scrapers.fighters.scraper import FighterScraper
+
+
+def stub_config(server: StubServer) -> Config:
+    """Configuración sin caché, límite de tasa ni esperas, con reintentos rápidos, dirigida al servidor local."""
+    config = Config(use_cache=False, requests_per_second=0, base_url=server.base_url)
+    config.scraping.delay_seconds = 0
+    config.scraping.backoff_base = 0.01
+    config.scraping.backoff_max = 0.05
+    config.scraping.max_retries = 8
+    return config
+
+
+class TestStubServer:
+    """
+    Pruebas de extremo a extremo de los scrapers contra el sitio sintético.
+    """
+
+    def test_scrapers_walk_synthetic_site(self, stub_server):
+        """
+        Prueba que eventos, peleas y luchadores del sitio sintético se extraen a la escala configurada.
+        """
+        server = stub_server(SyntheticSite(events=3, fights_per_event=4, fighters=40, upcoming=1))
+        config = stub_config(server)
+
+        events = EventScraper(config).scrape()
+        fights_index = FightScraper(config).scrape_fight_index(events)
+        fights = FightDetailScraper(config).scrape(fights_index)
+        fighters = FighterScraper(config).scrape()
+
+        assert len(events) == 4
+        assert len(fights) == 16
+        assert len(fighters) == 40
+        completed = [f for f in fights if f['event_id'] != events[-1]['event_id']]
+        assert all(f['winner_id'] in (f['red_id'], f['blue_id']) for f in completed)
+        assert {f['red_id'] for f in fights} <= {f['fighter_id'] for f in fighters}
+        assert server.stats_snapshot()['by_status'] == {'200': 1 + 1 + 4 + 16 + 26}
+
+    def test_synthetic_pages_are_deterministic(self):
+        """
+        Prueba que la misma semilla genera las mismas páginas y que una semilla distinta cambia los identificadores.
+        """
+        first, second = SyntheticSite(events=2, seed=7), SyntheticSite(events=2, seed=7)
+        fight_id = next(iter(first.fight_index))
+        assert first.page(f"/fight-details/{fight_id}", {}) == second.page(f"/fight-details/{fight_id}", {})
+        assert SyntheticSite(events=2, seed=8).page(f"/fight-details/{fight_id}", {}) is None
+
+    def test_injected_errors_are_retried(self, stub_server):
+        """
+        Prueba que los errores 5xx y 429 inyectados se reintentan hasta completar todas las peleas.
+        """
+        server = stub_server(SyntheticSite(events=2, fights_per_event=5, fighters=20, upcoming=0),
+                         Faults(error_rate=0.2, throttle_rate=0.2, retry_after=0, seed=3))
+        config = stub_config(server)
+
+        fights_index = FightScraper(config).scrape_fight_index(EventScraper(config).scrape())
+        scraper = FightDetailScraper(config)
+        fights = scraper.scrape(fights_index)
+
+        assert len(fights) == 10
+        assert all(f['method'] for f in fights)
+        assert len(scraper.dead_letters) == 0
+        by_status = server.stats_snapshot()['by_status']
+        assert by_status['429'] > 0
+        assert sum(by_status.values()) > by_status['200']
+
+    def test_streamed_rows_keep_index_order(self, stub_server):
+        """
+        Prueba que con un sink las filas se escriben una vez y en el orden del índice, también las fallidas
+        y las recuperadas en su reintento, y que no se retienen en memoria.
+        """
+        from src.core.constants import FIGHT_FIELDS
+        from src.utils.data import CSVManager
+        server = stub_server(SyntheticSite(events=2, fights_per_event=8, fighters=20, upcoming=0),
+                         Faults(error_rate=0.3, seed=5))
+        config = stub_config(server)
+        config.scraping.max_retries = 0
+
+        fights_index = FightScraper(config).scrape_fight_index(EventScraper(config).scrape())
+        scraper = FightDetailScraper(config)
+        with CSVManager.open_writer(config.data.fights_path, FIGHT_FIELDS) as sink:
+            assert scraper.scrape(fights_index, sink=sink) == []
+
+        rows = CSVManager.read_from_csv(config.data.fights_path)
+        assert [r['fight_id'] for r in rows] == [f['fight_id'] for f in fights_index]
+        failed = {e.key for e in scraper.dead_letters.pending(phase='fight_details')}
+        assert all(bool(r['method']) != (r['fight_id'] in failed) for r in rows)
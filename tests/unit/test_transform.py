@@ -0,0 +1,163 @@
+"""
+Pruebas de la fase de transformación vectorizada: mismo resultado que la limpieza fila a fila de los notebooks.
+"""
+import os
+from datetime import date
+import numpy as np
+import pandas as pd
+import pytest
+from scripts.benchmark_transform import notebook_fighters, notebook_events, notebook_upcoming, notebook_fights
+from src.core.config import DataConfig
+from src.pipeline.transform import (
+    DataTransformer, clean_fighters, clean_events, clean_upcoming, clean_fights, FIGHT_PAIR_COLUMNS
+)
+
+TODAY = date(2025, 6, 1)
+
+
+@pytest.fixture
+def raw_fighters():
+    return pd.DataFrame({
+        'fighter_id': ['f1', 'f2', 'f3', 'f4', 'f1'],
+        'first': ['  jon', 'Brennan', None, 'Amanda  Lee', 'Jon'],
+        'last': ['jones', 'Ward', 'Silva', None, 'Jones'],
+        'nickname': ['"Bones"', 'nan', None, "'Lioness'", 'Bones'],
+        'height': ["6' 4\"", '--', "5' 7\"", '70', "6' 4\""],
+        'weight': ['205 lbs.', '155 lbs.', None, '135 lbs.', '205 lbs.'],
+        'reach': ['84.5"', '--', '72.0"', None, '84.5"'],
+        'stance': ['Orthodox', None, 'southpaw', '', 'Orthodox'],
+        'wins': [27, 0, '3', None, 27],
+        'defeats': [1, 2, -1, 4, 1],
+        'draws': [0, 0, 0, 1, 0],
+        'belt': [True, False, False, False, True],
+        'dob': ['Jul 19, 1987', '--', 'Jan 05, 2000', None, 'Jul 19, 1987'],
+        'slpm': [4.29, 0.0, '--', 2.5, 4.29],
+        'str_acc': ['57%', '0%', '--', None, '57%'],
+        'sapm': [2.22, 1.0, 0.0, 3.1, 2.22],
+        'str_def': ['64%', '40%', '50%', '45%', '64%'],
+        'td_avg': [1.85, 0.0, 0.5, None, 1.85],
+        'td_acc': ['36%', '--', '100%', '20%', '36%'],
+        'td_def': ['95%', '0%', '50%', '60%', '95%'],
+        'sub_avg': [0.5, 0.0, 1.2, 0.0, 0.5],
+    })
+
+
+@pytest.fixture
+def raw_events():
+    return pd.DataFrame({
+        'event_id': ['e1', 'e2', 'e3', None],
+        'name': ['UFC 300:  pereira vs. hill', 'UFC Fight Night', None, 'UFC 1'],
+        'date': ['April 13, 2024', 'March 02, 2024', 'May 01, 2024', 'November 12, 1993'],
+        'location': ['Las Vegas, Nevada, USA', 'Paris', 'London, England, United Kingdom', 'Denver, Colorado, USA'],
+    })
+
+
+@pytest.fixture
+def raw_fights():
+    return pd.DataFrame({
+        'event_id': ['e1', 'e1', 'e2', 'e2', 'e1'],
+        'fight_id': ['x1', 'x2', 'x3', None, 'x1'],
+        'fight_order': [1, 2, 1, 2, 1],
+        'red_id': ['f1', 'f2', 'f3', 'f4', 'f1'],
+        'red_name': ['jon jones', 'Brennan Ward', 'A Silva', 'B', 'jon jones'],
+        'blue_id': ['f2', 'f3', 'f4', 'f1', 'f2'],
+        'blue_name': ['Brennan Ward', 'A Silva', 'Amanda Lee', 'Jon', 'Brennan Ward'],
+        'winner_id': ['f1', '', 'None', 'f4', 'f1'],
+        'weight_class': ['Light Heavyweight Bout', "Women's Strawweight Bout", 'UFC Heavyweight Title Bout',
+                         'Catch Weight Bout', 'Light Heavyweight Bout'],
+        'referee': ['Herb Dean', None, 'marc goddard', 'Herb Dean', 'Herb Dean'],
+        'round': [3, 1, '5', None, 3],
+        'time': ['5:00', '0:42', '1:02:03', '--', '5:00'],
+        'time_format': ['3 Rnd (5-5-5)'] * 5,
+        'method': ['Decision - Unanimous', 'KO/TKO', 'Submission', 'Overturned', 'Decision - Unanimous'],
+        'details': [None, 'Punch to Head At Distance', 'Rear Naked Choke', 'decision - split', None],
+        'bonus': [None] * 5,
+        'kd1': [0, 1, '--', 0, 0], 'kd2': [0, 0, 0, None, 0],
+        'str1': ['33 of 36', '0 of 0', '--', None, '33 of 36'],
+        'str2': ['1 of 31', '5 of 9', '12 of 20', '3 of 4', '1 of 31'],
+        'td1': ['2 of 5', '0 of 1', '1 of 1', '0 of 0', '2 of 5'],
+        'td2': ['4 of 8', '0 of 0', '0 of 2', '1 of 3', '4 of 8'],
+        'sub1': [0, 1, 2, 0, 0], 'sub2': [3, 0, 0, 0, 3],
+        'control_time1': ['9:12', '0:00', '--', None, '9:12'],
+        'control_time2': ['0:21', '1:05', '2:00', '0:10', '0:21'],
+        'sig_head1': ['18 of 86'] * 5, 'sig_head2': ['50 of 69'] * 5,
+        'sig_body1': ['8 of 78'] * 5, 'sig_body2': ['51 of 145'] * 5,
+        'sig_leg1': ['2 of 78'] * 5, 'sig_leg2': ['72 of 102'] * 5,
+        'total_str1': ['24 of 140'] * 5, 'total_str2': ['19 of 56'] * 5,
+        'pass1': [0, 1, 2, 0, 0], 'pass2': [0, 0, 0, 1, 0],
+        'rev1': [1, 0, 0, 0, 1], 'rev2': [1, 0, 0, 0, 1],
+    })
+
+
+class TestVectorizedTransform:
+    """
+    Pruebas de equivalencia con los notebooks y de las conversiones de la fase de transformación.
+    """
+
+    def test_fighters_match_notebook(self, raw_fighters):
+        """
+        Prueba que los luchadores limpios coinciden con la limpieza fila a fila, incluidos valores nulos y '--'.
+        """
+        clean = clean_fighters(raw_fighters, TODAY)
+        pd.testing.assert_frame_equal(clean, notebook_fighters(raw_fighters, TODAY))
+
+        assert clean.index.tolist() == ['f1', 'f2', 'f3', 'f4']
+        assert clean.loc['f1', 'height'] == 193.0
+        assert clean.loc['f1', 'age'] == 38
+        assert clean.loc['f2', 'full_name'] == 'Brennan Ward'
+        assert clean.loc['f4', 'height'] == 177.8
+        assert clean.loc['f1', 'str_acc'] == pytest.approx(0.57)
+        assert clean.loc['f3', 'defeats'] == 0
+        assert clean.loc['f4', 'stance'] == 'Unknown'
+
+    def test_events_match_notebook(self, raw_events):
+        """
+        Prueba que los eventos disputados y próximos coinciden con la limpieza fila a fila.
+        """
+        pd.testing.assert_frame_equal(clean_events(raw_events), notebook_events(raw_events))
+        pd.testing.assert_frame_equal(clean_upcoming(raw_events), notebook_upcoming(raw_events))
+
+        events = clean_events(raw_events)
+        assert events.index.tolist() == ['e1', 'e2']
+        assert events.loc['e1', 'name'] == 'Ufc 300: Pereira Vs. Hill'
+        assert events.loc['e1', 'country'] == 'Usa'
+        assert pd.isna(events.loc['e2', 'country'])
+        assert clean_events(raw_events.assign(location=None))['country'].isna().all()
+
+    def test_fights_match_notebook(self, raw_fights):
+        """
+        Prueba que las peleas coinciden con la limpieza fila a fila y que los tiempos y pares se convierten.
+        """
+        clean = clean_fights(raw_fights)
+        pd.testing.assert_frame_equal(clean, notebook_fights(raw_fights))
+
+        assert clean['fight_id'].tolist() == ['x1', 'x2', 'x3']
+        first, second, third = (clean.iloc[i] for i in range(3))
+        assert first['winner_id'] == 'f1' and pd.isna(second['winner_id']) and pd.isna(third['winner_id'])
+        assert (first['time'], first['control_time1'], third['time']) == (300.0, 552.0, 3723.0)
+        assert pd.isna(third['control_time1'])
+        assert (first['str1_landed'], first['str1_attempted']) == (33.0, 36.0)
+        assert np.isnan(third['str1_landed'])
+        assert [first['weight_class'], second['weight_class'], third['weight_class']] == [
+            'Light Heavyweight', "Women's Strawweight", 'Heavyweight']
+        assert [first['method'], second['method'], third['details']] == [
+            'Decision Unanimous', 'KO/TKO', 'Rear Naked Choke']
+        assert not set(FIGHT_PAIR_COLUMNS) & set(clean.columns)
+
+    def test_transformer_writes_processed_csvs(self, tmp_path, raw_fighters, raw_fights):
+        """
+        Prueba que el transformador escribe los CSV procesados y omite las tablas sin CSV crudo.
+        """
+        data = DataConfig(base_dir=str(tmp_path))
+        os.makedirs(os.path.dirname(data.fighters_path), exist_ok=True)
+        raw_fighters.to_csv(data.fighters_path, index=False)
+        raw_fights.to_csv(data.fights_path, index=False)
+
+        written = DataTransformer(data, today=TODAY).run()
+
+        assert written == {'fighters': 4, 'fights': 3}
+        fighters = pd.read_csv(data.processed_fighters_path, index_col='fighter_id')
+        assert fighters.loc['f1', 'full_name'] == 'Jon Jones'
+        assert pd.read_csv(data.processed_fights_path)['fight_id'].tolist() == ['x1', 'x2', 'x3']
+        assert not os.path.exists(data.processed_events_path)
+        assert not [name for name in os.listdir(data.processed_dir) if name.endswith('.tmp')]
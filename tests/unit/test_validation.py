@@ -0,0 +1,103 @@
+"""
+Pruebas del validador por columnas: comprobaciones por tabla, integridad referencial e informe JSON.
+"""
+import json
+import os
+import pandas as pd
+import pytest
+from src.core.config import DataConfig
+from src.core.exceptions import ValidationError
+from src.utils.validation import DataValidator
+
+
+def make_tables():
+    """Tablas crudas con errores de cada tipo; las dos primeras filas de luchadores son válidas."""
+    fighters = pd.DataFrame({
+        'fighter_id': ['a', 'b', 'c', 'c', ''],
+        'first': ['Ann', 'Bob', '', 'Cid', 'Eve'],
+        'last': ['One', 'Two', '', 'Four', 'Five'],
+        'height': ['5\' 11"', '--', '6\' 0"', '180 cm', '5\' 4"'],
+        'weight': ['155 lbs.', '170 lbs.', '', '185 lbs.', '125 lbs.'],
+        'wins': ['10', '3', '-1', '0', '7'],
+    })
+    events = pd.DataFrame({
+        'event_id': ['e1', 'e2'],
+        'name': ['UFC 1', 'UFC 2'],
+        'date': ['November 12, 1993', '1994-03-11'],
+    })
+    fights = pd.DataFrame({
+        'event_id': ['e1', 'e1', 'e2', 'e9'],
+        'fight_id': ['x1', 'x2', 'x3', 'x4'],
+        'fight_order': ['2', '1', '1', '1'],
+        'red_id': ['a', 'b', 'zz', 'a'],
+        'blue_id': ['b', 'c', 'a', 'b'],
+        'winner_id': ['a', '', 'a', 'yy'],
+        'round': ['1', '3', '9', '2'],
+        'time': ['4:20', '5:00', '1:02', 'soon'],
+        'str1': ['10 of 20', '3 of 8', '--', '12 of 30'],
+    })
+    return fighters, events, fights
+
+
+class TestDataValidator:
+    """
+    Pruebas del validador por columnas.
+    """
+
+    def test_table_checks(self):
+        """
+        Prueba las comprobaciones de nulos, nombre, unicidad, formato y rango con sus filas de ejemplo.
+        """
+        fighters, events, fights = make_tables()
+        report = DataValidator.validate_tables(fighters, events, fights)
+        failures = {(c.table, c.check, c.column): (c.failed, c.rows, c.values) for c in report.failures}
+
+        assert failures[('fighter', 'required', 'fighter_id')] == (1, [4], [''])
+        assert failures[('fighter', 'name', 'first/last/name')][:2] == (1, [2])
+        assert failures[('fighter', 'unique', 'fighter_id')] == (1, [3], ['c'])
+        assert failures[('fighter', 'format', 'height')] == (1, [3], ['180 cm'])
+        assert failures[('fighter', 'range', 'wins')] == (1, [2], ['-1'])
+        assert failures[('event', 'format', 'date')] == (1, [1], ['1994-03-11'])
+        assert failures[('fight', 'range', 'round')] == (1, [2], ['9'])
+        assert failures[('fight', 'format', 'time')] == (1, [3], ['soon'])
+        # Los valores ausentes ('--', vacíos) no se comprueban salvo en los campos obligatorios
+        assert ('fighter', 'format', 'weight') not in failures and ('fight', 'format', 'str1') not in failures
+        assert report.tables['fighter'].stats() == {'total': 5, 'valid': 2, 'invalid': 3, 'success_rate': 40.0}
+
+    def test_referential_integrity(self):
+        """
+        Prueba que las peleas con luchadores o eventos desconocidos fallan y que el winner_id vacío no cuenta.
+        """
+        fighters, events, fights = make_tables()
+        report = DataValidator.validate_tables(fighters, events, fights)
+        references = {c.column: c.values for c in report.checks if c.check == 'reference'}
+
+        assert references == {'red_id': ['zz'], 'blue_id': [], 'winner_id': ['yy'], 'event_id': ['e9']}
+        assert report.tables['fight'].invalid == 2 and not report.ok
+        # Sin la tabla referenciada no hay comprobaciones entre tablas
+        alone = DataValidator.validate_tables(fights=fights)
+        assert not [c for c in alone.checks if c.check == 'reference']
+
+    def test_files_report_and_dataset_stats(self, tmp_path):
+        """
+        Prueba el informe JSON de los CSV crudos y que validate_dataset mantiene sus estadísticas con registros.
+        """
+        fighters, events, fights = make_tables()
+        data = DataConfig(base_dir=str(tmp_path))
+        os.makedirs(os.path.dirname(data.fighters_path))
+        fighters.to_csv(data.fighters_path, index=False)
+        events.to_csv(data.events_path, index=False)
+        report = DataValidator.validate_files(data)
+        report.write_json(data.validation_report_path)
+
+        with open(data.validation_report_path, encoding='utf-8') as f:
+            saved = json.load(f)
+        assert sorted(saved['tables']) == ['event', 'fighter'] and saved['ok'] is False
+        assert saved['tables']['event'] == {'total': 2, 'valid': 1, 'invalid': 1, 'success_rate': 50.0}
+        assert {'table': 'event', 'check': 'format', 'column': 'date', 'failed': 1, 'rows': [1],
+                'values': ['1994-03-11']} in saved['checks']
+
+        stats = DataValidator.validate_dataset([{'event_id': 'e1', 'name': 'UFC 1'}, {'event_id': 'e2'}], 'event')
+        assert stats == {'total': 2, 'valid': 1, 'invalid': 1, 'success_rate': 50.0}
+        with pytest.raises(ValidationError):
+            DataValidator.validate_dataset([], 'referee')